@@ -127,14 +127,33 @@ InputParameter::~InputParameter() {
 
 void InputParameter::ReadInputParameterFromFile(const std::string & inputFile) {
 	FILE *fp = fopen(inputFile.c_str(), "r");
-	char line[5000];
-	char tmp[5000];
 
 	if (!fp) {
 		cout << inputFile << " cannot be found!\n";
 		exit(-1);
 	}
 
+	ReadInputParameter(fp, inputFile);
+	fclose(fp);
+}
+
+void InputParameter::ReadInputParameterFromText(const std::string & inputText, const std::string & inputFile) {
+	/* parse the configuration from memory with the same reader as files */
+	FILE *fp = fmemopen((void *)inputText.c_str(), inputText.size(), "r");
+
+	if (!fp) {
+		cout << inputFile << " cannot be read!\n";
+		exit(-1);
+	}
+
+	ReadInputParameter(fp, inputFile);
+	fclose(fp);
+}
+
+void InputParameter::ReadInputParameter(FILE *fp, const std::string & inputFile) {
+	char line[5000];
+	char tmp[5000];
+
 	while (fscanf(fp, "%[^\n]\n", line) != EOF) {
 		if (!strncmp("-DesignTarget", line, strlen("-DesignTarget"))) {
 			sscanf(line, "-DesignTarget: %s", tmp);
@@ -607,8 +626,6 @@ void InputParameter::ReadInputParameterFromFile(const std::string & inputFile) {
 			continue;
 		}
 	}
-
-	fclose(fp);
 }
 
 void InputParameter::PrintInputParameter() {
@@ -41,6 +41,7 @@
 #include <iostream>
 #include <string>
 #include <stdint.h>
+#include <stdio.h>
 
 #include "typedef.h"
 
@@ -53,6 +54,8 @@ public:
 
 	/* Functions */
 	void ReadInputParameterFromFile(const std::string & inputFile);
+	void ReadInputParameterFromText(const std::string & inputText, const std::string & inputFile);
+	void ReadInputParameter(FILE *fp, const std::string & inputFile);
 	void PrintInputParameter();
 
 	/* Properties */
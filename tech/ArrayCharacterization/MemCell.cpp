@@ -103,14 +103,35 @@ MemCell::~MemCell() {
 void MemCell::ReadCellFromFile(const string & inputFile)
 {
 	FILE *fp = fopen(inputFile.c_str(), "r");
-	char line[5000];
-	char tmp[5000];
 
 	if (!fp) {
 		cout << inputFile << " cannot be found!\n";
 		exit(-1);
 	}
 
+	ReadCell(fp);
+	fclose(fp);
+}
+
+void MemCell::ReadCellFromText(const string & inputText)
+{
+	/* parse the cell from memory with the same reader as files */
+	FILE *fp = fmemopen((void *)inputText.c_str(), inputText.size(), "r");
+
+	if (!fp) {
+		cout << "Cell definition cannot be read!\n";
+		exit(-1);
+	}
+
+	ReadCell(fp);
+	fclose(fp);
+}
+
+void MemCell::ReadCell(FILE *fp)
+{
+	char line[5000];
+	char tmp[5000];
+
 	while (fscanf(fp, "%[^\n]\n", line) != EOF) {
 		if (!strncmp("-MemCellType", line, strlen("-MemCellType"))) {
 			sscanf(line, "-MemCellType: %s", tmp);
@@ -486,8 +507,6 @@ void MemCell::ReadCellFromFile(const string & inputFile)
         }
                 
 	}
-
-	fclose(fp);
 }
 
 void MemCell::ApplyPVT() {
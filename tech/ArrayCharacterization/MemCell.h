@@ -54,6 +54,8 @@ public:
 
 	/* Functions */
 	void ReadCellFromFile(const std::string & inputFile);
+	void ReadCellFromText(const std::string & inputText);
+	void ReadCell(FILE *fp);
     void ApplyPVT();
 	void CellScaling(int _targetProcessNode);
 	double GetMemristance(double _relativeReadVoltage);  /* Get the LRS resistance of memristor at log-linera region of I-V curve */
@@ -45,6 +45,10 @@ SubArray::SubArray() {
 	// TODO Auto-generated constructor stub
 	initialized = false;
 	invalid = false;
+	/* not every cell type computes all delays; keep the others at 0 */
+	bitlineDelay = bitlineDelayW = bitlineDelayR = 0;
+	bitlineDelayOn = bitlineDelayOff = 0;
+	chargeLatency = columnDecoderLatency = 0;
 }
 
 SubArray::~SubArray() {
@@ -57,6 +57,7 @@
 #include "Result.h"
 #include "formula.h"
 #include "macros.h"
+#include "nvsim_api.h"
 
 using namespace std;
 
@@ -70,6 +71,7 @@ Wire *globalWire;
 
 void applyConstraint();
 
+#ifndef NVSIM_LIBRARY
 int main(int argc, char *argv[])
 {
 	cout << fixed << setprecision(3);
@@ -89,12 +91,30 @@ int main(int argc, char *argv[])
 	}
 	cout << endl;
 
+	ifstream inputFile(inputFileName.c_str());
+	if (!inputFile) {
+		cout << inputFileName << " cannot be found!\n";
+		exit(-1);
+	}
+	stringstream configText;
+	configText << inputFile.rdbuf();
+
+	return nvsimSimulate(configText.str(), inputFileName, NULL, NULL);
+}
+#endif
+
+/* cellText overrides the -MemoryCellInputFile of the configuration; result, if given, receives the selected design */
+int nvsimSimulate(const string & configText, const string & inputFileName, const char *cellText, NVSimResult *result)
+{
 	inputParameter = new InputParameter();
 	RESTORE_SEARCH_SIZE;
-	inputParameter->ReadInputParameterFromFile(inputFileName);
+	inputParameter->ReadInputParameterFromText(configText, inputFileName);
 
 	cell = new MemCell();
-	cell->ReadCellFromFile(inputParameter->fileMemCell);
+	if (cellText)
+		cell->ReadCellFromText(cellText);
+	else
+		cell->ReadCellFromFile(inputParameter->fileMemCell);
 //	cell->CellScaling(inputParameter->processNode);
 	
         bool is_FeFET = false;
@@ -381,7 +401,7 @@ int main(int argc, char *argv[])
 		} else {
 			numSolution = 0;
 			RESTORE_SEARCH_SIZE;
-			inputParameter->ReadInputParameterFromFile(inputFileName);	/* just for restoring the search space */
+			inputParameter->ReadInputParameterFromText(configText, inputFileName);	/* just for restoring the search space */
 			applyConstraint();
 		}
 	}
@@ -585,6 +605,9 @@ int main(int argc, char *argv[])
 				bestDataResults[inputParameter->optimizationTarget].printAsCache(bestTagResults[inputParameter->optimizationTarget], inputParameter->cacheAccessMode);
 			else
 				bestDataResults[inputParameter->optimizationTarget].print();
+			if (result)
+				nvsimFillResult(bestDataResults[inputParameter->optimizationTarget],
+						inputParameter->designTarget == cache ? &bestTagResults[inputParameter->optimizationTarget] : NULL, result);
 		} else {
 			cout << "No valid solutions." << endl;
 		}
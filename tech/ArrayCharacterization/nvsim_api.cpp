@@ -0,0 +1,128 @@
+/*******************************************************************************
+* In-process interface to NVSim (libnvsim.so), see nvsim_api.h
+*******************************************************************************/
+
+#include <iostream>
+#include <sstream>
+#include <iomanip>
+#include <math.h>
+#include <stdlib.h>
+#include <string.h>
+#include "InputParameter.h"
+#include "MemCell.h"
+#include "Technology.h"
+#include "Wire.h"
+#include "Result.h"
+#include "nvsim_api.h"
+#include "nvsim_exit.h"	/* NVSimExit, also when linked into the executable */
+
+using namespace std;
+
+extern InputParameter *inputParameter;
+extern Technology *tech;
+extern Technology *techW;
+extern Technology *techR;
+extern MemCell *cell;
+
+void nvsimFillResult(Result & dataResult, Result *tagResult, NVSimResult *result) {
+	/* same expressions as Result::print() and Result::printAsCache() */
+	Bank *bank = dataResult.bank;
+
+	result->status = NVSIM_OK;
+	result->isCache = tagResult != NULL;
+	if (cell->memCellType == PCRAM || cell->memCellType == FBRAM || cell->memCellType == FeFET || cell->memCellType == MLCFeFET || cell->memCellType == MLCRRAM ||
+			(cell->memCellType == memristor && (cell->accessType == CMOS_access || cell->accessType == BJT_access)))
+		result->writeMode = NVSIM_SET_RESET;
+	else if (cell->memCellType == SLCNAND)
+		result->writeMode = NVSIM_ERASE_PROGRAM;
+	else
+		result->writeMode = NVSIM_WRITE;
+
+	result->readLatency = bank->readLatency;
+	result->writeLatency = bank->writeLatency;
+	result->setLatency = bank->setLatency;
+	result->resetLatency = bank->resetLatency;
+	result->readDynamicEnergy = bank->readDynamicEnergy;
+	result->writeDynamicEnergy = bank->writeDynamicEnergy;
+	result->setDynamicEnergy = bank->setDynamicEnergy;
+	result->resetDynamicEnergy = bank->resetDynamicEnergy;
+	result->leakage = bank->leakage;
+	result->area = bank->area;
+	result->cacheArea = tagResult ? tagResult->bank->area + bank->area : -1;
+	result->areaEfficiency = cell->area * tech->featureSize * tech->featureSize
+			* bank->capacity / bank->area * 100;
+
+	double readBandwidth = (double)bank->blockSize /
+			(bank->mat.subarray.readLatency - bank->mat.subarray.rowDecoder.readLatency
+			+ bank->mat.subarray.precharger.readLatency) / 8;
+	if (cell->memCellType == MLCCTT || cell->memCellType == MLCFeFET || cell->memCellType == MLCRRAM) {
+		readBandwidth *= log2(cell->nLvl);
+	}
+	result->readBandwidth = readBandwidth;
+	result->writeBandwidth = (double)bank->blockSize /
+			(bank->mat.subarray.writeLatency) / 8;
+}
+
+static void resetResult(NVSimResult *result, int status) {
+	result->status = status;
+	result->isCache = 0;
+	result->writeMode = NVSIM_WRITE;
+	result->readLatency = result->writeLatency = result->setLatency = result->resetLatency = -1;
+	result->readDynamicEnergy = result->writeDynamicEnergy = -1;
+	result->setDynamicEnergy = result->resetDynamicEnergy = -1;
+	result->leakage = result->area = result->cacheArea = result->areaEfficiency = -1;
+	result->readBandwidth = result->writeBandwidth = -1;
+}
+
+static void releaseGlobals() {
+	/* localWire and globalWire are released by nvsimSimulate() */
+	delete inputParameter;
+	delete cell;
+	delete tech;
+	delete techR;
+	delete techW;
+	inputParameter = NULL;
+	cell = NULL;
+	tech = techR = techW = NULL;
+}
+
+extern "C" int nvsim_characterize(const char *configText, const char *cellText, NVSimResult *result, char **output) {
+	NVSimResult localResult;
+	if (!result)
+		result = &localResult;
+	resetResult(result, NVSIM_NO_SOLUTION);
+
+	/* capture everything nvsim would print */
+	ostringstream captured;
+	streambuf *coutBuffer = cout.rdbuf(captured.rdbuf());
+	ios_base::fmtflags coutFlags = cout.flags();
+	streamsize coutPrecision = cout.precision();
+	cout << fixed << setprecision(3);
+
+	try {
+		nvsimSimulate(configText ? configText : "", "<memory>", cellText, result);
+	} catch (const NVSimExit &) {
+		resetResult(result, NVSIM_ERROR);
+	} catch (const exception &e) {
+		cout << "[NVSIM Error]: " << e.what() << endl;
+		resetResult(result, NVSIM_ERROR);
+	}
+	releaseGlobals();
+
+	cout.flush();
+	cout.flags(coutFlags);
+	cout.precision(coutPrecision);
+	cout.rdbuf(coutBuffer);
+
+	if (output) {
+		string text = captured.str();
+		*output = (char *)malloc(text.size() + 1);
+		if (*output)
+			memcpy(*output, text.c_str(), text.size() + 1);
+	}
+	return result->status;
+}
+
+extern "C" void nvsim_free(char *output) {
+	free(output);
+}
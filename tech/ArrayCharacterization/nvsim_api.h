@@ -0,0 +1,81 @@
+/*******************************************************************************
+* In-process interface to NVSim (libnvsim.so)
+*
+* nvsim_characterize() runs the same design space search as the nvsim
+* executable on a configuration and cell definition held in memory and returns
+* the headline results of the selected design in NVSimResult. Everything the
+* executable would print is captured and returned as well. Calls are not
+* thread-safe: NVSim keeps its state in globals.
+*******************************************************************************/
+
+#ifndef NVSIM_API_H_
+#define NVSIM_API_H_
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* nvsim_characterize() status codes */
+#define NVSIM_OK			0	/* a design was found */
+#define NVSIM_NO_SOLUTION	1	/* no valid design (results are -1) */
+#define NVSIM_ERROR			2	/* NVSim stopped on an error (see output) */
+
+/* write reporting of the memory cell, as in Result::print() */
+#define NVSIM_WRITE			0	/* write latency/energy */
+#define NVSIM_SET_RESET		1	/* separate SET and RESET latency/energy */
+#define NVSIM_ERASE_PROGRAM	2	/* NAND erase and programming */
+
+/* Headline results of the selected design in SI units (s, J, W, m^2, B/s) */
+typedef struct {
+	int status;
+	int isCache;				/* cacheArea includes the tag array */
+	int writeMode;				/* NVSIM_WRITE, NVSIM_SET_RESET or NVSIM_ERASE_PROGRAM */
+	double readLatency;
+	double writeLatency;
+	double setLatency;
+	double resetLatency;
+	double readDynamicEnergy;
+	double writeDynamicEnergy;
+	double setDynamicEnergy;
+	double resetDynamicEnergy;
+	double leakage;
+	double area;				/* data array */
+	double cacheArea;			/* data plus tag array, caches only */
+	double areaEfficiency;		/* percent */
+	double readBandwidth;
+	double writeBandwidth;
+} NVSimResult;
+
+/*
+ * Characterize a memory array
+ *
+ * configText: contents of an NVSim .cfg file
+ * cellText: contents of the cell file, or NULL to read -MemoryCellInputFile
+ * result: filled with the headline results
+ * output: if not NULL, set to the text nvsim would print (free with nvsim_free)
+ *
+ * Returns the status code, also stored in result->status
+ */
+int nvsim_characterize(const char *configText, const char *cellText, NVSimResult *result, char **output);
+
+/* Free output returned by nvsim_characterize() */
+void nvsim_free(char *output);
+
+#ifdef __cplusplus
+}
+
+#include <string>
+
+class Result;
+
+/* Run the search; defined in main.cpp and shared by main() and nvsim_characterize() */
+int nvsimSimulate(const std::string & configText, const std::string & configName, const char *cellText,
+		NVSimResult *result);
+
+/* Fill result from the selected data (and, for caches, tag) design */
+void nvsimFillResult(Result & dataResult, Result *tagResult, NVSimResult *result);
+#endif
+
+#endif /* NVSIM_API_H_ */
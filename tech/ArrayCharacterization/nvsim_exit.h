@@ -0,0 +1,29 @@
+/*******************************************************************************
+* exit() replacement for libnvsim.so
+*
+* NVSim reports fatal errors by printing a message and calling exit(), which
+* would terminate the host process. The shared library is compiled with
+* -include nvsim_exit.h so that those calls throw NVSimExit instead;
+* nvsim_characterize() catches it and returns NVSIM_ERROR.
+*******************************************************************************/
+
+#ifndef NVSIM_EXIT_H_
+#define NVSIM_EXIT_H_
+
+#ifdef __cplusplus
+
+#include <cstdlib>
+
+struct NVSimExit {
+	int code;
+};
+
+[[noreturn]] inline void nvsimExit(int code) {
+	throw NVSimExit{code};
+}
+
+#define exit(code) nvsimExit(code)
+
+#endif
+
+#endif /* NVSIM_EXIT_H_ */
@@ -0,0 +1,187 @@
+"""
+Traffic Evaluation Benchmarks
+
+asv-style benchmark suites for the tech traffic-evaluation path. Each class
+is a suite: ``setup``/``teardown`` run around every repeat, and every
+``time_*`` method is one benchmark. Classes may set ``number`` to fix the
+number of calls per repeat (otherwise it is calibrated by the runner).
+
+NVSim is replaced by benchmarks/fake_nvsim.py, which prints canned output;
+run the suites with benchmarks/run_benchmarks.py.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from integrate.data.workload_data import DNN_weights, DNN_weights_acts, graph8MB, spec8MBLLC
+from integrate.input_defs.access_pattern import PatternConfig
+from integrate.input_defs.nvsim_interface import NVSimInputConfig, NVSimOutputConfig
+from integrate.input_defs.nvsim_parser import parse_nvsim_text
+from integrate.interfaces.array_interface import ArrayCharacterizationInterface
+from integrate.traffic_evaluation.eval_utils import (
+    BatchExperimentResult, ExperimentResult, parse_nvsim_input_file
+)
+from integrate.traffic_evaluation.traffic import (
+    dnn_traffic, generic_traffic, generic_traffic_with_write_buff, graph_traffic, spec_traffic_single
+)
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+TECH_DIR = BENCHMARK_DIR.parent
+DATA_DIR = BENCHMARK_DIR / "data"
+CELL_FILE = TECH_DIR / "integrate" / "data" / "cell_cfgs" / "RRAM_best_case.cell"
+MEM_CFG_FILE = TECH_DIR / "integrate" / "data" / "mem_cfgs" / "RRAM_1MB_ReadLatency_1BPC-best_case.cfg"
+
+
+def _array_objects(memory_type: str = "SRAM"):
+    """
+    Build NVSim input/output objects from canned NVSim output, as main.py does from array results
+    
+    Args:
+        memory_type: "SRAM" or "RRAM"
+        
+    Returns:
+        Tuple of (nvsim_input_cfg, nvsim_output)
+    """
+    canned = "nvsim_memristor.out" if memory_type == "RRAM" else "nvsim_sram.out"
+    metrics = parse_nvsim_text((DATA_DIR / canned).read_text()).metrics(memory_type)
+    
+    nvsim_input_cfg = NVSimInputConfig(mem_cfg_file_path=str(MEM_CFG_FILE), process_node=22,
+                                       opt_target="ReadLatency", word_width=64, capacity=1,
+                                       cell_type=memory_type)
+    nvsim_output = NVSimOutputConfig(
+        read_latency=metrics["read_latency_ns"], write_latency=metrics["write_latency_ns"],
+        read_energy=metrics["read_energy_pj"], write_energy=metrics["write_energy_pj"],
+        leakage_power=metrics["leakage_power_mw"], area=metrics["area_mm2"],
+        read_bw=metrics["read_bandwidth_gbps"], write_bw=metrics["write_bandwidth_gbps"],
+        area_efficiency=80.0
+    )
+    return nvsim_input_cfg, nvsim_output
+
+
+def _access_pattern() -> PatternConfig:
+    """Base access pattern matching MemSysExplorer's defaults"""
+    return PatternConfig(exp_name="bench", read_freq=100000, read_size=8,
+                         write_freq=10, write_size=8, workingset=1)
+
+
+class ExperimentResultSuite:
+    """Single-point and vectorized metric evaluation"""
+    
+    def setup(self):
+        self.access_pattern = _access_pattern()
+        self.nvsim_input_cfg, self.nvsim_output = _array_objects("SRAM")
+        write_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7]
+        read_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7,
+                         2e7, 1e8, 2e8, 1e9, 2e9, 1e10]
+        self.write_freq = [wr for wr in write_accesses for rd in read_accesses]
+        self.read_freq = [rd for wr in write_accesses for rd in read_accesses]
+    
+    def time_evaluate(self):
+        ExperimentResult(self.access_pattern, self.nvsim_input_cfg, self.nvsim_output).evaluate()
+    
+    def time_batch_evaluate_generic_grid(self):
+        BatchExperimentResult(self.access_pattern, self.nvsim_input_cfg, self.nvsim_output,
+                              read_freq=self.read_freq, write_freq=self.write_freq,
+                              benchmark_names="test").evaluate()
+
+
+class TrafficSweepSuite:
+    """The five traffic sweeps, each writing a fresh results CSV"""
+    
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="msx-bench-")
+        self.results_csv = os.path.join(self.tmpdir, "RRAM_1MB_ReadLatency_1BPC-bench.csv")
+        self.access_pattern = _access_pattern()
+        nvsim_input_cfg, nvsim_output = _array_objects("RRAM")
+        self.nvsim_input_cfgs = [nvsim_input_cfg]
+        self.nvsim_outputs = [nvsim_output]
+        self.cell_paths = [str(CELL_FILE)]
+        self.cfg_paths = [str(MEM_CFG_FILE)]
+    
+    def teardown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    
+    def _fresh_csv(self) -> str:
+        if os.path.exists(self.results_csv):
+            os.remove(self.results_csv)
+        return self.results_csv
+    
+    def time_generic(self):
+        generic_traffic(self.access_pattern, self.nvsim_input_cfgs, self.nvsim_outputs,
+                        self._fresh_csv(), self.cell_paths, self.cfg_paths)
+    
+    def time_graph(self):
+        graph_traffic(graph8MB, self.access_pattern, self.nvsim_input_cfgs, self.nvsim_outputs,
+                      self._fresh_csv(), self.cell_paths, self.cfg_paths)
+    
+    def time_dnn(self):
+        dnn_traffic(DNN_weights, DNN_weights_acts, self.access_pattern, self.nvsim_input_cfgs,
+                    self.nvsim_outputs, self._fresh_csv(), self.cell_paths, self.cfg_paths)
+    
+    def time_spec(self):
+        spec_traffic_single(spec8MBLLC, self.access_pattern, self.nvsim_input_cfgs, self.nvsim_outputs,
+                            self._fresh_csv(), self.cell_paths, self.cfg_paths)
+    
+    def time_generic_write_buff(self):
+        generic_traffic_with_write_buff(self.access_pattern, self.nvsim_input_cfgs, self.nvsim_outputs,
+                                        self._fresh_csv(), self.cell_paths, self.cfg_paths)
+
+
+class ParseSuite:
+    """NVSim output and input file parsing"""
+    
+    def setup(self):
+        self.interface = ArrayCharacterizationInterface(use_cache=False)
+        self.sram_output = (DATA_DIR / "nvsim_sram.out").read_text()
+        self.rram_output = (DATA_DIR / "nvsim_memristor.out").read_text()
+    
+    def time_parse_nvsim_output_sram(self):
+        self.interface._parse_nvsim_output(self.sram_output, "SRAM")
+    
+    def time_parse_nvsim_output_rram(self):
+        self.interface._parse_nvsim_output(self.rram_output, "RRAM")
+    
+    def time_parse_nvsim_input_file_cell(self):
+        parse_nvsim_input_file(str(CELL_FILE))
+    
+    def time_parse_nvsim_input_file_mem_cfg(self):
+        parse_nvsim_input_file(str(MEM_CFG_FILE))
+
+
+class EndToEndSuite:
+    """MemSysExplorer.run over two technologies and every traffic suite, cache disabled"""
+    
+    number = 1
+    
+    def setup(self):
+        self.tmpdir = tempfile.mkdtemp(prefix="msx-bench-")
+        self.output_path = os.path.join(self.tmpdir, "output")
+        self.config_path = os.path.join(self.tmpdir, "bench.json")
+        # configurations whose memory configs are checked in, so no files are generated in the tree
+        config = {
+            "experiment": {
+                "exp_name": "bench",
+                "cell_type": ["RRAM", "eDRAM3T"],
+                "opt_target": ["ReadLatency"],
+                "capacity": [1],
+                "bits_per_cell": [1],
+                "case": "best_case",
+                "process_node": 22,
+                "traffic": ["generic", "graph", "dnn", "spec", "generic_write_buff"],
+                "output_path": self.output_path
+            }
+        }
+        with open(self.config_path, "w") as f:
+            json.dump(config, f)
+    
+    def teardown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    
+    def time_run(self):
+        from main import MemSysExplorer
+        
+        shutil.rmtree(self.output_path, ignore_errors=True)
+        MemSysExplorer(self.config_path, use_cache=False).run()
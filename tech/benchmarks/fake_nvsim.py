@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Stand-in NVSim executable for benchmarks
+
+Prints canned NVSim output instead of running the design-space search, so
+benchmark timings measure MemSysExplorer rather than NVSim. The output is
+chosen by the MemCellType of the cell file referenced by the given memory
+config (benchmarks/data/nvsim_<memcelltype>.out, falling back to SRAM), so
+the same inputs always produce the same output.
+
+Usage:
+    NVSIM_EXECUTABLE=benchmarks/fake_nvsim.py python main.py <config_file.json>
+"""
+
+import sys
+from pathlib import Path
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+def _config_value(path, key):
+    """Return the value of a "-Key: value" line in an NVSim input file, or None"""
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(f"-{key}:"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: fake_nvsim.py <config_file>", file=sys.stderr)
+        return 1
+    
+    config_file = sys.argv[1]
+    cell_file = _config_value(config_file, "MemoryCellInputFile")
+    cell_type = _config_value(cell_file, "MemCellType") if cell_file else None
+    
+    canned = DATA_DIR / f"nvsim_{(cell_type or 'SRAM').lower()}.out"
+    if not canned.exists():
+        canned = DATA_DIR / "nvsim_sram.out"
+    
+    sys.stdout.write(canned.read_text())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Import Budget Check
+
+Imports main.py in fresh interpreters and fails if the import takes longer
+than the budget or loads a module that only some code paths need (pandas for
+tentpole generation, torch and scipy for fault injection). main.py is started
+thousands of times by orchestration scripts, so its startup cost is tracked
+like any other benchmark.
+
+Usage:
+    python benchmarks/import_budget.py [--budget SECONDS] [--repeat N]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+TECH_DIR = BENCHMARK_DIR.parent
+
+# Median wall time allowed for `import main` in a fresh interpreter
+DEFAULT_BUDGET = 0.25
+
+# Modules that must not be loaded by `import main`
+DEFERRED_MODULES = ("pandas", "torch", "scipy")
+
+_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed,
+                  "loaded": [name for name in {DEFERRED_MODULES!r} if name in sys.modules]}}))
+"""
+
+
+def measure(repeat: int):
+    """
+    Import main.py in repeat fresh interpreters
+    
+    Args:
+        repeat: Number of interpreters to start
+        
+    Returns:
+        Tuple of (sorted import times in seconds, deferred modules loaded by any import)
+    """
+    times, loaded = [], set()
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", _PROBE], cwd=TECH_DIR,
+                                capture_output=True, text=True, check=True)
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(probe["elapsed"])
+        loaded.update(probe["loaded"])
+    return sorted(times), loaded
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Check the startup import cost of tech/main.py")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help=f"Allowed median import time in seconds (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to time (default: 5)")
+    args = parser.parse_args()
+    
+    times, loaded = measure(max(1, args.repeat))
+    median = times[len(times) // 2]
+    print(f"import main: median {median * 1000:.1f} ms, min {times[0] * 1000:.1f} ms "
+          f"(budget {args.budget * 1000:.0f} ms, {len(times)} runs)")
+    
+    failed = False
+    if median > args.budget:
+        print(f"✗ import time exceeds the budget by {(median - args.budget) * 1000:.1f} ms")
+        failed = True
+    if loaded:
+        print(f"✗ import main loaded deferred module(s): {', '.join(sorted(loaded))}")
+        failed = True
+    if not failed:
+        print("✓ within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+
+Runs the asv-style suites in benchmarks/bench_*.py against the stand-in
+NVSim (benchmarks/fake_nvsim.py) and stores the timings as JSON, so results
+from different branches can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--filter REGEX] [--repeat N] [--output results.json]
+    python benchmarks/run_benchmarks.py --compare base.json head.json
+    
+Example:
+    git checkout main && python benchmarks/run_benchmarks.py --output /tmp/main.json
+    git checkout my-branch && python benchmarks/run_benchmarks.py --output /tmp/branch.json
+    python benchmarks/run_benchmarks.py --compare /tmp/main.json /tmp/branch.json
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+TECH_DIR = BENCHMARK_DIR.parent
+
+# Calls per repeat are raised until a repeat takes at least this long
+MIN_REPEAT_TIME = 0.2
+
+# A benchmark this much slower than the baseline is reported as a regression
+REGRESSION_THRESHOLD = 1.10
+
+
+def _git(*args: str) -> Optional[str]:
+    """Return the output of a git command in the repository, or None if it fails"""
+    try:
+        return subprocess.run(["git", *args], cwd=TECH_DIR, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def discover(pattern: Optional[str] = None) -> Iterator[Tuple[str, type, str]]:
+    """
+    Find benchmark methods in benchmarks/bench_*.py
+    
+    Args:
+        pattern: Optional regular expression matched against "module.Suite.time_name"
+        
+    Yields:
+        Tuples of (benchmark name, suite class, method name)
+    """
+    regex = re.compile(pattern) if pattern else None
+    for path in sorted(BENCHMARK_DIR.glob("bench_*.py")):
+        module = importlib.import_module(path.stem)
+        for suite_name, suite in sorted(vars(module).items()):
+            if not isinstance(suite, type) or suite.__module__ != module.__name__:
+                continue
+            for method in sorted(name for name in vars(suite) if name.startswith("time_")):
+                name = f"{path.stem}.{suite_name}.{method}"
+                if regex is None or regex.search(name):
+                    yield name, suite, method
+
+
+def time_benchmark(suite: type, method: str, repeat: int) -> Dict[str, Any]:
+    """
+    Time one benchmark method
+    
+    Each repeat creates a fresh suite instance, calls setup, times ``number``
+    calls of the method and calls teardown; ``number`` comes from the suite or
+    is calibrated so a repeat takes at least MIN_REPEAT_TIME.
+    
+    Args:
+        suite: Suite class
+        method: Name of the time_* method
+        repeat: Number of timed repeats
+        
+    Returns:
+        Dictionary of per-call seconds (min, median, mean, stdev) and counts
+    """
+    number = getattr(suite, "number", None)
+    samples: List[float] = []
+    
+    for index in range(repeat + 1):
+        instance = suite()
+        if hasattr(instance, "setup"):
+            instance.setup()
+        try:
+            func = getattr(instance, method)
+            if number is None:
+                # calibration repeat, not recorded
+                number = 1
+                while True:
+                    start = time.perf_counter()
+                    for _ in range(number):
+                        func()
+                    elapsed = time.perf_counter() - start
+                    if elapsed >= MIN_REPEAT_TIME or number >= 1 << 20:
+                        break
+                    number *= 10 if elapsed < MIN_REPEAT_TIME / 10 else 2
+                continue
+            if index == 0:
+                func()  # warm-up call (imports, caches)
+                continue
+            
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number)
+        finally:
+            if hasattr(instance, "teardown"):
+                instance.teardown()
+    
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": len(samples),
+        "number": number
+    }
+
+
+def run(pattern: Optional[str], repeat: int) -> Dict[str, Any]:
+    """
+    Run all matching benchmarks with the stand-in NVSim
+    
+    Args:
+        pattern: Optional regular expression selecting benchmarks
+        repeat: Number of timed repeats per benchmark
+        
+    Returns:
+        JSON-serializable results with environment metadata
+    """
+    import numpy
+    
+    os.environ["NVSIM_EXECUTABLE"] = str(BENCHMARK_DIR / "fake_nvsim.py")
+    sys.path.insert(0, str(BENCHMARK_DIR))
+    sys.path.insert(0, str(TECH_DIR))
+    logging.disable(logging.WARNING)
+    
+    results: Dict[str, Any] = {
+        "commit": _git("rev-parse", "HEAD"),
+        "branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "benchmarks": {}
+    }
+    
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="msx-bench-") as workdir:
+        # NVSim logs go to output/ under the working directory; keep them out of the tree
+        os.chdir(workdir)
+        try:
+            for name, suite, method in discover(pattern):
+                timing = time_benchmark(suite, method, repeat)
+                results["benchmarks"][name] = timing
+                print(f"{name:<60} {_format_seconds(timing['median'])} "
+                      f"(min {_format_seconds(timing['min'])}, {timing['repeat']}x{timing['number']})")
+        finally:
+            os.chdir(cwd)
+    
+    return results
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any]) -> int:
+    """
+    Print median timings of two result files side by side
+    
+    Args:
+        base: Baseline results
+        head: Results to compare against the baseline
+        
+    Returns:
+        Number of benchmarks slower than REGRESSION_THRESHOLD x baseline
+    """
+    print(f"base: {base.get('branch')} {str(base.get('commit'))[:10]}   "
+          f"head: {head.get('branch')} {str(head.get('commit'))[:10]}")
+    regressions = 0
+    for name in sorted(set(base["benchmarks"]) | set(head["benchmarks"])):
+        before = base["benchmarks"].get(name)
+        after = head["benchmarks"].get(name)
+        if before is None or after is None:
+            print(f"{name:<60} {'only in ' + ('head' if before is None else 'base'):>24}")
+            continue
+        ratio = after["median"] / before["median"] if before["median"] else float("inf")
+        flag = ""
+        if ratio > REGRESSION_THRESHOLD:
+            flag = "  slower"
+            regressions += 1
+        elif ratio < 1 / REGRESSION_THRESHOLD:
+            flag = "  faster"
+        print(f"{name:<60} {_format_seconds(before['median'])} → {_format_seconds(after['median'])} "
+              f"{ratio:6.2f}x{flag}")
+    return regressions
+
+
+def _format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit"""
+    for unit, scale in (("s", 1.), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f}{unit:>2}"
+    return f"{seconds / 1e-9:8.3f}ns"
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Run or compare tech traffic-evaluation benchmarks")
+    parser.add_argument("--filter", help="Only run benchmarks whose name matches this regular expression")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats per benchmark (default: 5)")
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/<branch>-<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"),
+                        help="Compare two results files instead of running benchmarks")
+    args = parser.parse_args()
+    
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            head = json.load(f)
+        return 1 if compare(base, head) else 0
+    
+    results = run(args.filter, max(1, args.repeat))
+    
+    output = args.output
+    if output is None:
+        label = f"{results['branch'] or 'unknown'}-{(results['commit'] or 'unknown')[:10]}".replace("/", "_")
+        output = BENCHMARK_DIR / "results" / f"{label}.json"
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {len(results['benchmarks'])} benchmark results to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,7 @@ from .workload_data import (
     get_workload_by_name, get_all_workloads, list_available_workloads,
     get_benchmark_count, get_benchmark_data, iterate_benchmarks
 )
+from .workload_catalog import WorkloadCatalog
 
 __all__ = [
     'DNN_weights', 
@@ -20,5 +21,6 @@ __all__ = [
     'list_available_workloads',
     'get_benchmark_count', 
     'get_benchmark_data', 
-    'iterate_benchmarks'
+    'iterate_benchmarks',
+    'WorkloadCatalog'
 ]
\ No newline at end of file
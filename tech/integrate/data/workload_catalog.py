@@ -0,0 +1,355 @@
+"""
+Workload Catalog
+
+This module holds workloads as one columnar NumPy structured array instead of
+dicts of Python lists. A catalog can be built from the built-in workload
+dicts, CSV or Parquet files, or PatternConfig JSONs written by apps/main.py,
+saved as a .npy file and reopened memory-mapped, so catalogs with many
+thousands of benchmarks and phases are loaded without parsing and selected
+and derived with vectorized operations.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import csv
+import json
+
+import numpy as np
+
+# Numeric columns of a catalog; -1 marks an unknown value, as in PatternConfig
+NUMERIC_COLUMNS = ("read_freq", "write_freq", "total_reads", "total_writes",
+                   "read_size", "write_size", "workingset", "total_ins")
+
+# Text columns of a catalog: the dataset (source) and benchmark name of each row
+TEXT_COLUMNS = ("dataset", "name")
+
+# Column names accepted for the benchmark name, in order of preference
+_NAME_KEYS = ("names", "name", "benchmark_name", "Benchmark Name")
+
+
+class WorkloadCatalog:
+    """
+    Columnar collection of workloads
+    
+    Every row is one benchmark (or one phase of a benchmark) with its reads and
+    writes per second; rows keep the order they were added in. Columns are
+    NumPy arrays, e.g. ``catalog["read_freq"]``.
+    
+    Usage:
+        catalog = WorkloadCatalog.from_files(["spec.parquet", "pattern_config.json"])
+        catalog.save("catalog.npy")
+        catalog = WorkloadCatalog.load("catalog.npy")      # memory-mapped
+        names, read_freq, write_freq = catalog.traffic()
+    """
+    
+    def __init__(self, table: Optional[np.ndarray] = None):
+        """
+        Initialize a catalog from a structured array
+        
+        Args:
+            table: Structured array with TEXT_COLUMNS and NUMERIC_COLUMNS fields
+                (an empty catalog when None)
+        """
+        self.table = table if table is not None else _empty_table(0)
+    
+    def __len__(self) -> int:
+        return len(self.table)
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Return a column as an array (a view into the catalog)"""
+        return self.table[column]
+    
+    @property
+    def datasets(self) -> List[str]:
+        """Dataset names in the order they first appear"""
+        return list(dict.fromkeys(self.table["dataset"].tolist()))
+    
+    @classmethod
+    def from_columns(cls, dataset: str, columns: Mapping[str, Sequence]) -> "WorkloadCatalog":
+        """
+        Build a catalog from a mapping of column name to values
+        
+        Reads and writes per second are taken from "read_freq"/"write_freq" when
+        present. Otherwise they are derived the way the traffic sweeps do it:
+        "reads"/"writes" per inference times "ips" (DNN workloads), or
+        "reads"/"writes" divided by "ex_time" in seconds (SPEC workloads; rows
+        without an execution time get no traffic).
+        
+        Args:
+            dataset: Dataset name stored with every row
+            columns: Column values, e.g. one of the dicts in workload_data
+            
+        Returns:
+            WorkloadCatalog
+        """
+        name_key = next((key for key in _NAME_KEYS if key in columns), None)
+        if name_key is None:
+            raise ValueError(f"Workload '{dataset}' has no benchmark name column")
+        names = [str(name) for name in columns[name_key]]
+        
+        def column(key: str, default: float = -1.) -> np.ndarray:
+            if key not in columns:
+                return np.full(len(names), default)
+            values = np.asarray(columns[key], dtype=float)
+            if values.shape != (len(names),):
+                raise ValueError(f"Workload '{dataset}' column '{key}' has {values.size} values "
+                                 f"for {len(names)} benchmarks")
+            return values
+        
+        table = _empty_table(len(names), name_width=max(map(len, names), default=1),
+                             dataset_width=max(len(dataset), 1))
+        table["dataset"] = dataset
+        table["name"] = names
+        for key in NUMERIC_COLUMNS:
+            table[key] = column(key)
+        
+        if "read_freq" not in columns and "reads" in columns:
+            reads, writes = column("reads"), column("writes", 0.)
+            if "ips" in columns:
+                ips = column("ips")
+                table["read_freq"] = reads * ips
+                table["write_freq"] = writes * ips
+            elif "ex_time" in columns:
+                ex_time = column("ex_time")
+                timed = ex_time > 0
+                table["read_freq"] = np.divide(reads, ex_time, out=np.zeros(len(names)), where=timed)
+                table["write_freq"] = np.divide(writes, ex_time, out=np.zeros(len(names)), where=timed)
+                if "total_reads" not in columns:
+                    table["total_reads"] = reads
+                    table["total_writes"] = writes
+            else:
+                raise ValueError(f"Workload '{dataset}' has reads but neither 'ips' nor 'ex_time' "
+                                 f"to turn them into reads per second")
+        return cls(table)
+    
+    @classmethod
+    def from_workloads(cls, workloads: Union[Mapping[str, Mapping], Sequence[Mapping]]) -> "WorkloadCatalog":
+        """
+        Build a catalog from workload dicts in the workload_data layout
+        
+        Args:
+            workloads: Mapping of dataset name to workload dict, or a sequence of
+                workload dicts (named "workload0", "workload1", ...)
+                
+        Returns:
+            WorkloadCatalog with the datasets' rows in order
+        """
+        if not isinstance(workloads, Mapping):
+            workloads = {f"workload{i}": workload for i, workload in enumerate(workloads)}
+        return cls.concatenate([cls.from_columns(dataset, workload) for dataset, workload in workloads.items()])
+    
+    @classmethod
+    def from_csv(cls, path: str, dataset: Optional[str] = None) -> "WorkloadCatalog":
+        """
+        Load a CSV file with one row per benchmark
+        
+        Args:
+            path: CSV path; the header names the columns (see from_columns)
+            dataset: Dataset name (defaults to the file stem)
+            
+        Returns:
+            WorkloadCatalog
+        """
+        with open(path, "r", newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns: Dict[str, List[Any]] = {key: [] for key in header}
+            for row in reader:
+                for key, value in zip(header, row):
+                    columns[key].append(value)
+        
+        for key in columns:
+            if key not in _NAME_KEYS:
+                columns[key] = [_number(value) for value in columns[key]]
+        return cls.from_columns(dataset or Path(path).stem, columns)
+    
+    @classmethod
+    def from_parquet(cls, path: str, dataset: Optional[str] = None) -> "WorkloadCatalog":
+        """
+        Load a Parquet file with one row per benchmark (requires pyarrow)
+        
+        Args:
+            path: Parquet path; column names as for from_columns
+            dataset: Dataset name (defaults to the file stem)
+            
+        Returns:
+            WorkloadCatalog
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet workloads requires pyarrow (pip install pyarrow)") from e
+        
+        columns = pq.read_table(path).to_pydict()
+        return cls.from_columns(dataset or Path(path).stem, columns)
+    
+    @classmethod
+    def from_pattern_json(cls, path: str, dataset: Optional[str] = None) -> "WorkloadCatalog":
+        """
+        Load PatternConfig JSON written by apps/main.py (one config or a list of them)
+        
+        Profiler frequencies reported in bytes/s are converted to accesses per
+        second using the access size, and the working set from bytes to MB.
+        
+        Args:
+            path: JSON path
+            dataset: Dataset name (defaults to the file stem)
+            
+        Returns:
+            WorkloadCatalog
+        """
+        with open(path, "r") as f:
+            configs = json.load(f)
+        if isinstance(configs, dict):
+            configs = [configs]
+        
+        columns: Dict[str, List[Any]] = {"names": [], **{key: [] for key in NUMERIC_COLUMNS}}
+        for config in configs:
+            unit = config.get("unit") or {}
+            read_size = _number(config.get("read_size"), 1.)
+            write_size = _number(config.get("write_size"), 1.)
+            read_freq = _number(config.get("read_freq"))
+            write_freq = _number(config.get("write_freq"))
+            if unit.get("read_freq") == "bytes/s" and read_freq > 0:
+                read_freq /= read_size
+            if unit.get("write_freq") == "bytes/s" and write_freq > 0:
+                write_freq /= write_size
+            workingset = _number(config.get("workingset_size", config.get("workingset")))
+            if "workingset_size" in config and unit.get("workingset_size", "bytes") == "bytes" and workingset > 0:
+                workingset /= 1024. * 1024.
+            
+            columns["names"].append(config.get("benchmark_name") or config.get("exp_name") or "unknown")
+            columns["read_freq"].append(read_freq)
+            columns["write_freq"].append(write_freq)
+            columns["total_reads"].append(_number(config.get("total_reads")))
+            columns["total_writes"].append(_number(config.get("total_writes")))
+            columns["read_size"].append(read_size)
+            columns["write_size"].append(write_size)
+            columns["workingset"].append(workingset)
+            columns["total_ins"].append(_number(config.get("total_ins")))
+        return cls.from_columns(dataset or Path(path).stem, columns)
+    
+    @classmethod
+    def from_files(cls, paths: Sequence[str]) -> "WorkloadCatalog":
+        """
+        Load and concatenate workload files, dispatching on the file suffix
+        
+        Supported: .npy (catalog saved with save, memory-mapped), .csv,
+        .parquet and .json (PatternConfig output of apps/main.py).
+        
+        Args:
+            paths: Workload file paths
+            
+        Returns:
+            WorkloadCatalog with the files' rows in order
+        """
+        loaders = {".npy": cls.load, ".csv": cls.from_csv, ".parquet": cls.from_parquet,
+                   ".json": cls.from_pattern_json}
+        catalogs = []
+        for path in paths:
+            loader = loaders.get(Path(path).suffix.lower())
+            if loader is None:
+                raise ValueError(f"Unsupported workload file '{path}'; expected one of {', '.join(loaders)}")
+            catalogs.append(loader(path))
+        return catalogs[0] if len(catalogs) == 1 else cls.concatenate(catalogs)
+    
+    @classmethod
+    def concatenate(cls, catalogs: Sequence["WorkloadCatalog"]) -> "WorkloadCatalog":
+        """
+        Concatenate catalogs, widening the text columns as needed
+        
+        Args:
+            catalogs: Catalogs in row order
+            
+        Returns:
+            New WorkloadCatalog
+        """
+        tables = [catalog.table for catalog in catalogs]
+        if not tables:
+            return cls()
+        dtype = _table_dtype(
+            name_width=max(table.dtype["name"].itemsize // 4 for table in tables),
+            dataset_width=max(table.dtype["dataset"].itemsize // 4 for table in tables)
+        )
+        return cls(np.concatenate([table.astype(dtype) for table in tables]))
+    
+    def save(self, path: str):
+        """
+        Save the catalog as a .npy file that load can memory-map
+        
+        Args:
+            path: Output path
+        """
+        np.save(path, self.table, allow_pickle=False)
+    
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = "r") -> "WorkloadCatalog":
+        """
+        Open a catalog saved with save
+        
+        Args:
+            path: .npy path
+            mmap_mode: NumPy memory-map mode ("r" maps the file read-only; None reads it into memory)
+            
+        Returns:
+            WorkloadCatalog
+        """
+        table = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+        missing = [key for key in TEXT_COLUMNS + NUMERIC_COLUMNS if key not in (table.dtype.names or ())]
+        if missing:
+            raise ValueError(f"{path} is not a workload catalog (missing {', '.join(missing)})")
+        return cls(table)
+    
+    def select(self, datasets: Optional[Sequence[str]] = None, active: bool = False) -> "WorkloadCatalog":
+        """
+        Select rows by dataset and/or traffic
+        
+        Args:
+            datasets: Keep only rows of these datasets (all when None)
+            active: Keep only rows with reads, as the traffic sweeps do
+            
+        Returns:
+            WorkloadCatalog with the selected rows in order
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if datasets is not None:
+            mask &= np.isin(self.table["dataset"], list(datasets))
+        if active:
+            mask &= self.table["read_freq"] > 0
+        return WorkloadCatalog(self.table[mask])
+    
+    def traffic(self, datasets: Optional[Sequence[str]] = None) -> Tuple[List[str], List[float], List[float]]:
+        """
+        Returns the traffic points of the rows with reads, ready for a traffic sweep
+        
+        Args:
+            datasets: Restrict to these datasets (all when None)
+            
+        Returns:
+            Tuple of (benchmark names, reads/s, writes/s) lists in row order
+        """
+        selected = self.select(datasets, active=True).table
+        return (selected["name"].tolist(), selected["read_freq"].tolist(),
+                selected["write_freq"].tolist())
+
+
+def _table_dtype(name_width: int = 1, dataset_width: int = 1) -> np.dtype:
+    """Structured dtype of a catalog with the given text column widths"""
+    return np.dtype([("dataset", f"U{dataset_width}"), ("name", f"U{name_width}")] +
+                    [(key, "f8") for key in NUMERIC_COLUMNS])
+
+
+def _empty_table(rows: int, name_width: int = 1, dataset_width: int = 1) -> np.ndarray:
+    """Catalog table with every numeric column set to -1"""
+    table = np.zeros(rows, dtype=_table_dtype(name_width, dataset_width))
+    for key in NUMERIC_COLUMNS:
+        table[key] = -1.
+    return table
+
+
+def _number(value: Any, default: float = -1.) -> float:
+    """Converts a JSON value to float, using default for missing or non-numeric values"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
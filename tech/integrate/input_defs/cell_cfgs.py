@@ -13,13 +13,29 @@ class NVSimCellConfig:
     self.cell_ratio = cell_ratio
     self.access_type = access_type
 
+  def cell_file_header(self):
+    """ Returns the cell type and geometry lines of the NVSim cell file """
+    return ("-MemCellType: "+self.mem_cell_type+"\n"
+            + "-CellArea (F^2): %d\n" % self.cell_area
+            + "-CellAspectRatio: %f\n" % self.cell_ratio
+            + "-AccessType: "+self.access_type+"\n")
+
+  def cell_file_body(self):
+    """ Returns the technology-specific parameter lines of the NVSim cell file """
+    return ""
+
+  def cell_file_text(self):
+    """ Returns the complete contents of the NVSim cell file """
+    return self.cell_file_header() + self.cell_file_body()
+
   def generate_cell_file(self):
-    cell_file = open(self.cell_file_path, "w+")
-    cell_file.write("-MemCellType: "+self.mem_cell_type+"\n")
-    cell_file.write("-CellArea (F^2): %d\n" % self.cell_area)
-    cell_file.write("-CellAspectRatio: %f\n" % self.cell_ratio)
-    cell_file.write("-AccessType: "+self.access_type+"\n")
-    cell_file.close() 
+    with open(self.cell_file_path, "w+") as cell_file:
+      cell_file.write(self.cell_file_header())
+
+  def append_cell_file(self):
+    """ Appends necessary parameters to NVSim cell file to prepare for simulation """
+    with open(self.cell_file_path, "a+") as cell_file:
+      cell_file.write(self.cell_file_body())
 
 class SRAMCellConfig(NVSimCellConfig):
   def __init__(self,
@@ -52,27 +68,16 @@ class SRAMCellConfig(NVSimCellConfig):
     self.mem_cfg_base = "-MemoryCellInputFile: " + self.cell_file_path + "\n" + mem_cfg_base + "\n\n" #customize base string for each technology
     self.mlc = 1
 
-  def append_cell_file(self):
-    """ Appends necessary parameters to NVSim cell file to prepare for simulation
-
-    :param startHnd: Start index, defaults to 1
-    :type startHnd: int, optional
-    :param endHnd: End index, defaults to 0xFFFF
-    :type endHnd: int, optional
-    :param uuids: a list of UUID strings, defaults to None
-    :type uuids: list, optional
-    :return: List of returned :class:`bluepy.btle.Characteristic` objects
-    :rtype: list
-    """
-    cell_file = open(self.cell_file_path, "a+")
-    cell_file.write("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
-    cell_file.write("-SRAMCellNMOSWidth (F): %f\n" % self.nmos_width)
-    cell_file.write("-SRAMCellPMOSWidth (F): %f\n" % self.pmos_width)
-    cell_file.write("-ReadMode: "+self.read_mode+"\n")
-    cell_file.write("-ReadVoltage (V): 1.1\n")
-    cell_file.write("-MinSenseVoltage (mV): 80\n")
-    cell_file.write("-Stitching: 16\n")
-    cell_file.close()
+  def cell_file_body(self):
+    lines = []
+    lines.append("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
+    lines.append("-SRAMCellNMOSWidth (F): %f\n" % self.nmos_width)
+    lines.append("-SRAMCellPMOSWidth (F): %f\n" % self.pmos_width)
+    lines.append("-ReadMode: "+self.read_mode+"\n")
+    lines.append("-ReadVoltage (V): 1.1\n")
+    lines.append("-MinSenseVoltage (mV): 80\n")
+    lines.append("-Stitching: 16\n")
+    return "".join(lines)
 
 class RRAMCellConfig(NVSimCellConfig):
   def __init__(self,
@@ -147,33 +152,33 @@ class RRAMCellConfig(NVSimCellConfig):
     self.read_floating = read_floating
     self.mem_cfg_base = "-MemoryCellInputFile: " + self.cell_file_path + "\n" + mem_cfg_base + "\n\n" #customize base string for each technology
 
-  def append_cell_file(self):
-    cell_file = open(self.cell_file_path, "a+")
-    cell_file.write("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
-    cell_file.write("-ResistanceOnAtSetVoltage (ohm): %d\n" % self.r_on_set_v)
-    cell_file.write("-ResistanceOffAtSetVoltage (ohm): %d\n" % self.r_off_set_v)
-    cell_file.write("-ResistanceOnAtResetVoltage (ohm): %d\n" % self.r_on_reset_v)
-    cell_file.write("-ResistanceOffAtResetVoltage (ohm): %d\n" % self.r_off_reset_v)
-    cell_file.write("-ResistanceOnAtReadVoltage (ohm): %d\n" % self.r_on_read_v)
-    cell_file.write("-ResistanceOffAtReadVoltage (ohm): %d\n" % self.r_off_read_v)
-    cell_file.write("-ResistanceOnAtHalfResetVoltage (ohm): %d\n" % self.r_on_half_reset)
-    cell_file.write("-CapacitanceOn (F): "+self.cap_on+"\n")
-    cell_file.write("-CapacitanceOff (F): "+self.cap_off+"\n")
-    cell_file.write("-ReadMode: "+self.read_mode+"\n")
-    cell_file.write("-ReadVoltage (V): %f\n" % self.read_voltage)
-    cell_file.write("-ReadPower (uW): %f\n" % self.read_power)
-    cell_file.write("-ResetMode: " + self.reset_mode+"\n")
-    cell_file.write("-ResetVoltage (V): "+str(self.reset_voltage) +"\n")
-    cell_file.write("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
-    cell_file.write("-ResetEnergy (pJ): " + str(self.reset_energy) + "\n")
-    cell_file.write("-SetMode: "+self.set_mode+"\n")
-    cell_file.write("-SetVoltage (V): "+str(self.set_voltage) +"\n")
-    cell_file.write("-SetPulse (ns): "+str(self.set_pulse) +"\n")
-    cell_file.write("-SetEnergy (pJ): "+str(self.set_energy) + "\n")
+  def cell_file_body(self):
+    lines = []
+    lines.append("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
+    lines.append("-ResistanceOnAtSetVoltage (ohm): %d\n" % self.r_on_set_v)
+    lines.append("-ResistanceOffAtSetVoltage (ohm): %d\n" % self.r_off_set_v)
+    lines.append("-ResistanceOnAtResetVoltage (ohm): %d\n" % self.r_on_reset_v)
+    lines.append("-ResistanceOffAtResetVoltage (ohm): %d\n" % self.r_off_reset_v)
+    lines.append("-ResistanceOnAtReadVoltage (ohm): %d\n" % self.r_on_read_v)
+    lines.append("-ResistanceOffAtReadVoltage (ohm): %d\n" % self.r_off_read_v)
+    lines.append("-ResistanceOnAtHalfResetVoltage (ohm): %d\n" % self.r_on_half_reset)
+    lines.append("-CapacitanceOn (F): "+self.cap_on+"\n")
+    lines.append("-CapacitanceOff (F): "+self.cap_off+"\n")
+    lines.append("-ReadMode: "+self.read_mode+"\n")
+    lines.append("-ReadVoltage (V): %f\n" % self.read_voltage)
+    lines.append("-ReadPower (uW): %f\n" % self.read_power)
+    lines.append("-ResetMode: " + self.reset_mode+"\n")
+    lines.append("-ResetVoltage (V): "+str(self.reset_voltage) +"\n")
+    lines.append("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
+    lines.append("-ResetEnergy (pJ): " + str(self.reset_energy) + "\n")
+    lines.append("-SetMode: "+self.set_mode+"\n")
+    lines.append("-SetVoltage (V): "+str(self.set_voltage) +"\n")
+    lines.append("-SetPulse (ns): "+str(self.set_pulse) +"\n")
+    lines.append("-SetEnergy (pJ): "+str(self.set_energy) + "\n")
     if self.mlc > 1:
-      cell_file.write("-CellLevels: "+str(2**self.mlc) + "\n")
+      lines.append("-CellLevels: "+str(2**self.mlc) + "\n")
 
-    cell_file.close()
+    return "".join(lines)
 
 class STTRAMCellConfig(NVSimCellConfig):
   def __init__(self,
@@ -234,24 +239,24 @@ class STTRAMCellConfig(NVSimCellConfig):
     self.read_floating = read_floating
     self.mem_cfg_base = "-MemoryCellInputFile: " + self.cell_file_path + "\n" + mem_cfg_base + "\n\n" #customize base string for each technology
 
-  def append_cell_file(self):
-    cell_file = open(self.cell_file_path, "a+")
-    cell_file.write("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
-    cell_file.write("-ResistanceOn (ohm): %d\n" % self.r_on)
-    cell_file.write("-ResistanceOff (ohm): %d\n" % self.r_off)
-    cell_file.write("-ReadMode: "+self.read_mode+"\n")
-    cell_file.write("-ReadVoltage (V): %f\n" % self.read_voltage)
-    cell_file.write("-ReadPower (uW): %f\n" % self.read_power)
-    cell_file.write("-ResetMode: " + self.reset_mode+"\n")
-    cell_file.write("-ResetCurrent (uA): "+str(self.reset_current) +"\n")
-    cell_file.write("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
-    cell_file.write("-ResetEnergy (pJ): " + str(self.reset_energy) + "\n")
-    cell_file.write("-SetMode: "+self.set_mode+"\n")
-    cell_file.write("-SetCurrent (uA): "+str(self.set_current) +"\n")
-    cell_file.write("-SetPulse (ns): "+str(self.set_pulse) +"\n")
-    cell_file.write("-SetEnergy (pJ): "+str(self.set_energy) + "\n")
+  def cell_file_body(self):
+    lines = []
+    lines.append("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
+    lines.append("-ResistanceOn (ohm): %d\n" % self.r_on)
+    lines.append("-ResistanceOff (ohm): %d\n" % self.r_off)
+    lines.append("-ReadMode: "+self.read_mode+"\n")
+    lines.append("-ReadVoltage (V): %f\n" % self.read_voltage)
+    lines.append("-ReadPower (uW): %f\n" % self.read_power)
+    lines.append("-ResetMode: " + self.reset_mode+"\n")
+    lines.append("-ResetCurrent (uA): "+str(self.reset_current) +"\n")
+    lines.append("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
+    lines.append("-ResetEnergy (pJ): " + str(self.reset_energy) + "\n")
+    lines.append("-SetMode: "+self.set_mode+"\n")
+    lines.append("-SetCurrent (uA): "+str(self.set_current) +"\n")
+    lines.append("-SetPulse (ns): "+str(self.set_pulse) +"\n")
+    lines.append("-SetEnergy (pJ): "+str(self.set_energy) + "\n")
 
-    cell_file.close()
+    return "".join(lines)
 
 class PCMCellConfig(NVSimCellConfig):
   def __init__(self,
@@ -306,22 +311,22 @@ class PCMCellConfig(NVSimCellConfig):
     self.mlc = mlc
     self.mem_cfg_base = "-MemoryCellInputFile: " + self.cell_file_path + "\n" + mem_cfg_base + "\n\n" #customize base string for each technology
 
-  def append_cell_file(self):
-    cell_file = open(self.cell_file_path, "a+")
-    cell_file.write("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
-    cell_file.write("-ResistanceOn (ohm): %d\n" % self.r_on)
-    cell_file.write("-ResistanceOff (ohm): %d\n" % self.r_off)
-    cell_file.write("-ReadMode: "+self.read_mode+"\n")
-    cell_file.write("-ReadVoltage (V): %f\n" % self.read_voltage)
-    cell_file.write("-ReadEnergy (pJ): %f\n" % self.read_energy)
-    cell_file.write("-ResetMode: " + self.reset_mode+"\n")
-    cell_file.write("-ResetCurrent (uA): "+str(self.reset_current) +"\n")
-    cell_file.write("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
-    cell_file.write("-SetMode: "+self.set_mode+"\n")
-    cell_file.write("-SetCurrent (uA): "+str(self.set_current) +"\n")
-    cell_file.write("-SetPulse (ns): "+str(self.set_pulse) +"\n")
+  def cell_file_body(self):
+    lines = []
+    lines.append("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
+    lines.append("-ResistanceOn (ohm): %d\n" % self.r_on)
+    lines.append("-ResistanceOff (ohm): %d\n" % self.r_off)
+    lines.append("-ReadMode: "+self.read_mode+"\n")
+    lines.append("-ReadVoltage (V): %f\n" % self.read_voltage)
+    lines.append("-ReadEnergy (pJ): %f\n" % self.read_energy)
+    lines.append("-ResetMode: " + self.reset_mode+"\n")
+    lines.append("-ResetCurrent (uA): "+str(self.reset_current) +"\n")
+    lines.append("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
+    lines.append("-SetMode: "+self.set_mode+"\n")
+    lines.append("-SetCurrent (uA): "+str(self.set_current) +"\n")
+    lines.append("-SetPulse (ns): "+str(self.set_pulse) +"\n")
 
-    cell_file.close()
+    return "".join(lines)
 
 
 class FeFETCellConfig(NVSimCellConfig):
@@ -400,33 +405,33 @@ class FeFETCellConfig(NVSimCellConfig):
     self.read_floating = read_floating
     self.mem_cfg_base = "-MemoryCellInputFile: " + self.cell_file_path + "\n" + mem_cfg_base + "\n\n" #customize base string for each technology
 
-  def append_cell_file(self):
-    cell_file = open(self.cell_file_path, "a+")
-    cell_file.write("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
-    cell_file.write("-ResistanceOnAtSetVoltage (ohm): %d\n" % self.r_on_set_v)
-    cell_file.write("-ResistanceOffAtSetVoltage (ohm): %d\n" % self.r_off_set_v)
-    cell_file.write("-ResistanceOnAtResetVoltage (ohm): %d\n" % self.r_on_reset_v)
-    cell_file.write("-ResistanceOffAtResetVoltage (ohm): %d\n" % self.r_off_reset_v)
-    cell_file.write("-ResistanceOnAtReadVoltage (ohm): %d\n" % self.r_on_read_v)
-    cell_file.write("-ResistanceOffAtReadVoltage (ohm): %d\n" % self.r_off_read_v)
-    cell_file.write("-ResistanceOnAtHalfResetVoltage (ohm): %d\n" % self.r_on_half_reset)
-    cell_file.write("-CapacitanceOn (F): "+self.cap_on+"\n")
-    cell_file.write("-CapacitanceOff (F): "+self.cap_off+"\n")
-    cell_file.write("-ReadMode: "+self.read_mode+"\n")
-    cell_file.write("-ReadVoltage (V): %f\n" % self.read_voltage)
-    cell_file.write("-ReadPower (uW): %f\n" % self.read_power)
-    cell_file.write("-ResetMode: " + self.reset_mode+"\n")
-    cell_file.write("-ResetVoltage (V): "+str(self.reset_voltage) +"\n")
-    cell_file.write("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
-    cell_file.write("-ResetEnergy (pJ): " + str(self.reset_energy) + "\n")
-    cell_file.write("-SetMode: "+self.set_mode+"\n")
-    cell_file.write("-SetVoltage (V): "+str(self.set_voltage) +"\n")
-    cell_file.write("-SetPulse (ns): "+str(self.set_pulse) +"\n")
-    cell_file.write("-SetEnergy (pJ): "+str(self.set_energy) + "\n")
+  def cell_file_body(self):
+    lines = []
+    lines.append("-AccessCMOSWidth (F): %f\n" % self.access_CMOS_width)
+    lines.append("-ResistanceOnAtSetVoltage (ohm): %d\n" % self.r_on_set_v)
+    lines.append("-ResistanceOffAtSetVoltage (ohm): %d\n" % self.r_off_set_v)
+    lines.append("-ResistanceOnAtResetVoltage (ohm): %d\n" % self.r_on_reset_v)
+    lines.append("-ResistanceOffAtResetVoltage (ohm): %d\n" % self.r_off_reset_v)
+    lines.append("-ResistanceOnAtReadVoltage (ohm): %d\n" % self.r_on_read_v)
+    lines.append("-ResistanceOffAtReadVoltage (ohm): %d\n" % self.r_off_read_v)
+    lines.append("-ResistanceOnAtHalfResetVoltage (ohm): %d\n" % self.r_on_half_reset)
+    lines.append("-CapacitanceOn (F): "+self.cap_on+"\n")
+    lines.append("-CapacitanceOff (F): "+self.cap_off+"\n")
+    lines.append("-ReadMode: "+self.read_mode+"\n")
+    lines.append("-ReadVoltage (V): %f\n" % self.read_voltage)
+    lines.append("-ReadPower (uW): %f\n" % self.read_power)
+    lines.append("-ResetMode: " + self.reset_mode+"\n")
+    lines.append("-ResetVoltage (V): "+str(self.reset_voltage) +"\n")
+    lines.append("-ResetPulse (ns): "+ str(self.reset_pulse) +"\n")
+    lines.append("-ResetEnergy (pJ): " + str(self.reset_energy) + "\n")
+    lines.append("-SetMode: "+self.set_mode+"\n")
+    lines.append("-SetVoltage (V): "+str(self.set_voltage) +"\n")
+    lines.append("-SetPulse (ns): "+str(self.set_pulse) +"\n")
+    lines.append("-SetEnergy (pJ): "+str(self.set_energy) + "\n")
     if self.mlc > 1:
-      cell_file.write("-CellLevels: "+str(2**self.mlc) + "\n")
+      lines.append("-CellLevels: "+str(2**self.mlc) + "\n")
 
-    cell_file.close()
+    return "".join(lines)
 
 if __name__ == '__main__':
   #test cell def generation
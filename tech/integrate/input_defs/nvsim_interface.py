@@ -1,4 +1,5 @@
 from .cell_cfgs import *
+from .nvsim_parser import parse_nvsim_text
 
 class NVSimInputConfig:
   def __init__(self,
@@ -45,7 +46,8 @@ class NVSimOutputConfig: #initialized to 16nm SRAM, 4MB
 		write_energy=-1, #nJ/access
 		leakage_power=-1, #mW
 		area=-1, #mm^2
-		area_efficiency=-1 #percentage
+		area_efficiency=-1, #percentage
+		report=None #parsed NVSimRun with full breakdowns, if available
 		):
     # define all parameters
     self.exp_name = exp_name
@@ -59,6 +61,7 @@ class NVSimOutputConfig: #initialized to 16nm SRAM, 4MB
     self.leakage_power = leakage_power
     self.area = area
     self.area_efficiency = area_efficiency
+    self.report = report
 
   def print_summary(self):
     """ Prints a summary of the parsed NVSim output results
@@ -89,85 +92,21 @@ def parse_nvsim_output(filepath='output_examples/sram_0', input_cfg=NVSimInputCo
   base = NVSimOutputConfig(input_cfg=input_cfg)
 
   with open(filepath, 'r') as f:
-    lines = f.readlines()
+    run = parse_nvsim_text(f.read())
+
+  metrics = run.metrics(getattr(input_cfg.cell_type, 'mem_cell_type', input_cfg.cell_type))
+  base.read_latency = metrics['read_latency_ns']
+  base.read_bw = metrics['read_bandwidth_gbps']
+  base.read_energy = metrics['read_energy_pj']
+  base.write_latency = metrics['write_latency_ns']
+  base.write_bw = metrics['write_bandwidth_gbps']
+  base.write_energy = metrics['write_energy_pj']
+  base.leakage_power = metrics['leakage_power_mw']
+  base.area = metrics['area_mm2']
+  base.area_efficiency = metrics['area_efficiency']
+  # keep tag array, bank and mat breakdowns around for analysis
+  base.report = run
 
-  # Get rid of new lines
-  lines = map(lambda x: x.rstrip(), lines)
-
-  for line in lines:
-    if ' - Total Area =' in line and (base.area == -1):
-      # sloppy fix, skip to end of line
-      if "=" in line[line.index("=")+1:]:
-        line = line[line.index("=")+1:]
-      base.area = float(line[line.index("=")+1:][:-4])
-      if line[-4:] == "um^2":
-        base.area = base.area / (1000.)**2
-    elif ' -  Read Latency' in line and (base.read_latency == -1):
-      base.read_latency = float(line[line.index("=")+1:][:-2])
-      if line[-2:] == "us":
-        base.read_latency = base.read_latency * 1000.
-      if line[-2:] == "ps":
-        base.read_latency = base.read_latency / 1000.
-      if line[-2:] == "ms":
-        base.read_latency = base.read_latency * 1000000.
-    elif ' - Area Efficiency =' in line:
-      base.area_efficiency = float(line[line.index("=")+1:][:-1])
-    elif ' - Read Bandwidth' in line:
-      base.read_bw = float(line[line.index("=")+1:][:-4])
-      if line[-4:] == "MB/s":
-        base.read_bw = base.read_bw / 1024.
-      if line[-4:] == "KB/s":
-        base.read_bw = base.read_bw / 1024. / 1024.
-    elif ' - Write Bandwidth' in line:
-      base.write_bw = float(line[line.index("=")+1:][:-4])
-      if line[-4:] == "MB/s":
-        base.write_bw = base.write_bw / 1024.
-      if line[-4:] == "KB/s":
-        base.write_bw = base.write_bw / 1024. / 1024.
-    elif ' -  Read Dynamic Energy ' in line:
-      base.read_energy = float(line[line.index("=")+1:][:-2])
-      if line[-2:] == "nJ":
-        base.read_energy = base.read_energy * 1000.
-      if line[-2:] == "uJ":
-        base.read_energy = base.read_energy * 1000. * 1000.
-    elif ' - Leakage Power ' in line:
-      base.leakage_power = float(line[line.index("=")+1:][:-2])
-      if line[-2:] == "uW":
-        base.leakage_power = base.leakage_power / 1000.
-    elif ' - Write Latency' in line and (base.write_latency == -1):
-      base.write_latency = float(line[line.index("=")+1:][:-2])
-      if line[-2:] == "us":
-        base.write_latency = base.write_latency * 1000.
-      if line[-2:] == "ps":
-        base.write_latency = base.write_latency / 1000.
-      if line[-2:] == "ms":
-        base.write_latency = base.write_latency * 1000000.
-    elif ' - Write Dynamic Energy ' in line:
-      base.write_energy = float(line[line.index("=")+1:][:-2])
-      if line[-2:] == "nJ":
-        base.write_energy = base.write_energy * 1000.
-      if line[-2:] == "uJ":
-        base.write_energy = base.write_energy * 1000. * 1000.
-
-
-    if input_cfg.cell_type.mem_cell_type == "SRAM":
-      continue
-    else:
-      if ' - SET Latency' in line:
-        base.write_latency = float(line[line.index("=")+1:][:-2])
-        if line[-2:] == "us":
-          base.write_latency = base.write_latency * 1000.
-        if line[-2:] == "ps":
-          base.write_latency = base.write_latency / 1000.
-        if line[-2:] == "ms":
-          base.write_latency = base.write_latency * 1000000.
-      elif ' - SET Dynamic Energy ' in line:
-        base.write_energy = float(line[line.index("=")+1:][:-2])
-        if line[-2:] == "nJ":
-          base.write_energy = base.write_energy * 1000.
-        if line[-2:] == "uJ":
-          base.write_energy = base.write_energy * 1000. * 1000.
-        
   return base
 
 if __name__ == '__main__':
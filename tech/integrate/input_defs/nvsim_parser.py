@@ -0,0 +1,435 @@
+"""
+NVSim Output Parser
+
+This module provides the NVSim text output parser shared by the array
+characterization interface and the legacy input_defs helpers. A run is split
+into its sections with plain string searches; headline metrics come from one
+precompiled regex over the cache summary and data array results, while the
+full breakdowns (tag array, per-bank H-tree and mat/subarray components) are
+parsed in a single pass over a section the first time they are accessed. All
+values are normalized through a single unit table.
+"""
+
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from functools import lru_cache
+import re
+import sys
+import time
+
+
+# unit -> (key suffix, scale to the suffix unit)
+UNIT_TABLE: Dict[str, Tuple[str, float]] = {
+    # latency
+    'ps': ('ns', 1e-3),
+    'ns': ('ns', 1.),
+    'us': ('ns', 1e3),
+    'ms': ('ns', 1e6),
+    's': ('ns', 1e9),
+    # energy
+    'pJ': ('pj', 1.),
+    'nJ': ('pj', 1e3),
+    'uJ': ('pj', 1e6),
+    'mJ': ('pj', 1e9),
+    'J': ('pj', 1e12),
+    # power
+    'pW': ('mw', 1e-9),
+    'nW': ('mw', 1e-6),
+    'uW': ('mw', 1e-3),
+    'mW': ('mw', 1.),
+    'W': ('mw', 1e3),
+    # bandwidth (binary prefixes, as the original parsers used)
+    'B/s': ('gbps', 1. / 1024. ** 3),
+    'KB/s': ('gbps', 1. / 1024. ** 2),
+    'MB/s': ('gbps', 1. / 1024.),
+    'GB/s': ('gbps', 1.),
+    'TB/s': ('gbps', 1024.),
+    # area
+    'nm^2': ('mm2', 1e-12),
+    'um^2': ('mm2', 1e-6),
+    'mm^2': ('mm2', 1.),
+    'm^2': ('mm2', 1e6),
+    # length
+    'pm': ('um', 1e-6),
+    'nm': ('um', 1e-3),
+    'um': ('um', 1.),
+    'mm': ('um', 1e3),
+    'm': ('um', 1e6),
+    '%': ('percent', 1.),
+}
+
+_VALUE = r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[-+]?inf|nan)([A-Za-z%/]*(?:\^2)?)'
+_VALUE_RE = re.compile(_VALUE)
+# ' - Label = value' items (the value after the last '=' on the line)
+_HEADLINE_RE = re.compile(r'\n ?- +([A-Za-z][^=\n]*?) *= *(?:[^=\n]*= *)?' + _VALUE)
+_SLUG_RE = re.compile(r'[^0-9a-z]+')
+_MAX_DEPTH = 12
+
+# unit -> ('_' + key suffix, scale) as appended to parsed keys
+_UNIT_SUFFIXES = {unit: ('_' + suffix, scale) for unit, (suffix, scale) in UNIT_TABLE.items()}
+
+
+@lru_cache(maxsize=None)
+def _label_key(label: str) -> Tuple[int, str]:
+    """
+    Split a raw NVSim label into its tree depth and key name
+    
+    Unprefixed lines are headings (0), ' - ' items are their children (1) and
+    each '|---' level nests one deeper, three columns at a time. Labels repeat
+    across runs, so the result is memoized on the raw text.
+    
+    Args:
+        label: Text before the separator (e.g. '    |--- Predecoder Latency ')
+        
+    Returns:
+        Tuple of (depth, key name such as 'predecoder_latency')
+    """
+    name = label.lstrip(' \t|-')
+    lead = label[:len(label) - len(name)]
+    pipe = lead.find('|')
+    if pipe >= 0:
+        depth = min(2 + (pipe - 1) // 3, _MAX_DEPTH)
+    else:
+        depth = 1 if '-' in lead else 0
+    return depth, _SLUG_RE.sub('_', name.lower()).strip('_')
+
+
+def convert_value(number: str, unit: str) -> Tuple[float, str]:
+    """
+    Convert a number and NVSim unit through UNIT_TABLE
+    
+    Args:
+        number: Numeric text (e.g. '392.271')
+        unit: Unit text (e.g. 'ps')
+        
+    Returns:
+        Tuple of (converted value, key suffix such as '_ns'; empty for unknown units)
+    """
+    unit = _UNIT_SUFFIXES.get(unit)
+    if unit is None:
+        return float(number), ''
+    return float(number) * unit[1], unit[0]
+
+
+def _parse_block(text: str, start: int, end: int, textual: bool) -> Dict[str, Any]:
+    """
+    Parse the 'label = value' and 'label: value' lines of one section in a single pass
+    
+    Keys are dotted paths that follow NVSim's indentation tree, e.g.
+    'timing.read_latency.mat_latency.predecoder_latency_ns'.
+    
+    Args:
+        text: NVSim run output
+        start: Offset where the section starts
+        end: Offset where the section ends
+        textual: Keep values as the raw strings (cell, design and configuration
+            blocks) instead of converting numbers (result blocks)
+            
+    Returns:
+        Dictionary mapping dotted keys to values; the first occurrence wins
+    """
+    parsed: Dict[str, Any] = {}
+    # prefixes[d] is the dotted key of the enclosing item for lines at depth d
+    prefixes = [''] * (_MAX_DEPTH + 3)
+    
+    for line in text[start:end].splitlines():
+        label, sep, rhs = line.partition('=')
+        if not sep:
+            label, sep, rhs = line.partition(':')
+            if not sep:
+                # headers and rules end any open nesting
+                prefixes = [''] * (_MAX_DEPTH + 3)
+                continue
+        depth, name = _label_key(label)
+        if not name:
+            continue
+        key = prefixes[depth] + name
+        prefixes[depth + 1] = prefixes[depth + 2] = key + '.'
+        if textual:
+            rhs = rhs.strip()
+            if rhs:
+                parsed.setdefault(key, rhs)
+        elif sep == '=':
+            match = _VALUE_RE.match(rhs.rpartition('=')[2].lstrip())
+            if match is not None:
+                value, suffix = convert_value(*match.groups())
+                parsed.setdefault(key + suffix, value)
+        # descriptive ':' lines inside result blocks (e.g. 'Access Mode: Normal') only nest
+    
+    return parsed
+
+
+def _parse_headline(text: str, start: int, end: int) -> Dict[str, float]:
+    """
+    Parse only the top-level ' - Label = value' items of a result section
+    
+    Args:
+        text: NVSim run output
+        start: Offset where the section starts
+        end: Offset where the section ends
+        
+    Returns:
+        Dictionary mapping key names (e.g. 'read_latency_ns') to values
+    """
+    parsed: Dict[str, float] = {}
+    for label, number, unit in _HEADLINE_RE.findall(text, start, end):
+        value, suffix = convert_value(number, unit)
+        parsed.setdefault(_label_key(label)[1] + suffix, value)
+    return parsed
+
+
+class NVSimArrayReport:
+    """
+    CONFIGURATION and RESULT blocks of one NVSim array (data or tag)
+    
+    ``configuration`` maps dotted keys to the raw strings NVSim prints (e.g.
+    ``'bank_organization'`` -> ``'32 x 16'``) and ``results`` maps dotted keys to
+    floats in ns / pJ / mW / GB/s / mm^2 / um / percent, with the unit appended
+    to the last key component. For example ``'timing.read_latency_ns'`` is the
+    array read latency, ``'timing.read_latency.h_tree_latency_ns'`` the bank-level
+    H-tree part of it and ``'power.read_dynamic_energy.mat_dynamic_energy_pj'``
+    the per-mat read energy. Both are parsed on first access.
+    """
+    
+    def __init__(self, text: str = '', start: int = 0, end: int = 0):
+        self._text = text
+        self._start = start
+        self._end = end
+        result_at = text.find('RESULT', start, end)
+        self._result_at = result_at if result_at >= 0 else end
+        self._configuration: Optional[Dict[str, str]] = None
+        self._results: Optional[Dict[str, float]] = None
+        self._headline: Optional[Dict[str, float]] = None
+    
+    @property
+    def configuration(self) -> Dict[str, str]:
+        if self._configuration is None:
+            self._configuration = _parse_block(self._text, self._start, self._result_at, textual=True)
+        return self._configuration
+    
+    @property
+    def results(self) -> Dict[str, float]:
+        if self._results is None:
+            self._results = _parse_block(self._text, self._result_at, self._end, textual=False)
+        return self._results
+    
+    @property
+    def headline(self) -> Dict[str, float]:
+        """Top-level results (e.g. 'read_latency_ns') without parsing the breakdowns"""
+        if self._headline is None:
+            self._headline = _parse_headline(self._text, self._result_at, self._end)
+        return self._headline
+    
+    def get(self, key: str, default: float = -1.0) -> float:
+        """Return a result value by dotted key, or default when NVSim did not report it"""
+        return self.results.get(key, default)
+    
+    def organization(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Return bank, mat and subarray organization as (rows, columns) tuples
+        
+        Returns:
+            Dictionary with 'bank', 'mat' and 'subarray' entries that NVSim reported
+        """
+        organization = {}
+        for name, key in (('bank', 'bank_organization'), ('mat', 'mat_organization'),
+                          ('subarray', 'mat_organization.subarray_size')):
+            numbers = re.findall(r'\d+', self.configuration.get(key, ''))
+            if len(numbers) >= 2:
+                organization[name] = (int(numbers[0]), int(numbers[1]))
+        return organization
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of the report"""
+        return {'configuration': dict(self.configuration), 'results': dict(self.results),
+                'organization': {k: list(v) for k, v in self.organization().items()}}
+
+
+class NVSimRun:
+    """
+    Output of a single NVSim invocation
+    
+    Sections are located when the run is created and parsed on first access.
+    
+    Attributes:
+        cell: Memory cell description printed before the design specification
+        design: Design specification (target, capacity, associativity, ...)
+        summary: Cache summary results (empty for non-cache design targets)
+        data: Data array report (the only array for non-cache design targets)
+        tag: Tag array report, or None when NVSim did not model one
+        finished: Whether NVSim printed its completion marker
+    """
+    
+    def __init__(self, text: str = '', finished: bool = False):
+        self.text = text
+        self.finished = finished
+        end = len(text)
+        
+        design_at = text.find('DESIGN SPECIFICATION')
+        summary_at = text.find('CACHE DESIGN -- SUMMARY')
+        data_at = text.find('CACHE DATA ARRAY')
+        tag_at = text.find('CACHE TAG ARRAY')
+        if data_at < 0:
+            # non-cache design targets print a single array without a section title
+            data_at = text.find('CONFIGURATION', max(design_at, 0))
+        
+        self._cell_bounds = (0, self._first_of(end, design_at, summary_at, data_at))
+        self._design_bounds = (design_at, self._first_of(end, summary_at, data_at)) if design_at >= 0 else (0, 0)
+        self._summary_bounds = (summary_at, self._first_of(end, data_at, tag_at)) if summary_at >= 0 else (0, 0)
+        self.data = NVSimArrayReport(text, data_at, tag_at if tag_at > data_at else end) if data_at >= 0 \
+            else NVSimArrayReport()
+        self.tag = NVSimArrayReport(text, tag_at, end) if tag_at >= 0 else None
+        
+        self._cell: Optional[Dict[str, str]] = None
+        self._design: Optional[Dict[str, str]] = None
+        self._summary: Optional[Dict[str, float]] = None
+    
+    @staticmethod
+    def _first_of(default: int, *offsets: int) -> int:
+        """Return the smallest non-negative offset, or default"""
+        return min((offset for offset in offsets if offset >= 0), default=default)
+    
+    @property
+    def cell(self) -> Dict[str, str]:
+        if self._cell is None:
+            self._cell = _parse_block(self.text, *self._cell_bounds, textual=True)
+        return self._cell
+    
+    @property
+    def design(self) -> Dict[str, str]:
+        if self._design is None:
+            self._design = _parse_block(self.text, *self._design_bounds, textual=True)
+        return self._design
+    
+    @property
+    def summary(self) -> Dict[str, float]:
+        if self._summary is None:
+            self._summary = _parse_block(self.text, *self._summary_bounds, textual=False)
+        return self._summary
+    
+    def has_results(self) -> bool:
+        """Return True if the run contains any array results"""
+        return self.data._result_at < self.data._end
+    
+    def metrics(self, memory_type: str = 'SRAM') -> Dict[str, float]:
+        """
+        Return the headline array metrics used throughout the explorer
+        
+        Metrics come from the data array, except for area which is the whole
+        cache (data plus tag) when a cache summary exists. For cells that
+        report separate SET/RESET operations, write latency and energy are the
+        larger of the two. Anything NVSim did not report is -1.0. Breakdown
+        lines are not parsed.
+        
+        Args:
+            memory_type: Type of memory
+            
+        Returns:
+            Dictionary with read/write latency, energy, bandwidth, leakage, area and area efficiency
+        """
+        data = self.data.headline
+        write_latency = data.get('write_latency_ns', -1.0)
+        write_energy = data.get('write_dynamic_energy_pj', -1.0)
+        if memory_type != 'SRAM' and 'set_latency_ns' in data:
+            # SET/RESET cells: a write takes the slower of the two, as NVSim models it
+            write_latency = max(data['set_latency_ns'], data.get('reset_latency_ns', -1.0))
+            write_energy = max(data.get('set_dynamic_energy_pj', -1.0), data.get('reset_dynamic_energy_pj', -1.0))
+        
+        summary = _parse_headline(self.text, *self._summary_bounds)
+        
+        return {
+            'read_latency_ns': data.get('read_latency_ns', -1.0),
+            'write_latency_ns': write_latency,
+            'read_energy_pj': data.get('read_dynamic_energy_pj', -1.0),
+            'write_energy_pj': write_energy,
+            'leakage_power_mw': data.get('leakage_power_mw', -1.0),
+            'area_mm2': summary.get('total_area_mm2', data.get('total_area_mm2', -1.0)),
+            'read_bandwidth_gbps': data.get('read_bandwidth_gbps', -1.0),
+            'write_bandwidth_gbps': data.get('write_bandwidth_gbps', -1.0),
+            'area_efficiency': data.get('area_efficiency_percent', -1.0)
+        }
+    
+    def breakdown(self) -> Dict[str, Any]:
+        """
+        Return the cache summary and per-array breakdowns as plain dictionaries
+        
+        Returns:
+            Dictionary with 'summary', 'data' and (for caches) 'tag' entries
+        """
+        breakdown = {'summary': dict(self.summary), 'data': self.data.to_dict()}
+        if self.tag is not None:
+            breakdown['tag'] = self.tag.to_dict()
+        return breakdown
+
+
+def iter_nvsim_runs(text: str) -> Iterator[NVSimRun]:
+    """
+    Split NVSim output into one NVSimRun per invocation
+    
+    Concatenated logs are split on NVSim's 'Finished!' marker; a trailing run
+    without the marker (e.g. a truncated log) is yielded if it has results.
+    
+    Args:
+        text: NVSim output, possibly containing several runs
+        
+    Yields:
+        NVSimRun objects in the order they appear
+    """
+    start = 0
+    while True:
+        finished_at = text.find('Finished!', start)
+        if finished_at < 0:
+            break
+        yield NVSimRun(text[start:finished_at], finished=True)
+        start = finished_at + len('Finished!')
+    
+    run = NVSimRun(text[start:])
+    if run.has_results():
+        yield run
+
+
+def parse_nvsim_runs(text: str) -> List[NVSimRun]:
+    """
+    Split every NVSim invocation contained in text
+    
+    Args:
+        text: NVSim output, possibly containing several runs
+        
+    Returns:
+        List of NVSimRun objects
+    """
+    return list(iter_nvsim_runs(text))
+
+
+def parse_nvsim_text(text: str) -> NVSimRun:
+    """
+    Return the output of a single NVSim invocation
+    
+    Args:
+        text: NVSim output
+        
+    Returns:
+        The first NVSimRun in text, or an empty NVSimRun if none was found
+    """
+    for run in iter_nvsim_runs(text):
+        return run
+    return NVSimRun()
+
+
+if __name__ == '__main__':
+    # Throughput check on archived logs: python nvsim_parser.py [--breakdowns] <nvsim .out files>
+    breakdowns = '--breakdowns' in sys.argv[1:]
+    total_runs = 0
+    total_bytes = 0
+    start = time.perf_counter()
+    for filepath in [arg for arg in sys.argv[1:] if not arg.startswith('--')]:
+        with open(filepath, 'r') as f:
+            text = f.read()
+        total_bytes += len(text)
+        for run in iter_nvsim_runs(text):
+            run.metrics()
+            if breakdowns:
+                run.breakdown()
+            total_runs += 1
+    elapsed = time.perf_counter() - start
+    print(f"Parsed {total_runs} runs ({total_bytes / 1e6:.1f} MB) in {elapsed:.3f}s"
+          f" ({total_runs / max(elapsed, 1e-9):.0f} runs/s)")
@@ -0,0 +1,272 @@
+"""
+Instrumentation
+
+This module provides a lightweight, process-wide registry of pipeline stage
+timings. Stages are timed with a context manager or a decorator and record
+wall time, call counts and bytes written; the registry can be dumped as a
+JSON summary and as Chrome trace events (viewable in chrome://tracing or
+Perfetto). While disabled, a stage costs one attribute check.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+
+class _Stage:
+    """Context manager timing one entry into a stage"""
+    
+    __slots__ = ("registry", "name", "bytes_written", "_start")
+    
+    def __init__(self, registry: "Instrumentation", name: str):
+        self.registry = registry
+        self.name = name
+        self.bytes_written = 0
+        self._start = 0.0
+    
+    def add_bytes(self, count: int):
+        """Attribute count bytes written to this stage entry"""
+        self.bytes_written += count
+    
+    def __enter__(self) -> "_Stage":
+        self._start = time.time()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.registry._record(self.name, self._start, time.time() - self._start, self.bytes_written)
+        return False
+
+
+class _NullStage:
+    """Stand-in returned while instrumentation is disabled"""
+    
+    __slots__ = ()
+    
+    def add_bytes(self, count: int):
+        pass
+    
+    def __enter__(self) -> "_NullStage":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Instrumentation:
+    """
+    Registry of per-stage wall time, call counts and bytes written
+    
+    Usage:
+        instrumentation.enable()
+        with instrumentation.stage("nvsim") as s:
+            ...
+            s.add_bytes(len(output))
+            
+        @timed("evaluation")
+        def evaluate(...): ...
+        
+        instrumentation.write("profile.json", "profile_trace.json")
+    """
+    
+    # Trace events kept before further events are only counted in the summary
+    MAX_TRACE_EVENTS = 1_000_000
+    
+    def __init__(self):
+        """Initialize a disabled, empty registry"""
+        self.enabled = False
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def enable(self):
+        """Start recording stages"""
+        self.enabled = True
+    
+    def disable(self):
+        """Stop recording stages (recorded data is kept)"""
+        self.enabled = False
+    
+    def reset(self):
+        """Drop all recorded data"""
+        with self._lock:
+            self._stats: Dict[str, Dict[str, float]] = {}
+            self._events: List[Dict[str, Any]] = []
+            self._dropped_events = 0
+    
+    def stage(self, name: str):
+        """
+        Return a context manager timing the enclosed block as one call of a stage
+        
+        Args:
+            name: Stage name (dotted names group related stages, e.g. "traffic.generic")
+            
+        Returns:
+            Context manager yielding an object with add_bytes(count)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+    
+    def add_bytes(self, name: str, count: int):
+        """
+        Attribute bytes written to a stage without timing a call
+        
+        Args:
+            name: Stage name
+            count: Number of bytes
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._stage_stats(name)["bytes_written"] += count
+    
+    def _stage_stats(self, name: str) -> Dict[str, float]:
+        """Return the (created on first use) statistics of a stage; caller holds the lock"""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = {"calls": 0, "total_s": 0.0, "min_s": float("inf"),
+                                         "max_s": 0.0, "bytes_written": 0}
+        return stats
+    
+    def _record(self, name: str, start: float, elapsed: float, bytes_written: int):
+        """Record one completed call of a stage"""
+        with self._lock:
+            stats = self._stage_stats(name)
+            stats["calls"] += 1
+            stats["total_s"] += elapsed
+            stats["min_s"] = min(stats["min_s"], elapsed)
+            stats["max_s"] = max(stats["max_s"], elapsed)
+            stats["bytes_written"] += bytes_written
+            
+            if len(self._events) < self.MAX_TRACE_EVENTS:
+                event = {"name": name, "cat": name.split(".", 1)[0], "ph": "X",
+                         "ts": start * 1e6, "dur": elapsed * 1e6,
+                         "pid": os.getpid(), "tid": threading.get_ident()}
+                if bytes_written:
+                    event["args"] = {"bytes_written": bytes_written}
+                self._events.append(event)
+            else:
+                self._dropped_events += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the recorded data in a picklable form, e.g. to send from a worker process
+        
+        Returns:
+            Dictionary with "stats", "events" and "dropped_events"
+        """
+        with self._lock:
+            return {"stats": {name: dict(stats) for name, stats in self._stats.items()},
+                    "events": list(self._events),
+                    "dropped_events": self._dropped_events}
+    
+    def merge(self, snapshot: Dict[str, Any]):
+        """
+        Add the data of a snapshot (e.g. from a worker process) to this registry
+        
+        Args:
+            snapshot: Dictionary returned by :meth:`snapshot`
+        """
+        with self._lock:
+            for name, other in snapshot.get("stats", {}).items():
+                stats = self._stage_stats(name)
+                stats["calls"] += other["calls"]
+                stats["total_s"] += other["total_s"]
+                stats["min_s"] = min(stats["min_s"], other["min_s"])
+                stats["max_s"] = max(stats["max_s"], other["max_s"])
+                stats["bytes_written"] += other["bytes_written"]
+            
+            room = self.MAX_TRACE_EVENTS - len(self._events)
+            events = snapshot.get("events", [])
+            self._events.extend(events[:max(room, 0)])
+            self._dropped_events += snapshot.get("dropped_events", 0) + max(len(events) - max(room, 0), 0)
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded stages, slowest first
+        
+        Returns:
+            Dictionary with a "stages" mapping of name to calls, total/mean/min/max
+            seconds and bytes written
+        """
+        with self._lock:
+            stages = {}
+            for name, stats in sorted(self._stats.items(), key=lambda item: -item[1]["total_s"]):
+                calls = stats["calls"]
+                stages[name] = {
+                    "calls": calls,
+                    "total_s": stats["total_s"],
+                    "mean_s": stats["total_s"] / calls if calls else 0.0,
+                    "min_s": stats["min_s"] if calls else 0.0,
+                    "max_s": stats["max_s"],
+                    "bytes_written": stats["bytes_written"]
+                }
+            return {"stages": stages, "trace_events": len(self._events),
+                    "dropped_trace_events": self._dropped_events}
+    
+    def write(self, summary_path: str, trace_path: Optional[str] = None):
+        """
+        Write the JSON summary and, optionally, the Chrome trace
+        
+        Args:
+            summary_path: Path of the JSON summary
+            trace_path: Path of the Chrome trace JSON (skipped when None)
+        """
+        with open(summary_path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        
+        if trace_path is not None:
+            with self._lock:
+                events = sorted(self._events, key=lambda event: event["ts"])
+            with open(trace_path, "w") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        
+        self.logger.info(f"Wrote stage profile to {summary_path}" +
+                         (f" and trace to {trace_path}" if trace_path else ""))
+
+
+# Process-wide registry used by the pipeline
+instrumentation = Instrumentation()
+
+
+def stage(name: str):
+    """
+    Time the enclosed block as one call of a stage in the process-wide registry
+    
+    Args:
+        name: Stage name
+        
+    Returns:
+        Context manager yielding an object with add_bytes(count)
+    """
+    return instrumentation.stage(name)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """
+    Decorator timing every call of a function as a stage in the process-wide registry
+    
+    Args:
+        name: Stage name (defaults to the function's qualified name)
+        
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        stage_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return func(*args, **kwargs)
+            with _Stage(instrumentation, stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
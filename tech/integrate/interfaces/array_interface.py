@@ -5,23 +5,42 @@ This interface provides real connection to ArrayCharacterization/NVSim
 executable with tentpole mode and dynamic configuration generation.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from contextlib import contextmanager
 import logging
 import subprocess
 import tempfile
 import os
-import time
 import sys
+import time
 from pathlib import Path
 import shutil
 
+import numpy as np
+
+if TYPE_CHECKING:
+    import asyncio
+
 # Add module paths for imports
 current_dir = Path(__file__).parent.parent
 sys.path.append(str(current_dir))
 
-# Import modules
-from tentpoles import form_tentpoles
+# Import modules (tentpoles pulls in pandas, so it is imported only when tentpoles are generated)
 from input_defs.nvsim_interface import NVSimInputConfig
+from input_defs.nvsim_parser import parse_nvsim_text
+from .characterization_cache import CharacterizationCache
+from .fault_statistics import MemoryFaultController
+from .nvsim_archive import NVSimArchive
+from .nvsim_library import NVSIM_ERROR, load_nvsim_library, result_metrics
+from .runtime_scheduler import RuntimeHistory, adaptive_timeout, config_signature, longest_first
+from .surrogate import (CharacterizationSurrogate, DEFAULT_PARETO_OBJECTIVES, features, group_key,
+                        near_pareto_front)
+from ..instrumentation import instrumentation, stage, timed
+
+
+class NVSimTimeoutError(RuntimeError):
+    """NVSim was killed at its timeout"""
+
 
 class ArrayCharacterizationInterface:
     """
@@ -31,13 +50,37 @@ class ArrayCharacterizationInterface:
     ArrayCharacterization (NVSim) executable to get real results.
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    DEFAULT_NVSIM_TIMEOUT = 60
+    DEFAULT_PROCESS_NODE = 22
+    
+    # config settings named in config file names when they differ from the defaults: (key, label format)
+    CONFIG_NAME_SETTINGS = (("process_node", "{}nm"), ("device_roadmap", "{}"), ("word_width", "{}bit"),
+                            ("temperature", "{}K"), ("process_node_r", "R{}nm"), ("device_roadmap_r", "R{}"),
+                            ("process_node_w", "W{}nm"), ("device_roadmap_w", "W{}"))
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None, use_cache: bool = True,
+                 refresh_cache: bool = False,
+                 cache_max_entries: int = CharacterizationCache.DEFAULT_MAX_ENTRIES,
+                 read_only: bool = False):
+        """
+        Initialize the interface
+        
+        Args:
+            config: Full experiment configuration (used for the output directory)
+            use_cache: Reuse cached characterization results instead of re-running NVSim
+            refresh_cache: Re-run NVSim even on a cache hit and overwrite the cached entry
+            cache_max_entries: Maximum number of cached results before LRU eviction
+            read_only: Create no directories and open the cache only if it exists, for
+                :meth:`plan_characterization`
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.config = config or {}
         
         # Setup paths
         current_dir = Path(__file__).parent.parent.parent
         self.array_char_dir = current_dir / "ArrayCharacterization"
-        self.executable_path = self.array_char_dir / "nvsim"
+        # NVSIM_EXECUTABLE points at another NVSim build (e.g. the stand-in used by benchmarks/)
+        self.executable_path = Path(os.environ.get("NVSIM_EXECUTABLE") or self.array_char_dir / "nvsim")
         
         # Setup data and configuration paths
         self.integrate_dir = current_dir / "integrate"
@@ -46,30 +89,272 @@ class ArrayCharacterizationInterface:
         self.cell_cfgs_dir = self.data_dir / "cell_cfgs"
         
         # Ensure directories exist
-        self.mem_cfgs_dir.mkdir(parents=True, exist_ok=True)
-        self.cell_cfgs_dir.mkdir(parents=True, exist_ok=True)
+        if not read_only:
+            self.mem_cfgs_dir.mkdir(parents=True, exist_ok=True)
+            self.cell_cfgs_dir.mkdir(parents=True, exist_ok=True)
         
         # Validate executable exists
         if not self.executable_path.exists():
             self.logger.error(f"NVSim executable not found at {self.executable_path}")
             raise FileNotFoundError(f"NVSim executable not found at {self.executable_path}")
+        
+        # In-process NVSim (libnvsim.so); the executable is the fallback
+        self.nvsim_library = load_nvsim_library(self.array_char_dir)
+        
+        # Persistent cache of parsed results under the experiment output directory
+        output_path = self.config.get("experiment", {}).get("output_path") or "output"
+        self.refresh_cache = refresh_cache
+        self.cache = None
+        cache_path = Path(output_path) / "cache" / "characterization.sqlite"
+        if use_cache and not (read_only and not cache_path.exists()):
+            self.cache = CharacterizationCache(cache_path, max_entries=cache_max_entries)
+        
+        # Raw NVSim outputs, indexed by the same key as the cache
+        self.nvsim_archive = NVSimArchive(Path(output_path) / "array_output")
+        
+        # NVSim runtimes per configuration signature, for timeouts and longest-first scheduling
+        self.runtime_history = RuntimeHistory(Path(output_path) / "cache" / "runtimes.sqlite")
+        self.nvsim_seconds = 0.0
+        
+        # Fault model from the "fault_injection" section, if any
+        self.fault_controller = MemoryFaultController.from_config(self.config)
+    
+    @property
+    def nvsim_path(self) -> Path:
+        """The NVSim build run_characterization uses: libnvsim.so when it is loaded, else the executable"""
+        return self.nvsim_library.path if self.nvsim_library is not None else self.executable_path
     
     def run_characterization(self, memory_config: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Run array characterization using real NVSim executable
+        Run array characterization using real NVSim
+        
+        NVSim runs through libnvsim.so when it is available and as the
+        executable otherwise; both give identical results and both are killed
+        at the adaptive timeout from :meth:`nvsim_timeout`.
         
         Args:
             memory_config: Memory configuration parameters
             
+        Returns:
+            Dictionary containing array characteristics (default characteristics
+            if NVSim fails)
+        """
+        memory_config = self._with_default_case(memory_config)
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        
+        try:
+            return self._characterize(memory_config)
+        except Exception as e:
+            self.logger.error(f"NVSim characterization failed for {memory_type}: {e}")
+            # Fallback to default values
+            return self._get_default_characteristics(memory_type, memory_config.get('process_node', 22),
+                                                     memory_config.get('capacity_mb', 1.0))
+    
+    def _characterize(self, memory_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Characterize a memory configuration, raising instead of falling back to defaults
+        
+        Args:
+            memory_config: Memory configuration parameters (with 'case' set)
+            
         Returns:
             Dictionary containing array characteristics
         """
         memory_type = memory_config.get('memory_type', 'SRAM')
-        process_node = memory_config.get('process_node', 22)
-        capacity_mb = memory_config.get('capacity_mb', 1.0)
-        opt_target = memory_config.get('optimization_target', 'ReadLatency')
+        cell_file, config_file, cache_key, cached_results = self._prepare_characterization(memory_config)
+        if cached_results is not None:
+            return cached_results
+        
+        # Run NVSim through libnvsim.so, or the executable when the library is not built
+        metrics = None
+        signature = config_signature(memory_config)
+        timeout = self.nvsim_timeout(memory_config)
+        with self._timed_nvsim(signature, timeout):
+            if self.nvsim_library is not None:
+                results, metrics = self._run_nvsim_library(config_file, cell_file, memory_type, timeout)
+            else:
+                results = self._run_nvsim(config_file, cell_file, timeout)
+        
+        return self._finish_characterization(results, memory_config, cell_file, cache_key, metrics)
+    
+    async def run_characterization_async(self, memory_config: Dict[str, Any],
+                                         timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run array characterization with NVSim launched as an asyncio subprocess
         
-        # Ensure case is set following NVMExplorer logic
+        Unlike :meth:`run_characterization` this never blocks the event loop on
+        NVSim and never changes the process working directory, so many
+        characterizations can be in flight at once. Cancelling the task kills
+        the NVSim process.
+        
+        Args:
+            memory_config: Memory configuration parameters
+            timeout: Seconds before NVSim is killed (defaults to :meth:`nvsim_timeout`)
+            
+        Returns:
+            Dictionary containing array characteristics
+        """
+        memory_config = self._with_default_case(memory_config)
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        
+        try:
+            cell_file, config_file, cache_key, cached_results = self._prepare_characterization(
+                memory_config, self.executable_path
+            )
+            if cached_results is not None:
+                return cached_results
+            
+            if timeout is None:
+                timeout = self.nvsim_timeout(memory_config)
+            with self._timed_nvsim(config_signature(memory_config), timeout):
+                results = await self._run_nvsim_async(config_file, cell_file, timeout)
+            
+            return self._finish_characterization(results, memory_config, cell_file, cache_key)
+            
+        except Exception as e:
+            self.logger.error(f"NVSim characterization failed for {memory_type}: {e}")
+            return self._get_default_characteristics(memory_type, memory_config.get('process_node', 22),
+                                                     memory_config.get('capacity_mb', 1.0))
+    
+    async def run_many(self, memory_configs: List[Dict[str, Any]], concurrency: int = 4,
+                       timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Characterize many memory configurations with bounded concurrency
+        
+        Characterizations start longest-first by recorded runtime, so a long
+        NVSim run does not start last and hold up the whole batch.
+        
+        Usage (e.g. from a notebook):
+            results = await interface.run_many(configs, concurrency=16)
+        
+        Args:
+            memory_configs: Memory configuration parameters, one dict per characterization
+            concurrency: Maximum number of NVSim processes running at once
+            timeout: Per-job NVSim timeout in seconds (defaults to :meth:`nvsim_timeout`)
+            
+        Returns:
+            Characterization results in the same order as memory_configs
+        """
+        import asyncio
+        
+        semaphore = asyncio.BoundedSemaphore(max(1, concurrency))
+        
+        async def run_one(memory_config):
+            async with semaphore:
+                return await self.run_characterization_async(memory_config, timeout=timeout)
+        
+        # the semaphore admits waiting tasks in creation order
+        order = longest_first([self.predict_runtime(memory_config) for memory_config in memory_configs])
+        tasks = {index: asyncio.ensure_future(run_one(memory_configs[index])) for index in order}
+        return [await tasks[index] for index in range(len(memory_configs))]
+    
+    def run_surrogate_sweep(self, memory_configs: List[Dict[str, Any]], max_uncertainty: float = 0.05,
+                            pareto_margin: Optional[float] = 0.1,
+                            objectives: Sequence[str] = DEFAULT_PARETO_OBJECTIVES,
+                            batch_size: int = 1) -> List[Dict[str, Any]]:
+        """
+        Characterize a sweep, running NVSim only where a surrogate cannot stand in for it
+        
+        A :class:`CharacterizationSurrogate` trained on the cached characterizations
+        predicts every configuration that is not cached. In rounds, NVSim is run
+        (through :meth:`run_characterization`) on the configurations whose prediction
+        is too uncertain or whose place on the Pareto frontier of configurations with
+        the same capacity, process node and word width could change within
+        pareto_margin; the surrogate is refitted after each round. The remaining
+        configurations get predicted results, marked with 'surrogate': True and their
+        'surrogate_uncertainty'. Configurations whose NVSim run fails get default
+        characteristics like in :meth:`run_characterization`, but the surrogate is
+        never trained on them, so they do not stand in for NVSim results.
+        
+        Args:
+            memory_configs: Memory configuration parameters, one dict per characterization
+            max_uncertainty: Largest log-space standard deviation accepted for a
+                prediction (0.05 is about ±5%)
+            pareto_margin: Relative error assumed for predicted objectives when checking
+                whether they are near the frontier, or None to skip the frontier check
+            objectives: Result keys compared for the frontier, all minimized
+            batch_size: Configurations characterized per cell and round
+            
+        Returns:
+            Results in the same order as memory_configs
+        """
+        memory_configs = [self._with_default_case(memory_config) for memory_config in memory_configs]
+        if self.cache is not None and not self.refresh_cache:
+            surrogate = CharacterizationSurrogate.from_cache(self.cache)
+        else:
+            surrogate = CharacterizationSurrogate()
+        
+        # configurations characterized before need no prediction
+        results: List[Optional[Dict[str, Any]]] = [surrogate.sample(memory_config) for memory_config in memory_configs]
+        specs = [features(memory_config) for memory_config in memory_configs]
+        failed = set()
+        rounds = 0
+        while True:
+            predictions = surrogate.predict(memory_configs)
+            uncertain = [results[index] is None and uncertainty > max_uncertainty
+                         for index, (_, uncertainty) in enumerate(predictions)]
+            
+            near = [False] * len(memory_configs)
+            if pareto_margin is not None and not all(uncertain):
+                # failed configurations have no objective values, so they never decide the frontier
+                values = np.array([[np.nan if index in failed else
+                                    float((results[index] or metrics or {}).get(objective, np.nan))
+                                    for objective in objectives]
+                                   for index, (metrics, _) in enumerate(predictions)])
+                margin = np.array([0.0 if result is not None else pareto_margin for result in results])[:, None]
+                near = near_pareto_front(values, values * (1 - margin), values * (1 + margin), specs)
+            
+            pending: Dict[Tuple, List[int]] = {}
+            for index, memory_config in enumerate(memory_configs):
+                if results[index] is None and (uncertain[index] or near[index]):
+                    pending.setdefault(group_key(memory_config), []).append(index)
+            if not pending:
+                break
+            
+            rounds += 1
+            for indices in pending.values():
+                # most uncertain first
+                indices.sort(key=lambda index: -predictions[index][1])
+                for index in indices[:max(1, batch_size)]:
+                    try:
+                        results[index] = self._characterize(memory_configs[index])
+                    except Exception as e:
+                        memory_type = memory_configs[index].get('memory_type', 'SRAM')
+                        self.logger.error(f"NVSim characterization failed for {memory_type}: {e}")
+                        failed.add(index)
+                        results[index] = self._get_default_characteristics(
+                            memory_type, memory_configs[index].get('process_node', 22),
+                            memory_configs[index].get('capacity_mb', 1.0))
+                        continue
+                    surrogate.add(memory_configs[index], results[index])
+        
+        predicted = 0
+        for index, (metrics, uncertainty) in enumerate(surrogate.predict(memory_configs)):
+            if results[index] is None:
+                predicted += 1
+                results[index] = {
+                    **metrics,
+                    **self._extract_cell_parameters(self._find_cell_file(memory_configs[index])),
+                    'surrogate': True,
+                    'surrogate_uncertainty': uncertainty
+                }
+        self.logger.info(f"Surrogate sweep: characterized {len(memory_configs) - predicted - len(failed)} and "
+                         f"predicted {predicted} of {len(memory_configs)} configurations in {rounds} rounds")
+        if failed:
+            self.logger.warning(f"Surrogate sweep: NVSim failed on {len(failed)} configurations, "
+                                f"which use default characteristics")
+        return results
+    
+    def _with_default_case(self, memory_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return memory_config with 'case' set following NVMExplorer logic
+        
+        Args:
+            memory_config: Memory configuration parameters
+            
+        Returns:
+            The same dict if 'case' is present, otherwise a copy with it filled in
+        """
         if 'case' not in memory_config:
             memory_config = memory_config.copy()
             # Default to best_case for tentpole mode unless custom_cells are specified
@@ -77,33 +362,204 @@ class ArrayCharacterizationInterface:
                 memory_config['case'] = 'best_case'
             else:
                 memory_config['case'] = 'custom'
+        return memory_config
+    
+    def _prepare_characterization(self, memory_config: Dict[str, Any],
+                                  nvsim_path: Optional[Path] = None) -> tuple:
+        """
+        Resolve the cell and config files for a characterization and consult the cache
         
+        Args:
+            memory_config: Memory configuration parameters (with 'case' set)
+            nvsim_path: NVSim build that will run, part of the cache key (defaults to :attr:`nvsim_path`)
+            
+        Returns:
+            Tuple of (cell_file, config_file, cache_key, cached_results); cached_results is
+            None unless a usable cache entry exists
+        """
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        capacity_mb = memory_config.get('capacity_mb', 1.0)
+        opt_target = memory_config.get('optimization_target', 'ReadLatency')
         case = memory_config.get('case', 'best_case')
         self.logger.info(f"Characterizing {memory_type} {capacity_mb}MB {opt_target} ({case})")
         
-        try:
-            # Generate configuration files using simplified logic
-            cell_file = self._find_cell_file(memory_config)
-            config_file = self._get_or_generate_config_file(memory_config)
-            
-            # Run NVSim executable
-            results = self._run_nvsim(config_file, cell_file)
-            
-            # Parse results
-            parsed_results = self._parse_nvsim_output(results, memory_type)
+        # Generate configuration files using simplified logic
+        cell_file = self._find_cell_file(memory_config)
+        config_file = self._get_or_generate_config_file(memory_config)
+        
+        # Reuse results for identical cfg/cell/NVSim build inputs
+        cache_key = None
+        cached_results = None
+        if self.cache is not None:
+            with stage("cache_lookup"):
+                cache_key = self.cache.make_key(config_file, cell_file, nvsim_path or self.nvsim_path)
+                if not self.refresh_cache:
+                    cached_results = self.cache.get(cache_key)
+            if cached_results is not None:
+                self.logger.info(f"✓ Cached Read={cached_results['read_latency_ns']:.1f}ns, Write={cached_results['write_latency_ns']:.1f}ns")
+        
+        return cell_file, config_file, cache_key, cached_results
+    
+    def nvsim_timeout(self, memory_config: Dict[str, Any]) -> float:
+        """
+        Return the NVSim timeout of a configuration, scaled to its recorded runtime
+        
+        Args:
+            memory_config: Memory configuration parameters
             
-            # Add cell parameters
-            cell_params = self._extract_cell_parameters(cell_file)
-            parsed_results.update(cell_params)
+        Returns:
+            Timeout in seconds (DEFAULT_NVSIM_TIMEOUT without history)
+        """
+        memory_config = self._with_default_case(memory_config)
+        predicted = self.runtime_history.predict(config_signature(memory_config), "nvsim")
+        return adaptive_timeout(predicted, self.DEFAULT_NVSIM_TIMEOUT)
+    
+    def predict_runtime(self, memory_config: Dict[str, Any]) -> Optional[float]:
+        """
+        Predict how long characterizing a configuration will take
+        
+        Args:
+            memory_config: Memory configuration parameters
             
-            self.logger.info(f"✓ Read={parsed_results['read_latency_ns']:.1f}ns, Write={parsed_results['write_latency_ns']:.1f}ns")
+        Returns:
+            Predicted NVSim seconds (0 when the result is cached), or None without history
+        """
+        memory_config = self._with_default_case(memory_config)
+        if self.cache is not None and not self.refresh_cache:
+            try:
+                cell_file = self._find_cell_file(memory_config)
+                config_file = self._get_or_generate_config_file(memory_config)
+                if self.cache.make_key(config_file, cell_file, self.nvsim_path) in self.cache:
+                    return 0.0
+            except Exception as e:
+                self.logger.debug(f"Cannot check the cache for a runtime prediction: {e}")
+        return self.runtime_history.predict(config_signature(memory_config), "nvsim")
+    
+    def plan_characterization(self, memory_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve the cell file, config file and NVSim invocation of a characterization
+        without generating, writing or running anything
+        
+        Configurations with the same key run NVSim on identical inputs, so one
+        run serves all of them. Files that do not exist yet are keyed on the
+        contents they would be generated with, which for an existing cell file
+        is the cache key the run will use.
+        
+        Args:
+            memory_config: Memory configuration parameters
             
-            return parsed_results
+        Returns:
+            Dictionary with "cell_file", "cell_status" ("existing", "generate" or
+            "missing"), "config_file", "config_status" ("existing" or "generate"),
+            "key", "cached", "predicted_seconds" (0 when cached, None without
+            history) and lists of "errors" and "warnings"
+        """
+        memory_config = self._with_default_case(memory_config)
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        errors, warnings = [], []
+        
+        cell_file = self._lookup_cell_file(memory_config)
+        if cell_file is None:
+            cell_file = self._tentpole_cell_file(memory_config)
+            cell_status = "generate"
+            from tentpoles import SPREADSHEET_FILES
+            spreadsheet = SPREADSHEET_FILES.get(memory_type)
+            if spreadsheet is None:
+                # generate_tentpoles would silently characterize RRAM data for this cell type
+                errors.append(f"Unknown cell type {memory_type}: no cell file in {self.cell_cfgs_dir.name} "
+                              f"and no NVM_data spreadsheet to generate its tentpoles from")
+            elif not (self.data_dir / "NVM_data" / spreadsheet).exists():
+                errors.append(f"Cannot generate tentpoles for {memory_type}: NVM_data/{spreadsheet} not found")
+        elif Path(cell_file).exists():
+            cell_status = "existing"
+        else:
+            cell_status = "missing"
+            errors.append(f"Cell file {cell_file} not found")
+        
+        config_path = self._config_file_path(memory_config)
+        generated = self._generate_config_content(memory_config, cell_file)
+        if config_path.exists():
+            config_status = "existing"
+            config_text = config_path.read_text()
+            if self._config_settings(config_text) != self._config_settings(generated):
+                # config names leave out e.g. the process node, so an existing file may not match
+                warnings.append(f"{config_path.name} already exists with other settings than this "
+                                f"configuration and would be used as is")
+        else:
+            config_status = "generate"
+            config_text = generated
+        
+        cell = Path(cell_file).read_bytes() if cell_status == "existing" else f"{cell_status}:{cell_file}".encode()
+        key = CharacterizationCache.content_key(config_text.encode(), cell, self.nvsim_path)
+        cached = cell_status == "existing" and self.cache is not None and not self.refresh_cache \
+            and key in self.cache
+        
+        return {
+            'cell_file': cell_file,
+            'cell_status': cell_status,
+            'config_file': str(config_path),
+            'config_status': config_status,
+            'key': key,
+            'cached': cached,
+            'predicted_seconds': 0.0 if cached else
+                self.runtime_history.predict(config_signature(memory_config), "nvsim"),
+            'errors': errors,
+            'warnings': warnings
+        }
+    
+    @staticmethod
+    def _config_settings(config_text: str) -> List[str]:
+        """Return the non-empty lines of a config file, ignoring layout and order"""
+        return sorted(line.strip() for line in config_text.splitlines() if line.strip())
+    
+    @contextmanager
+    def _timed_nvsim(self, signature: str, timeout: float):
+        """
+        Record the runtime of the NVSim run inside the block
+        
+        Args:
+            signature: Configuration signature from :func:`config_signature`
+            timeout: Timeout of the run, recorded as a lower bound if it is hit
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except NVSimTimeoutError:
+            self.runtime_history.record(signature, "nvsim", timeout, timed_out=True)
+            raise
+        elapsed = time.perf_counter() - start
+        self.nvsim_seconds += elapsed
+        self.runtime_history.record(signature, "nvsim", elapsed)
+    
+    def _finish_characterization(self, output: str, memory_config: Dict[str, Any],
+                                 cell_file: str, cache_key: Optional[str],
+                                 metrics: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Parse NVSim output, attach cell parameters and store the result in the cache
+        
+        Args:
+            output: NVSim output string
+            memory_config: Memory configuration parameters
+            cell_file: Path to cell file used
+            cache_key: Cache key for this invocation, or None when caching is disabled
+            metrics: Headline metrics from the in-process result, or None to parse them from output
             
-        except Exception as e:
-            self.logger.error(f"NVSim characterization failed for {memory_type}: {e}")
-            # Fallback to default values
-            return self._get_default_characteristics(memory_type, process_node, capacity_mb)
+        Returns:
+            Dictionary containing array characteristics
+        """
+        # Parse results
+        parsed_results = self._parse_nvsim_output(output, memory_config.get('memory_type', 'SRAM'), metrics)
+        
+        # Add cell parameters
+        cell_params = self._extract_cell_parameters(cell_file)
+        parsed_results.update(cell_params)
+        
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(cache_key, parsed_results, params=memory_config)
+        
+        self.logger.info(f"✓ Read={parsed_results['read_latency_ns']:.1f}ns, Write={parsed_results['write_latency_ns']:.1f}ns")
+        
+        return parsed_results
     
     def run_tentpole_characterization(self, memory_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -148,13 +604,20 @@ class ArrayCharacterizationInterface:
         
         return results
     
-    def run_fault_aware_characterization(self, memory_config: Dict[str, Any], seed: Optional[int] = None) -> Dict[str, Any]:
+    def run_fault_aware_characterization(self, memory_config: Dict[str, Any], seed: Optional[int] = None,
+                                         validate: Optional[bool] = None) -> Dict[str, Any]:
         """
         Run fault-aware array characterization with optional fault injection.
         
+        Fault statistics for the full capacity are computed analytically from
+        the fault model's per-level error maps. Full fault injection on a
+        sampled matrix is run only to validate them.
+        
         Args:
             memory_config: Memory configuration parameters
-            seed: Random seed for reproducible fault injection
+            seed: Random seed for sampled fault counts and validation injection
+            validate: Also run full fault injection (defaults to the fault
+                configuration's "validate" setting)
             
         Returns:
             Dictionary containing both baseline and faulty characteristics
@@ -169,18 +632,9 @@ class ArrayCharacterizationInterface:
                 'fault_injection_enabled': False
             }
         
-        # Apply fault injection to memory characteristics
+        # Apply fault statistics to memory characteristics
         try:
-            # Create a synthetic memory array for fault injection testing
-            import numpy as np
-            memory_size = int(memory_config.get('capacity_mb', 1.0) * 1024 * 1024 / 8)  # in bytes
-            test_array = np.random.randn(min(memory_size // 4, 1000), 4).astype(np.float32)  # Limit size for testing
-            
-            # Inject faults
-            faulty_array = self.fault_controller.inject_memory_faults(test_array, seed)
-            
-            # Calculate fault statistics
-            fault_stats = self.fault_controller.get_fault_statistics(test_array, faulty_array)
+            fault_stats = self.fault_controller.fault_statistics(memory_config, seed)
             
             # Estimate impact on memory characteristics
             fault_impact = self._estimate_fault_impact(baseline_results, fault_stats)
@@ -188,12 +642,14 @@ class ArrayCharacterizationInterface:
             # Create faulty characteristics
             faulty_results = baseline_results.copy()
             for metric, impact in fault_impact.items():
-                if metric in faulty_results:
+                # Results also carry non-numeric entries such as the timing breakdown
+                if impact != 1.0 and isinstance(faulty_results.get(metric), (int, float)):
                     faulty_results[metric] *= impact
             
-            self.logger.info(f"Fault injection applied: {fault_stats['fault_rate']:.4f} fault rate")
+            self.logger.info(f"Fault statistics applied: {fault_stats['fault_rate']:.4f} fault rate, "
+                             f"{fault_stats['expected_faulty_values']:.1f} expected faulty values")
             
-            return {
+            results = {
                 'baseline': baseline_results,
                 'faulty': faulty_results,
                 'fault_statistics': fault_stats,
@@ -202,6 +658,14 @@ class ArrayCharacterizationInterface:
                 'memory_model': self.fault_controller.get_memory_model_info()
             }
             
+            if validate if validate is not None else self.fault_controller.validate:
+                validation = self.fault_controller.validate_statistics(memory_config, seed)
+                results['fault_validation'] = validation
+                self.logger.info(f"Fault injection validation: {validation['fault_rate']:.4f} fault rate "
+                                 f"over {validation['num_values']} values")
+            
+            return results
+            
         except Exception as e:
             self.logger.error(f"Fault-aware characterization failed: {e}")
             return {
@@ -419,19 +883,23 @@ class ArrayCharacterizationInterface:
         
         return cell_file, config_file
     
-    def _find_cell_file(self, memory_config: Dict[str, Any]) -> str:
+    def _lookup_cell_file(self, memory_config: Dict[str, Any]) -> Optional[str]:
         """
-        Find appropriate cell file for memory type following NVMExplorer tentpole logic
+        Find an existing cell file for memory type following NVMExplorer tentpole logic
         
         Args:
             memory_config: Memory configuration parameters
             
         Returns:
-            Path to cell file
+            Path to cell file, or None if tentpoles have to be generated
         """
         memory_type = memory_config.get('memory_type', 'SRAM')
         case = memory_config.get('case', 'best_case')
         
+        # custom cell, e.g. from tentpoles.gen_custom_cells
+        if memory_config.get('cell_file'):
+            return str(memory_config['cell_file'])
+        
         self.logger.debug(f"Looking for cell file: {memory_type}, case: {case}")
         
         cell_filename = f"{memory_type}_{case}.cell"
@@ -442,7 +910,7 @@ class ArrayCharacterizationInterface:
             return str(cell_path)
         
         if case in ['best_case', 'worst_case']:
-            self.logger.info(f"Tentpole file {cell_filename} not found for {memory_type}, will generate")
+            self.logger.debug(f"Tentpole file {cell_filename} not found for {memory_type}")
         else:
             cell_filename = f"{memory_type}.cell"
             cell_path = self.cell_cfgs_dir / cell_filename
@@ -451,7 +919,7 @@ class ArrayCharacterizationInterface:
                 self.logger.debug(f"Using generic cell file: {cell_path}")
                 return str(cell_path)
             else:
-                self.logger.info(f"No generic cell file found for {memory_type}, will generate tentpole files")
+                self.logger.debug(f"No generic cell file found for {memory_type}")
         
         memory_type_mappings = {
             "STTRAM": "MRAM",
@@ -479,23 +947,62 @@ class ArrayCharacterizationInterface:
                 self.logger.debug(f"Using mapped generic cell file: {cell_path}")
                 return str(cell_path)
         
+        return None
+    
+    def _tentpole_cell_file(self, memory_config: Dict[str, Any]) -> str:
+        """
+        Return the cell file generated tentpoles provide for a configuration
+        
+        Args:
+            memory_config: Memory configuration parameters
+            
+        Returns:
+            Path to the best- or worst-case cell file (best case for other cases)
+        """
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        case = memory_config.get('case', 'best_case')
+        if case not in ['best_case', 'worst_case']:
+            case = 'best_case'
+        return str(self.cell_cfgs_dir / f"{memory_type}_{case}.cell")
+    
+    def _find_cell_file(self, memory_config: Dict[str, Any]) -> str:
+        """
+        Find appropriate cell file for memory type following NVMExplorer tentpole logic,
+        generating tentpoles if none exists
+        
+        Args:
+            memory_config: Memory configuration parameters
+            
+        Returns:
+            Path to cell file
+        """
+        cell_file = self._lookup_cell_file(memory_config)
+        if cell_file is not None:
+            return cell_file
+        
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        case = memory_config.get('case', 'best_case')
+        
         self.logger.info(f"Tentpole files not found for {memory_type}, generating them...")
         
         try:
-            from tentpoles import load_spreadsheet_data
+            from tentpoles import generate_tentpoles
             
             data_path = str(self.integrate_dir / "data")
-            data_df = load_spreadsheet_data(memory_type, data_path)
-            
             bits_per_cell = memory_config.get('bits_per_cell', 1)
             if isinstance(bits_per_cell, list):
                 bits_per_cell = bits_per_cell[0] if bits_per_cell else 1
-                
-            best_case_cell_path, worst_case_cell_path, best_case_cell_cfg, worst_case_cell_cfg = form_tentpoles(
-                data_df, memory_type, bits_per_cell
-            )
             
-            self.logger.info(f"Generated tentpoles for {memory_type}: {best_case_cell_path}, {worst_case_cell_path}")
+            # locked and atomic, so concurrent workers missing the same cell generate it once
+            with stage("tentpoles"):
+                best_case_cell_path, worst_case_cell_path, generated = generate_tentpoles(
+                    memory_type, bits_per_cell, data_path, str(self.cell_cfgs_dir)
+                )
+            
+            if generated:
+                self.logger.info(f"Generated tentpoles for {memory_type}: {best_case_cell_path}, {worst_case_cell_path}")
+            else:
+                self.logger.debug(f"Tentpoles for {memory_type} were generated by another worker")
             
             cell_filename = f"{memory_type}_{case}.cell"
             cell_path = self.cell_cfgs_dir / cell_filename
@@ -513,15 +1020,16 @@ class ArrayCharacterizationInterface:
                 f"No tentpole cell file found for {memory_type}_{case} and failed to generate: {e}"
             )
     
-    def _get_or_generate_config_file(self, memory_config: Dict[str, Any]) -> str:
+    def _config_file_path(self, memory_config: Dict[str, Any]) -> Path:
         """
-        Get existing config file or generate a new one following NVMExplorer logic
+        Return the memory config file path of a configuration
         
         Args:
             memory_config: Memory configuration parameters
             
         Returns:
-            Path to memory config file
+            Path in mem_cfgs named after type, capacity, target, bits per cell, case and
+            the settings that differ from their defaults
         """
         memory_type = memory_config.get('memory_type', 'SRAM')
         capacity_mb = memory_config.get('capacity_mb', 1.0)
@@ -532,12 +1040,40 @@ class ArrayCharacterizationInterface:
         if isinstance(bits_per_cell, list):
             bits_per_cell = bits_per_cell[0] if bits_per_cell else 1
         
-        if capacity_mb < 1.0:
+        # fractional capacities keep their decimals so e.g. 1.5MB does not reuse the 2MB config
+        if capacity_mb < 1.0 or capacity_mb != int(capacity_mb):
             capacity_str = f"{capacity_mb:.3f}MB".rstrip('0').rstrip('.')
         else:
             capacity_str = f"{capacity_mb:.0f}MB"
         config_filename = f"{memory_type}_{capacity_str}_{opt_target}_{bits_per_cell}BPC-{case}.cfg"
-        config_path = self.mem_cfgs_dir / config_filename
+        
+        # settings off their defaults are named too, so e.g. a process node sweep does not reuse one config
+        settings = self._nvsim_settings(memory_config)
+        # read/write nodes default to the process node, so they are named only when set otherwise
+        defaults = self._nvsim_settings({'memory_type': memory_type, 'process_node': settings['process_node']})
+        defaults['process_node'] = self.DEFAULT_PROCESS_NODE
+        named = [label.format(settings[key]) for key, label in self.CONFIG_NAME_SETTINGS
+                 if key in settings and settings[key] != defaults[key]]
+        if named:
+            config_filename = config_filename[:-len(".cfg")] + "-" + "-".join(named) + ".cfg"
+        
+        if memory_config.get('cell_file'):
+            # one config per custom cell; gen_custom_cells names cells after their contents
+            config_filename = config_filename[:-len(".cfg")] + f"-{Path(memory_config['cell_file']).stem}.cfg"
+        return self.mem_cfgs_dir / config_filename
+    
+    @timed("config_generation")
+    def _get_or_generate_config_file(self, memory_config: Dict[str, Any]) -> str:
+        """
+        Get existing config file or generate a new one following NVMExplorer logic
+        
+        Args:
+            memory_config: Memory configuration parameters
+            
+        Returns:
+            Path to memory config file
+        """
+        config_path = self._config_file_path(memory_config)
         
         if config_path.exists():
             self.logger.debug(f"Found existing config: {config_path}")
@@ -554,63 +1090,75 @@ class ArrayCharacterizationInterface:
             
         return str(config_path)
     
+    @staticmethod
+    def _scalar_setting(memory_config: Dict[str, Any], key: str, default: Any) -> Any:
+        """Return a memory configuration setting, taking the first value of a list"""
+        value = memory_config.get(key, default)
+        if isinstance(value, list):
+            return value[0] if value else default
+        return value
+    
+    def _nvsim_settings(self, memory_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the process, roadmap, word width and temperature settings of a config file
+        
+        Args:
+            memory_config: Memory configuration parameters
+            
+        Returns:
+            Dictionary of the settings with defaults applied; eDRAM3T types also get
+            their read and write process nodes and roadmaps
+        """
+        memory_type = memory_config.get('memory_type', 'SRAM')
+        process_node = self._scalar_setting(memory_config, 'process_node', self.DEFAULT_PROCESS_NODE)
+        settings = {
+            'process_node': process_node,
+            'device_roadmap': self._scalar_setting(memory_config, 'device_roadmap', 'LOP'),
+            'word_width': self._scalar_setting(memory_config, 'word_width', 64),
+            'temperature': self._scalar_setting(memory_config, 'temperature', 370)
+        }
+        
+        if memory_type in ["eDRAM3T", "EDRAM3T"]:
+            defaults = (process_node, 'LOP', process_node, 'LOP')
+        elif memory_type in ["EDRAM3T333", "eDRAM3T333"]:
+            defaults = (22, 'CNT', 45, 'IGZO')
+        else:
+            return settings
+        for key, default in zip(('process_node_r', 'device_roadmap_r', 'process_node_w', 'device_roadmap_w'),
+                                defaults):
+            settings[key] = self._scalar_setting(memory_config, key, default)
+        return settings
+    
     def _generate_config_content(self, memory_config: Dict[str, Any], cell_path: str) -> str:
         """
         Generate memory configuration content using NVMExplorer logic
         """
         capacity_mb = memory_config.get('capacity_mb', 1.0)
         capacity_kb = int(capacity_mb * 1024)
-        memory_type = memory_config.get('memory_type', 'SRAM')
-        
-        def get_scalar_value(config, key, default):
-            value = config.get(key, default)
-            if isinstance(value, list):
-                return value[0] if value else default
-            return value
         
         if cell_path.startswith(str(self.cell_cfgs_dir)):
             cell_relative_path = f"../integrate/data/cell_cfgs/{Path(cell_path).name}"
         else:
             cell_relative_path = cell_path
         
-        process_node = get_scalar_value(memory_config, 'process_node', 22)
-        word_width = get_scalar_value(memory_config, 'word_width', 64)
-        opt_target = get_scalar_value(memory_config, 'optimization_target', 'ReadLatency')
+        settings = self._nvsim_settings(memory_config)
+        opt_target = self._scalar_setting(memory_config, 'optimization_target', 'ReadLatency')
         
         config_lines = [
             f"-MemoryCellInputFile: {cell_relative_path}",
             "",
-            f"-ProcessNode: {process_node}",
-            f"-DeviceRoadmap: LOP"
+            f"-ProcessNode: {settings['process_node']}",
+            f"-DeviceRoadmap: {settings['device_roadmap']}"
         ]
         
-        if memory_type in ["eDRAM3T", "EDRAM3T"]:
-            process_node_r = get_scalar_value(memory_config, 'process_node_r', process_node)
-            process_node_w = get_scalar_value(memory_config, 'process_node_w', process_node)
-            device_roadmap_r = get_scalar_value(memory_config, 'device_roadmap_r', 'LOP')
-            device_roadmap_w = get_scalar_value(memory_config, 'device_roadmap_w', 'LOP')
-            
-            config_lines.extend([
-                "",
-                f"-ProcessNodeR: {process_node_r}",
-                f"-DeviceRoadmapR: {device_roadmap_r}",
-                "",
-                f"-ProcessNodeW: {process_node_w}",
-                f"-DeviceRoadmapW: {device_roadmap_w}"
-            ])
-        elif memory_type in ["EDRAM3T333", "eDRAM3T333"]:
-            process_node_r = get_scalar_value(memory_config, 'process_node_r', 22)
-            process_node_w = get_scalar_value(memory_config, 'process_node_w', 45)
-            device_roadmap_r = get_scalar_value(memory_config, 'device_roadmap_r', 'CNT')
-            device_roadmap_w = get_scalar_value(memory_config, 'device_roadmap_w', 'IGZO')
-            
+        if 'process_node_r' in settings:
             config_lines.extend([
                 "",
-                f"-ProcessNodeR: {process_node_r}",
-                f"-DeviceRoadmapR: {device_roadmap_r}", 
+                f"-ProcessNodeR: {settings['process_node_r']}",
+                f"-DeviceRoadmapR: {settings['device_roadmap_r']}",
                 "",
-                f"-ProcessNodeW: {process_node_w}",
-                f"-DeviceRoadmapW: {device_roadmap_w}"
+                f"-ProcessNodeW: {settings['process_node_w']}",
+                f"-DeviceRoadmapW: {settings['device_roadmap_w']}"
             ])
         
         config_lines.extend([
@@ -626,7 +1174,7 @@ class ArrayCharacterizationInterface:
             f"-EnablePruning: Yes",
             "",
             f"-Capacity (KB): {capacity_kb}",
-            f"-WordWidth (bit): {word_width}",
+            f"-WordWidth (bit): {settings['word_width']}",
             "",
             f"-LocalWireType: LocalAggressive",
             f"-LocalWireRepeaterType: RepeatedNone",
@@ -641,7 +1189,7 @@ class ArrayCharacterizationInterface:
             "",
             f"-InternalSensing: true",
             "",
-            f"-Temperature (K): 370",
+            f"-Temperature (K): {settings['temperature']}",
             "",
             f"-BufferDesignOptimization: latency",
             ""
@@ -814,294 +1362,210 @@ class ArrayCharacterizationInterface:
         
         return config_path
     
-    def _run_nvsim(self, config_file: str, cell_file: str) -> str:
+    def _run_nvsim(self, config_file: str, cell_file: str, timeout: Optional[float] = None) -> str:
         """
         Run NVSim executable with configuration
         
+        NVSim runs with the ArrayCharacterization directory as its working
+        directory; the calling process's working directory is left untouched.
+        
         Args:
             config_file: Path to configuration file
             cell_file: Path to cell file
+            timeout: Seconds before NVSim is killed (defaults to DEFAULT_NVSIM_TIMEOUT)
             
         Returns:
             NVSim output string
         """
+        if timeout is None:
+            timeout = self.DEFAULT_NVSIM_TIMEOUT
+        
         try:
-            # Change to ArrayCharacterization directory
-            original_cwd = os.getcwd()
-            os.chdir(self.array_char_dir)
-            
             # Run NVSim executable
             cmd = [str(self.executable_path), config_file]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            # Restore original directory
-            os.chdir(original_cwd)
-            
-            if result.returncode != 0:
-                # NVSim often puts error messages in stdout, not stderr
-                error_output = result.stderr.strip() if result.stderr.strip() else result.stdout.strip()
-                # Extract key error information from the output
-                error_lines = []
-                if error_output:
-                    for line in error_output.split('\n'):
-                        if 'Error:' in line or 'error:' in line or 'ERROR:' in line:
-                            error_lines.append(line.strip())
-                
-                if error_lines:
-                    error_msg = '; '.join(error_lines)
-                else:
-                    error_msg = error_output[-500:] if len(error_output) > 500 else error_output
-                
-                raise RuntimeError(f"NVSim execution failed: {error_msg}")
-            
-            # Save NVSim output to logs directory
-            self._save_nvsim_output(result.stdout, result.stderr, config_file, cell_file)
+            with stage("nvsim"):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                                        cwd=self.array_char_dir)
+        except subprocess.TimeoutExpired:
+            raise NVSimTimeoutError(f"NVSim execution timed out after {timeout:.0f}s")
+        except Exception as e:
+            raise RuntimeError(f"NVSim execution error: {e}")
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"NVSim execution failed: {self._nvsim_error_message(result.stdout, result.stderr)}")
+        
+        # Save NVSim output to logs directory
+        self._save_nvsim_output(result.stdout, result.stderr, config_file, cell_file, self.executable_path)
+        
+        return result.stdout
+    
+    def _run_nvsim_library(self, config_file: str, cell_file: str, memory_type: str,
+                           timeout: Optional[float] = None) -> Tuple[str, Dict[str, float]]:
+        """
+        Run NVSim through libnvsim.so
+        
+        Paths are resolved as the executable resolves them from the
+        ArrayCharacterization directory. Calls are serialized and run in the
+        library's helper process, which is killed at the timeout like the executable.
+        
+        Args:
+            config_file: Path to configuration file
+            cell_file: Path to cell file
+            memory_type: Type of memory
+            timeout: Seconds before NVSim is killed (defaults to DEFAULT_NVSIM_TIMEOUT)
             
-            return result.stdout
+        Returns:
+            Tuple of (NVSim output string, headline metrics of the result struct)
+        """
+        if timeout is None:
+            timeout = self.DEFAULT_NVSIM_TIMEOUT
+        
+        try:
+            with stage("nvsim"):
+                status, result, output = self.nvsim_library.characterize_file(config_file, self.array_char_dir,
+                                                                              timeout)
+        except TimeoutError:
+            raise NVSimTimeoutError(f"NVSim execution timed out after {timeout:.0f}s")
+        except Exception as e:
+            raise RuntimeError(f"NVSim execution error: {e}")
+        
+        if status == NVSIM_ERROR:
+            raise RuntimeError(f"NVSim execution failed: {self._nvsim_error_message(output, '')}")
+        
+        self._save_nvsim_output(output, "", config_file, cell_file, self.nvsim_library.path)
+        
+        return output, result_metrics(result, memory_type)
+    
+    async def _run_nvsim_async(self, config_file: str, cell_file: str, timeout: Optional[float] = None) -> str:
+        """
+        Run NVSim executable as an asyncio subprocess
+        
+        Args:
+            config_file: Path to configuration file
+            cell_file: Path to cell file
+            timeout: Seconds before NVSim is killed (defaults to DEFAULT_NVSIM_TIMEOUT)
             
-        except subprocess.TimeoutExpired:
-            os.chdir(original_cwd)
-            raise RuntimeError("NVSim execution timed out")
+        Returns:
+            NVSim output string
+        """
+        import asyncio
+        
+        if timeout is None:
+            timeout = self.DEFAULT_NVSIM_TIMEOUT
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                str(self.executable_path), config_file,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.array_char_dir)
+            )
         except Exception as e:
-            os.chdir(original_cwd)
             raise RuntimeError(f"NVSim execution error: {e}")
+        
+        try:
+            with stage("nvsim"):
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self._kill_process(process)
+            raise NVSimTimeoutError(f"NVSim execution timed out after {timeout:.0f}s")
+        except asyncio.CancelledError:
+            await self._kill_process(process)
+            raise
+        
+        stdout = stdout.decode(errors='replace')
+        stderr = stderr.decode(errors='replace')
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"NVSim execution failed: {self._nvsim_error_message(stdout, stderr)}")
+        
+        self._save_nvsim_output(stdout, stderr, config_file, cell_file, self.executable_path)
+        
+        return stdout
+    
+    @staticmethod
+    async def _kill_process(process: "asyncio.subprocess.Process"):
+        """Kill an NVSim subprocess and reap it"""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+    
+    @staticmethod
+    def _nvsim_error_message(stdout: str, stderr: str) -> str:
+        """
+        Extract a concise error message from a failed NVSim run
+        
+        Args:
+            stdout: NVSim standard output
+            stderr: NVSim standard error
+            
+        Returns:
+            Error message
+        """
+        # NVSim often puts error messages in stdout, not stderr
+        error_output = stderr.strip() if stderr.strip() else stdout.strip()
+        # Extract key error information from the output
+        error_lines = []
+        if error_output:
+            for line in error_output.split('\n'):
+                if 'Error:' in line or 'error:' in line or 'ERROR:' in line:
+                    error_lines.append(line.strip())
+        
+        if error_lines:
+            return '; '.join(error_lines)
+        return error_output[-500:] if len(error_output) > 500 else error_output
     
-    def _save_nvsim_output(self, stdout: str, stderr: str, config_file: str, cell_file: str):
+    @timed("nvsim_output")
+    def _save_nvsim_output(self, stdout: str, stderr: str, config_file: str, cell_file: str,
+                           nvsim_path: Path):
         """
-        Save NVSim output and error logs to files
+        Append NVSim output and error log to the NVSim output archive
         
         Args:
             stdout: NVSim standard output
             stderr: NVSim standard error 
             config_file: Path to configuration file used
             cell_file: Path to cell file used
+            nvsim_path: NVSim executable or library that produced the output
         """
         try:
-            # Create output directories (only use array_output, not logs)
-            array_output_dir = Path("output/array_output")
-            array_output_dir.mkdir(parents=True, exist_ok=True)
-            
             # Extract clean cell name from file path
             cell_name = Path(cell_file).stem if cell_file else "unknown_cell"
             # Remove 'sample_' prefix if present to clean up filename
             if cell_name.startswith('sample_'):
                 cell_name = cell_name[7:]  # Remove 'sample_' prefix
             
-            # Use simpler timestamp (just hour and minute)
-            timestamp = time.strftime("%H%M")
-            
-            # Save NVSim output to array_output directory only (no duplication)
-            array_output_file = array_output_dir / f"nvsim_{cell_name}_{timestamp}.out"
-            with open(array_output_file, 'w') as f:
-                f.write(f"NVSim Array Characterization Results\n")
-                f.write(f"===================================\n")
-                f.write(f"Cell: {cell_name}\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Cell file: {cell_file}\n")
-                f.write(f"Config file: {config_file}\n")
-                f.write(f"\nArray Characteristics:\n")
-                f.write("=" * 30 + "\n")
-                f.write(stdout)
-            
-            # Save stderr only if there's content (in logs directory for debugging)
-            if stderr.strip():
-                logs_dir = Path("output/logs")
-                logs_dir.mkdir(parents=True, exist_ok=True)
-                stderr_file = logs_dir / f"nvsim_{cell_name}_{timestamp}_error.log"
-                with open(stderr_file, 'w') as f:
-                    f.write(f"NVSim Error Log\n")
-                    f.write(f"===============\n")
-                    f.write(f"Cell file: {cell_file}\n")
-                    f.write(f"Config file: {config_file}\n")
-                    f.write(f"Timestamp: {timestamp}\n")
-                    f.write(f"Command: {self.executable_path} {config_file}\n")
-                    f.write(f"\nSTDERR:\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(stderr)
-                self.logger.debug(f"NVSim output saved to {array_output_file}, error log saved to {stderr_file}")
-            else:
-                self.logger.debug(f"NVSim output saved to {array_output_file}")
+            key = CharacterizationCache.make_key(config_file, cell_file, nvsim_path)
+            written = self.nvsim_archive.append(key, stdout, stderr.strip(), cell=cell_name,
+                                                config_file=config_file, cell_file=cell_file)
+            instrumentation.add_bytes("nvsim_output", written)
+            self.logger.debug(f"NVSim output archived in {self.nvsim_archive.archive_path} under {key[:12]}")
             
         except Exception as e:
             self.logger.warning(f"Failed to save NVSim output: {e}")
     
-    def _parse_nvsim_output(self, output: str, memory_type: str) -> Dict[str, Any]:
+    @timed("parse")
+    def _parse_nvsim_output(self, output: str, memory_type: str,
+                            metrics: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Parse NVSim output to extract key metrics with proper unit conversions
         
-        Parse NVSim output to extract key metrics with proper unit conversions
+        Metrics NVSim did not report fall back to default characteristics. The
+        full cache summary and data/tag array breakdowns (bank H-tree, mat and
+        subarray components) are returned under 'breakdown'.
         
         Args:
             output: NVSim output string
             memory_type: Type of memory
+            metrics: Headline metrics already taken from an in-process result
             
         Returns:
             Dictionary with parsed results
         """
-        results = {
-            'read_latency_ns': -1.0,
-            'write_latency_ns': -1.0,
-            'read_energy_pj': -1.0,
-            'write_energy_pj': -1.0,
-            'leakage_power_mw': -1.0,
-            'area_mm2': -1.0,
-            'read_bandwidth_gbps': -1.0,
-            'write_bandwidth_gbps': -1.0,
-            'area_efficiency': -1.0
-        }
-        
-        lines = output.split('\n')
-        in_data_array_section = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            if 'CACHE DATA ARRAY' in line:
-                in_data_array_section = True
-            elif 'CACHE TAG ARRAY' in line:
-                in_data_array_section = False
-            
-            # Area parsing
-            if '- Total Area =' in line and results['area_mm2'] == -1.0:
-                try:
-                    if 'mm^2' in line:
-                        area_str = line.split('=')[1].strip().replace('mm^2', '')
-                        results['area_mm2'] = float(area_str)
-                    elif 'um^2' in line and '=' in line:
-                        parts = line.split('=')
-                        if len(parts) >= 3:
-                            area_part = parts[-1].strip()
-                            if 'um^2' in area_part:
-                                area_str = area_part.replace('um^2', '').strip()
-                                results['area_mm2'] = float(area_str) / (1000.**2)
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '-  Read Latency' in line and in_data_array_section and results['read_latency_ns'] == -1.0:
-                try:
-                    if '=' in line:
-                        latency_part = line.split('=')[1].strip()
-                        if 'ns' in latency_part:
-                            results['read_latency_ns'] = float(latency_part.replace('ns', ''))
-                        elif 'us' in latency_part:
-                            results['read_latency_ns'] = float(latency_part.replace('us', '')) * 1000.
-                        elif 'ps' in latency_part:
-                            results['read_latency_ns'] = float(latency_part.replace('ps', '')) / 1000.
-                        elif 'ms' in latency_part:
-                            results['read_latency_ns'] = float(latency_part.replace('ms', '')) * 1000000.
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '- Write Latency' in line and in_data_array_section and results['write_latency_ns'] == -1.0:
-                try:
-                    if '=' in line:
-                        latency_part = line.split('=')[1].strip()
-                        if 'ns' in latency_part:
-                            results['write_latency_ns'] = float(latency_part.replace('ns', ''))
-                        elif 'us' in latency_part:
-                            results['write_latency_ns'] = float(latency_part.replace('us', '')) * 1000.
-                        elif 'ps' in latency_part:
-                            results['write_latency_ns'] = float(latency_part.replace('ps', '')) / 1000.
-                        elif 'ms' in latency_part:
-                            results['write_latency_ns'] = float(latency_part.replace('ms', '')) * 1000000.
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '- Area Efficiency =' in line and in_data_array_section:
-                try:
-                    if '=' in line:
-                        efficiency_part = line.split('=')[1].strip()
-                        results['area_efficiency'] = float(efficiency_part.replace('%', ''))
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '- Read Bandwidth' in line and in_data_array_section:
-                try:
-                    if '=' in line:
-                        bw_part = line.split('=')[1].strip()
-                        if 'GB/s' in bw_part:
-                            results['read_bandwidth_gbps'] = float(bw_part.replace('GB/s', ''))
-                        elif 'MB/s' in bw_part:
-                            results['read_bandwidth_gbps'] = float(bw_part.replace('MB/s', '')) / 1024.
-                        elif 'KB/s' in bw_part:
-                            results['read_bandwidth_gbps'] = float(bw_part.replace('KB/s', '')) / 1024. / 1024.
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '- Write Bandwidth' in line and in_data_array_section:
-                try:
-                    if '=' in line:
-                        bw_part = line.split('=')[1].strip()
-                        if 'GB/s' in bw_part:
-                            results['write_bandwidth_gbps'] = float(bw_part.replace('GB/s', ''))
-                        elif 'MB/s' in bw_part:
-                            results['write_bandwidth_gbps'] = float(bw_part.replace('MB/s', '')) / 1024.
-                        elif 'KB/s' in bw_part:
-                            results['write_bandwidth_gbps'] = float(bw_part.replace('KB/s', '')) / 1024. / 1024.
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '-  Read Dynamic Energy' in line and in_data_array_section and results['read_energy_pj'] == -1.0:
-                try:
-                    if '=' in line:
-                        energy_part = line.split('=')[1].strip()
-                        if 'pJ' in energy_part:
-                            results['read_energy_pj'] = float(energy_part.replace('pJ', ''))
-                        elif 'nJ' in energy_part:
-                            results['read_energy_pj'] = float(energy_part.replace('nJ', '')) * 1000.
-                        elif 'uJ' in energy_part:
-                            results['read_energy_pj'] = float(energy_part.replace('uJ', '')) * 1000. * 1000.
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '- Write Dynamic Energy' in line and in_data_array_section and results['write_energy_pj'] == -1.0:
-                try:
-                    if '=' in line:
-                        energy_part = line.split('=')[1].strip()
-                        if 'pJ' in energy_part:
-                            results['write_energy_pj'] = float(energy_part.replace('pJ', ''))
-                        elif 'nJ' in energy_part:
-                            results['write_energy_pj'] = float(energy_part.replace('nJ', '')) * 1000.
-                        elif 'uJ' in energy_part:
-                            results['write_energy_pj'] = float(energy_part.replace('uJ', '')) * 1000. * 1000.
-                except (ValueError, IndexError):
-                    pass
-            
-            elif '- Leakage Power' in line and in_data_array_section:
-                try:
-                    if '=' in line:
-                        power_part = line.split('=')[1].strip()
-                        if 'mW' in power_part:
-                            results['leakage_power_mw'] = float(power_part.replace('mW', ''))
-                        elif 'uW' in power_part:
-                            results['leakage_power_mw'] = float(power_part.replace('uW', '')) / 1000.
-                        elif 'W' in power_part and 'mW' not in power_part:
-                            results['leakage_power_mw'] = float(power_part.replace('W', '')) * 1000.
-                except (ValueError, IndexError):
-                    pass
-            
-            if memory_type != "SRAM":
-                if ' - SET Latency' in line:
-                    try:
-                        results['write_latency_ns'] = float(line[line.index("=")+1:][:-2])
-                        if line[-2:] == "us":
-                            results['write_latency_ns'] = results['write_latency_ns'] * 1000.
-                        elif line[-2:] == "ps":
-                            results['write_latency_ns'] = results['write_latency_ns'] / 1000.
-                        elif line[-2:] == "ms":
-                            results['write_latency_ns'] = results['write_latency_ns'] * 1000000.
-                    except (ValueError, IndexError):
-                        pass
-                
-                elif ' - SET Dynamic Energy ' in line:
-                    try:
-                        results['write_energy_pj'] = float(line[line.index("=")+1:][:-2])
-                        if line[-2:] == "nJ":
-                            results['write_energy_pj'] = results['write_energy_pj'] * 1000.
-                        elif line[-2:] == "uJ":
-                            results['write_energy_pj'] = results['write_energy_pj'] * 1000. * 1000.
-                    except (ValueError, IndexError):
-                        pass
+        run = parse_nvsim_text(output)
+        results = dict(metrics) if metrics is not None else run.metrics(memory_type)
         
         defaults = self._get_default_characteristics(memory_type, 22, 1.0)
         for key in results:
@@ -1109,6 +1573,8 @@ class ArrayCharacterizationInterface:
                 if key in defaults:
                     results[key] = defaults[key]
         
+        results['breakdown'] = run.breakdown()
+        
         return results
     
     def _extract_cell_parameters(self, cell_file: str) -> Dict[str, Any]:
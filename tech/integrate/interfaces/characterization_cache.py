@@ -0,0 +1,210 @@
+"""
+Characterization Cache
+
+This module provides a persistent, content-addressed cache for NVSim array
+characterization results so repeated sweeps can skip the NVSim subprocess.
+"""
+
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
+from contextlib import contextmanager
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+
+_executable_digests: Dict[tuple, str] = {}
+
+
+def _file_digest(path: Union[str, Path]) -> str:
+    """
+    Return the SHA-256 hex digest of a file's contents
+    
+    Args:
+        path: Path to file
+        
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def executable_digest(path: Union[str, Path]) -> str:
+    """
+    Return the digest of an executable, memoized on path, size and mtime
+    
+    Args:
+        path: Path to executable
+        
+    Returns:
+        Hex digest string
+    """
+    stat = os.stat(path)
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _executable_digests:
+        _executable_digests[memo_key] = _file_digest(path)
+    return _executable_digests[memo_key]
+
+
+class CharacterizationCache:
+    """
+    SQLite-backed cache of parsed NVSim characterization results
+    
+    Entries are keyed on a hash of the memory cfg contents, the cell file
+    contents and the NVSim build (executable or libnvsim.so) that ran, so an
+    entry is reused only when NVSim would see exactly the same inputs. The cache holds at most max_entries
+    results and evicts the least recently used ones beyond that.
+    """
+    
+    DEFAULT_MAX_ENTRIES = 10000
+    
+    def __init__(self, db_path: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize characterization cache
+        
+        Args:
+            db_path: Path to SQLite database file (created if missing)
+            max_entries: Maximum number of cached results before LRU eviction
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " results TEXT NOT NULL,"
+                " params TEXT,"
+                " created REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)")
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed"""
+        conn = sqlite3.connect(str(self.db_path), timeout=60)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def make_key(config_file: Union[str, Path], cell_file: Union[str, Path],
+                 executable_path: Union[str, Path]) -> str:
+        """
+        Build the content-addressed cache key for an NVSim invocation
+        
+        Args:
+            config_file: Path to memory configuration file
+            cell_file: Path to cell file
+            executable_path: Path to the NVSim executable or libnvsim.so that runs it
+            
+        Returns:
+            Hex digest identifying the invocation
+        """
+        return CharacterizationCache.content_key(Path(config_file).read_bytes(), Path(cell_file).read_bytes(),
+                                                 executable_path)
+    
+    @staticmethod
+    def content_key(config: bytes, cell: bytes, executable_path: Union[str, Path]) -> str:
+        """
+        Build the cache key from the cfg and cell contents instead of their files
+        
+        Args:
+            config: Memory configuration file contents
+            cell: Cell file contents
+            executable_path: Path to the NVSim executable or libnvsim.so that runs it
+            
+        Returns:
+            Hex digest identifying the invocation (equal to :meth:`make_key` on the same contents)
+        """
+        digest = hashlib.sha256()
+        digest.update(config)
+        digest.update(b'\0')
+        digest.update(cell)
+        digest.update(b'\0')
+        digest.update(executable_digest(executable_path).encode())
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached results and mark them as recently used
+        
+        Args:
+            key: Cache key from :meth:`make_key`
+            
+        Returns:
+            Parsed results dictionary, or None on a miss
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT results FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+    
+    def put(self, key: str, results: Dict[str, Any], params: Optional[Dict[str, Any]] = None):
+        """
+        Store results and evict least recently used entries beyond the size cap
+        
+        Args:
+            key: Cache key from :meth:`make_key`
+            results: Parsed results dictionary
+            params: Optional memory configuration that produced the results
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, results, params, created, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(results), json.dumps(params, default=str) if params is not None else None, now, now)
+            )
+            count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_access ASC LIMIT ?)",
+                    (count - self.max_entries,)
+                )
+                self.logger.debug(f"Evicted {count - self.max_entries} cached characterizations")
+    
+    def entries(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Iterate over cached results that recorded their memory configuration
+        
+        Yields:
+            (params, results) pairs, oldest first
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT params, results FROM results WHERE params IS NOT NULL ORDER BY created ASC"
+            ).fetchall()
+        for params, results in rows:
+            yield json.loads(params), json.loads(results)
+    
+    def clear(self):
+        """
+        Remove all cached results
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+    
+    def __contains__(self, key: str) -> bool:
+        """Return True if results are cached under key, without marking them as used"""
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is not None
+    
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
@@ -0,0 +1,353 @@
+"""
+Fault Statistics
+
+This module computes the expected number of memory faults in a characterized
+array from msxFI's per-level error maps. Every cell of the array is assumed to
+hold uniformly distributed levels, so the fault probability of a cell is the
+mean over its levels of the probabilities of shifting one level down or up.
+Cells fault independently, so fault counts over the full capacity are
+binomial and their mean and variance follow in closed form, in time that
+depends only on the number of levels per cell and not on the capacity. Full
+fault injection through msxFI on a sampled matrix remains available to
+validate the analytic statistics.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+import contextlib
+import io
+import logging
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# msxFI package directory (tech/msxFI) is importable from here
+_TECH_DIR = Path(__file__).parent.parent.parent
+
+# Number of data values injected in validation mode
+DEFAULT_VALIDATION_VALUES = 4096
+
+
+def cell_fault_probabilities(error_map: Sequence[np.ndarray], rep_conf: Sequence[int]) -> np.ndarray:
+    """
+    Return the fault probability of each cell storing a data value
+    
+    Args:
+        error_map: msxFI error map; entry i is a (2**(i+1), 2) array of
+            per-level probabilities of shifting one level down and up
+        rep_conf: Number of levels of each cell storing a data value
+        
+    Returns:
+        Array of per-cell fault probabilities, one per entry of rep_conf
+    """
+    probabilities = []
+    for levels in rep_conf:
+        cell_errors = np.asarray(error_map[int(math.log2(levels)) - 1], dtype=float)
+        probabilities.append(float(cell_errors[:levels].sum(axis=1).mean()))
+    return np.array(probabilities)
+
+
+def analytic_fault_statistics(error_map: Sequence[np.ndarray], rep_conf: Sequence[int], capacity_bits: int,
+                              sample: bool = False, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compute fault statistics for an array filled with data values
+    
+    Args:
+        error_map: msxFI error map (see :func:`cell_fault_probabilities`)
+        rep_conf: Number of levels of each cell storing a data value
+        capacity_bits: Array capacity in bits
+        sample: Also draw binomially distributed fault counts
+        seed: Random seed for the sampled counts
+        
+    Returns:
+        Dictionary of fault statistics. fault_rate is the expected fraction
+        of data values with at least one faulty cell.
+    """
+    cell_probabilities = cell_fault_probabilities(error_map, rep_conf)
+    bits_per_value = int(sum(math.log2(levels) for levels in rep_conf))
+    num_values = int(capacity_bits // bits_per_value)
+    num_cells = num_values * len(rep_conf)
+    # A value is faulty when any of its cells is
+    value_probability = float(1.0 - np.prod(1.0 - cell_probabilities))
+    
+    stats = {
+        'method': 'analytic',
+        'capacity_bits': int(capacity_bits),
+        'num_values': num_values,
+        'num_cells': num_cells,
+        'cell_fault_rate': float(cell_probabilities.mean()) if len(cell_probabilities) else 0.0,
+        'expected_cell_faults': float(num_values * cell_probabilities.sum()),
+        'cell_faults_variance': float(num_values * (cell_probabilities * (1.0 - cell_probabilities)).sum()),
+        'fault_rate': value_probability,
+        'expected_faulty_values': num_values * value_probability,
+        'faulty_values_variance': num_values * value_probability * (1.0 - value_probability),
+    }
+    if sample:
+        rng = np.random.default_rng(seed)
+        stats['method'] = 'sampled'
+        stats['sampled_cell_faults'] = int(rng.binomial(num_values, cell_probabilities).sum())
+        stats['sampled_faulty_values'] = int(rng.binomial(num_values, value_probability))
+    return stats
+
+
+def _msxfi():
+    """Import msxFI (which pulls in torch and scipy) on first use"""
+    if str(_TECH_DIR) not in sys.path:
+        sys.path.append(str(_TECH_DIR))
+    from msxFI import fault_injection, fi_utils
+    return fault_injection, fi_utils
+
+
+class MemoryFaultController:
+    """
+    Fault model for fault-aware array characterization
+    
+    Wraps msxFI with the settings of the "fault_injection" and
+    "dram_fault_params" sections of an experiment configuration. Error maps
+    are computed once per controller and reused for every configuration.
+    """
+    
+    def __init__(self, fault_config: Optional[Dict[str, Any]] = None,
+                 dram_params: Optional[Dict[str, Any]] = None):
+        """
+        Initialize fault controller
+        
+        Args:
+            fault_config: "fault_injection" configuration section
+            dram_params: "dram_fault_params" configuration section
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        fault_config = fault_config or {}
+        dram_params = dram_params or {}
+        
+        self.enabled = bool(fault_config.get('enabled', False))
+        self.memory_model = fault_config.get('memory_model', 'rram_mlc')
+        quantization = fault_config.get('quantization', {})
+        self.q_type = quantization.get('q_type', 'signed')
+        self.int_bits = quantization.get('int_bits', 2)
+        self.frac_bits = quantization.get('frac_bits', 4)
+        self.encoding = fault_config.get('encoding', 'dense')
+        self.rep_conf = fault_config.get('rep_conf')
+        # 'analytic' or 'sampled'; full injection is requested with 'validate'
+        self.statistics = fault_config.get('statistics', 'analytic')
+        self.validate = bool(fault_config.get('validate', False))
+        self.validation_values = int(fault_config.get('validation_values', DEFAULT_VALIDATION_VALUES))
+        
+        self.refresh_time = dram_params.get('refresh_time')
+        self.vth_sigma = dram_params.get('vth_sigma', 0.05)
+        self.custom_vdd = dram_params.get('custom_vdd')
+        self.temperature = dram_params.get('temperature')
+        self.feature_size = dram_params.get('feature_size')
+        
+        self._error_maps: Dict[int, Any] = {}
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["MemoryFaultController"]:
+        """
+        Create a controller from an experiment configuration
+        
+        Args:
+            config: Full experiment configuration
+            
+        Returns:
+            MemoryFaultController, or None if the configuration has no fault_injection section
+        """
+        if 'fault_injection' not in config:
+            return None
+        return cls(config['fault_injection'], config.get('dram_fault_params'))
+    
+    def is_enabled(self) -> bool:
+        return self.enabled
+    
+    @property
+    def is_dram(self) -> bool:
+        return 'dram' in self.memory_model
+    
+    def get_memory_model_info(self) -> Dict[str, Any]:
+        """
+        Return the fault model settings
+        
+        Returns:
+            Dictionary describing the memory model and data representation
+        """
+        info = {
+            'memory_model': self.memory_model,
+            'q_type': self.q_type,
+            'int_bits': self.int_bits,
+            'frac_bits': self.frac_bits,
+            'encoding': self.encoding,
+            'rep_conf': list(self.rep_conf) if self.rep_conf is not None else None,
+        }
+        if self.is_dram:
+            info.update({'refresh_time': self.refresh_time, 'vth_sigma': self.vth_sigma,
+                         'custom_vdd': self.custom_vdd})
+        return info
+    
+    def _configure_msxfi(self):
+        """Import msxFI and point its module-level settings at this fault model"""
+        fault_injection, fi_utils = _msxfi()
+        for module in (fault_injection, fi_utils):
+            module.mem_model = self.memory_model
+            if self.temperature is not None:
+                module.temperature = self.temperature
+            if self.feature_size is not None:
+                module.feature_size = self.feature_size
+        return fault_injection, fi_utils
+    
+    def cell_rep_conf(self, bits_per_cell: int = 1) -> List[int]:
+        """
+        Return the number of levels of each cell storing a data value
+        
+        Args:
+            bits_per_cell: Bits per cell of the characterized array, used
+                when the fault configuration does not set rep_conf
+                
+        Returns:
+            List of levels per cell
+        """
+        _, fi_utils = _msxfi()
+        width = fi_utils.get_q_type_bit_width(self.q_type, self.int_bits, self.frac_bits)
+        if width is None:
+            raise ValueError(f"Unsupported q_type '{self.q_type}'")
+        # DRAM stores every bit in its own cell
+        if self.is_dram:
+            return [2] * width
+        if self.rep_conf is not None:
+            return [int(levels) for levels in self.rep_conf]
+        bits_per_cell = max(int(bits_per_cell), 1)
+        rep_conf = [2 ** bits_per_cell] * (width // bits_per_cell)
+        if width % bits_per_cell:
+            rep_conf.append(2 ** (width % bits_per_cell))
+        return rep_conf
+    
+    def error_map(self, max_levels: int):
+        """
+        Return the msxFI error map covering cells of up to max_levels levels
+        
+        Args:
+            max_levels: Largest number of levels per cell
+            
+        Returns:
+            msxFI error map
+        """
+        key = 2 if self.is_dram else int(max_levels)
+        if key not in self._error_maps:
+            _, fi_utils = self._configure_msxfi()
+            # get_error_map prints its model choice and exits on unsupported level counts
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if self.is_dram:
+                        error_map = fi_utils.get_error_map(None, refresh_time=self.refresh_time,
+                                                           vth_sigma=self.vth_sigma, custom_vdd=self.custom_vdd)
+                    else:
+                        error_map = fi_utils.get_error_map(key, vth_sigma=self.vth_sigma)
+            except SystemExit as e:
+                raise ValueError(str(e)) from None
+            self._error_maps[key] = error_map
+        return self._error_maps[key]
+    
+    def fault_statistics(self, memory_config: Dict[str, Any], seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compute fault statistics for the full capacity of a memory configuration
+        
+        Args:
+            memory_config: Memory configuration parameters
+            seed: Random seed for sampled fault counts
+            
+        Returns:
+            Dictionary of fault statistics (see :func:`analytic_fault_statistics`)
+        """
+        bits_per_cell = memory_config.get('bits_per_cell', 1)
+        if isinstance(bits_per_cell, list):
+            bits_per_cell = bits_per_cell[0] if bits_per_cell else 1
+        rep_conf = self.cell_rep_conf(bits_per_cell)
+        capacity_bits = int(float(memory_config.get('capacity_mb', 1.0)) * 1024 * 1024 * 8)
+        stats = analytic_fault_statistics(self.error_map(max(rep_conf)), rep_conf, capacity_bits,
+                                          sample=self.statistics == 'sampled', seed=seed)
+        stats['rep_conf'] = rep_conf
+        return stats
+    
+    def inject_memory_faults(self, array: np.ndarray, seed: Optional[int] = None,
+                             rep_conf: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Inject faults into a data matrix with msxFI
+        
+        Args:
+            array: Data values (float32)
+            seed: Random seed for fault injection
+            rep_conf: Levels of each cell storing a value (defaults to :meth:`cell_rep_conf`)
+            
+        Returns:
+            Faulty copy of array
+        """
+        fault_injection, _ = self._configure_msxfi()
+        rep_conf = np.array(rep_conf if rep_conf is not None else self.cell_rep_conf())
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fault_injection.mat_fi(array.copy(), seed=seed or 0, int_bits=self.int_bits,
+                                          frac_bits=self.frac_bits, rep_conf=rep_conf, q_type=self.q_type,
+                                          encode=self.encoding, refresh_time=self.refresh_time,
+                                          vth_sigma=self.vth_sigma, custom_vdd=self.custom_vdd)
+    
+    def get_fault_statistics(self, original: np.ndarray, faulty: np.ndarray) -> Dict[str, Any]:
+        """
+        Measure fault statistics of an injected data matrix
+        
+        Args:
+            original: Data values before injection
+            faulty: Data values after injection
+            
+        Returns:
+            Dictionary with the number and fraction of changed values
+        """
+        faulty_values = int(np.count_nonzero(original != faulty))
+        return {
+            'method': 'injection',
+            'num_values': int(original.size),
+            'faulty_values': faulty_values,
+            'fault_rate': faulty_values / original.size if original.size else 0.0,
+        }
+    
+    def validate_statistics(self, memory_config: Dict[str, Any], seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Inject faults into a sampled matrix and measure its fault rate
+        
+        Args:
+            memory_config: Memory configuration parameters
+            seed: Random seed for the matrix and fault injection
+            
+        Returns:
+            Dictionary of measured fault statistics (see :meth:`get_fault_statistics`)
+        """
+        bits_per_cell = memory_config.get('bits_per_cell', 1)
+        if isinstance(bits_per_cell, list):
+            bits_per_cell = bits_per_cell[0] if bits_per_cell else 1
+        rep_conf = self.cell_rep_conf(bits_per_cell)
+        bits_per_value = int(sum(math.log2(levels) for levels in rep_conf))
+        capacity_bits = int(float(memory_config.get('capacity_mb', 1.0)) * 1024 * 1024 * 8)
+        num_values = max(min(capacity_bits // bits_per_value, self.validation_values), 1)
+        
+        # Values spread over the representable range so stored levels are close to uniform
+        rng = np.random.default_rng(seed)
+        scale = 2.0 ** self.int_bits if self.q_type in ('signed', 'unsigned', 'afloat', 'int') else 1.0
+        low = 0.0 if self.q_type == 'unsigned' else -scale
+        test_array = rng.uniform(low, scale, num_values).astype(np.float32)
+        faulty_array = self.inject_memory_faults(test_array, seed, rep_conf)
+        # Compare against the fault-free round trip so quantization error is not counted as faults
+        return self.get_fault_statistics(self._round_trip(test_array, rep_conf), faulty_array)
+    
+    def _round_trip(self, array: np.ndarray, rep_conf: Sequence[int]) -> np.ndarray:
+        """Quantize and decode data values the way msxFI stores them, without faults"""
+        _, fi_utils = self._configure_msxfi()
+        import torch
+        
+        flattened = torch.from_numpy(array.copy()).view(-1)
+        rep_conf = np.array(rep_conf)
+        exp_bias = 0
+        if self.q_type == 'afloat':
+            exp_bias = fi_utils.get_afloat_bias(abs(flattened), self.frac_bits)
+        mlc_values, mask = fi_utils.convert_mlc_mat(flattened, rep_conf, self.int_bits, self.frac_bits,
+                                                    exp_bias, self.q_type)
+        flattened = fi_utils.convert_f_mat(mlc_values, rep_conf, self.int_bits, self.frac_bits, exp_bias,
+                                           self.q_type, mask)
+        return np.reshape(flattened.cpu().data.numpy(), array.shape)
@@ -0,0 +1,267 @@
+"""
+NVSim Output Archive
+
+This module stores raw NVSim outputs in a single append-only archive instead
+of one text file per run. Every output is appended as its own gzip member, so
+the archive is a valid multi-member gzip file (``zcat`` prints every run), and
+an SQLite index records the offset and length of each member keyed by the
+hash of the NVSim inputs. Any run can be read back with one seek, and the
+whole archive can be streamed in write order for bulk re-parsing.
+"""
+
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+from contextlib import contextmanager
+import gzip
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class ArchivedRun(NamedTuple):
+    """Index entry of one archived NVSim output"""
+    key: str
+    cell: str
+    config_file: str
+    cell_file: str
+    created: float
+    stderr: str
+    offset: int
+    length: int
+
+
+class NVSimArchive:
+    """
+    Append-only, gzip-compressed archive of NVSim outputs with an SQLite index
+    
+    Appends from several processes are serialized with an exclusive lock on
+    the archive file. A key may be archived more than once; lookups return
+    the most recent output.
+    
+    Usage:
+        archive = NVSimArchive("output/array_output")
+        archive.append(key, stdout, cell="SRAM")
+        text = archive.get(key)
+        for run, text in archive:
+            ...
+    """
+    
+    ARCHIVE_NAME = "nvsim_outputs.gz"
+    INDEX_NAME = "nvsim_outputs.index.sqlite"
+    
+    def __init__(self, directory: Union[str, Path], compresslevel: int = 6):
+        """
+        Initialize archive (files are created on the first append)
+        
+        Args:
+            directory: Directory holding the archive and its index
+            compresslevel: gzip compression level for appended outputs
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.directory = Path(directory)
+        self.archive_path = self.directory / self.ARCHIVE_NAME
+        self.index_path = self.directory / self.INDEX_NAME
+        self.compresslevel = compresslevel
+        self._index_ready = False
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open an index connection that commits on success and is always closed"""
+        if not self._index_ready:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), timeout=60)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                if not self._index_ready:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS runs ("
+                        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                        " key TEXT NOT NULL,"
+                        " cell TEXT,"
+                        " config_file TEXT,"
+                        " cell_file TEXT,"
+                        " created REAL NOT NULL,"
+                        " stderr TEXT,"
+                        " offset INTEGER NOT NULL,"
+                        " length INTEGER NOT NULL)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS runs_key ON runs (key)")
+                    self._index_ready = True
+                yield conn
+        finally:
+            conn.close()
+    
+    def append(self, key: str, stdout: str, stderr: str = "", cell: str = "",
+               config_file: str = "", cell_file: str = "") -> int:
+        """
+        Append an NVSim output and index it
+        
+        Args:
+            key: Hash of the NVSim inputs (see :meth:`CharacterizationCache.make_key`)
+            stdout: NVSim standard output
+            stderr: NVSim standard error
+            cell: Cell name
+            config_file: Path to configuration file used
+            cell_file: Path to cell file used
+            
+        Returns:
+            Number of compressed bytes written
+        """
+        member = gzip.compress(stdout.encode(), compresslevel=self.compresslevel)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.archive_path, 'ab') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(member)
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO runs (key, cell, config_file, cell_file, created, stderr, offset, length)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, cell, str(config_file), str(cell_file), time.time(), stderr or None, offset, len(member))
+            )
+        return len(member)
+    
+    @staticmethod
+    def _run(row: Tuple) -> ArchivedRun:
+        key, cell, config_file, cell_file, created, stderr, offset, length = row
+        return ArchivedRun(key, cell or "", config_file or "", cell_file or "", created, stderr or "",
+                           offset, length)
+    
+    def lookup(self, key: str) -> Optional[ArchivedRun]:
+        """
+        Return the index entry of the most recent output archived under a key
+        
+        Args:
+            key: Hash of the NVSim inputs
+            
+        Returns:
+            ArchivedRun, or None if the key was never archived
+        """
+        if not self.index_path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT key, cell, config_file, cell_file, created, stderr, offset, length FROM runs"
+                " WHERE key = ? ORDER BY id DESC LIMIT 1", (key,)
+            ).fetchone()
+        return self._run(row) if row is not None else None
+    
+    def read(self, run: ArchivedRun) -> str:
+        """
+        Read the output of an index entry
+        
+        Args:
+            run: Entry from :meth:`lookup` or :meth:`runs`
+            
+        Returns:
+            NVSim standard output
+        """
+        with open(self.archive_path, 'rb') as f:
+            f.seek(run.offset)
+            return gzip.decompress(f.read(run.length)).decode(errors='replace')
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the most recent output archived under a key
+        
+        Args:
+            key: Hash of the NVSim inputs
+            
+        Returns:
+            NVSim standard output, or None if the key was never archived
+        """
+        run = self.lookup(key)
+        return self.read(run) if run is not None else None
+    
+    def runs(self) -> List[ArchivedRun]:
+        """
+        Return the index entries of all archived outputs in archive order
+        
+        Returns:
+            List of ArchivedRun
+        """
+        if not self.index_path.exists():
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, cell, config_file, cell_file, created, stderr, offset, length FROM runs"
+                " ORDER BY offset ASC"
+            ).fetchall()
+        return [self._run(row) for row in rows]
+    
+    def __iter__(self) -> Iterator[Tuple[ArchivedRun, str]]:
+        """
+        Stream every archived output in archive order
+        
+        The archive is read sequentially, one member at a time.
+        
+        Yields:
+            (ArchivedRun, stdout) pairs
+        """
+        runs = self.runs()
+        if not runs:
+            return
+        with open(self.archive_path, 'rb') as f:
+            position = 0
+            for run in runs:
+                if run.offset != position:
+                    f.seek(run.offset)
+                data = f.read(run.length)
+                position = run.offset + run.length
+                yield run, gzip.decompress(data).decode(errors='replace')
+    
+    def __len__(self) -> int:
+        if not self.index_path.exists():
+            return 0
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from input_defs.nvsim_parser import iter_nvsim_runs
+    
+    parser = argparse.ArgumentParser(description="Read or re-parse an NVSim output archive")
+    parser.add_argument("directory", help="Directory holding the archive (e.g. output/array_output)")
+    parser.add_argument("--key", help="Print the most recent output archived under this key")
+    parser.add_argument("--breakdowns", action="store_true", help="Also parse the full breakdowns")
+    args = parser.parse_args()
+    
+    archive = NVSimArchive(args.directory)
+    if args.key:
+        text = archive.get(args.key)
+        if text is None:
+            sys.exit(f"Key {args.key} not found in {archive.index_path}")
+        sys.stdout.write(text)
+        sys.exit(0)
+    
+    # Throughput check on the archive, as for nvsim_parser.py on .out files
+    total_runs = 0
+    total_bytes = 0
+    start = time.perf_counter()
+    for _, text in archive:
+        total_bytes += len(text)
+        for run in iter_nvsim_runs(text):
+            run.metrics()
+            if args.breakdowns:
+                run.breakdown()
+            total_runs += 1
+    elapsed = time.perf_counter() - start
+    print(f"Parsed {total_runs} runs ({total_bytes / 1e6:.1f} MB) in {elapsed:.3f}s"
+          f" ({total_runs / max(elapsed, 1e-9):.0f} runs/s)")
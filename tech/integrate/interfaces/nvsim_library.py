@@ -0,0 +1,343 @@
+"""
+In-process NVSim Binding
+
+This module runs NVSim inside the Python process through libnvsim.so (built
+next to the nvsim executable with ``make``) instead of spawning the
+executable for every characterization. The configuration and cell
+definitions are handed over as in-memory text and the selected design comes
+back as a result struct, so no files are written and no output has to be
+parsed for the headline metrics. The text NVSim would print is still
+returned for the breakdowns and the output archive.
+
+A ctypes call cannot be interrupted, so calls with a timeout run in a helper
+process that loads the library once and serves every call after it. A call
+that overruns its timeout kills the helper, and the next call starts a new one.
+"""
+
+from typing import Dict, Optional, Tuple, Union
+import ctypes
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+from input_defs.nvsim_parser import convert_value
+
+# nvsim_characterize() status codes (nvsim_api.h)
+NVSIM_OK = 0
+NVSIM_NO_SOLUTION = 1
+NVSIM_ERROR = 2
+
+# NVSimResult.writeMode values (nvsim_api.h)
+NVSIM_WRITE = 0
+NVSIM_SET_RESET = 1
+NVSIM_ERASE_PROGRAM = 2
+
+LIBRARY_NAME = "libnvsim.so"
+
+_CELL_FILE_RE = re.compile(r'^-MemoryCellInputFile: *(\S+)', re.MULTILINE)
+
+
+class NVSimResult(ctypes.Structure):
+    """Headline results of the selected design in SI units (NVSimResult in nvsim_api.h)"""
+    _fields_ = [
+        ("status", ctypes.c_int),
+        ("isCache", ctypes.c_int),
+        ("writeMode", ctypes.c_int),
+        ("readLatency", ctypes.c_double),
+        ("writeLatency", ctypes.c_double),
+        ("setLatency", ctypes.c_double),
+        ("resetLatency", ctypes.c_double),
+        ("readDynamicEnergy", ctypes.c_double),
+        ("writeDynamicEnergy", ctypes.c_double),
+        ("setDynamicEnergy", ctypes.c_double),
+        ("resetDynamicEnergy", ctypes.c_double),
+        ("leakage", ctypes.c_double),
+        ("area", ctypes.c_double),
+        ("cacheArea", ctypes.c_double),
+        ("areaEfficiency", ctypes.c_double),
+        ("readBandwidth", ctypes.c_double),
+        ("writeBandwidth", ctypes.c_double),
+    ]
+
+
+def _printed(value: float, scales: Tuple[Tuple[float, float, str], ...], default_unit: str) -> float:
+    """
+    Round a value the way NVSim prints it and convert it as the parser would
+    
+    NVSim picks a unit with the TO_SECOND/TO_JOULE/... macros and prints three
+    decimals, so going through the same text keeps results identical to
+    parsing the executable's output.
+    
+    Args:
+        value: Value in SI units
+        scales: (upper bound, scale, unit) thresholds in macro order
+        default_unit: Unit when value is above every bound
+        
+    Returns:
+        Value in the parser's unit (ns, pJ, mW, GB/s, mm^2)
+    """
+    for bound, scale, unit in scales:
+        if value < bound:
+            return convert_value('%.3f' % (value * scale), unit)[0]
+    return convert_value('%.3f' % value, default_unit)[0]
+
+
+_SECOND = ((1e-9, 1e12, 'ps'), (1e-6, 1e9, 'ns'), (1e-3, 1e6, 'us'), (1, 1e3, 'ms'))
+_JOULE = ((1e-9, 1e12, 'pJ'), (1e-6, 1e9, 'nJ'), (1e-3, 1e6, 'uJ'), (1, 1e3, 'mJ'))
+_WATT = ((1e-9, 1e12, 'pW'), (1e-6, 1e9, 'nW'), (1e-3, 1e6, 'uW'), (1, 1e3, 'mW'))
+_SQM = ((1e-12, 1e18, 'nm^2'), (1e-6, 1e12, 'um^2'), (1, 1e6, 'mm^2'))
+
+
+def _bandwidth(value: float) -> float:
+    """Round a bandwidth as TO_BPS prints it (decimal prefixes) and convert it"""
+    for bound, scale, unit in ((1e3, 1., 'B/s'), (1e6, 1e3, 'KB/s'), (1e9, 1e6, 'MB/s'), (1e12, 1e9, 'GB/s')):
+        if value < bound:
+            return convert_value('%.3f' % (value / scale), unit)[0]
+    return convert_value('%.3f' % (value / 1e12), 'TB/s')[0]
+
+
+def result_metrics(result: NVSimResult, memory_type: str = 'SRAM') -> Dict[str, float]:
+    """
+    Return the headline metrics of a result struct
+    
+    Mirrors :meth:`NVSimRun.metrics` on the text the executable prints for
+    the same design: SET/RESET cells report the larger of the two for writes,
+    area is the whole cache for cache designs and anything NVSim did not
+    report is -1.0.
+    
+    Args:
+        result: Result filled by nvsim_characterize()
+        memory_type: Type of memory
+        
+    Returns:
+        Dictionary with read/write latency, energy, bandwidth, leakage, area and area efficiency
+    """
+    if result.status != NVSIM_OK:
+        return {key: -1.0 for key in ('read_latency_ns', 'write_latency_ns', 'read_energy_pj', 'write_energy_pj',
+                                      'leakage_power_mw', 'area_mm2', 'read_bandwidth_gbps',
+                                      'write_bandwidth_gbps', 'area_efficiency')}
+    
+    if result.writeMode == NVSIM_WRITE:
+        write_latency = _printed(result.writeLatency, _SECOND, 's')
+        write_energy = _printed(result.writeDynamicEnergy, _JOULE, 'J')
+    elif result.writeMode == NVSIM_SET_RESET and memory_type != 'SRAM':
+        write_latency = max(_printed(result.setLatency, _SECOND, 's'), _printed(result.resetLatency, _SECOND, 's'))
+        write_energy = max(_printed(result.setDynamicEnergy, _JOULE, 'J'),
+                           _printed(result.resetDynamicEnergy, _JOULE, 'J'))
+    else:
+        # erase/program cells print no write latency or energy
+        write_latency = write_energy = -1.0
+    
+    if result.isCache:
+        # the cache summary prints the area in mm^2 without unit scaling
+        area = convert_value('%.3f' % (result.cacheArea * 1e6), 'mm^2')[0]
+    else:
+        area = _printed(result.area, _SQM, 'm^2')
+    
+    return {
+        'read_latency_ns': _printed(result.readLatency, _SECOND, 's'),
+        'write_latency_ns': write_latency,
+        'read_energy_pj': _printed(result.readDynamicEnergy, _JOULE, 'J'),
+        'write_energy_pj': write_energy,
+        'leakage_power_mw': _printed(result.leakage, _WATT, 'W'),
+        'area_mm2': area,
+        'read_bandwidth_gbps': _bandwidth(result.readBandwidth),
+        'write_bandwidth_gbps': _bandwidth(result.writeBandwidth),
+        'area_efficiency': convert_value('%.3f' % result.areaEfficiency, '%')[0]
+    }
+
+
+class NVSimLibrary:
+    """
+    ctypes binding to libnvsim.so
+    
+    NVSim keeps its state in globals, so calls are serialized with a lock;
+    use the subprocess path for concurrent characterizations. Calls with a
+    timeout run in the library's helper process, which is killed when a call
+    overruns.
+    
+    Usage:
+        library = NVSimLibrary("ArrayCharacterization/libnvsim.so")
+        status, result, output = library.characterize(config_text, cell_text, timeout=60)
+    """
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Load the shared library
+        
+        Args:
+            path: Path to libnvsim.so
+        """
+        self.path = Path(path)
+        self._lib = ctypes.CDLL(str(self.path))
+        self._lib.nvsim_characterize.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(NVSimResult),
+                                                 ctypes.POINTER(ctypes.c_void_p)]
+        self._lib.nvsim_characterize.restype = ctypes.c_int
+        self._lib.nvsim_free.argtypes = [ctypes.c_void_p]
+        self._lib.nvsim_free.restype = None
+        self._lock = threading.Lock()
+        # (process, connection) of the helper process serving calls with a timeout
+        self._helper: Optional[Tuple[multiprocessing.Process, Connection]] = None
+    
+    def characterize(self, config_text: str, cell_text: Optional[str] = None,
+                     timeout: Optional[float] = None) -> Tuple[int, NVSimResult, str]:
+        """
+        Characterize a memory array
+        
+        Args:
+            config_text: Contents of an NVSim .cfg file
+            cell_text: Contents of the cell file (None reads -MemoryCellInputFile
+                relative to the working directory)
+            timeout: Seconds before the call is abandoned and the helper process
+                killed, or None to call NVSim in this process without a timeout
+                
+        Returns:
+            Tuple of (status, result struct, text the executable would print)
+            
+        Raises:
+            TimeoutError: NVSim did not finish within timeout
+        """
+        with self._lock:
+            if timeout is None:
+                return self._characterize(config_text, cell_text)
+            return self._characterize_in_helper(config_text, cell_text, timeout)
+    
+    def _characterize(self, config_text: str, cell_text: Optional[str]) -> Tuple[int, NVSimResult, str]:
+        """Call nvsim_characterize() in this process (the caller holds the lock)"""
+        result = NVSimResult()
+        output = ctypes.c_void_p()
+        status = self._lib.nvsim_characterize(config_text.encode(),
+                                              cell_text.encode() if cell_text is not None else None,
+                                              ctypes.byref(result), ctypes.byref(output))
+        try:
+            text = ctypes.string_at(output).decode(errors='replace') if output.value else ''
+        finally:
+            self._lib.nvsim_free(output)
+        return status, result, text
+    
+    def _characterize_in_helper(self, config_text: str, cell_text: Optional[str],
+                                timeout: float) -> Tuple[int, NVSimResult, str]:
+        """Call nvsim_characterize() in the helper process, killing it on timeout (the caller holds the lock)"""
+        if self._helper is None or not self._helper[0].is_alive():
+            self._stop_helper()
+            connection, helper_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve, args=(str(self.path), helper_connection, connection),
+                                              daemon=True)
+            process.start()
+            helper_connection.close()
+            self._helper = (process, connection)
+        
+        _, connection = self._helper
+        connection.send((config_text, cell_text))
+        if not connection.poll(timeout):
+            self._stop_helper()
+            raise TimeoutError(f"NVSim did not finish within {timeout:.0f}s")
+        try:
+            status, result, text = connection.recv()
+        except EOFError:
+            self._stop_helper()
+            raise RuntimeError("The NVSim helper process exited during the call")
+        return status, NVSimResult.from_buffer_copy(result), text
+    
+    def _stop_helper(self):
+        """Kill the helper process, if any"""
+        if self._helper is not None:
+            process, connection = self._helper
+            self._helper = None
+            process.kill()
+            process.join()
+            connection.close()
+    
+    def characterize_file(self, config_file: Union[str, Path], base_dir: Union[str, Path],
+                          timeout: Optional[float] = None) -> Tuple[int, NVSimResult, str]:
+        """
+        Characterize a .cfg file as the executable would from base_dir
+        
+        The cell file named by -MemoryCellInputFile is resolved against
+        base_dir (the executable's working directory) and passed as text.
+        
+        Args:
+            config_file: Path to configuration file
+            base_dir: Directory relative cell paths are resolved against
+            timeout: Seconds before the call is abandoned, or None for no timeout
+            
+        Returns:
+            Tuple of (status, result struct, text the executable would print)
+            
+        Raises:
+            FileNotFoundError: The cell file does not exist
+            TimeoutError: NVSim did not finish within timeout
+        """
+        config_text = (Path(base_dir) / config_file).read_text()
+        cell_files = _CELL_FILE_RE.findall(config_text)
+        cell_text = None
+        if cell_files:
+            # NVSim keeps the last -MemoryCellInputFile line; it must not fall back to
+            # reading a file of the same name relative to this process's working directory
+            cell_path = Path(base_dir) / cell_files[-1]
+            if not cell_path.exists():
+                raise FileNotFoundError(f"Cell file {cell_path} not found")
+            cell_text = cell_path.read_text()
+        return self.characterize(config_text, cell_text, timeout)
+
+
+def _serve(path: str, connection: Connection, parent_connection: Connection):
+    """
+    Helper process loop: characterize (config text, cell text) requests until the connection closes
+    
+    Args:
+        path: Path to libnvsim.so
+        connection: Helper end of the pipe
+        parent_connection: Parent end of the pipe, closed here so the helper sees EOF once the parent is gone
+    """
+    parent_connection.close()
+    library = NVSimLibrary(path)
+    while True:
+        try:
+            config_text, cell_text = connection.recv()
+        except EOFError:
+            return
+        status, result, text = library.characterize(config_text, cell_text)
+        connection.send((status, bytes(result), text))
+
+
+_libraries: Dict[Path, NVSimLibrary] = {}
+
+
+def load_nvsim_library(array_char_dir: Union[str, Path]) -> Optional[NVSimLibrary]:
+    """
+    Load libnvsim.so for in-process characterization, if it is available
+    
+    NVSIM_LIBRARY overrides the default ArrayCharacterization/libnvsim.so.
+    When NVSIM_EXECUTABLE selects another NVSim build without a matching
+    NVSIM_LIBRARY, the executable is used instead. Each library is loaded once
+    per process.
+    
+    Args:
+        array_char_dir: ArrayCharacterization directory
+        
+    Returns:
+        NVSimLibrary, or None to use the executable
+    """
+    path = os.environ.get("NVSIM_LIBRARY")
+    if path is None:
+        if os.environ.get("NVSIM_EXECUTABLE"):
+            return None
+        path = Path(array_char_dir) / LIBRARY_NAME
+    path = Path(path).resolve()
+    if path in _libraries:
+        return _libraries[path]
+    if not path.exists():
+        return None
+    
+    try:
+        library = NVSimLibrary(path)
+    except (OSError, AttributeError) as e:
+        logging.getLogger(NVSimLibrary.__name__).warning(f"Cannot load {path}, using the NVSim executable: {e}")
+        return None
+    _libraries[path] = library
+    return library
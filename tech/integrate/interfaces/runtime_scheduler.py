@@ -0,0 +1,219 @@
+"""
+Runtime-Aware Scheduling
+
+This module records how long array characterization jobs took, keyed by a
+signature of the memory configuration, and uses that history to schedule new
+jobs: jobs are started longest-first (LPT order) so a parallel sweep does not
+end on one long NVSim run, and each NVSim run gets a timeout scaled to its
+predicted runtime instead of a fixed one. Makespan helpers compare a finished
+schedule against the ideal for the same work.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from contextlib import contextmanager
+import hashlib
+import heapq
+import json
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+from .surrogate import NVSIM_SETTINGS
+
+# memory configuration keys that determine how long NVSim runs: every input NVSim sees
+SIGNATURE_KEYS = ("memory_type", "capacity_mb", "optimization_target", "bits_per_cell", "process_node",
+                  "word_width", "case", "cell_file") + NVSIM_SETTINGS
+
+# timeout = clamp(TIMEOUT_FACTOR * predicted + TIMEOUT_SLACK, MIN_TIMEOUT, MAX_TIMEOUT)
+TIMEOUT_FACTOR = 4.0
+TIMEOUT_SLACK = 5.0
+MIN_TIMEOUT = 10.0
+MAX_TIMEOUT = 3600.0
+
+
+def config_signature(memory_config: Dict[str, Any]) -> str:
+    """
+    Return the runtime signature of a memory configuration
+    
+    Args:
+        memory_config: Memory configuration parameters
+        
+    Returns:
+        Hex digest of the configuration keys that affect runtime
+    """
+    values = {key: memory_config[key] for key in SIGNATURE_KEYS if memory_config.get(key) is not None}
+    if "cell_file" in values:
+        # custom cells from gen_custom_cells are named after their contents
+        values["cell_file"] = Path(values["cell_file"]).name
+    return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def adaptive_timeout(predicted: Optional[float], default: float) -> float:
+    """
+    Return a timeout for a job from its predicted runtime
+    
+    Args:
+        predicted: Predicted runtime in seconds, or None if unknown
+        default: Timeout for jobs without history
+        
+    Returns:
+        Timeout in seconds
+    """
+    if predicted is None:
+        return default
+    return min(MAX_TIMEOUT, max(MIN_TIMEOUT, TIMEOUT_FACTOR * predicted + TIMEOUT_SLACK))
+
+
+def longest_first(predicted: Sequence[Optional[float]]) -> List[int]:
+    """
+    Order jobs longest-first by predicted runtime
+    
+    Jobs without a prediction are assumed to take the mean of the known ones;
+    ties keep sweep order.
+    
+    Args:
+        predicted: Predicted runtime per job in seconds (None if unknown)
+        
+    Returns:
+        Job indices in the order to start them
+    """
+    known = [seconds for seconds in predicted if seconds is not None]
+    if not known:
+        return list(range(len(predicted)))
+    fallback = sum(known) / len(known)
+    return sorted(range(len(predicted)),
+                  key=lambda index: -(predicted[index] if predicted[index] is not None else fallback))
+
+
+def list_makespan(durations: Sequence[float], workers: int, order: Optional[Sequence[int]] = None) -> float:
+    """
+    Return the makespan of starting jobs in order on the first free worker
+    
+    Args:
+        durations: Runtime per job in seconds
+        workers: Number of workers
+        order: Job indices in start order (defaults to sweep order)
+        
+    Returns:
+        Time until the last job finishes, in seconds
+    """
+    finish = [0.0] * max(1, min(workers, len(durations)))
+    for index in (order if order is not None else range(len(durations))):
+        heapq.heapreplace(finish, finish[0] + durations[index])
+    return max(finish)
+
+
+def ideal_makespan(durations: Sequence[float], workers: int) -> float:
+    """
+    Return the lower bound on the makespan of a set of jobs
+    
+    Args:
+        durations: Runtime per job in seconds
+        workers: Number of workers
+        
+    Returns:
+        The larger of the perfectly balanced share and the longest job, in seconds
+    """
+    if not durations:
+        return 0.0
+    return max(sum(durations) / max(1, workers), max(durations))
+
+
+class RuntimeHistory:
+    """
+    SQLite-backed history of job runtimes per configuration signature
+    
+    Runtimes are recorded per kind of work (e.g. "nvsim" or "evaluation").
+    The prediction is the median of the most recent runs; a run that hit its
+    timeout only bounds the runtime from below, so the prediction is then at
+    least that timeout and the next timeout grows with it.
+    
+    Usage:
+        history = RuntimeHistory("output/cache/runtimes.sqlite")
+        history.record(signature, "nvsim", 12.5)
+        predicted = history.predict(signature, "nvsim")
+    """
+    
+    WINDOW = 5
+    
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize runtime history (the database is created on the first record)
+        
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._ready = False
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed"""
+        if not self._ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=60)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                if not self._ready:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS runtimes ("
+                        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                        " signature TEXT NOT NULL,"
+                        " kind TEXT NOT NULL,"
+                        " seconds REAL NOT NULL,"
+                        " timed_out INTEGER NOT NULL,"
+                        " recorded REAL NOT NULL)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS runtimes_signature ON runtimes (signature, kind)")
+                    self._ready = True
+                yield conn
+        finally:
+            conn.close()
+    
+    def record(self, signature: str, kind: str, seconds: float, timed_out: bool = False):
+        """
+        Record the runtime of a job
+        
+        Args:
+            signature: Configuration signature from :func:`config_signature`
+            kind: Kind of work timed
+            seconds: Runtime in seconds (the timeout if the job timed out)
+            timed_out: Whether the job was killed at its timeout
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO runtimes (signature, kind, seconds, timed_out, recorded) VALUES (?, ?, ?, ?, ?)",
+                (signature, kind, float(seconds), int(timed_out), time.time())
+            )
+    
+    def predict(self, signature: str, kind: str) -> Optional[float]:
+        """
+        Predict the runtime of a job from its recent history
+        
+        Args:
+            signature: Configuration signature from :func:`config_signature`
+            kind: Kind of work
+            
+        Returns:
+            Predicted runtime in seconds, or None without history
+        """
+        if not self.db_path.exists():
+            return None
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT seconds, timed_out FROM runtimes WHERE signature = ? AND kind = ?"
+                " ORDER BY id DESC LIMIT ?", (signature, kind, self.WINDOW)
+            ).fetchall()
+        if not rows:
+            return None
+        predicted = statistics.median(seconds for seconds, _ in rows)
+        timeouts = [seconds for seconds, timed_out in rows if timed_out]
+        return max([predicted] + timeouts)
+    
+    def __len__(self) -> int:
+        if not self.db_path.exists():
+            return 0
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM runtimes").fetchone()[0]
@@ -0,0 +1,314 @@
+"""
+Characterization Surrogate
+
+This module predicts NVSim array characterization results from results that
+have already been characterized, so sweeps can skip NVSim where its output is
+predictable. For a fixed cell (memory type, case, optimization target, bits
+per cell and cell file) and fixed other NVSim settings, NVSim's latency, energy, leakage, area and bandwidth
+vary smoothly with capacity, process node and word width. Each metric is
+modelled in log space over log2 of those three parameters by Gaussian-process
+regression with a linear (power-law) trend, which also gives an uncertainty
+for every prediction.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import logging
+import math
+from pathlib import Path
+
+import numpy as np
+
+# Metrics predicted by the surrogate (keys of characterization results)
+SURROGATE_METRICS = ("read_latency_ns", "write_latency_ns", "read_energy_pj", "write_energy_pj",
+                     "leakage_power_mw", "area_mm2", "read_bandwidth_gbps", "write_bandwidth_gbps")
+
+# Objectives used to decide whether a prediction is close to the Pareto frontier (all minimized)
+DEFAULT_PARETO_OBJECTIVES = ("read_latency_ns", "write_latency_ns", "read_energy_pj", "write_energy_pj",
+                             "leakage_power_mw", "area_mm2")
+
+# Memory configuration settings besides the cell and the features that change NVSim's inputs
+NVSIM_SETTINGS = ("custom_cells", "temperature", "retention_time_us", "device_roadmap", "device_roadmap_r",
+                  "device_roadmap_w", "process_node_r", "process_node_w", "design_target", "local_wire_type",
+                  "local_wire_repeater_type", "local_wire_use_low_swing", "global_wire_type",
+                  "global_wire_repeater_type", "global_wire_use_low_swing", "routing", "internal_sensing",
+                  "buffer_design_optimization")
+
+# Prior variances of the kernel, in squared natural-log units of the metric.
+# OFFSET_VARIANCE covers the metric's level, SLOPE_VARIANCE the power-law
+# exponent per doubling of a parameter, and the grids below the smooth
+# deviation from the power law.
+OFFSET_VARIANCE = 1.0
+SLOPE_VARIANCE = 1.0
+NOISE_VARIANCE = 1e-6
+
+# Hyperparameter grids searched by marginal likelihood (length scales in doublings)
+_LENGTH_SCALES = (1.0, 2.0, 4.0)
+_SIGNAL_VARIANCES = (0.01, 0.1, 1.0)
+
+
+def group_key(memory_config: Dict[str, Any]) -> Tuple:
+    """
+    Return the key of the cell a memory configuration characterizes
+    
+    Configurations with the same key share a surrogate model and differ only
+    in capacity, process node and word width; a difference in any of
+    NVSIM_SETTINGS (temperature, device roadmap, ...) gives another key.
+    
+    Args:
+        memory_config: Memory configuration parameters
+        
+    Returns:
+        Tuple of (memory type, case, optimization target, bits per cell, cell file name)
+        followed by the JSON value of each of NVSIM_SETTINGS
+    """
+    bits_per_cell = memory_config.get('bits_per_cell', 1)
+    if isinstance(bits_per_cell, list):
+        bits_per_cell = bits_per_cell[0] if bits_per_cell else 1
+    cell_file = memory_config.get('cell_file')
+    settings = tuple(json.dumps(memory_config.get(key), sort_keys=True, default=str) for key in NVSIM_SETTINGS)
+    return (memory_config.get('memory_type', 'SRAM'), memory_config.get('case', 'best_case'),
+            memory_config.get('optimization_target', 'ReadLatency'), int(bits_per_cell),
+            Path(cell_file).name if cell_file else None) + settings
+
+
+def features(memory_config: Dict[str, Any]) -> Tuple[float, float, float]:
+    """
+    Return the surrogate inputs of a memory configuration
+    
+    Args:
+        memory_config: Memory configuration parameters
+        
+    Returns:
+        Tuple of log2 capacity (MB), log2 process node (nm) and log2 word width (bits)
+    """
+    process_node = memory_config.get('process_node', 22)
+    if isinstance(process_node, list):
+        process_node = process_node[0] if process_node else 22
+    return (math.log2(float(memory_config.get('capacity_mb', 1.0))), math.log2(float(process_node)),
+            math.log2(float(memory_config.get('word_width', 64))))
+
+
+def _kernel(a: np.ndarray, b: np.ndarray, length_scale: float, signal_variance: float) -> np.ndarray:
+    """Linear-trend plus squared-exponential covariance between two sets of centered inputs"""
+    sq_dist = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2)
+    return (OFFSET_VARIANCE + SLOPE_VARIANCE * (a @ b.T)
+            + signal_variance * np.exp(-0.5 * sq_dist / length_scale ** 2))
+
+
+class _MetricModel:
+    """Gaussian process for one metric of one cell, fitted on log values"""
+    
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        """
+        Fit the model, choosing hyperparameters by log marginal likelihood
+        
+        Args:
+            x: (n, 3) training inputs
+            y: (n,) log metric values
+        """
+        self.x_mean = x.mean(axis=0)
+        self.y_mean = y.mean()
+        self.x = x - self.x_mean
+        y = y - self.y_mean
+        
+        best = None
+        for length_scale in _LENGTH_SCALES:
+            for signal_variance in _SIGNAL_VARIANCES:
+                K = _kernel(self.x, self.x, length_scale, signal_variance) + NOISE_VARIANCE * np.eye(len(y))
+                try:
+                    L = np.linalg.cholesky(K)
+                except np.linalg.LinAlgError:
+                    continue
+                alpha = np.linalg.solve(L.T, np.linalg.solve(L, y))
+                log_likelihood = -0.5 * y @ alpha - np.log(np.diag(L)).sum()
+                if best is None or log_likelihood > best[0]:
+                    best = (log_likelihood, length_scale, signal_variance, L, alpha)
+        _, self.length_scale, self.signal_variance, self.L, self.alpha = best
+    
+    def predict(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict log values with their standard deviations
+        
+        Args:
+            x: (m, 3) inputs
+            
+        Returns:
+            Tuple of (mean, standard deviation) arrays of length m
+        """
+        x = x - self.x_mean
+        K_star = _kernel(x, self.x, self.length_scale, self.signal_variance)
+        mean = self.y_mean + K_star @ self.alpha
+        v = np.linalg.solve(self.L, K_star.T)
+        prior = OFFSET_VARIANCE + SLOPE_VARIANCE * (x * x).sum(axis=1) + self.signal_variance
+        variance = np.maximum(prior - (v * v).sum(axis=0), 0.0)
+        return mean, np.sqrt(variance)
+
+
+class CharacterizationSurrogate:
+    """
+    Predicts characterization results, with uncertainty, from characterized samples
+    
+    Uncertainties are standard deviations of the natural log of a metric, so
+    0.05 means roughly ±5%. Models are fitted lazily per cell and refitted
+    after samples for that cell are added.
+    
+    Usage:
+        surrogate = CharacterizationSurrogate.from_cache(cache)
+        predictions = surrogate.predict(memory_configs)
+    """
+    
+    def __init__(self, samples: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]] = ()):
+        """
+        Initialize surrogate
+        
+        Args:
+            samples: (memory_config, results) pairs to train on
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # group key -> {features: results}; a later sample for the same point replaces an earlier one
+        self._samples: Dict[Tuple, Dict[Tuple[float, float, float], Dict[str, Any]]] = {}
+        self._models: Dict[Tuple, Dict[str, Optional[_MetricModel]]] = {}
+        for memory_config, results in samples:
+            self.add(memory_config, results)
+    
+    @classmethod
+    def from_cache(cls, cache) -> "CharacterizationSurrogate":
+        """
+        Train on every cached characterization that recorded its memory configuration
+        
+        Args:
+            cache: :class:`CharacterizationCache`
+            
+        Returns:
+            CharacterizationSurrogate instance
+        """
+        surrogate = cls(cache.entries())
+        surrogate.logger.info(f"Surrogate trained on {len(surrogate)} cached characterizations "
+                              f"of {len(surrogate._samples)} cells")
+        return surrogate
+    
+    def __len__(self) -> int:
+        return sum(len(points) for points in self._samples.values())
+    
+    def add(self, memory_config: Dict[str, Any], results: Dict[str, Any]):
+        """
+        Add a characterized sample
+        
+        Args:
+            memory_config: Memory configuration parameters (with 'case' set)
+            results: Characterization results for memory_config
+        """
+        try:
+            point = features(memory_config)
+        except (TypeError, ValueError):
+            return
+        key = group_key(memory_config)
+        self._samples.setdefault(key, {})[point] = results
+        self._models.pop(key, None)
+    
+    def sample(self, memory_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the results of a sample at exactly this configuration
+        
+        Args:
+            memory_config: Memory configuration parameters (with 'case' set)
+            
+        Returns:
+            Results added for the configuration, or None if there are none
+        """
+        return self._samples.get(group_key(memory_config), {}).get(features(memory_config))
+    
+    def _group_models(self, key: Tuple) -> Dict[str, Optional[_MetricModel]]:
+        """Return the per-metric models of a cell, fitting them if needed"""
+        models = self._models.get(key)
+        if models is None:
+            points = self._samples.get(key, {})
+            x = np.array(list(points), dtype=float).reshape(-1, 3)
+            models = {}
+            for metric in SURROGATE_METRICS:
+                values = np.array([results.get(metric, -1.0) for results in points.values()], dtype=float)
+                # NVSim reports -1 for metrics it did not compute; those cannot be modelled in log space
+                usable = values > 0
+                models[metric] = _MetricModel(x[usable], np.log(values[usable])) if usable.any() else None
+            self._models[key] = models
+        return models
+    
+    def predict(self, memory_configs: Sequence[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, float]], float]]:
+        """
+        Predict characterization results
+        
+        Args:
+            memory_configs: Memory configuration parameters (with 'case' set)
+            
+        Returns:
+            (metrics, uncertainty) for each configuration, where metrics maps
+            SURROGATE_METRICS to predicted values and uncertainty is the largest
+            log-space standard deviation among them. Configurations of cells
+            without samples get (None, inf).
+        """
+        predictions: List[Tuple[Optional[Dict[str, float]], float]] = [(None, math.inf)] * len(memory_configs)
+        by_group: Dict[Tuple, List[int]] = {}
+        for index, memory_config in enumerate(memory_configs):
+            by_group.setdefault(group_key(memory_config), []).append(index)
+        
+        for key, indices in by_group.items():
+            if key not in self._samples:
+                continue
+            x = np.array([features(memory_configs[index]) for index in indices], dtype=float)
+            means, stds = {}, []
+            for metric, model in self._group_models(key).items():
+                if model is None:
+                    continue
+                mean, std = model.predict(x)
+                means[metric] = np.exp(mean)
+                stds.append(std)
+            if not stds:
+                continue
+            uncertainty = np.max(stds, axis=0)
+            for row, index in enumerate(indices):
+                metrics = {metric: float(means[metric][row]) if metric in means else -1.0
+                           for metric in SURROGATE_METRICS}
+                predictions[index] = (metrics, float(uncertainty[row]))
+        return predictions
+
+
+def near_pareto_front(values: np.ndarray, optimistic: np.ndarray, pessimistic: np.ndarray,
+                      groups: Sequence[Any]) -> np.ndarray:
+    """
+    Flag designs whose Pareto frontier membership depends on the accuracy of their values
+    
+    A design is near the frontier when no other design of its group dominates
+    its optimistic values but some design dominates its pessimistic values, so
+    an error within that range decides whether it is on the frontier. Designs
+    that are dominated either way, or not dominated either way, are not near.
+    
+    Args:
+        values: (n, k) objective values (all minimized)
+        optimistic: (n, k) lowest plausible objective values
+        pessimistic: (n, k) highest plausible objective values
+        groups: Group of each design; designs are only compared within a group
+        
+    Returns:
+        Boolean array of length n
+    """
+    near = np.zeros(len(values), dtype=bool)
+    by_group: Dict[Any, List[int]] = {}
+    for index, group in enumerate(groups):
+        by_group.setdefault(group, []).append(index)
+    
+    for indices in by_group.values():
+        indices = np.asarray(indices)
+        nominal = values[indices]
+        near[indices] = (~_dominated(nominal, optimistic[indices])) & _dominated(nominal, pessimistic[indices])
+    return near
+
+
+def _dominated(nominal: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Flag candidate rows dominated by a nominal row other than their own"""
+    # dominates[j, i]: nominal row j dominates candidate row i
+    no_worse = (nominal[:, None, :] <= candidates[None, :, :]).all(axis=2)
+    better = (nominal[:, None, :] < candidates[None, :, :]).any(axis=2)
+    dominates = no_worse & better
+    np.fill_diagonal(dominates, False)
+    return dominates.any(axis=0)
@@ -0,0 +1,258 @@
+"""
+Run Manifest
+
+This module records which (array configuration, traffic suite) units of a
+sweep have been written to their results CSVs, so an interrupted sweep can be
+resumed without redoing finished work. The manifest is an append-only JSON
+lines file in the experiment's output directory; each completed unit records
+the byte range it occupies in its results CSV and a SHA-256 checksum of those
+bytes.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+def _segment_digest(path: str, start: int, end: int) -> str:
+    """
+    Return the SHA-256 hex digest of bytes [start, end) of a file
+    
+    Args:
+        path: Path to file
+        start: First byte offset
+        end: Byte offset after the last byte
+        
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+class RunManifest:
+    """
+    Append-only record of completed sweep units
+    
+    A unit is one block of rows in a configuration's results CSV: the header
+    row ("header") or the rows of one traffic suite (e.g. "generic"). Units of
+    a results CSV are written in a fixed order, so on resume the completed
+    units form a prefix of the CSV; anything after the last verified unit is
+    a partial write and is truncated before the missing units are appended.
+    
+    Usage:
+        manifest = RunManifest(output_path, RunManifest.experiment_fingerprint(experiment))
+        completed, offset = manifest.verified_prefix(results_csv, units)
+        ...
+        manifest.record(results_csv, unit, start, end, rows)
+    """
+    
+    FILENAME = "manifest.jsonl"
+    
+    def __init__(self, output_path: str, fingerprint: str):
+        """
+        Initialize run manifest
+        
+        Args:
+            output_path: Experiment output directory holding the manifest
+            fingerprint: Fingerprint of the experiment settings; records written
+                under a different fingerprint are ignored
+        """
+        self.output_path = Path(output_path)
+        self.manifest_path = self.output_path / self.FILENAME
+        self.fingerprint = fingerprint
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._records: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    
+    @staticmethod
+    def experiment_fingerprint(experiment: Dict[str, Any]) -> str:
+        """
+        Fingerprint the experiment settings that affect results CSV contents
+        
+        Args:
+            experiment: The "experiment" section of the configuration
+            
+        Returns:
+            Hex digest identifying the settings
+        """
+        settings = {key: value for key, value in experiment.items() if key != "output_path"}
+        canonical = json.dumps(settings, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    
+    def _key(self, results_csv: str) -> str:
+        """Return the manifest key for a results CSV (relative to the output directory)"""
+        try:
+            return os.path.relpath(results_csv, self.output_path)
+        except ValueError:
+            return os.path.abspath(results_csv)
+    
+    def _append(self, record: Dict[str, Any]):
+        """
+        Durably append one record to the manifest
+        
+        Args:
+            record: JSON-serializable record
+        """
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, sort_keys=True) + "\n"
+        with open(self.manifest_path, "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    
+    def records(self, results_csv: str) -> List[Dict[str, Any]]:
+        """
+        Return the unit records for a results CSV since it was last reset
+        
+        The manifest is read once, on the first call, so this reflects the
+        state left by previous runs.
+        
+        Args:
+            results_csv: Path to results CSV
+            
+        Returns:
+            Unit records in the order they were written
+        """
+        if self._records is None:
+            self._records = self._load()
+        return self._records.get(self._key(results_csv), [])
+    
+    def refresh(self):
+        """Re-read the manifest on the next lookup, picking up units recorded since it was loaded"""
+        self._records = None
+    
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read the manifest, keeping each CSV's records since its last reset
+        
+        Returns:
+            Dictionary mapping manifest keys to unit records
+        """
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        if not self.manifest_path.exists():
+            return records
+        
+        with open(self.manifest_path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # a torn final line from a crash mid-append
+                    continue
+                key = record.get("csv")
+                if record.get("reset") or record.get("fingerprint") != self.fingerprint:
+                    records[key] = []
+                    continue
+                records.setdefault(key, []).append(record)
+        return records
+    
+    def verified_prefix(self, results_csv: str, units: Sequence[str]) -> Tuple[List[str], int]:
+        """
+        Find the completed units of a results CSV that are still intact on disk
+        
+        Records are checked in order against the expected unit order, the CSV
+        size and each unit's checksum; checking stops at the first mismatch.
+        
+        Args:
+            results_csv: Path to results CSV
+            units: Units expected in the CSV, in write order
+            
+        Returns:
+            Tuple of (completed units, byte offset where the next unit starts)
+        """
+        if not os.path.exists(results_csv):
+            return [], 0
+        
+        size = os.path.getsize(results_csv)
+        completed: List[str] = []
+        offset = 0
+        for record, unit in zip(self.records(results_csv), units):
+            if record.get("unit") != unit or record.get("start") != offset or record.get("end", 0) > size:
+                break
+            if _segment_digest(results_csv, record["start"], record["end"]) != record.get("sha256"):
+                self.logger.warning(f"Checksum mismatch for {unit} in {results_csv}; re-running from there")
+                break
+            completed.append(unit)
+            offset = record["end"]
+        return completed, offset
+    
+    def record(self, results_csv: str, unit: str, start: int, end: int, rows: int,
+               configuration: Optional[Sequence[Any]] = None):
+        """
+        Record a unit whose rows occupy bytes [start, end) of the results CSV
+        
+        The rows must already be flushed to disk.
+        
+        Args:
+            results_csv: Path to results CSV
+            unit: Unit name ("header" or a traffic suite)
+            start: Byte offset where the unit's rows start
+            end: Byte offset after the unit's rows
+            rows: Number of rows written
+            configuration: Array configuration the CSV belongs to, for reference
+        """
+        self._append({
+            "csv": self._key(results_csv),
+            "fingerprint": self.fingerprint,
+            "configuration": list(configuration) if configuration is not None else None,
+            "unit": unit,
+            "start": start,
+            "end": end,
+            "rows": rows,
+            "sha256": _segment_digest(results_csv, start, end),
+            "completed": time.time()
+        })
+    
+    def rewind(self, results_csv: str, keep: int):
+        """
+        Keep only the first keep unit records of a results CSV
+        
+        Used when resuming from a verified prefix so that stale records of
+        units past it (e.g. one whose checksum no longer matches) cannot
+        shadow the records of their re-run.
+        
+        Args:
+            results_csv: Path to results CSV
+            keep: Number of leading unit records to keep
+        """
+        records = self.records(results_csv)
+        if len(records) <= keep:
+            return
+        self.reset(results_csv)
+        for record in records[:keep]:
+            self._append(record)
+        self._records[self._key(results_csv)] = records[:keep]
+    
+    def reset(self, results_csv: str):
+        """
+        Forget every recorded unit of a results CSV (it is being rewritten)
+        
+        Args:
+            results_csv: Path to results CSV
+        """
+        if self.manifest_path.exists():
+            self._append({"csv": self._key(results_csv), "reset": True, "completed": time.time()})
@@ -0,0 +1,153 @@
+"""
+Sweep Axes
+
+This module turns the "experiment" section of a configuration into the points
+of a sweep. Any experiment setting can be an axis: a list of values, or a range
+{"start": 22, "stop": 45, "step": 1} whose stop is included when it lies on
+the grid. The sweep is the Cartesian product of its axes, generated lazily in
+nested-loop order (the first axis varies slowest), so a large sweep is never
+materialized just to be iterated.
+
+Axes are either array axes, which change the NVSim characterization, or
+traffic axes, which only change the access pattern of the traffic evaluation.
+Points that differ only in traffic axes share one array characterization.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import itertools
+import math
+
+# Values of the axes of a sweep point that are not among the leading axes, as (key, value) pairs
+Settings = Tuple[Tuple[str, Any], ...]
+
+# experiment settings whose lists are a single value rather than a sweep axis
+FIXED_KEYS = frozenset(("exp_name", "name", "description", "traffic", "workloads", "pareto", "surrogate",
+                        "output_path", "adaptive_metric", "adaptive_max_depth"))
+
+# experiment settings that only change the traffic evaluation's access pattern
+TRAFFIC_KEYS = frozenset(("read_frequency", "write_frequency", "read_size", "write_size", "working_set"))
+
+
+def range_values(start: float, stop: float, step: float = 1) -> List[float]:
+    """
+    Return the values of a range, including stop when it lies on the grid
+    
+    Args:
+        start: First value
+        stop: Last value
+        step: Distance between values (negative for a descending range)
+        
+    Returns:
+        Values from start to stop; integers if start, stop and step are integers
+    """
+    if step == 0 or (stop - start) * step < 0:
+        raise ValueError(f"Invalid range from {start} to {stop} in steps of {step}")
+    # the tolerance keeps e.g. 0.1 to 0.3 in steps of 0.1 from dropping its stop
+    count = int(math.floor((stop - start) / step + 1e-9)) + 1
+    if all(isinstance(value, int) for value in (start, stop, step)):
+        return [start + index * step for index in range(count)]
+    return [round(start + index * step, 12) for index in range(count)]
+
+
+def axis_values(value: Any) -> Optional[List[Any]]:
+    """
+    Return the values of an experiment setting if it is a sweep axis
+    
+    Args:
+        value: Setting from the "experiment" section
+        
+    Returns:
+        The values of a list of scalars or of a {"start", "stop", "step"} range,
+        or None if the setting is a single value
+    """
+    if isinstance(value, list):
+        if not value or any(isinstance(item, (list, dict)) for item in value):
+            return None
+        return list(value)
+    if isinstance(value, dict) and "start" in value and "stop" in value:
+        return range_values(value["start"], value["stop"], value.get("step", 1))
+    return None
+
+
+def split_settings(settings: Settings) -> Tuple[Settings, Settings]:
+    """
+    Split the settings of a sweep point into array and traffic settings
+    
+    Args:
+        settings: (key, value) pairs of a sweep point
+        
+    Returns:
+        Tuple of (array settings, traffic settings), each in the original order
+    """
+    array = tuple((key, value) for key, value in settings if key not in TRAFFIC_KEYS)
+    traffic = tuple((key, value) for key, value in settings if key in TRAFFIC_KEYS)
+    return array, traffic
+
+
+class SweepAxes:
+    """
+    Lazy Cartesian product of the axes of a sweep
+    
+    Usage:
+        axes = SweepAxes.from_experiment(experiment, leading=[("cell_type", ["SRAM", "RRAM"])])
+        for cell_type, *values in axes:
+            settings = tuple(zip(axes.keys[1:], values))
+    """
+    
+    def __init__(self, axes: Sequence[Tuple[str, Sequence[Any]]]):
+        """
+        Initialize a sweep from its axes
+        
+        Args:
+            axes: (key, values) pairs, slowest-varying axis first
+        """
+        self.axes = [(key, list(values)) for key, values in axes]
+        empty = [key for key, values in self.axes if not values]
+        if empty:
+            raise ValueError(f"Sweep axis '{empty[0]}' has no values")
+    
+    @classmethod
+    def from_experiment(cls, experiment: Dict[str, Any],
+                        leading: Sequence[Tuple[str, Sequence[Any]]] = ()) -> "SweepAxes":
+        """
+        Build the sweep of an experiment
+        
+        Args:
+            experiment: The "experiment" section of the configuration
+            leading: (key, values) axes that come first, e.g. with defaults applied;
+                these keys are not read from the experiment again
+                
+        Returns:
+            SweepAxes with the leading axes followed by every other list or range
+            setting, in experiment order
+        """
+        axes = list(leading)
+        taken = {key for key, _ in leading}
+        for key, value in experiment.items():
+            if key in taken or key in FIXED_KEYS:
+                continue
+            values = axis_values(value)
+            if values is not None:
+                axes.append((key, values))
+        return cls(axes)
+    
+    @property
+    def keys(self) -> List[str]:
+        """Axis keys, slowest-varying first"""
+        return [key for key, _ in self.axes]
+    
+    @property
+    def varying(self) -> List[str]:
+        """Keys of the axes with more than one value"""
+        return [key for key, values in self.axes if len(values) > 1]
+    
+    @property
+    def traffic_keys(self) -> List[str]:
+        """Keys of the axes that only change the traffic evaluation"""
+        return [key for key in self.keys if key in TRAFFIC_KEYS]
+    
+    def __len__(self) -> int:
+        return math.prod(len(values) for _, values in self.axes)
+    
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return itertools.product(*(values for _, values in self.axes))
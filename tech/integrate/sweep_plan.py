@@ -0,0 +1,231 @@
+"""
+Sweep Plan
+
+This module lays out a sweep as the DAG of work a run would do: the cell files
+and memory cfg files every array configuration needs, the NVSim invocations
+they feed and the traffic suites evaluated on each result. Configurations
+whose cfg and cell contents are identical share one NVSim invocation, so the
+plan counts it once. Building a plan generates, writes and runs nothing, which
+makes it a cheap check of a sweep before a long run.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+import os
+
+from .interfaces.runtime_scheduler import list_makespan, longest_first
+
+
+def _duration(seconds: float) -> str:
+    """Format seconds as e.g. 45s, 12m05s or 3h20m"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+def _display_path(path: str) -> str:
+    """Return path relative to the working directory when it lies below it"""
+    relative = os.path.relpath(path)
+    return path if relative.startswith("..") else relative
+
+
+class SweepPlan:
+    """
+    DAG of a sweep: cell files -> cfg files -> NVSim runs -> traffic suites
+    
+    Usage:
+        plan = SweepPlan(workers=4)
+        plan.add_configuration(label, interface.plan_characterization(memory_config), suites)
+        print(plan.format())
+    """
+    
+    def __init__(self, workers: int = 1):
+        """
+        Initialize an empty plan
+        
+        Args:
+            workers: Number of worker processes the sweep would run on
+        """
+        self.workers = max(1, workers)
+        self.configurations: List[Dict[str, Any]] = []
+        # NVSim invocations by key, in the order of their first configuration
+        self.runs: Dict[str, Dict[str, Any]] = {}
+        self.cross_configuration_suites: List[str] = []
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self._config_files: Dict[str, Dict[str, Any]] = {}
+    
+    def add_configuration(self, label: str, characterization: Dict[str, Any], suites: Sequence[str],
+                          evaluation_seconds: Optional[float] = None):
+        """
+        Add an array configuration and the traffic suites evaluated on it
+        
+        Args:
+            label: Configuration name, e.g. "SRAM_1MB_ReadLatency_1BPC"
+            characterization: Result of ArrayCharacterizationInterface.plan_characterization
+            suites: Traffic suites evaluated on the configuration alone
+            evaluation_seconds: Predicted traffic evaluation seconds, or None without history
+        """
+        key = characterization['key']
+        run = self.runs.get(key)
+        if run is None:
+            run = self.runs[key] = {
+                'key': key,
+                'cell_file': characterization['cell_file'],
+                'cell_status': characterization['cell_status'],
+                'config_file': characterization['config_file'],
+                'config_status': characterization['config_status'],
+                'cached': characterization['cached'],
+                'predicted_seconds': characterization['predicted_seconds'],
+                'configurations': []
+            }
+        run['configurations'].append(label)
+        
+        # the first configuration writes a missing cfg file and later ones reuse it as is
+        config_file = characterization['config_file']
+        first = self._config_files.setdefault(config_file, {'label': label, 'key': key})
+        if first['key'] != key and characterization['config_status'] == "generate":
+            self.warnings.append(f"{label}: shares {os.path.basename(config_file)} with {first['label']} "
+                                 f"but needs other contents; it would run with {first['label']}'s settings")
+        
+        self.configurations.append({
+            'label': label,
+            'key': key,
+            'cell_file': characterization['cell_file'],
+            'cell_status': characterization['cell_status'],
+            'config_file': config_file,
+            'config_status': characterization['config_status'],
+            'suites': list(suites),
+            'evaluation_seconds': evaluation_seconds
+        })
+        self.errors.extend(f"{label}: {error}" for error in characterization['errors'])
+        self.warnings.extend(f"{label}: {warning}" for warning in characterization['warnings'])
+    
+    def add_cross_configuration_suite(self, suite: str):
+        """
+        Add a traffic suite evaluated across all configurations after every NVSim run
+        
+        Args:
+            suite: Traffic suite name
+        """
+        self.cross_configuration_suites.append(suite)
+    
+    def _files(self, kind: str) -> Dict[str, str]:
+        """Return {path: status} of the cell or config files, in first-use order"""
+        return {configuration[f'{kind}_file']: configuration[f'{kind}_status']
+                for configuration in self.configurations}
+    
+    def estimate(self) -> Dict[str, Any]:
+        """
+        Estimate the sweep's runtime from the predicted seconds
+        
+        Every NVSim run is counted once, with the first configuration using
+        it. Runs without history are assumed to take the mean of the runs
+        with history when estimating the makespan.
+        
+        Returns:
+            Dictionary with "nvsim_seconds" and "evaluation_seconds" (sums over
+            jobs with history), "unknown_runs" and "unknown_evaluations" (jobs
+            without history) and "makespan_seconds" on the plan's workers
+            (None without any history)
+        """
+        pending = [run for run in self.runs.values() if not run['cached']]
+        known = [run['predicted_seconds'] for run in pending if run['predicted_seconds'] is not None]
+        fallback = sum(known) / len(known) if known else None
+        evaluations = [configuration['evaluation_seconds'] for configuration in self.configurations]
+        
+        durations, seen = [], set()
+        for configuration in self.configurations:
+            run = self.runs[configuration['key']]
+            nvsim = 0.0
+            if configuration['key'] not in seen and not run['cached']:
+                nvsim = run['predicted_seconds'] if run['predicted_seconds'] is not None else fallback
+            seen.add(configuration['key'])
+            evaluation = configuration['evaluation_seconds']
+            durations.append(None if nvsim is None and evaluation is None else (nvsim or 0.0) + (evaluation or 0.0))
+        
+        makespan = None
+        if known or any(seconds is not None for seconds in evaluations):
+            order = longest_first(durations)
+            known_durations = [duration for duration in durations if duration is not None]
+            mean = sum(known_durations) / len(known_durations) if known_durations else 0.0
+            makespan = list_makespan([duration if duration is not None else mean for duration in durations],
+                                     self.workers, order)
+        
+        return {
+            'nvsim_seconds': sum(known),
+            'evaluation_seconds': sum(seconds for seconds in evaluations if seconds is not None),
+            'unknown_runs': len(pending) - len(known),
+            'unknown_evaluations': sum(1 for seconds in evaluations if seconds is None),
+            'makespan_seconds': makespan
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the plan as a JSON-serializable dictionary
+        
+        Returns:
+            Dictionary with the cell and config files, NVSim runs, configurations,
+            cross-configuration suites, runtime estimate, errors and warnings
+        """
+        return {
+            'cell_files': self._files('cell'),
+            'config_files': self._files('config'),
+            'runs': list(self.runs.values()),
+            'configurations': self.configurations,
+            'cross_configuration_suites': self.cross_configuration_suites,
+            'estimate': self.estimate(),
+            'errors': self.errors,
+            'warnings': self.warnings
+        }
+    
+    def format(self) -> str:
+        """
+        Format the plan for printing
+        
+        Returns:
+            Multi-line summary of files, NVSim runs, traffic suites, estimated runtime and problems
+        """
+        lines = []
+        for kind, title in (('cell', "Cell files"), ('config', "Config files")):
+            files = self._files(kind)
+            lines.append(f"{title} ({len(files)}):")
+            lines.extend(f"  {status:<9} {_display_path(path)}" for path, status in files.items())
+        
+        cached = sum(1 for run in self.runs.values() if run['cached'])
+        duplicates = len(self.configurations) - len(self.runs)
+        lines.append(f"NVSim runs ({len(self.runs)} for {len(self.configurations)} configurations, "
+                     f"{duplicates} duplicate(s) collapsed, {cached} cached):")
+        for run in self.runs.values():
+            if run['cached']:
+                predicted = "cached"
+            elif run['predicted_seconds'] is None:
+                predicted = "no history"
+            else:
+                predicted = f"~{_duration(run['predicted_seconds'])}"
+            lines.append(f"  {predicted:<11} {', '.join(run['configurations'])}")
+        
+        suites = sum(len(configuration['suites']) for configuration in self.configurations)
+        line = f"Traffic suites: {suites} across {len(self.configurations)} configurations"
+        if self.cross_configuration_suites:
+            line += f", then {', '.join(self.cross_configuration_suites)} across all of them"
+        lines.append(line)
+        
+        estimate = self.estimate()
+        line = f"Estimated runtime: {_duration(estimate['nvsim_seconds'])} NVSim"
+        if estimate['unknown_runs']:
+            line += f" (+{estimate['unknown_runs']} runs without history)"
+        line += f", {_duration(estimate['evaluation_seconds'])} evaluation"
+        if estimate['unknown_evaluations']:
+            line += f" (+{estimate['unknown_evaluations']} configurations without history)"
+        if estimate['makespan_seconds'] is not None:
+            line += f"; about {_duration(estimate['makespan_seconds'])} on {self.workers} worker(s)"
+        lines.append(line)
+        
+        for title, messages in (("Warnings", self.warnings), ("Errors", self.errors)):
+            if messages:
+                lines.append(f"{title} ({len(messages)}):")
+                lines.extend(f"  {message}" for message in messages)
+        return "\n".join(lines)
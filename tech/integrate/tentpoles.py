@@ -1,39 +1,99 @@
-import math
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
 import pandas as pd
 import numpy as np
 import input_defs
 
+try:
+  import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+  fcntl = None
+
+
+# Spreadsheet pickle per cell type; other cell types fall back to RRAM
+SPREADSHEET_FILES = {
+    'STT': 'STTRAM_data.pkl',
+    'RRAM': 'RRAM_data.pkl',
+    'PCM': 'PCM_data.pkl',
+    'CTT': 'CTT_data.pkl',
+    'FeFET': 'FeFET_data.pkl',
+}
+
+CELL_CFGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data/cell_cfgs")
+
+# In-process memo of loaded spreadsheets: path -> ((mtime_ns, size), dataframe, sha256)
+_spreadsheets = {}
+
+
+def _spreadsheet_path(cell_type, output_path):
+  return "{}/NVM_data/{}".format(output_path, SPREADSHEET_FILES.get(cell_type, 'RRAM_data.pkl'))
+
+
+def _load_spreadsheet(path):
+  """ Returns the memo entry for a spreadsheet pickle, reading the file only if it
+  changed since it was last loaded by this process
+  """
+  stat = os.stat(path)
+  stamp = (stat.st_mtime_ns, stat.st_size)
+  entry = _spreadsheets.get(path)
+  if entry is None or entry[0] != stamp:
+      with open(path, 'rb') as f:
+          raw = f.read()
+      temp_df = pd.read_pickle(io.BytesIO(raw))
+      temp_df.replace('', np.nan, inplace = True)
+      entry = (stamp, temp_df, hashlib.sha256(raw).hexdigest())
+      _spreadsheets[path] = entry
+  return entry
+
 
 def load_spreadsheet_data(cell_type, output_path):
   """ Returns a pandas dataframe object containing data for a particular NVM technology
   specified by cell_type from the NVM spreadsheet
 
+  Spreadsheets are loaded once per process; later calls return a copy of the memoized dataframe.
+
   :param cell_type: String indicating which NVM technology to use
   :type cyll_type: String
   :return: pandas dataframe object containing the spreadsheet data
   :rtype: pandas dataframe 
   """
-  if (cell_type == 'STT'):
-      temp_df = pd.read_pickle("{}/NVM_data/STTRAM_data.pkl".format(output_path))
-  elif (cell_type == 'RRAM'):
-      temp_df = pd.read_pickle("{}/NVM_data/RRAM_data.pkl".format(output_path))
-  elif (cell_type == 'PCM'):
-      temp_df = pd.read_pickle("{}/NVM_data/PCM_data.pkl".format(output_path))
-  elif (cell_type == 'CTT'):
-      temp_df = pd.read_pickle("{}/NVM_data/CTT_data.pkl".format(output_path))
-  elif (cell_type == 'FeFET'):
-      temp_df = pd.read_pickle("{}/NVM_data/FeFET_data.pkl".format(output_path))
-  else:
-      temp_df = pd.read_pickle("{}/NVM_data/RRAM_data.pkl".format(output_path))
-  
+  return _load_spreadsheet(_spreadsheet_path(cell_type, output_path))[1].copy()
 
-  if (cell_type != 'SRAM'):
-      temp_df.replace('', np.nan, inplace = True)
 
-  return temp_df
+def spreadsheet_digest(cell_type, output_path):
+  """ Returns the SHA-256 hex digest of the NVM spreadsheet used for a cell type
 
+  :param cell_type: String indicating which NVM technology to use
+  :type cell_type: String
+  :return: hex digest of the spreadsheet pickle
+  :rtype: String
+  """
+  return _load_spreadsheet(_spreadsheet_path(cell_type, output_path))[2]
+
+
+def select_tentpole_rows(data_df):
+  """ Returns the index labels of the spreadsheet rows with the best (smallest) and worst
+  (largest) cell area per capacity, F2/Mb. Rows missing either value are ignored, and ties
+  go to the first row. Both labels are 0 if no row has both values.
+
+  :param data_df: pandas dataframe object containing NVM spreadsheet data
+  :type data_df: pandas dataframe
+  :return: index labels of the best-case and worst-case rows
+  :rtype: tuple
+  """
+  area = pd.to_numeric(data_df['Cell Area [F2]'], errors='coerce')
+  capacity = pd.to_numeric(data_df['Capacity [Mb]'], errors='coerce')
+  F2_per_Mb = (area / capacity)[area.notna() & capacity.notna()]
+  if F2_per_Mb.empty:
+      return 0, 0
+  return F2_per_Mb.idxmin(), F2_per_Mb.idxmax()
 
-def form_tentpoles(data_df, cell_type, bits_per_cell):
+
+def form_tentpoles(data_df, cell_type, bits_per_cell, cell_dir=None):
   """ Generates best-case and worst-case NVSim cell files for a specified cell type and multi-level 
   cell configuration
 
@@ -43,37 +103,22 @@ def form_tentpoles(data_df, cell_type, bits_per_cell):
   :type cell_type: String
   :param bits_per_cell: number of bits per cell for a potential multi-level cell configuration
   :type bits_per_cell: String
+  :param cell_dir: directory to write the cell files to (default: data/cell_cfgs)
+  :type cell_dir: String
   :return: list of paths to NVSim cell files and :class:`NVSimInputConfig` objects containing NVSim input cfgs 
   for best-case and worst-case scenarios
   :rtype: list of Strings and :class:`NVSimInputConfig` objects
   """
-  best_F2_per_Mb = 0.0
   best_F2_per_Mb_idx = 0
-  worst_F2_per_Mb = 0.0
   worst_F2_per_Mb_idx = 0
-  first = 1
  
   if (cell_type != 'SRAM'): 
-      for index, row in data_df.iterrows():
-          if not math.isnan(row['Cell Area [F2]']) and not math.isnan(row['Capacity [Mb]']):
-              curr_F2_per_Mb = (row['Cell Area [F2]']/row['Capacity [Mb]'])
-              if first == 1:
-                  best_F2_per_Mb = curr_F2_per_Mb
-                  best_F2_per_Mb_idx = index 
-                  worst_F2_per_Mb = curr_F2_per_Mb
-                  worst_F2_per_Mb_idx = index 
-                  first = 0
-              elif curr_F2_per_Mb < best_F2_per_Mb:
-                  best_F2_per_Mb = curr_F2_per_Mb
-                  best_F2_per_Mb_idx = index 
-              elif curr_F2_per_Mb > worst_F2_per_Mb:
-                  worst_F2_per_Mb = curr_F2_per_Mb
-                  worst_F2_per_Mb_idx = index 
+      best_F2_per_Mb_idx, worst_F2_per_Mb_idx = select_tentpole_rows(data_df)
   
-  import os
-  current_dir = os.path.dirname(os.path.abspath(__file__))
-  best_case_cell_path = os.path.join(current_dir, "data/cell_cfgs/{}_best_case.cell".format(cell_type))
-  worst_case_cell_path = os.path.join(current_dir, "data/cell_cfgs/{}_worst_case.cell".format(cell_type))
+  if cell_dir is None:
+      cell_dir = CELL_CFGS_DIR
+  best_case_cell_path = os.path.join(cell_dir, "{}_best_case.cell".format(cell_type))
+  worst_case_cell_path = os.path.join(cell_dir, "{}_worst_case.cell".format(cell_type))
   
   if (cell_type == 'STT'):
       best_case_cell_cfg = input_defs.cell_cfgs.STTRAMCellConfig(
@@ -197,236 +242,193 @@ def form_tentpoles(data_df, cell_type, bits_per_cell):
       worst_case_cell_cfg.generate_cell_file()
       worst_case_cell_cfg.append_cell_file()
   return best_case_cell_path, worst_case_cell_path, best_case_cell_cfg, worst_case_cell_cfg
-def gen_custom_cell(cell_type, custom_cell_inputs):
-  """ Generates NVSim cell files for a specified cell type and input characteristics
+
+
+def generate_tentpoles(cell_type, bits_per_cell, output_path, cell_dir=None):
+  """ Generates the best-case and worst-case cell files for a cell type unless they are
+  already up to date, safely when several processes ask for the same tentpoles at once
+
+  Generation holds an exclusive lock per cell type; files are written to a private
+  directory and renamed into place, so readers never see a partially written cell file.
+  A stamp file records the spreadsheet digest the files were generated from, and the
+  tentpoles are regenerated only when a file is missing or the spreadsheet changed.
+
+  :param cell_type: String specifying which NVM technology to use
+  :type cell_type: String
+  :param bits_per_cell: number of bits per cell for a potential multi-level cell configuration
+  :type bits_per_cell: int
+  :param output_path: data directory containing NVM_data/
+  :type output_path: String
+  :param cell_dir: directory to write the cell files to (default: data/cell_cfgs)
+  :type cell_dir: String
+  :return: paths to the best-case and worst-case cell files, and whether this call generated them
+  :rtype: tuple
+  """
+  if cell_dir is None:
+      cell_dir = CELL_CFGS_DIR
+  os.makedirs(cell_dir, exist_ok=True)
+  best_case_cell_path = os.path.join(cell_dir, "{}_best_case.cell".format(cell_type))
+  worst_case_cell_path = os.path.join(cell_dir, "{}_worst_case.cell".format(cell_type))
+  stamp_path = os.path.join(cell_dir, ".{}_tentpoles.json".format(cell_type))
+  key = {'spreadsheet_sha256': spreadsheet_digest(cell_type, output_path),
+         'bits_per_cell': bits_per_cell}
+
+  with open(os.path.join(cell_dir, ".{}_tentpoles.lock".format(cell_type)), 'a') as lock:
+      if fcntl is not None:
+          fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+      try:
+          if os.path.exists(best_case_cell_path) and os.path.exists(worst_case_cell_path):
+              try:
+                  with open(stamp_path) as f:
+                      current = json.load(f) == key
+              except FileNotFoundError:
+                  # files not generated by this function (e.g. shipped with the repository)
+                  current = True
+              if current:
+                  return best_case_cell_path, worst_case_cell_path, False
+
+          staging = tempfile.mkdtemp(prefix=".{}_tentpoles.".format(cell_type), dir=cell_dir)
+          try:
+              form_tentpoles(load_spreadsheet_data(cell_type, output_path), cell_type, bits_per_cell,
+                             cell_dir=staging)
+              for path in (best_case_cell_path, worst_case_cell_path):
+                  staged = os.path.join(staging, os.path.basename(path))
+                  if os.path.exists(staged):
+                      os.replace(staged, path)
+              with open(os.path.join(staging, "stamp.json"), 'w') as f:
+                  json.dump(key, f)
+              os.replace(os.path.join(staging, "stamp.json"), stamp_path)
+          finally:
+              shutil.rmtree(staging, ignore_errors=True)
+      finally:
+          if fcntl is not None:
+              fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+  return best_case_cell_path, worst_case_cell_path, True
+
+
+# Custom cell parameters accepted per cell type; "cell_size_F2" sets the cell area.
+# Cell types not listed here are built as SRAM cells, except CTT, which has no cell config.
+CUSTOM_CELL_PARAMS = {
+    'STT': ('cell_size_F2', 'access_CMOS_width', 'r_on', 'r_off', 'read_mode', 'read_voltage',
+            'min_sense_voltage', 'read_power', 'reset_mode', 'reset_current', 'reset_pulse',
+            'reset_energy', 'set_mode', 'set_current', 'set_pulse', 'set_energy', 'mlc',
+            'read_floating'),
+    'PCM': ('cell_size_F2', 'access_CMOS_width', 'r_on', 'r_off', 'read_mode', 'read_voltage',
+            'read_current', 'read_energy', 'reset_mode', 'reset_current', 'reset_pulse', 'set_mode',
+            'set_current', 'set_pulse', 'mlc'),
+    'RRAM': ('cell_size_F2', 'access_CMOS_width', 'r_on_set_v', 'r_off_set_v', 'r_on_reset_v',
+             'r_off_reset_v', 'r_on_read_v', 'r_off_read_v', 'r_on_half_reset', 'cap_on', 'cap_off',
+             'read_mode', 'read_voltage', 'read_power', 'reset_mode', 'reset_voltage', 'reset_pulse',
+             'reset_energy', 'set_mode', 'set_voltage', 'set_pulse', 'set_energy', 'mlc',
+             'read_floating'),
+    'FeFET': ('cell_size_F2', 'access_CMOS_width', 'access_Vdrop', 'r_on_set_v', 'r_off_set_v',
+              'r_on_reset_v', 'r_off_reset_v', 'r_on_read_v', 'r_off_read_v', 'r_on_half_reset',
+              'cap_on', 'cap_off', 'read_mode', 'read_voltage', 'read_power', 'reset_mode',
+              'reset_voltage', 'reset_pulse', 'reset_energy', 'set_mode', 'set_voltage', 'set_pulse',
+              'set_energy', 'mlc'),
+    'SRAM': ('cell_size_F2', 'access_CMOS_width', 'nmos_width', 'pmos_width', 'read_mode'),
+}
+
+
+def custom_cell_cfg(cell_type, custom_cell_inputs, cell_path):
+  """ Returns the cell config for a cell type with custom input characteristics, without
+  writing a cell file
 
   :param cell_type: String specifying which NVM technology to use
   :type cell_type: String
   :param custom_cell_inputs: dictionary object specifying possible input params to cell def
-  :return: path to NVSim cell file and :class:`NVSimInputConfig` object containing NVSim input cfgs 
+  :param cell_path: path of the cell file the config describes
+  :type cell_path: String
+  :return: :class:`NVSimCellConfig` object
+  :raises ValueError: for CTT cells and for parameters the cell type does not accept
   """
-  
-  import os
-  current_dir = os.path.dirname(os.path.abspath(__file__))
-  cell_path = os.path.join(current_dir, "data/cell_cfgs/{}_{}.cell".format(cell_type, custom_cell_inputs["name"]))
- 
+  if (cell_type == 'CTT'):
+      raise ValueError("Custom CTT cells are not supported: CTT has no NVSim cell config")
+  accepted = CUSTOM_CELL_PARAMS.get(cell_type, CUSTOM_CELL_PARAMS['SRAM'])
+  unknown = sorted(param for param in custom_cell_inputs if param != 'name' and param not in accepted)
+  if unknown:
+      raise ValueError("Unknown {} cell parameter(s) {}; expected any of {}".format(
+          cell_type, ", ".join(unknown), ", ".join(accepted)))
+
   if (cell_type == 'STT'):
-      cell_cfg = input_defs.cell_cfgs.STTRAMCellConfig(
-          cell_file_path=cell_path,
-         )
-      if "cell_size_F2" in custom_cell_inputs:
-          cell_cfg.cell_area = custom_cell_inputs["cell_size_F2"]
-      if "access_CMOS_width" in custom_cell_inputs:
-          cell_cfg.access_CMOS_width = custom_cell_inputs["access_CMOS_width"]
-      if "r_on" in custom_cell_inputs:
-          cell_cfg.r_on = custom_cell_inputs["r_on"]  
-      if "r_off" in custom_cell_inputs:
-          cell_cfg.r_off = custom_cell_inputs["r_off"]  
-      if "read_mode" in custom_cell_inputs:
-          cell_cfg.read_mode = custom_cell_inputs["read_mode"]  
-      if "read_voltage" in custom_cell_inputs:
-          cell_cfg.read_voltage = custom_cell_inputs["read_voltage"]  
-      if "min_sense_voltage" in custom_cell_inputs:
-          cell_cfg.min_sense_voltage = custom_cell_inputs["min_sense_voltage"]  
-      if "read_power" in custom_cell_inputs:
-          cell_cfg.read_power = custom_cell_inputs["read_power"]  
-      if "reset_mode" in custom_cell_inputs:
-          cell_cfg.reset_mode = custom_cell_inputs["reset_mode"]  
-      if "reset_current" in custom_cell_inputs:
-          cell_cfg.reset_current = custom_cell_inputs["reset_current"]  
-      if "reset_pulse" in custom_cell_inputs:
-          cell_cfg.reset_pulse = custom_cell_inputs["reset_pulse"]  
-      if "reset_energy" in custom_cell_inputs:
-          cell_cfg.reset_energy = custom_cell_inputs["reset_energy"]  
-      if "set_mode" in custom_cell_inputs:
-          cell_cfg.set_mode = custom_cell_inputs["set_mode"]  
-      if "set_current" in custom_cell_inputs:
-          cell_cfg.set_current = custom_cell_inputs["set_current"]  
-      if "set_pulse" in custom_cell_inputs:
-          cell_cfg.set_pulse = custom_cell_inputs["set_pulse"]  
-      if "set_energy" in custom_cell_inputs:
-          cell_cfg.set_energy = custom_cell_inputs["set_energy"]  
-      if "mlc" in custom_cell_inputs:
-          cell_cfg.mlc = custom_cell_inputs["mlc"]  
-      if "read_floating" in custom_cell_inputs:
-          cell_cfg.read_floating = custom_cell_inputs["read_floating"]  
-
-      cell_cfg.generate_cell_file()
-      cell_cfg.append_cell_file()
-  
+      cell_cfg = input_defs.cell_cfgs.STTRAMCellConfig(cell_file_path=cell_path)
   elif (cell_type == 'PCM'):
-      cell_cfg = input_defs.cell_cfgs.PCMCellConfig(
-          cell_file_path=cell_path,
-         )
-      if "cell_size_F2" in custom_cell_inputs:
-          cell_cfg.cell_area = custom_cell_inputs["cell_size_F2"]
-      if "access_CMOS_width" in custom_cell_inputs:
-          cell_cfg.access_CMOS_width = custom_cell_inputs["access_CMOS_width"]
-      if "r_on" in custom_cell_inputs:
-          cell_cfg.r_on = custom_cell_inputs["r_on"]  
-      if "r_off" in custom_cell_inputs:
-          cell_cfg.r_off = custom_cell_inputs["r_off"]  
-      if "read_mode" in custom_cell_inputs:
-          cell_cfg.read_mode = custom_cell_inputs["read_mode"]  
-      if "read_voltage" in custom_cell_inputs:
-          cell_cfg.read_voltage = custom_cell_inputs["read_voltage"]  
-      if "read_current" in custom_cell_inputs:
-          cell_cfg.read_current = custom_cell_inputs["read_current"]  
-      if "read_energy" in custom_cell_inputs:
-          cell_cfg.read_energy = custom_cell_inputs["read_energy"]  
-      if "reset_mode" in custom_cell_inputs:
-          cell_cfg.reset_mode = custom_cell_inputs["reset_mode"]  
-      if "reset_current" in custom_cell_inputs:
-          cell_cfg.reset_current = custom_cell_inputs["reset_current"]  
-      if "reset_pulse" in custom_cell_inputs:
-          cell_cfg.reset_pulse = custom_cell_inputs["reset_pulse"]  
-      if "set_mode" in custom_cell_inputs:
-          cell_cfg.set_mode = custom_cell_inputs["set_mode"]  
-      if "set_current" in custom_cell_inputs:
-          cell_cfg.set_current = custom_cell_inputs["set_current"]  
-      if "set_pulse" in custom_cell_inputs:
-          cell_cfg.set_pulse = custom_cell_inputs["set_pulse"]  
-      if "mlc" in custom_cell_inputs:
-          cell_cfg.mlc = custom_cell_inputs["mlc"]  
-      
-      cell_cfg.generate_cell_file()
-      cell_cfg.append_cell_file()
-  
-  elif (cell_type == 'CTT'):
-      cell_cfg = input_defs.cell_cfgs.CTTCellConfig()
-      if "cell_size_F2" in custom_cell_inputs:
-          cell_cfg.cell_area = custom_cell_inputs["cell_size_F2"]
-
- 
+      cell_cfg = input_defs.cell_cfgs.PCMCellConfig(cell_file_path=cell_path)
   elif (cell_type == 'RRAM'):
-      cell_cfg = input_defs.cell_cfgs.RRAMCellConfig(
-          cell_file_path=cell_path
-         )
-      if "cell_size_F2" in custom_cell_inputs:
-          cell_cfg.cell_area = custom_cell_inputs["cell_size_F2"]
-      if "access_CMOS_width" in custom_cell_inputs:
-          cell_cfg.access_CMOS_width = custom_cell_inputs["access_CMOS_width"]
-      if "r_on_set_v" in custom_cell_inputs:
-          cell_cfg.r_on_set_v = custom_cell_inputs["r_on_set_v"]
-      if "r_off_set_v" in custom_cell_inputs:
-          cell_cfg.r_off_set_v = custom_cell_inputs["r_off_set_v"]
-      if "r_on_reset_v" in custom_cell_inputs:
-          cell_cfg.r_on_reset_v = custom_cell_inputs["r_on_reset_v"]
-      if "r_off_reset_v" in custom_cell_inputs:
-          cell_cfg.r_off_reset_v = custom_cell_inputs["r_off_reset_v"]
-      if "r_on_read_v" in custom_cell_inputs:
-          cell_cfg.r_on_read_v = custom_cell_inputs["r_on_read_v"]
-      if "r_off_read_v" in custom_cell_inputs:
-          cell_cfg.r_off_read_v = custom_cell_inputs["r_off_read_v"]
-      if "r_on_half_reset" in custom_cell_inputs:
-          cell_cfg.r_on_half_reset = custom_cell_inputs["r_on_half_reset"]
-      if "cap_on" in custom_cell_inputs:
-          cell_cfg.cap_on = custom_cell_inputs["cap_on"]
-      if "cap_off" in custom_cell_inputs:
-          cell_cfg.cap_off = custom_cell_inputs["cap_off"]
-      if "read_mode" in custom_cell_inputs:
-          cell_cfg.read_mode = custom_cell_inputs["read_mode"]  
-      if "read_voltage" in custom_cell_inputs:
-          cell_cfg.read_voltage = custom_cell_inputs["read_voltage"]  
-      if "read_power" in custom_cell_inputs:
-          cell_cfg.read_power = custom_cell_inputs["read_power"]  
-      if "reset_mode" in custom_cell_inputs:
-          cell_cfg.reset_mode = custom_cell_inputs["reset_mode"]  
-      if "reset_voltage" in custom_cell_inputs:
-          cell_cfg.reset_voltage = custom_cell_inputs["reset_voltage"]  
-      if "reset_pulse" in custom_cell_inputs:
-          cell_cfg.reset_pulse = custom_cell_inputs["reset_pulse"]  
-      if "reset_energy" in custom_cell_inputs:
-          cell_cfg.reset_energy = custom_cell_inputs["reset_energy"]  
-      if "set_mode" in custom_cell_inputs:
-          cell_cfg.set_mode = custom_cell_inputs["set_mode"]  
-      if "set_voltage" in custom_cell_inputs:
-          cell_cfg.set_voltage = custom_cell_inputs["set_voltage"]  
-      if "set_pulse" in custom_cell_inputs:
-          cell_cfg.set_pulse = custom_cell_inputs["set_pulse"]  
-      if "set_energy" in custom_cell_inputs:
-          cell_cfg.set_energy = custom_cell_inputs["set_energy"]  
-      if "mlc" in custom_cell_inputs:
-          cell_cfg.mlc = custom_cell_inputs["mlc"]  
-      if "read_floating" in custom_cell_inputs:
-          cell_cfg.read_floating = custom_cell_inputs["read_floating"]  
-      
-      cell_cfg.generate_cell_file()
-      cell_cfg.append_cell_file()
-
+      cell_cfg = input_defs.cell_cfgs.RRAMCellConfig(cell_file_path=cell_path)
   elif (cell_type == 'FeFET'):
-      cell_cfg = input_defs.cell_cfgs.FeFETCellConfig(
-          cell_file_path=cell_path
-         )
-      if "cell_size_F2" in custom_cell_inputs:
-          cell_cfg.cell_area = custom_cell_inputs["cell_size_F2"]
-      if "access_CMOS_width" in custom_cell_inputs:
-          cell_cfg.access_CMOS_width = custom_cell_inputs["access_CMOS_width"]
-      if "access_Vdrop" in custom_cell_inputs:
-          cell_cfg.access_Vdrop = custom_cell_inputs["access_Vdrop"]
-      if "r_on_set_v" in custom_cell_inputs:
-          cell_cfg.r_on_set_v = custom_cell_inputs["r_on_set_v"]
-      if "r_off_set_v" in custom_cell_inputs:
-          cell_cfg.r_off_set_v = custom_cell_inputs["r_off_set_v"]
-      if "r_on_reset_v" in custom_cell_inputs:
-          cell_cfg.r_on_reset_v = custom_cell_inputs["r_on_reset_v"]
-      if "r_off_reset_v" in custom_cell_inputs:
-          cell_cfg.r_off_reset_v = custom_cell_inputs["r_off_reset_v"]
-      if "r_on_read_v" in custom_cell_inputs:
-          cell_cfg.r_on_read_v = custom_cell_inputs["r_on_read_v"]
-      if "r_off_read_v" in custom_cell_inputs:
-          cell_cfg.r_off_read_v = custom_cell_inputs["r_off_read_v"]
-      if "r_on_half_reset" in custom_cell_inputs:
-          cell_cfg.r_on_half_reset = custom_cell_inputs["r_on_half_reset"]
-      if "cap_on" in custom_cell_inputs:
-          cell_cfg.cap_on = custom_cell_inputs["cap_on"]
-      if "cap_off" in custom_cell_inputs:
-          cell_cfg.cap_off = custom_cell_inputs["cap_off"]
-      if "read_mode" in custom_cell_inputs:
-          cell_cfg.read_mode = custom_cell_inputs["read_mode"]  
-      if "read_voltage" in custom_cell_inputs:
-          cell_cfg.read_voltage = custom_cell_inputs["read_voltage"]  
-      if "read_power" in custom_cell_inputs:
-          cell_cfg.read_power = custom_cell_inputs["read_power"]  
-      if "reset_mode" in custom_cell_inputs:
-          cell_cfg.reset_mode = custom_cell_inputs["reset_mode"]  
-      if "reset_voltage" in custom_cell_inputs:
-          cell_cfg.reset_voltage = custom_cell_inputs["reset_voltage"]  
-      if "reset_pulse" in custom_cell_inputs:
-          cell_cfg.reset_pulse = custom_cell_inputs["reset_pulse"]  
-      if "reset_energy" in custom_cell_inputs:
-          cell_cfg.reset_energy = custom_cell_inputs["reset_energy"]  
-      if "set_mode" in custom_cell_inputs:
-          cell_cfg.set_mode = custom_cell_inputs["set_mode"]  
-      if "set_voltage" in custom_cell_inputs:
-          cell_cfg.set_voltage = custom_cell_inputs["set_voltage"]  
-      if "set_pulse" in custom_cell_inputs:
-          cell_cfg.set_pulse = custom_cell_inputs["set_pulse"]  
-      if "set_energy" in custom_cell_inputs:
-          cell_cfg.set_energy = custom_cell_inputs["set_energy"]  
-      if "mlc" in custom_cell_inputs:
-          cell_cfg.mlc = custom_cell_inputs["mlc"]  
-
+      cell_cfg = input_defs.cell_cfgs.FeFETCellConfig(cell_file_path=cell_path)
       cell_cfg.cell_ratio = 1.0
-      cell_cfg.generate_cell_file()
-      cell_cfg.append_cell_file()
-
   else:
-      cell_cfg = input_defs.cell_cfgs.SRAMCellConfig(
-          cell_area_F2 = 146,
-          cell_file_path=cell_path)
-      if "cell_size_F2" in custom_cell_inputs:
-          cell_cfg.cell_area = custom_cell_inputs["cell_size_F2"]
-      if "access_CMOS_width" in custom_cell_inputs:
-          cell_cfg.access_CMOS_width = custom_cell_inputs["access_CMOS_width"]
-      if "nmos_width" in custom_cell_inputs:
-          cell_cfg.nmos_width = custom_cell_inputs["nmos_width"]
-      if "pmos_width" in custom_cell_inputs:
-          cell_cfg.pmos_width = custom_cell_inputs["pmos_width"]
-      if "read_mode" in custom_cell_inputs:
-          cell_cfg.read_mode = custom_cell_inputs["read_mode"]
-
-      cell_cfg.generate_cell_file()
-      cell_cfg.append_cell_file()
+      cell_cfg = input_defs.cell_cfgs.SRAMCellConfig(cell_area_F2 = 146, cell_file_path=cell_path)
+
+  for param in accepted:
+      if param in custom_cell_inputs:
+          setattr(cell_cfg, 'cell_area' if param == 'cell_size_F2' else param, custom_cell_inputs[param])
+  return cell_cfg
+
+
+def _write_cell_file(cell_path, text):
+  """ Writes a cell file in one go, via a temporary file renamed into place """
+  temp_path = "{}.{}.tmp".format(cell_path, os.getpid())
+  with open(temp_path, 'w') as f:
+      f.write(text)
+  os.replace(temp_path, cell_path)
+
+
+def gen_custom_cell(cell_type, custom_cell_inputs):
+  """ Generates NVSim cell files for a specified cell type and input characteristics
+
+  :param cell_type: String specifying which NVM technology to use
+  :type cell_type: String
+  :param custom_cell_inputs: dictionary object specifying possible input params to cell def
+  :return: path to NVSim cell file and :class:`NVSimInputConfig` object containing NVSim input cfgs 
+  """
+  cell_path = os.path.join(CELL_CFGS_DIR, "{}_{}.cell".format(cell_type, custom_cell_inputs["name"]))
+  cell_cfg = custom_cell_cfg(cell_type, custom_cell_inputs, cell_path)
+  _write_cell_file(cell_path, cell_cfg.cell_file_text())
 
   return cell_path, cell_cfg
+
+
+def gen_custom_cells(cell_type, cell_inputs, cell_dir=None):
+  """ Generates NVSim cell files for a table of custom cell parameter sets, e.g. a sweep over
+  set_pulse, r_on and cell_size_F2
+
+  Each cell file is named after a hash of its contents, so identical parameter sets share one
+  file, which is written once and reused by later sweeps.
+
+  :param cell_type: String specifying which NVM technology to use
+  :type cell_type: String
+  :param cell_inputs: list of dictionaries or pandas dataframe with one parameter set per row;
+  missing (None/NaN) values keep the cell type defaults, and "name" is ignored; the other keys must
+  be in CUSTOM_CELL_PARAMS for the cell type
+  :param cell_dir: directory to write the cell files to (default: data/cell_cfgs)
+  :type cell_dir: String
+  :return: paths to the NVSim cell files, one per parameter set, e.g. for the "cell_file" key of
+  a memory configuration
+  :rtype: list of Strings
+  :raises ValueError: for CTT cells and for parameters the cell type does not accept
+  """
+  if cell_dir is None:
+      cell_dir = CELL_CFGS_DIR
+  os.makedirs(cell_dir, exist_ok=True)
+  if isinstance(cell_inputs, pd.DataFrame):
+      cell_inputs = cell_inputs.to_dict('records')
+
+  paths = []
+  by_params = {}
+  for custom_cell_inputs in cell_inputs:
+      params = {param: value for param, value in custom_cell_inputs.items()
+                if param != 'name' and not (value is None or (isinstance(value, float) and np.isnan(value)))}
+      key = tuple(sorted((param, repr(value)) for param, value in params.items()))
+      if key not in by_params:
+          text = custom_cell_cfg(cell_type, params, "").cell_file_text()
+          digest = hashlib.sha256(text.encode()).hexdigest()[:16]
+          cell_path = os.path.join(cell_dir, "{}_{}.cell".format(cell_type, digest))
+          if not os.path.exists(cell_path):
+              _write_cell_file(cell_path, text)
+          by_params[key] = cell_path
+      paths.append(by_params[key])
+  return paths
@@ -10,10 +10,16 @@ from .traffic import (
     graph_traffic,
     spec_traffic,
     spec_traffic_single,
-    generic_traffic_with_write_buff
+    generic_traffic_with_write_buff,
+    generic_traffic_adaptive,
+    catalog_traffic,
+    ADAPTIVE_METRICS
 )
 
-from .eval_utils import ExperimentResult, parse_nvsim_input_file
+from .eval_utils import ExperimentResult, BatchExperimentResult, ResultSink, parse_nvsim_input_file
+from .pareto import pareto_front, grouped_pareto_front, write_pareto_frontier
+from .coefficient_model import CoefficientModel
+from .result_merge import merge_results, combine_by_technology
 
 __all__ = [
     'generic_traffic',
@@ -22,6 +28,17 @@ __all__ = [
     'spec_traffic',
     'spec_traffic_single', 
     'generic_traffic_with_write_buff',
+    'generic_traffic_adaptive',
+    'catalog_traffic',
+    'ADAPTIVE_METRICS',
     'ExperimentResult',
-    'parse_nvsim_input_file'
+    'BatchExperimentResult',
+    'ResultSink',
+    'parse_nvsim_input_file',
+    'pareto_front',
+    'grouped_pareto_front',
+    'write_pareto_frontier',
+    'CoefficientModel',
+    'merge_results',
+    'combine_by_technology'
 ]
\ No newline at end of file
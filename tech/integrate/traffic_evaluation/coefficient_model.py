@@ -0,0 +1,238 @@
+"""
+Coefficient Model
+
+This module contains a closed-form version of ExperimentResult.evaluate. For a
+fixed array configuration every metric is affine in a small set of workload
+features (accesses per second and total accesses, after the word-width
+rounding), so each configuration reduces to one coefficient matrix computed
+once. A new workload is then answered by a dot product, and comparing it
+across every configuration by a single matrix product.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..input_defs.access_pattern import PatternConfig
+    from ..input_defs.nvsim_interface import NVSimInputConfig, NVSimOutputConfig
+
+# Metrics in the order of a coefficient matrix's rows (ExperimentResult attribute names)
+METRICS = ("total_dynamic_read_power", "total_dynamic_write_power", "total_power",
+           "total_read_energy", "total_write_energy", "total_read_latency", "total_write_latency",
+           "read_bw_utilization", "write_bw_utilization")
+
+# Workload features in the order of a coefficient matrix's columns. The access
+# counts are the reads/writes per second when the pattern has no totals, as in
+# ExperimentResult.evaluate.
+FEATURES = ("constant", "reads_per_s", "writes_per_s", "read_accesses", "write_accesses")
+
+
+def workload_features(access_pattern: "PatternConfig", word_width: int) -> np.ndarray:
+    """
+    Computes the feature vector of a workload for arrays of a given word width
+    
+    Args:
+        access_pattern: Access pattern configuration (not modified)
+        word_width: Array word width in bits
+        
+    Returns:
+        Array of len(FEATURES) values
+    """
+    read_freq = access_pattern.read_freq
+    write_freq = access_pattern.write_freq
+    if read_freq == -1 or write_freq == -1:
+        read_freq = (access_pattern.total_reads / access_pattern.total_ins) / 1.e8
+        write_freq = (access_pattern.total_writes / access_pattern.total_ins) / 1.e8
+    
+    read_per_s = np.ceil((8 * access_pattern.read_size * read_freq) / word_width)
+    write_per_s = np.ceil((8 * access_pattern.write_size * write_freq) / word_width)
+    
+    if access_pattern.total_reads == -1:
+        read_accesses, write_accesses = read_per_s, write_per_s
+    else:
+        read_accesses = np.ceil((8 * access_pattern.total_reads * access_pattern.read_size) / word_width)
+        write_accesses = np.ceil((8 * access_pattern.total_writes * access_pattern.write_size) / word_width)
+    
+    return np.array([1., read_per_s, write_per_s, read_accesses, write_accesses])
+
+
+def configuration_coefficients(nvsim_input_cfg: "NVSimInputConfig",
+                               nvsim_output: "NVSimOutputConfig") -> np.ndarray:
+    """
+    Computes the coefficient matrix of an array configuration
+    
+    Multiplying it by workload_features(pattern, nvsim_input_cfg.word_width)
+    gives the METRICS of ExperimentResult.evaluate for that pattern, up to
+    floating-point rounding.
+    
+    Args:
+        nvsim_input_cfg: NVSim input configuration
+        nvsim_output: NVSim output configuration
+        
+    Returns:
+        (len(METRICS), len(FEATURES)) array
+    """
+    read_energy = nvsim_output.read_energy / 1000. / 1000. / 1000.
+    write_energy = nvsim_output.write_energy / 1000. / 1000. / 1000.
+    read_latency = nvsim_output.read_latency / 1000. / 1000.
+    write_latency = nvsim_output.write_latency / 1000. / 1000.
+    read_bw = nvsim_input_cfg.word_width / (nvsim_output.read_bw * 8e9) * 100
+    write_bw = nvsim_input_cfg.word_width / (nvsim_output.write_bw * 8e9) * 100
+    
+    return np.array([
+        # constant, reads_per_s, writes_per_s, read_accesses, write_accesses
+        [0., read_energy, 0., 0., 0.],
+        [0., 0., write_energy, 0., 0.],
+        [nvsim_output.leakage_power, read_energy, write_energy, 0., 0.],
+        [0., 0., 0., read_energy, 0.],
+        [0., 0., 0., 0., write_energy],
+        [0., 0., 0., read_latency, 0.],
+        [0., 0., 0., 0., write_latency],
+        [0., read_bw, 0., 0., 0.],
+        [0., 0., write_bw, 0., 0.],
+    ])
+
+
+class CoefficientModel:
+    """
+    Closed-form traffic metrics for a set of array configurations
+    
+    Each added configuration is reduced to its coefficient matrix once;
+    queries never touch NVSim outputs or the sweep code again.
+    
+    Usage:
+        model = CoefficientModel()
+        model.add(nvsim_input_cfg, nvsim_output, label="SRAM 1MB")
+        power = model.evaluate(pattern)["total_power"]   # one value per configuration
+        label, value = model.best(pattern, "total_power")
+    """
+    
+    def __init__(self):
+        """Initialize an empty model"""
+        self.labels: List[Any] = []
+        self.word_widths = np.empty(0, dtype=int)
+        self.coefficients = np.empty((0, len(METRICS), len(FEATURES)))
+    
+    def __len__(self) -> int:
+        return len(self.labels)
+    
+    def add(self, nvsim_input_cfg: "NVSimInputConfig", nvsim_output: "NVSimOutputConfig",
+            label: Optional[Any] = None) -> int:
+        """
+        Add an array configuration
+        
+        Args:
+            nvsim_input_cfg: NVSim input configuration
+            nvsim_output: NVSim output configuration
+            label: Name reported for the configuration (defaults to its index)
+            
+        Returns:
+            Index of the configuration
+        """
+        index = len(self.labels)
+        self.labels.append(index if label is None else label)
+        self.word_widths = np.append(self.word_widths, int(nvsim_input_cfg.word_width))
+        self.coefficients = np.concatenate(
+            [self.coefficients, configuration_coefficients(nvsim_input_cfg, nvsim_output)[None]]
+        )
+        return index
+    
+    def features(self, access_patterns: Sequence["PatternConfig"]) -> Dict[int, np.ndarray]:
+        """
+        Computes workload features once per distinct word width of the configurations
+        
+        Args:
+            access_patterns: Access pattern configurations
+            
+        Returns:
+            Dictionary mapping word width to a (len(access_patterns), len(FEATURES)) array
+        """
+        return {
+            int(word_width): np.array([workload_features(pattern, word_width) for pattern in access_patterns])
+            .reshape(len(access_patterns), len(FEATURES))
+            for word_width in np.unique(self.word_widths)
+        }
+    
+    def evaluate_many(self, access_patterns: Sequence["PatternConfig"]) -> np.ndarray:
+        """
+        Evaluates every metric of many workloads against every configuration
+        
+        Args:
+            access_patterns: Access pattern configurations
+            
+        Returns:
+            (len(access_patterns), len(self), len(METRICS)) array
+        """
+        values = np.empty((len(access_patterns), len(self), len(METRICS)))
+        for word_width, features in self.features(access_patterns).items():
+            configs = self.word_widths == word_width
+            values[:, configs, :] = np.einsum("cmf,wf->wcm", self.coefficients[configs], features)
+        return values
+    
+    def evaluate(self, access_pattern: "PatternConfig") -> Dict[str, np.ndarray]:
+        """
+        Evaluates one workload against every configuration
+        
+        Args:
+            access_pattern: Access pattern configuration
+            
+        Returns:
+            Dictionary mapping each metric in METRICS to one value per configuration
+        """
+        values = self.evaluate_many([access_pattern])[0]
+        return {metric: values[:, m] for m, metric in enumerate(METRICS)}
+    
+    def best(self, access_pattern: "PatternConfig", metric: str = "total_power") -> Tuple[Any, float]:
+        """
+        Finds the configuration with the lowest value of a metric for a workload
+        
+        Args:
+            access_pattern: Access pattern configuration
+            metric: Metric name from METRICS
+            
+        Returns:
+            Tuple of (configuration label, metric value)
+        """
+        if len(self) == 0:
+            raise ValueError("CoefficientModel has no configurations")
+        values = self.evaluate(access_pattern)[_metric_name(metric)]
+        index = int(np.argmin(values))
+        return self.labels[index], float(values[index])
+    
+    def save(self, path: str):
+        """
+        Save the model to a NumPy .npz file
+        
+        Args:
+            path: Output file path
+        """
+        np.savez(path, coefficients=self.coefficients, word_widths=self.word_widths,
+                 labels=np.array([str(label) for label in self.labels]),
+                 metrics=np.array(METRICS), features=np.array(FEATURES))
+    
+    @classmethod
+    def load(cls, path: str) -> "CoefficientModel":
+        """
+        Load a model saved with save
+        
+        Args:
+            path: File written by save
+            
+        Returns:
+            CoefficientModel (labels are restored as strings)
+        """
+        with np.load(path) as data:
+            if tuple(data["metrics"]) != METRICS or tuple(data["features"]) != FEATURES:
+                raise ValueError(f"{path} was saved with a different metric or feature layout")
+            model = cls()
+            model.coefficients = data["coefficients"]
+            model.word_widths = data["word_widths"]
+            model.labels = [str(label) for label in data["labels"]]
+        return model
+
+
+def _metric_name(metric: str) -> str:
+    """Validates a metric name"""
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'; expected one of {', '.join(METRICS)}")
+    return metric
@@ -7,9 +7,10 @@ traffic evaluation and performance analysis.
 
 import os
 import numpy as np
-import fileinput
 import csv
-from typing import List, Tuple, Optional, TYPE_CHECKING
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+from ..instrumentation import stage, timed
 
 if TYPE_CHECKING:
     from ..input_defs.access_pattern import PatternConfig
@@ -47,6 +48,25 @@ def parse_nvsim_input_file(file_path: str) -> Tuple[List[str], List[str]]:
     return headers, vals
 
 
+def _bits_per_cell_from_csv_path(csv_file_path: str) -> int:
+    """
+    Recover the bits-per-cell setting encoded in a results CSV file name
+    
+    Args:
+        csv_file_path: Path to CSV output file
+        
+    Returns:
+        Number of bits per cell (defaults to 1)
+    """
+    if "1BPC" in csv_file_path:
+        return 1
+    elif "2BPC" in csv_file_path:
+        return 2
+    elif "3BPC" in csv_file_path:
+        return 3
+    return 1
+
+
 class ExperimentResult:
     """
     Experiment result evaluation and reporting
@@ -83,6 +103,7 @@ class ExperimentResult:
         self.read_per_s: float = 0.0
         self.write_per_s: float = 0.0
     
+    @timed("evaluation")
     def evaluate(self):
         """
         Calculate total # reads/writes per second and derive all metrics
@@ -161,29 +182,17 @@ class ExperimentResult:
             cell_cfg_path: Path to cell configuration file
             mem_cfg_path: Path to memory configuration file
         """
-        if os.path.exists(mem_cfg_path):
-            for line in fileinput.FileInput(mem_cfg_path, inplace=True):
-                if line.rstrip():
-                    print(line, end="")
-
-        cell_headers, cell_vals = parse_nvsim_input_file(cell_cfg_path)
-        mem_headers, mem_vals = parse_nvsim_input_file(mem_cfg_path)
-
-        cell_param_map = dict(zip(cell_headers, cell_vals)) if len(cell_headers) == len(cell_vals) else {}
-        memory_type = cell_param_map.get("MemCellType", "")
-        
-        row_to_insert = self._generate_dynamic_header(memory_type)
-
-        with open(csv_file_path, "a+", newline='') as fp:
-            wr = csv.writer(fp, dialect='excel')
-            wr.writerow(row_to_insert)
+        with ResultSink(csv_file_path) as sink:
+            sink.write_header(self, cell_cfg_path, mem_cfg_path)
 
     def report_result_benchmark(self, to_csv: int, csv_file_path: str, cell_cfg_path: str, 
                               mem_cfg_path: str, access_pattern: "PatternConfig"):
         """
         Report results for benchmark studies
         
-        Configuration for memory access patterns
+        Configuration for memory access patterns. Sweeps that report many rows
+        for the same configuration should write through a shared
+        :class:`ResultSink` instead.
         
         Args:
             to_csv: Flag for CSV output (1 for CSV, 0 for other)
@@ -194,38 +203,15 @@ class ExperimentResult:
         """
         if self.output is None:
             raise ValueError("nvsim_output is required for reporting results")
-        if os.path.exists(mem_cfg_path):
-            for line in fileinput.FileInput(mem_cfg_path, inplace=True):
-                if line.rstrip():
-                    print(line, end="")
-
-        cell_headers, cell_vals = parse_nvsim_input_file(cell_cfg_path)
-        mem_headers, mem_vals = parse_nvsim_input_file(mem_cfg_path)
-
-        if "1BPC" in csv_file_path:
-            bits_per_cell = 1
-        elif "2BPC" in csv_file_path:
-            bits_per_cell = 2
-        elif "3BPC" in csv_file_path:
-            bits_per_cell = 3
-        else:
-            bits_per_cell = 1
-
-        extended_params = self._extract_extended_parameters(cell_cfg_path, mem_cfg_path, cell_vals, mem_vals)
-        
-        cell_param_map = dict(zip(cell_headers, cell_vals)) if len(cell_headers) == len(cell_vals) else {}
-        memory_type = cell_param_map.get("MemCellType", "")
-        
-        row_to_insert = self._generate_dynamic_row(memory_type, extended_params, cell_cfg_path, access_pattern, bits_per_cell)
-
         
-        with open(csv_file_path, "a", newline='') as fp:
-            wr = csv.writer(fp, dialect='excel')
-            wr.writerow(row_to_insert)
+        with ResultSink(csv_file_path) as sink:
+            sink.write_result(self, cell_cfg_path, mem_cfg_path, access_pattern)
     
     def _extract_extended_parameters(self, cell_cfg_path: str, mem_cfg_path: str, 
                                    cell_vals: List[str], mem_vals: List[str], 
-                                   json_config: dict = None) -> dict:
+                                   json_config: dict = None,
+                                   cell_headers: Optional[List[str]] = None,
+                                   mem_headers: Optional[List[str]] = None) -> dict:
         """
         Extract extended parameters from cell and memory configuration files based on unified schema
         
@@ -235,16 +221,20 @@ class ExperimentResult:
             cell_vals: Parsed cell configuration values
             mem_vals: Parsed memory configuration values
             json_config: JSON configuration for default values
+            cell_headers: Parsed cell configuration headers (re-parsed from cell_cfg_path if omitted)
+            mem_headers: Parsed memory configuration headers (re-parsed from mem_cfg_path if omitted)
             
         Returns:
             Dictionary containing all extracted parameters
         """
         params = {}
         
-        cell_headers, _ = parse_nvsim_input_file(cell_cfg_path)
+        if cell_headers is None:
+            cell_headers, _ = parse_nvsim_input_file(cell_cfg_path)
         cell_param_map = dict(zip(cell_headers, cell_vals)) if len(cell_headers) == len(cell_vals) else {}
         
-        mem_headers, _ = parse_nvsim_input_file(mem_cfg_path)
+        if mem_headers is None:
+            mem_headers, _ = parse_nvsim_input_file(mem_cfg_path)
         mem_param_map = dict(zip(mem_headers, mem_vals)) if len(mem_headers) == len(mem_vals) else {}
         
         universal_config_params = [
@@ -506,6 +496,73 @@ class ExperimentResult:
         Returns:
             List of values matching the dynamic header
         """
+        row = self._generate_config_columns(memory_type, extended_params)
+            
+        # Add file reference and traffic evaluation results (always included)
+        row.append(extended_params.get("MemoryCellInputFile", cell_cfg_path))
+        row.extend(self._generate_result_columns(access_pattern))
+        row.append(bits_per_cell)
+        
+        return row
+    
+    def _generate_result_columns(self, access_pattern) -> list:
+        """
+        Generate the traffic evaluation result columns of a CSV row
+        
+        Args:
+            access_pattern: Access pattern configuration
+            
+        Returns:
+            List of values from "Benchmark Name" through "Leakage Power (mW)"
+        """
+        return [
+            access_pattern.benchmark_name, 
+            access_pattern.read_freq, 
+            access_pattern.write_freq, 
+            self.total_dynamic_read_power, 
+            self.total_dynamic_write_power, 
+            self.total_power, 
+            self.total_read_energy, 
+            self.total_write_energy, 
+            self.total_read_latency, 
+            self.total_write_latency, 
+            self.read_bw_utilization, 
+            self.write_bw_utilization, 
+            self.output.area, 
+            self.output.area_efficiency, 
+            self.output.read_latency, 
+            self.output.write_latency, 
+            self.output.read_energy, 
+            self.output.write_energy, 
+            self.output.leakage_power
+        ]
+    
+    def _iter_result_columns(self, access_pattern=None) -> Iterator[list]:
+        """
+        Yield the result columns for every row this result reports
+        
+        Args:
+            access_pattern: Access pattern configuration (defaults to the evaluated one)
+            
+        Returns:
+            Iterator over result column lists, one per CSV row
+        """
+        yield self._generate_result_columns(access_pattern or self.access_pattern)
+    
+    def _generate_config_columns(self, memory_type: str, extended_params: dict) -> list:
+        """
+        Generate the configuration-derived leading columns of a CSV row
+        
+        These columns depend only on the cell and memory configuration, so they
+        are shared by every traffic point evaluated against the same array.
+        
+        Args:
+            memory_type: The memory cell type
+            extended_params: Dictionary of extracted parameters
+            
+        Returns:
+            List of values matching the configuration part of the dynamic header
+        """
         # Universal config parameters (always included)
         row = [
             extended_params.get("ProcessNode", self.input_cfg.process_node if self.input_cfg else ""),
@@ -702,30 +759,319 @@ class ExperimentResult:
                 extended_params.get("MaxStorageNodeDrop (V)", ""),
                 extended_params.get("RetentionTime (us)", "")
             ])
+        
+        return row
+
+
+class BatchExperimentResult(ExperimentResult):
+    """
+    Vectorized experiment result evaluation over many access patterns
+    
+    Computes the same metrics as :class:`ExperimentResult` for whole arrays of
+    read/write frequencies against a single array configuration. Every metric
+    attribute holds a NumPy array with one entry per traffic point.
+    """
+    
+    def __init__(self, access_pattern: Optional["PatternConfig"] = None, 
+                 nvsim_input_cfg: Optional["NVSimInputConfig"] = None, 
+                 nvsim_output: Optional["NVSimOutputConfig"] = None,
+                 read_freq: Optional[Sequence[float]] = None,
+                 write_freq: Optional[Sequence[float]] = None,
+                 benchmark_names: Optional[Union[str, Sequence[str]]] = None,
+                 write_latency: Optional[Sequence[float]] = None):
+        """
+        Initialize batch experiment result
+        
+        Args:
+            access_pattern: Access pattern supplying sizes and totals shared by all points
+            nvsim_input_cfg: NVSim input configuration
+            nvsim_output: NVSim output configuration
+            read_freq: Reads per second for each traffic point
+            write_freq: Writes per second for each traffic point
+            benchmark_names: Benchmark name per point, or a single name for all points
+                (defaults to access_pattern.benchmark_name)
+            write_latency: Optional per-point write latency (ns) overriding
+                nvsim_output.write_latency, e.g. for write-buffer masking studies
+        """
+        super().__init__(access_pattern, nvsim_input_cfg, nvsim_output)
+        
+        if read_freq is None or write_freq is None:
+            raise ValueError("read_freq and write_freq are required for batch evaluation")
+        if len(read_freq) != len(write_freq):
+            raise ValueError("read_freq and write_freq must have the same length")
+        if write_latency is not None and len(write_latency) != len(read_freq):
+            raise ValueError("write_latency must have one entry per traffic point")
+        
+        self.read_freq = read_freq
+        self.write_freq = write_freq
+        self.benchmark_names = benchmark_names
+        self.write_latency = write_latency
+    
+    def __len__(self) -> int:
+        return len(self.read_freq)
+    
+    @timed("evaluation")
+    def evaluate(self):
+        """
+        Calculate total # reads/writes per second and derive all metrics for every point
+        """
+        if self.access_pattern is None:
+            raise ValueError("access_pattern is required for evaluation")
+        if self.input_cfg is None:
+            raise ValueError("nvsim_input_cfg is required for evaluation")
+        if self.output is None:
+            raise ValueError("nvsim_output is required for evaluation")
+        
+        read_freq = np.asarray(self.read_freq, dtype=float)
+        write_freq = np.asarray(self.write_freq, dtype=float)
+        
+        derived = (read_freq == -1) | (write_freq == -1)
+        if derived.any():
+            read_freq = np.where(derived, (self.access_pattern.total_reads / self.access_pattern.total_ins) / 1.e8, read_freq)
+            write_freq = np.where(derived, (self.access_pattern.total_writes / self.access_pattern.total_ins) / 1.e8, write_freq)
+            self.read_freq = read_freq
+            self.write_freq = write_freq
+        
+        write_latency = self.output.write_latency
+        if self.write_latency is not None:
+            write_latency = np.asarray(self.write_latency, dtype=float)
+        
+        self.read_per_s = np.ceil((8 * self.access_pattern.read_size * read_freq) / self.input_cfg.word_width)
+        self.total_dynamic_read_power = self.read_per_s * self.output.read_energy / 1000. / 1000. / 1000.
+        
+        self.write_per_s = np.ceil((8 * self.access_pattern.write_size * write_freq) / self.input_cfg.word_width)
+        self.total_dynamic_write_power = self.write_per_s * self.output.write_energy / 1000. / 1000. /1000.
+        
+        self.total_power = self.output.leakage_power + self.total_dynamic_read_power + self.total_dynamic_write_power
+        
+        if (self.access_pattern.total_reads == -1):
+            self.total_read_energy = self.total_dynamic_read_power
+            self.total_write_energy = self.total_dynamic_write_power
+            self.total_read_latency = self.read_per_s * self.output.read_latency / 1000. / 1000.
+            self.total_write_latency = self.write_per_s * write_latency / 1000. / 1000.
+        else:
+            total_read_access = np.ceil((8 * self.access_pattern.total_reads * self.access_pattern.read_size) / self.input_cfg.word_width) 
+            self.total_read_energy = np.full(len(self), total_read_access * self.output.read_energy / 1000. / 1000. / 1000.)
+            total_write_access = np.ceil((8 * self.access_pattern.total_writes * self.access_pattern.write_size) / self.input_cfg.word_width) 
+            self.total_write_energy = np.full(len(self), total_write_access * self.output.write_energy / 1000. / 1000. /1000.)
+            self.total_read_latency = np.full(len(self), total_read_access * self.output.read_latency / 1000. / 1000.)
+            self.total_write_latency = total_write_access * np.broadcast_to(write_latency, (len(self),)) / 1000. / 1000.
+        
+        self.read_bw_utilization = ((self.read_per_s * self.input_cfg.word_width) / (self.output.read_bw * 8e9)) * 100
+        self.write_bw_utilization = ((self.write_per_s * self.input_cfg.word_width) / (self.output.write_bw * 8e9)) * 100
+    
+    def report_result_benchmark(self, to_csv: int, csv_file_path: str, cell_cfg_path: str, 
+                              mem_cfg_path: str, access_pattern: Optional["PatternConfig"] = None):
+        """
+        Report results for every traffic point in a single CSV write
+        
+        Args:
+            to_csv: Flag for CSV output (1 for CSV, 0 for other)
+            csv_file_path: Path to CSV output file
+            cell_cfg_path: Path to cell configuration file
+            mem_cfg_path: Path to memory configuration file
+            access_pattern: Unused, kept for signature compatibility with :class:`ExperimentResult`
+        """
+        if self.output is None:
+            raise ValueError("nvsim_output is required for reporting results")
+        
+        with ResultSink(csv_file_path) as sink:
+            sink.write_result(self, cell_cfg_path, mem_cfg_path)
+    
+    def _iter_result_columns(self, access_pattern=None) -> Iterator[list]:
+        """
+        Yield the per-point result columns in dynamic header order
+        
+        Args:
+            access_pattern: Unused, benchmark names come from the batch itself
             
-        # Add file reference and traffic evaluation results (always included)
-        row.extend([
-            extended_params.get("MemoryCellInputFile", cell_cfg_path),
-            access_pattern.benchmark_name, 
-            access_pattern.read_freq, 
-            access_pattern.write_freq, 
-            self.total_dynamic_read_power, 
-            self.total_dynamic_write_power, 
-            self.total_power, 
-            self.total_read_energy, 
-            self.total_write_energy, 
-            self.total_read_latency, 
-            self.total_write_latency, 
-            self.read_bw_utilization, 
-            self.write_bw_utilization, 
-            self.output.area, 
-            self.output.area_efficiency, 
-            self.output.read_latency, 
-            self.output.write_latency, 
-            self.output.read_energy, 
-            self.output.write_energy, 
-            self.output.leakage_power, 
-            bits_per_cell
-        ])
+        Returns:
+            Iterator over lists from "Benchmark Name" through "Leakage Power (mW)"
+        """
+        n = len(self)
+        names = self.benchmark_names
+        if names is None:
+            names = self.access_pattern.benchmark_name
+        if isinstance(names, str):
+            names = [names] * n
+        
+        write_latency = self.output.write_latency
+        if self.write_latency is not None:
+            write_latency = _as_list(self.write_latency)
+        else:
+            write_latency = [write_latency] * n
+        
+        columns = [
+            names,
+            _as_list(self.read_freq),
+            _as_list(self.write_freq),
+            self.total_dynamic_read_power.tolist(),
+            self.total_dynamic_write_power.tolist(),
+            self.total_power.tolist(),
+            self.total_read_energy.tolist(),
+            self.total_write_energy.tolist(),
+            self.total_read_latency.tolist(),
+            self.total_write_latency.tolist(),
+            self.read_bw_utilization.tolist(),
+            self.write_bw_utilization.tolist(),
+            [self.output.area] * n,
+            [self.output.area_efficiency] * n,
+            [self.output.read_latency] * n,
+            write_latency,
+            [self.output.read_energy] * n,
+            [self.output.write_energy] * n,
+            [self.output.leakage_power] * n,
+        ]
+        
+        for values in zip(*columns):
+            yield list(values)
+
+
+def _as_list(values) -> list:
+    """Return a plain list for array-like input without altering Python scalars"""
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+class ResultSink:
+    """
+    Buffered writer for a benchmark results CSV
+    
+    A sink is opened once per array configuration and shared by every traffic
+    sweep that reports into the same file. The configuration-derived leading
+    columns are parsed from the cell and memory cfg files once per
+    configuration and cached, and rows are buffered in memory and written in
+    large batches, on :meth:`flush` or on :meth:`close`.
+    
+    Usage:
+        with ResultSink(results_csv) as sink:
+            sink.write_header(result, cell_path, cfg_path)
+            generic_traffic(access_pattern, ..., sink, cell_paths, cfg_paths)
+    """
+    
+    DEFAULT_BUFFER_ROWS = 50000
+    
+    def __init__(self, csv_file_path: str, buffer_rows: int = DEFAULT_BUFFER_ROWS):
+        """
+        Initialize result sink
+        
+        Args:
+            csv_file_path: Path to CSV output file (appended to, created if missing)
+            buffer_rows: Number of buffered rows that triggers a write
+        """
+        self.csv_file_path = csv_file_path
+        self.buffer_rows = max(1, buffer_rows)
+        self.rows_written = 0
+        self._rows: List[list] = []
+        self._fp = None
+        self._writer = None
+        self._config_cache = {}
+    
+    def __enter__(self) -> "ResultSink":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def write_header(self, result: ExperimentResult, cell_cfg_path: str, mem_cfg_path: str):
+        """
+        Write the dynamic header row for a configuration
+        
+        Args:
+            result: Result whose configuration defines the header
+            cell_cfg_path: Path to cell configuration file
+            mem_cfg_path: Path to memory configuration file
+        """
+        memory_type, _ = self._config_columns(result, cell_cfg_path, mem_cfg_path)
+        self._rows.append(result._generate_dynamic_header(memory_type))
+        self._maybe_flush()
+    
+    def write_result(self, result: ExperimentResult, cell_cfg_path: str, mem_cfg_path: str,
+                     access_pattern: Optional["PatternConfig"] = None):
+        """
+        Buffer the rows of an evaluated :class:`ExperimentResult` or :class:`BatchExperimentResult`
+        
+        Args:
+            result: Evaluated experiment result
+            cell_cfg_path: Path to cell configuration file
+            mem_cfg_path: Path to memory configuration file
+            access_pattern: Access pattern to report for single results (defaults to the evaluated one)
+        """
+        _, config_columns = self._config_columns(result, cell_cfg_path, mem_cfg_path)
+        bits_per_cell = [_bits_per_cell_from_csv_path(self.csv_file_path)]
+        
+        self._rows.extend(config_columns + columns + bits_per_cell
+                          for columns in result._iter_result_columns(access_pattern))
+        self._maybe_flush()
+    
+    def flush(self, sync: bool = False):
+        """
+        Write all buffered rows to the CSV file
+        
+        Args:
+            sync: Also fsync the file so the rows survive a crash (used for checkpoints)
+        """
+        if self._rows:
+            with stage("csv_report") as timer:
+                if self._fp is None:
+                    self._fp = open(self.csv_file_path, "a", newline='')
+                    self._writer = csv.writer(self._fp, dialect='excel')
+                start = self._fp.tell()
+                self._writer.writerows(self._rows)
+                self._fp.flush()
+                timer.add_bytes(self._fp.tell() - start)
+                self.rows_written += len(self._rows)
+                self._rows = []
+        if sync and self._fp is not None:
+            os.fsync(self._fp.fileno())
+    
+    def close(self):
+        """
+        Flush remaining rows and close the CSV file
+        """
+        try:
+            self.flush()
+        finally:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+                self._writer = None
+    
+    def _maybe_flush(self):
+        if len(self._rows) >= self.buffer_rows:
+            self.flush()
+    
+    def _config_columns(self, result: ExperimentResult, cell_cfg_path: str,
+                        mem_cfg_path: str) -> Tuple[str, list]:
+        """
+        Return the memory type and cached configuration columns for a configuration
+        
+        Args:
+            result: Result providing the NVSim input config used for defaults
+            cell_cfg_path: Path to cell configuration file
+            mem_cfg_path: Path to memory configuration file
+            
+        Returns:
+            Tuple of (memory_type, leading columns through "MemoryCellInputFile")
+        """
+        input_cfg = result.input_cfg
+        key = (cell_cfg_path, mem_cfg_path,
+               getattr(input_cfg, "process_node", None), getattr(input_cfg, "opt_target", None),
+               getattr(input_cfg, "word_width", None), getattr(input_cfg, "capacity", None))
+        
+        if key not in self._config_cache:
+            cell_headers, cell_vals = parse_nvsim_input_file(cell_cfg_path)
+            mem_headers, mem_vals = parse_nvsim_input_file(mem_cfg_path)
+            
+            extended_params = result._extract_extended_parameters(cell_cfg_path, mem_cfg_path, cell_vals, mem_vals,
+                                                                  cell_headers=cell_headers, mem_headers=mem_headers)
+            
+            cell_param_map = dict(zip(cell_headers, cell_vals)) if len(cell_headers) == len(cell_vals) else {}
+            memory_type = cell_param_map.get("MemCellType", "")
+            
+            config_columns = result._generate_config_columns(memory_type, extended_params)
+            config_columns.append(extended_params.get("MemoryCellInputFile", cell_cfg_path))
+            self._config_cache[key] = (memory_type, config_columns)
         
-        return row
\ No newline at end of file
+        return self._config_cache[key]
@@ -0,0 +1,258 @@
+"""
+Pareto Frontier
+
+This module finds the non-dominated (Pareto-optimal) designs in traffic
+evaluation results. Every objective is minimized; a design dominates another
+when it is no worse in every objective and strictly better in at least one.
+Two objectives use an O(n log n) sort-and-sweep, more objectives use a
+sort-filter block-nested-loop skyline vectorized with NumPy.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import csv
+import logging
+
+import numpy as np
+
+# Objectives used when none are configured (results CSV column names, all minimized)
+DEFAULT_OBJECTIVES = ("Total Power", "Total Read Latency (ms)", "Total Write Latency (ms)",
+                      "Area (mm^2)", "Read BW Util", "Write BW Util")
+
+# Rows are compared only within a benchmark: same name and same traffic
+DEFAULT_GROUP_BY = ("Benchmark Name", "Read Accesses", "Write Accesses")
+
+# Configuration columns copied to the frontier file to identify each design
+DESIGN_COLUMNS = ("MemCellType", "OptimizationTarget", "Capacity (KB)", "ProcessNode", "Bits Per Cell")
+
+# Candidates reduced to their own skyline per step of the block-nested loop
+_BLOCK_SIZE = 256
+
+# Upper bound on comparison matrix elements when filtering candidates against new frontier rows
+_FILTER_ELEMENTS = 1 << 22
+
+
+def pareto_front(points) -> np.ndarray:
+    """
+    Returns the indices of the non-dominated rows of an objective matrix
+    
+    Identical rows do not dominate each other, so duplicates on the frontier
+    are all kept. Rows containing NaN are never on the frontier.
+    
+    Args:
+        points: (n, k) array-like of objective values, all minimized
+        
+    Returns:
+        Sorted array of row indices on the frontier
+    """
+    points = np.asarray(points, dtype=float)
+    if points.ndim != 2:
+        raise ValueError("points must be a 2-D array of shape (n, k)")
+    
+    valid = np.flatnonzero(~np.isnan(points).any(axis=1))
+    if len(valid) == 0 or points.shape[1] == 0:
+        return valid
+    
+    subset = points[valid]
+    if subset.shape[1] == 1:
+        front = np.flatnonzero(subset[:, 0] == subset[:, 0].min())
+    elif subset.shape[1] == 2:
+        front = _front_2d(subset)
+    else:
+        front = _front_bnl(subset)
+    return np.sort(valid[front])
+
+
+def _front_2d(points: np.ndarray) -> np.ndarray:
+    """
+    Two-objective frontier by sorting on the first objective and sweeping the second
+    
+    Args:
+        points: (n, 2) array without NaN
+        
+    Returns:
+        Indices of the frontier rows
+    """
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    x = points[order, 0]
+    y = points[order, 1]
+    
+    # Rows sharing a first objective form a run; its first row has the run's lowest y
+    starts = np.flatnonzero(np.r_[True, x[1:] != x[:-1]])
+    run_of = np.cumsum(np.r_[True, x[1:] != x[:-1]]) - 1
+    best_in_run = y[starts]
+    
+    # Lowest y among all rows with a strictly smaller first objective
+    best_before = np.r_[np.inf, np.minimum.accumulate(best_in_run)[:-1]]
+    keep = (y == best_in_run[run_of]) & (y < best_before[run_of])
+    return order[keep]
+
+
+def _front_bnl(points: np.ndarray) -> np.ndarray:
+    """
+    Frontier for three or more objectives using sort-filter skyline
+    
+    Rows are visited in order of their normalized objective sum, so a row can
+    only be dominated by rows visited before it. The next block of candidates
+    is reduced to its own skyline, which is final, and every later candidate
+    is then filtered against those new frontier rows at once; the remaining
+    candidates shrink quickly, keeping the Python loop short.
+    
+    Args:
+        points: (n, k) array without NaN
+        
+    Returns:
+        Indices of the frontier rows
+    """
+    if len(points) <= _BLOCK_SIZE:
+        return np.flatnonzero(~_dominated_by_any(points, points))
+    
+    # Normalize so objectives on different scales contribute comparably to the visit order
+    low = points.min(axis=0)
+    span = points.max(axis=0) - low
+    span[span == 0] = 1.
+    remaining = np.argsort(((points - low) / span).sum(axis=1), kind="stable")
+    
+    front = []
+    while len(remaining):
+        block_idx = remaining[:_BLOCK_SIZE]
+        block = points[block_idx]
+        alive = ~_dominated_by_any(block, block)
+        new_idx, new = block_idx[alive], block[alive]
+        front.append(new_idx)
+        
+        rest = remaining[_BLOCK_SIZE:]
+        chunk = max(1, _FILTER_ELEMENTS // (len(new) * points.shape[1]))
+        survivors = [part[~_dominated_by_any(points[part], new)]
+                     for part in np.array_split(rest, max(1, -(-len(rest) // chunk)))]
+        remaining = np.concatenate(survivors) if survivors else rest
+    
+    return np.concatenate(front) if front else np.empty(0, dtype=int)
+
+
+def _dominated_by_any(candidates: np.ndarray, window: np.ndarray) -> np.ndarray:
+    """
+    Returns a mask of the candidates dominated by at least one window row
+    
+    Args:
+        candidates: (m, k) array
+        window: (w, k) array
+        
+    Returns:
+        Boolean array of length m
+    """
+    # one (m, w) comparison per objective is much faster than reducing an (m, w, k) cube
+    no_worse = np.ones((len(candidates), len(window)), dtype=bool)
+    better = np.zeros((len(candidates), len(window)), dtype=bool)
+    for d in range(candidates.shape[1]):
+        column = candidates[:, d, None]
+        no_worse &= window[:, d] <= column
+        better |= window[:, d] < column
+    return (no_worse & better).any(axis=1)
+
+
+def grouped_pareto_front(points, groups: Sequence) -> np.ndarray:
+    """
+    Returns the indices of rows that are non-dominated within their group
+    
+    Args:
+        points: (n, k) array-like of objective values, all minimized
+        groups: group label for each row (e.g. the benchmark)
+        
+    Returns:
+        Sorted array of row indices on their group's frontier
+    """
+    points = np.asarray(points, dtype=float)
+    index: Dict = {}
+    group_ids = np.array([index.setdefault(group, len(index)) for group in groups], dtype=int)
+    order = np.argsort(group_ids, kind="stable")
+    bounds = np.flatnonzero(np.diff(group_ids[order])) + 1
+    
+    front = [members[pareto_front(points[members])]
+             for members in np.split(order, bounds) if len(members)]
+    return np.sort(np.concatenate(front)) if front else np.empty(0, dtype=int)
+
+
+def write_pareto_frontier(results_csvs: Sequence[str], frontier_csv: str,
+                          objectives: Optional[Sequence[str]] = None,
+                          group_by: Optional[Sequence[str]] = None) -> int:
+    """
+    Writes the designs on each benchmark's Pareto frontier across results CSVs
+    
+    Results CSVs may have different headers (they depend on the memory type);
+    only the group, design and objective columns are read. The frontier file
+    has one row per frontier design: its group columns, design columns,
+    objectives, and the results CSV and data row it came from.
+    
+    Args:
+        results_csvs: paths to results CSVs written by the traffic sweeps
+        frontier_csv: path of the frontier CSV to write
+        objectives: results CSV columns to minimize (defaults to DEFAULT_OBJECTIVES)
+        group_by: columns identifying a benchmark (defaults to DEFAULT_GROUP_BY)
+        
+    Returns:
+        Number of frontier rows written
+    """
+    objectives = list(objectives or DEFAULT_OBJECTIVES)
+    group_by = list(group_by or DEFAULT_GROUP_BY)
+    
+    groups, designs, values, sources = _load_results(results_csvs, objectives, group_by)
+    front = grouped_pareto_front(values, groups) if len(values) else np.empty(0, dtype=int)
+    front = sorted(front, key=lambda i: (groups[i], sources[i]))
+    
+    with open(frontier_csv, "w", newline='') as f:
+        writer = csv.writer(f, dialect='excel')
+        writer.writerow(group_by + list(DESIGN_COLUMNS) + objectives + ["Results CSV", "Row"])
+        for i in front:
+            writer.writerow(list(groups[i]) + list(designs[i]) + [repr(float(v)) for v in values[i]]
+                            + list(sources[i]))
+    
+    logging.getLogger(__name__).info(
+        f"Pareto frontier: {len(front)} of {len(values)} rows over {len(objectives)} objectives → {frontier_csv}"
+    )
+    return len(front)
+
+
+def _load_results(results_csvs: Sequence[str], objectives: List[str],
+                  group_by: List[str]) -> Tuple[List[tuple], List[tuple], np.ndarray, List[tuple]]:
+    """
+    Reads the group, design and objective columns of results CSVs
+    
+    Args:
+        results_csvs: paths to results CSVs
+        objectives: objective column names
+        group_by: group column names
+        
+    Returns:
+        Tuple of (group keys, design keys, (n, k) objective array, (csv path, row) sources)
+    """
+    groups, designs, rows, sources = [], [], [], []
+    for results_csv in results_csvs:
+        with open(results_csv, "r", newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                continue
+            column = {name: i for i, name in enumerate(header)}
+            missing = [name for name in objectives + group_by if name not in column]
+            if missing:
+                raise ValueError(f"{results_csv} has no column(s) {', '.join(missing)}")
+            
+            group_idx = [column[name] for name in group_by]
+            design_idx = [column.get(name) for name in DESIGN_COLUMNS]
+            objective_idx = [column[name] for name in objectives]
+            for row_number, row in enumerate(reader, start=1):
+                groups.append(tuple(row[i] for i in group_idx))
+                designs.append(tuple(row[i] if i is not None else "" for i in design_idx))
+                rows.append([_to_float(row[i]) for i in objective_idx])
+                sources.append((results_csv, row_number))
+    
+    values = np.array(rows, dtype=float).reshape(len(rows), len(objectives))
+    return groups, designs, values, sources
+
+
+def _to_float(value: str) -> float:
+    """Parses a CSV cell, treating blanks and non-numeric cells as NaN"""
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
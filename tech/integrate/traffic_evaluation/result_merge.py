@@ -0,0 +1,326 @@
+"""
+Result Merge
+
+This module combines any number of results CSVs into one dataset with
+bounded memory. Each CSV has its own dynamic header (the configuration
+columns depend on the memory type), so the schemas are unioned, and rows are
+ordered by a key with an external merge sort: inputs are cut into sorted runs
+spilled to temporary files, which are then k-way merged. Rows repeating the
+key of an earlier row (e.g. from re-running a configuration) are dropped. The
+output is CSV or, with pyarrow installed, Parquet.
+
+Usage:
+    python integrate/traffic_evaluation/result_merge.py -o combined.csv output/results/*.csv
+    python integrate/traffic_evaluation/result_merge.py --by-technology -o CSV_Files/ output/results/*.csv
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import csv
+import heapq
+import logging
+import os
+import re
+import tempfile
+
+# Key columns leading the default sort order, when present
+KEY_LEADING_COLUMNS = ("MemCellType", "Bits Per Cell", "Capacity (KB)", "OptimizationTarget", "ProcessNode")
+
+# Columns identifying a traffic point within a configuration
+BENCHMARK_COLUMNS = ("Benchmark Name", "Read Accesses", "Write Accesses")
+
+# Rows sorted in memory per run
+DEFAULT_RUN_ROWS = 200000
+
+# Runs merged at once; more runs are first merged into larger runs
+_MAX_FAN_IN = 128
+
+# Results CSV names written by main.py: <cell type>_<capacity>MB_<opt target>_<n>BPC-<exp name>.csv
+_RESULTS_NAME = re.compile(r"(?P<cell_type>.+?)_[\d.]+MB_.+_(?P<bits_per_cell>\d+)BPC-")
+
+
+def read_header(results_csv: str) -> List[str]:
+    """Returns the header row of a CSV (empty for an empty file)"""
+    with open(results_csv, "r", newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def union_columns(headers: Iterable[Sequence[str]]) -> List[str]:
+    """
+    Unions CSV headers, keeping every header's relative column order
+    
+    A column not seen before is placed right after the column preceding it in
+    its own header, so e.g. technology-specific configuration columns stay in
+    front of "Benchmark Name".
+    
+    Args:
+        headers: Header rows
+        
+    Returns:
+        Union of the columns
+    """
+    columns: List[str] = []
+    for header in headers:
+        position = 0
+        for column in header:
+            if column in columns:
+                position = columns.index(column) + 1
+            else:
+                columns.insert(position, column)
+                position += 1
+    return columns
+
+
+def default_key(columns: Sequence[str]) -> List[str]:
+    """
+    Returns the default key of a unioned schema
+    
+    The key is the configuration (every column before "Benchmark Name", led by
+    KEY_LEADING_COLUMNS) followed by BENCHMARK_COLUMNS, which identifies a row
+    of the traffic sweeps uniquely.
+    
+    Args:
+        columns: Unioned columns
+        
+    Returns:
+        Key column names in sort priority order
+    """
+    end = columns.index("Benchmark Name") if "Benchmark Name" in columns else len(columns)
+    leading = [column for column in KEY_LEADING_COLUMNS if column in columns]
+    configuration = [column for column in columns[:end] if column not in leading]
+    return leading + configuration + [column for column in BENCHMARK_COLUMNS if column in columns]
+
+
+def _sort_value(value: str) -> Tuple[int, float, str]:
+    """Orders numeric cells numerically, before text cells"""
+    try:
+        return (0, float(value), "")
+    except ValueError:
+        return (1, 0., value)
+
+
+def merge_results(results_csvs: Sequence[str], output: str, key: Optional[Sequence[str]] = None,
+                  dedupe: bool = True, run_rows: int = DEFAULT_RUN_ROWS,
+                  tmp_dir: Optional[str] = None) -> Dict[str, int]:
+    """
+    Merges results CSVs into one CSV or Parquet file ordered by key
+    
+    Memory use is bounded by run_rows rows regardless of the input size.
+    Rows with equal keys keep their input order, and with dedupe only the
+    first of them is written.
+    
+    Args:
+        results_csvs: Paths to results CSVs (the first row of each is its header)
+        output: Output path; a ".parquet" suffix writes Parquet (requires pyarrow)
+        key: Columns to order and dedupe by (defaults to default_key of the unioned schema)
+        dedupe: Drop rows whose key equals that of an earlier row
+        run_rows: Rows sorted in memory per spilled run
+        tmp_dir: Directory for the spilled runs (defaults to the output's directory)
+        
+    Returns:
+        Dictionary with the number of input rows, rows written, duplicates dropped
+        and conflicts (dropped duplicates whose other columns differed)
+    """
+    parquet = Path(output).suffix.lower() == ".parquet"
+    if parquet:
+        _pyarrow()  # fail before sorting anything
+    
+    headers = {path: read_header(path) for path in results_csvs}
+    columns = union_columns(header for header in headers.values() if header)
+    key = list(key) if key is not None else default_key(columns)
+    missing = [column for column in key if column not in columns]
+    if missing:
+        raise ValueError(f"Key column(s) {', '.join(missing)} are not in any input")
+    key_idx = [columns.index(column) for column in key]
+    
+    def sort_key(row: List[str]) -> Tuple:
+        return tuple(_sort_value(row[i]) for i in key_idx)
+    
+    is_numeric = [True] * len(columns)
+    stats = {"input_rows": 0, "rows_written": 0, "duplicates": 0, "conflicts": 0}
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".merge-", dir=tmp_dir or Path(output).parent) as spill_dir:
+        # Pass 1: cut the inputs into sorted runs in the unioned schema
+        runs: List[str] = []
+        buffer: List[List[str]] = []
+        for path, header in headers.items():
+            if not header:
+                continue
+            positions = [columns.index(column) for column in header]
+            with open(path, "r", newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                for row in reader:
+                    full = [""] * len(columns)
+                    for position, value in zip(positions, row):
+                        full[position] = value
+                        if is_numeric[position] and value and _sort_value(value)[0]:
+                            is_numeric[position] = False
+                    buffer.append(full)
+                    if len(buffer) >= run_rows:
+                        runs.append(_spill(buffer, sort_key, spill_dir))
+                        buffer = []
+        if buffer:
+            runs.append(_spill(buffer, sort_key, spill_dir))
+            buffer = []
+        
+        # Pass 2: reduce the number of runs until one k-way merge can take them all
+        while len(runs) > _MAX_FAN_IN:
+            runs = [_spill_stream(_merge_runs(runs[i:i + _MAX_FAN_IN], sort_key), spill_dir)
+                    for i in range(0, len(runs), _MAX_FAN_IN)]
+        
+        # Pass 3: k-way merge into the output, dropping repeated keys
+        def merged_rows() -> Iterator[List[str]]:
+            previous_key, previous_row = None, None
+            for row in _merge_runs(runs, sort_key):
+                stats["input_rows"] += 1
+                row_key = [row[i] for i in key_idx]
+                if dedupe and row_key == previous_key:
+                    stats["duplicates"] += 1
+                    if row != previous_row:
+                        stats["conflicts"] += 1
+                    continue
+                previous_key, previous_row = row_key, row
+                stats["rows_written"] += 1
+                yield row
+        
+        if parquet:
+            _write_parquet(output, columns, is_numeric, merged_rows(), run_rows)
+        else:
+            with open(output, "w", newline='') as f:
+                writer = csv.writer(f, dialect='excel')
+                writer.writerow(columns)
+                writer.writerows(merged_rows())
+    
+    logger = logging.getLogger(__name__)
+    logger.info(f"Merged {stats['input_rows']} rows of {len(results_csvs)} CSVs into {stats['rows_written']} "
+                f"rows ({stats['duplicates']} duplicates dropped) → {output}")
+    if stats["conflicts"]:
+        logger.warning(f"{stats['conflicts']} dropped duplicate(s) differed from the kept row outside the key")
+    return stats
+
+
+def combine_by_technology(results_csvs: Sequence[str], output_dir: str, suffix: str = ".csv",
+                          **kwargs: Any) -> List[str]:
+    """
+    Merges results CSVs into one <cell type>_<n>BPC-combined file per technology
+    
+    This is the layout the dataviz apps read (e.g. SRAM_1BPC-combined.csv).
+    Inputs are grouped by the cell type and bits per cell in their main.py file name.
+    
+    Args:
+        results_csvs: Paths to results CSVs written by main.py
+        output_dir: Directory for the combined files
+        suffix: ".csv" or ".parquet"
+        **kwargs: Passed on to merge_results
+        
+    Returns:
+        Paths of the combined files
+    """
+    groups: Dict[str, List[str]] = {}
+    for path in results_csvs:
+        match = _RESULTS_NAME.match(Path(path).name)
+        if match is None:
+            raise ValueError(f"Cannot tell the technology of {path} from its name")
+        groups.setdefault(f"{match['cell_type']}_{match['bits_per_cell']}BPC", []).append(path)
+    
+    outputs = []
+    for name, paths in groups.items():
+        output = os.path.join(output_dir, f"{name}-combined{suffix}")
+        merge_results(paths, output, **kwargs)
+        outputs.append(output)
+    return outputs
+
+
+def _spill(rows: List[List[str]], sort_key, spill_dir: str) -> str:
+    """Sorts rows (stably) and writes them to a new run file"""
+    rows.sort(key=sort_key)
+    return _spill_stream(rows, spill_dir)
+
+
+def _spill_stream(rows: Iterable[List[str]], spill_dir: str) -> str:
+    """Writes already ordered rows to a new run file"""
+    fd, path = tempfile.mkstemp(suffix=".csv", dir=spill_dir)
+    with os.fdopen(fd, "w", newline='') as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+def _merge_runs(runs: Sequence[str], sort_key) -> Iterator[List[str]]:
+    """
+    K-way merges run files, yielding rows in key order
+    
+    Ties are taken from earlier runs first, so the merge is stable.
+    """
+    files = [open(run, "r", newline='') for run in runs]
+    try:
+        yield from heapq.merge(*(csv.reader(f) for f in files), key=sort_key)
+    finally:
+        for f in files:
+            f.close()
+
+
+def _write_parquet(output: str, columns: List[str], is_numeric: List[bool],
+                   rows: Iterator[List[str]], batch_rows: int):
+    """
+    Writes rows to Parquet in row groups of batch_rows
+    
+    Columns whose non-empty cells are all numeric are stored as float64,
+    others as strings; empty cells become nulls.
+    """
+    pa, pq = _pyarrow()
+    schema = pa.schema([(column, pa.float64() if numeric else pa.string())
+                        for column, numeric in zip(columns, is_numeric)])
+    
+    def batch_table(batch: List[List[str]]):
+        arrays = []
+        for i, numeric in enumerate(is_numeric):
+            values = [row[i] if row[i] != "" else None for row in batch]
+            if numeric:
+                values = [float(value) if value is not None else None for value in values]
+            arrays.append(pa.array(values, type=schema.field(i).type))
+        return pa.Table.from_arrays(arrays, schema=schema)
+    
+    with pq.ParquetWriter(output, schema) as writer:
+        batch: List[List[str]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_rows:
+                writer.write_table(batch_table(batch))
+                batch = []
+        if batch:
+            writer.write_table(batch_table(batch))
+
+
+def _pyarrow():
+    """Imports pyarrow and pyarrow.parquet, which are only needed for Parquet output"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Writing Parquet requires pyarrow (pip install pyarrow)") from e
+    return pyarrow, pyarrow.parquet
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Merge results CSVs into one dataset ordered by key")
+    parser.add_argument("results_csvs", nargs="+", help="Results CSVs to merge")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Output file (.csv or .parquet), or directory with --by-technology")
+    parser.add_argument("--by-technology", action="store_true",
+                        help="Write one <cell type>_<n>BPC-combined file per technology into --output")
+    parser.add_argument("--parquet", action="store_true", help="With --by-technology, write Parquet files")
+    parser.add_argument("--key", help="Comma-separated key columns (default: configuration + benchmark)")
+    parser.add_argument("--keep-duplicates", action="store_true", help="Keep rows with repeated keys")
+    parser.add_argument("--run-rows", type=int, default=DEFAULT_RUN_ROWS,
+                        help=f"Rows sorted in memory per spilled run (default: {DEFAULT_RUN_ROWS})")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    options = {"key": args.key.split(",") if args.key else None, "dedupe": not args.keep_duplicates,
+               "run_rows": max(1, args.run_rows)}
+    if args.by_technology:
+        combine_by_technology(args.results_csvs, args.output, ".parquet" if args.parquet else ".csv", **options)
+    else:
+        merge_results(args.results_csvs, args.output, **options)
@@ -5,17 +5,33 @@ This module contains the core traffic evaluation functions for
 memory system traffic pattern analysis and evaluation.
 """
 
+from contextlib import contextmanager
+import logging
+
+import numpy as np
+
 from ..data.workload_data import *
-from .eval_utils import ExperimentResult
+from ..data.workload_catalog import WorkloadCatalog
+from .eval_utils import BatchExperimentResult, ResultSink
+
 
-# Import fault injection controller for fault-aware evaluation
-try:
-    from ..interfaces.msxfi_controller import MSXFIController
-except ImportError:
-    MSXFIController = None
+def __getattr__(name):
+    """
+    Resolves MSXFIController on first use: the fault injection controller pulls in the
+    array interface and torch, which plain traffic sweeps never need
+    """
+    if name == "MSXFIController":
+        try:
+            from ..interfaces.msxfi_controller import MSXFIController
+        except ImportError:
+            MSXFIController = None
+        globals()["MSXFIController"] = MSXFIController
+        return MSXFIController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def generic_traffic(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
+def generic_traffic(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    write_accesses=None, read_accesses=None):
     """
     Evaluates and writes results for scenarios from a pre-set, generic traffic sweep
     
@@ -23,23 +39,23 @@ def generic_traffic(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv
         access_pattern: AccessPattern object
         nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
         nvsim_outputs: paths to NVSim output files
-        results_csv: path to CSV file containing results
+        results_csv: path to CSV file containing results, or an open ResultSink
         cell_paths: paths to NVSim input cell files
         cfg_paths: paths to NVSim input config files
+        write_accesses: optional custom grid of writes/s (defaults to the pre-set sweep)
+        read_accesses: optional custom grid of reads/s (defaults to the pre-set sweep)
     """
-    write_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7]
-    read_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7, 2e7, 1e8, 2e8, 1e9, 2e9, 1e10]
+    if write_accesses is None:
+        write_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7]
+    if read_accesses is None:
+        read_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7, 2e7, 1e8, 2e8, 1e9, 2e9, 1e10]
     
-    for wr in write_accesses:
-        for rd in read_accesses:
-            access_pattern.write_freq = wr
-            access_pattern.read_freq = rd
-            access_pattern.benchmark_name = "test"  # Generic uses "test" as benchmark name
-            
-            for i in range(len(cell_paths)):
-                this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[i], nvsim_outputs[i])
-                this_result.evaluate()
-                this_result.report_result_benchmark(1, results_csv, cell_paths[i], cfg_paths[i], access_pattern)
+    write_freq = [wr for wr in write_accesses for rd in read_accesses]
+    read_freq = [rd for wr in write_accesses for rd in read_accesses]
+    
+    # Generic uses "test" as benchmark name
+    _evaluate_batch(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    "test", read_freq, write_freq)
 
 
 def graph_traffic(graph8MB, access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
@@ -51,21 +67,14 @@ def graph_traffic(graph8MB, access_pattern, nvsim_input_cfgs, nvsim_outputs, res
         access_pattern: AccessPattern object
         nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
         nvsim_outputs: paths to NVSim output files
-        results_csv: path to CSV file containing results
+        results_csv: path to CSV file containing results, or an open ResultSink
         cell_paths: paths to NVSim input cell files
         cfg_paths: paths to NVSim input config files
     """
-    for (i, name) in enumerate(graph8MB["names"]):
-        access_pattern.benchmark_name = name
-        if (graph8MB["read_freq"][i] > 0):
-            access_pattern.name = name
-            access_pattern.write_freq = graph8MB["write_freq"][i] 
-            access_pattern.read_freq = graph8MB["read_freq"][i]
-            
-            for j in range(len(cell_paths)):
-                this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[j], nvsim_outputs[j])
-                this_result.evaluate()
-                this_result.report_result_benchmark(1, results_csv, cell_paths[j], cfg_paths[j], access_pattern)
+    names, read_freq, write_freq = WorkloadCatalog.from_workloads([graph8MB]).traffic()
+    
+    _evaluate_batch(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    names, read_freq, write_freq)
 
 
 def dnn_traffic(DNN_weights, DNN_weights_acts, access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
@@ -78,24 +87,14 @@ def dnn_traffic(DNN_weights, DNN_weights_acts, access_pattern, nvsim_input_cfgs,
         access_pattern: AccessPattern object
         nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
         nvsim_outputs: paths to NVSim output files
-        results_csv: path to CSV file containing results
+        results_csv: path to CSV file containing results, or an open ResultSink
         cell_paths: paths to NVSim input cell files
         cfg_paths: paths to NVSim input config files
     """
-    dnns = [DNN_weights, DNN_weights_acts]
+    names, read_freq, write_freq = WorkloadCatalog.from_workloads([DNN_weights, DNN_weights_acts]).traffic()
     
-    for dnn in dnns:
-        for (i, name) in enumerate(dnn["names"]):
-            access_pattern.benchmark_name = name
-            if (dnn["reads"][i] > 0):
-                access_pattern.name = name
-                access_pattern.read_freq = dnn["reads"][i] * dnn["ips"][i]
-                access_pattern.write_freq = dnn["writes"][i] * dnn["ips"][i]
-                
-                for j in range(len(cell_paths)):
-                    this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[j], nvsim_outputs[j])
-                    this_result.evaluate()
-                    this_result.report_result_benchmark(1, results_csv, cell_paths[j], cfg_paths[j], access_pattern)
+    _evaluate_batch(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    names, read_freq, write_freq)
 
 
 def spec_traffic_single(spec8MBLLC, access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
@@ -107,21 +106,11 @@ def spec_traffic_single(spec8MBLLC, access_pattern, nvsim_input_cfgs, nvsim_outp
         access_pattern: AccessPattern object
         nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
         nvsim_outputs: paths to NVSim output files
-        results_csv: path to CSV file containing results
+        results_csv: path to CSV file containing results, or an open ResultSink
         cell_paths: paths to NVSim input cell files
         cfg_paths: paths to NVSim input config files
     """
-    for (i, name) in enumerate(spec8MBLLC["names"]):  
-        access_pattern.benchmark_name = name
-        if (spec8MBLLC["reads"][i] > 0):
-            access_pattern.name = name
-            access_pattern.write_freq = spec8MBLLC["writes"][i] / spec8MBLLC["ex_time"][i]
-            access_pattern.read_freq = spec8MBLLC["reads"][i] / spec8MBLLC["ex_time"][i]
-            
-            for j in range(len(cell_paths)):
-                this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[j], nvsim_outputs[j])
-                this_result.evaluate()
-                this_result.report_result_benchmark(1, results_csv, cell_paths[j], cfg_paths[j], access_pattern)
+    _spec_batch([spec8MBLLC], access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths)
 
 
 def spec_traffic(spec8MBLLC, spec16MBLLC, spec16MBDRAM, spec16MBL2, spec32MBLLC, spec64MBLLC, 
@@ -139,22 +128,50 @@ def spec_traffic(spec8MBLLC, spec16MBLLC, spec16MBDRAM, spec16MBL2, spec32MBLLC,
         access_pattern: AccessPattern object
         nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
         nvsim_outputs: paths to NVSim output files
-        results_csv: path to CSV file containing results
+        results_csv: path to CSV file containing results, or an open ResultSink
+        cell_paths: paths to NVSim input cell files
+        cfg_paths: paths to NVSim input config files
+    """
+    _spec_batch([spec8MBLLC, spec16MBLLC, spec16MBDRAM, spec16MBL2, spec32MBLLC, spec64MBLLC],
+                access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths)
+
+
+def _spec_batch(benchmarks, access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
+    """
+    Collects the SPEC traffic points of several datasets and evaluates them as one batch
+    
+    Args:
+        benchmarks: list of SPEC workload datasets
+        access_pattern: AccessPattern object
+        nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
+        nvsim_outputs: paths to NVSim output files
+        results_csv: path to CSV file containing results, or an open ResultSink
         cell_paths: paths to NVSim input cell files
         cfg_paths: paths to NVSim input config files
     """
-    for benchmark in [spec8MBLLC, spec16MBLLC, spec16MBDRAM, spec16MBL2, spec32MBLLC, spec64MBLLC]:
-        for (i, name) in enumerate(benchmark["names"]):  
-            access_pattern.benchmark_name = name
-            if (benchmark["reads"][i] > 0):
-                access_pattern.name = name
-                access_pattern.write_freq = benchmark["writes"][i] / benchmark["ex_time"][i]
-                access_pattern.read_freq = benchmark["reads"][i] / benchmark["ex_time"][i]
-                
-                for j in range(len(cell_paths)):
-                    this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[j], nvsim_outputs[j])
-                    this_result.evaluate()
-                    this_result.report_result_benchmark(1, results_csv, cell_paths[j], cfg_paths[j], access_pattern)
+    names, read_freq, write_freq = WorkloadCatalog.from_workloads(benchmarks).traffic()
+    
+    _evaluate_batch(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    names, read_freq, write_freq)
+
+
+def catalog_traffic(catalog, access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
+    """
+    Evaluates and writes results for every workload with reads in a workload catalog
+    
+    Args:
+        catalog: WorkloadCatalog
+        access_pattern: AccessPattern object
+        nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
+        nvsim_outputs: paths to NVSim output files
+        results_csv: path to CSV file containing results, or an open ResultSink
+        cell_paths: paths to NVSim input cell files
+        cfg_paths: paths to NVSim input config files
+    """
+    names, read_freq, write_freq = catalog.traffic()
+    
+    _evaluate_batch(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    names, read_freq, write_freq)
 
 
 def generic_traffic_with_write_buff(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths):
@@ -166,7 +183,7 @@ def generic_traffic_with_write_buff(access_pattern, nvsim_input_cfgs, nvsim_outp
         access_pattern: AccessPattern object
         nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
         nvsim_outputs: paths to NVSim output files
-        results_csv: path to CSV file containing results
+        results_csv: path to CSV file containing results, or an open ResultSink
         cell_paths: paths to NVSim input cell files
         cfg_paths: paths to NVSim input config files
     """
@@ -178,31 +195,188 @@ def generic_traffic_with_write_buff(access_pattern, nvsim_input_cfgs, nvsim_outp
     percent_write_traffic_reduction = [0.001, 0.01, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.99, 0.999, 1.0]
     percent_write_latency_mask = [0.001, 0.01, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.99, 0.999, 1.0]
 
+    names, read_freq, write_freq, write_latency_mask = [], [], [], []
     for pct_traffic in percent_write_traffic_reduction:
         for pct_mask in percent_write_latency_mask:
-            for i in range(len(cell_paths)):
-                # Create temp write latency, scale just for eval, reset
-                temp_write_latency = nvsim_outputs[i].write_latency
-                # Set updated write latency
-                nvsim_outputs[i].write_latency = temp_write_latency * pct_mask
-                
-                # Repeat for spec geomean, graph example      
-                access_pattern.write_freq = wr_base_spec * pct_traffic
-                access_pattern.read_freq = rd_base_spec
-                access_pattern.benchmark_name = f"spec_{pct_traffic}_{pct_mask}"
-                
-                this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[i], nvsim_outputs[i])
-                this_result.evaluate()
-                this_result.report_result_benchmark(1, results_csv, cell_paths[i], cfg_paths[i], access_pattern)
-                
-                # Graph example start
-                access_pattern.write_freq = wr_base_graph * pct_traffic
-                access_pattern.read_freq = rd_base_graph
-                access_pattern.benchmark_name = f"fbbfs_{pct_traffic}_{pct_mask}"
-                
-                this_result = ExperimentResult(access_pattern, nvsim_input_cfgs[i], nvsim_outputs[i])
-                this_result.evaluate()
-                this_result.report_result_benchmark(1, results_csv, cell_paths[i], cfg_paths[i], access_pattern)
-                
-                # Reset write latency
-                nvsim_outputs[i].write_latency = temp_write_latency
\ No newline at end of file
+            # Repeat for spec geomean, graph example
+            names.append(f"spec_{pct_traffic}_{pct_mask}")
+            write_freq.append(wr_base_spec * pct_traffic)
+            read_freq.append(rd_base_spec)
+            write_latency_mask.append(pct_mask)
+            
+            # Graph example start
+            names.append(f"fbbfs_{pct_traffic}_{pct_mask}")
+            write_freq.append(wr_base_graph * pct_traffic)
+            read_freq.append(rd_base_graph)
+            write_latency_mask.append(pct_mask)
+    
+    with _result_sink(results_csv) as sink:
+        for i in range(len(cell_paths)):
+            # Scale write latency per point just for eval, leaving the array output untouched
+            write_latency = [nvsim_outputs[i].write_latency * pct_mask for pct_mask in write_latency_mask]
+            
+            this_result = BatchExperimentResult(access_pattern, nvsim_input_cfgs[i], nvsim_outputs[i],
+                                                read_freq=read_freq, write_freq=write_freq,
+                                                benchmark_names=names, write_latency=write_latency)
+            this_result.evaluate()
+            sink.write_result(this_result, cell_paths[i], cfg_paths[i])
+
+
+# Metrics the adaptive sweep can refine on (per-point attributes of BatchExperimentResult)
+ADAPTIVE_METRICS = ("total_power", "total_dynamic_read_power", "total_dynamic_write_power",
+                    "total_read_energy", "total_write_energy", "total_read_latency", "total_write_latency")
+
+
+def generic_traffic_adaptive(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csvs, cell_paths, cfg_paths,
+                             metric="total_power", max_depth=6, write_accesses=None, read_accesses=None):
+    """
+    Evaluates a generic traffic sweep that is refined only where the best technology changes
+    
+    Starts from the coarse generic grid, evaluated against every array config. Each grid
+    cell whose four corners do not all pick the same technology (the cell type of the config
+    with the lowest metric) is bisected into four along both axes, and the new points are
+    evaluated; this repeats up to max_depth times. Cells away from a crossover are never
+    refined, so the evaluated points concentrate on the technology boundaries.
+    
+    Rows use the same schema as generic_traffic, with "adaptive" as benchmark name. Each
+    config's rows go to its own results CSV, in (writes/s, reads/s) order.
+    
+    Args:
+        access_pattern: AccessPattern object
+        nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
+        nvsim_outputs: paths to NVSim output files
+        results_csvs: path (or open ResultSink) per array config receiving its rows; None skips writing a config
+        cell_paths: paths to NVSim input cell files
+        cfg_paths: paths to NVSim input config files
+        metric: metric to minimize when picking the technology at a point (see ADAPTIVE_METRICS)
+        max_depth: maximum number of times a coarse grid cell is bisected
+        write_accesses: optional coarse grid of writes/s (defaults to the pre-set generic sweep)
+        read_accesses: optional coarse grid of reads/s (defaults to the pre-set generic sweep)
+        
+    Returns:
+        Tuple of (write_freq, read_freq) lists of the evaluated traffic points
+    """
+    if metric not in ADAPTIVE_METRICS:
+        raise ValueError(f"Unknown adaptive metric '{metric}'; expected one of {', '.join(ADAPTIVE_METRICS)}")
+    if write_accesses is None:
+        write_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7]
+    if read_accesses is None:
+        read_accesses = [0, 1, 2, 1e1, 2e1, 1e2, 2e2, 1e3, 2e3, 1e4, 2e4, 1e5, 2e5, 1e6, 2e6, 1e7, 2e7, 1e8, 2e8, 1e9, 2e9, 1e10]
+    write_accesses = sorted(set(float(wr) for wr in write_accesses))
+    read_accesses = sorted(set(float(rd) for rd in read_accesses))
+    
+    technologies = [getattr(cfg.cell_type, "mem_cell_type", cfg.cell_type) for cfg in nvsim_input_cfgs]
+    winners = {}
+    
+    def evaluate(points):
+        # One vectorized call per config for all new points of a refinement level
+        if not points:
+            return
+        write_freq = [wr for wr, rd in points]
+        read_freq = [rd for wr, rd in points]
+        values = []
+        for j in range(len(nvsim_input_cfgs)):
+            this_result = BatchExperimentResult(access_pattern, nvsim_input_cfgs[j], nvsim_outputs[j],
+                                                read_freq=read_freq, write_freq=write_freq,
+                                                benchmark_names="adaptive")
+            this_result.evaluate()
+            values.append(getattr(this_result, metric))
+        best = np.argmin(np.vstack(values), axis=0)
+        for point, j in zip(points, best):
+            winners[point] = technologies[j]
+    
+    evaluate([(wr, rd) for wr in write_accesses for rd in read_accesses])
+    cells = [(write_accesses[a], write_accesses[a + 1], read_accesses[b], read_accesses[b + 1])
+             for a in range(len(write_accesses) - 1) for b in range(len(read_accesses) - 1)]
+    
+    depth = 0
+    while depth < max_depth:
+        split = [cell for cell in cells
+                 if len({winners[(wr, rd)] for wr in cell[:2] for rd in cell[2:]}) > 1]
+        if not split:
+            break
+        depth += 1
+        
+        cells, new_points = [], set()
+        for wr_lo, wr_hi, rd_lo, rd_hi in split:
+            wr_mid = _grid_midpoint(wr_lo, wr_hi)
+            rd_mid = _grid_midpoint(rd_lo, rd_hi)
+            for wr_range in ((wr_lo, wr_mid), (wr_mid, wr_hi)):
+                for rd_range in ((rd_lo, rd_mid), (rd_mid, rd_hi)):
+                    cells.append(wr_range + rd_range)
+            new_points.update((wr, rd) for wr in (wr_lo, wr_mid, wr_hi) for rd in (rd_lo, rd_mid, rd_hi))
+        evaluate(sorted(point for point in new_points if point not in winners))
+    
+    points = sorted(winners)
+    write_freq = [wr for wr, rd in points]
+    read_freq = [rd for wr, rd in points]
+    
+    dense = ((len(write_accesses) - 1) * 2 ** depth + 1) * ((len(read_accesses) - 1) * 2 ** depth + 1)
+    logging.getLogger(__name__).info(
+        f"Adaptive sweep: {len(points)} traffic points after {depth} refinement level(s) "
+        f"(a uniform grid at the same resolution has {dense})"
+    )
+    
+    for j in range(len(nvsim_input_cfgs)):
+        if results_csvs[j] is None:
+            continue
+        _evaluate_batch(access_pattern, [nvsim_input_cfgs[j]], [nvsim_outputs[j]], results_csvs[j],
+                        [cell_paths[j]], [cfg_paths[j]], "adaptive", read_freq, write_freq)
+    
+    return write_freq, read_freq
+
+
+def _grid_midpoint(lo, hi):
+    """
+    Returns the point bisecting [lo, hi] on the log-spaced traffic axes
+    
+    Args:
+        lo: lower edge of the grid cell (>= 0)
+        hi: upper edge of the grid cell
+    """
+    if lo <= 0:
+        return hi / 2.
+    return float(np.sqrt(lo * hi))
+
+
+def _evaluate_batch(access_pattern, nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths,
+                    names, read_freq, write_freq):
+    """
+    Evaluates a list of named traffic points against every array config in one vectorized call each
+    
+    Args:
+        access_pattern: AccessPattern object
+        nvsim_input_cfgs: NVSimInputConfig objects which were used for array simulation
+        nvsim_outputs: paths to NVSim output files
+        results_csv: path to CSV file containing results, or an open ResultSink
+        cell_paths: paths to NVSim input cell files
+        cfg_paths: paths to NVSim input config files
+        names: benchmark name for each traffic point, or one name shared by all points
+        read_freq: reads/s for each traffic point
+        write_freq: writes/s for each traffic point
+    """
+    if not names:
+        return
+    
+    with _result_sink(results_csv) as sink:
+        for j in range(len(cell_paths)):
+            this_result = BatchExperimentResult(access_pattern, nvsim_input_cfgs[j], nvsim_outputs[j],
+                                                read_freq=read_freq, write_freq=write_freq,
+                                                benchmark_names=names)
+            this_result.evaluate()
+            sink.write_result(this_result, cell_paths[j], cfg_paths[j])
+
+
+@contextmanager
+def _result_sink(results_csv):
+    """
+    Yields a ResultSink for results_csv, opening (and closing) one only when given a path
+    
+    Args:
+        results_csv: path to CSV file containing results, or an open ResultSink
+    """
+    if isinstance(results_csv, ResultSink):
+        yield results_csv
+    else:
+        with ResultSink(results_csv) as sink:
+            yield sink
@@ -0,0 +1,192 @@
+"""
+Work Queue
+
+This module splits a sweep into independent jobs, one per (array
+configuration, traffic suite) unit, for running it on several machines that
+share a filesystem. Jobs are either partitioned up front (``--shard i/N``) or
+claimed one at a time from a directory-based queue (``--queue DIR``). Claiming
+is an atomic rename of a job file from pending/ to claimed/, so any number of
+workers can cooperate without a scheduler service.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import logging
+import os
+import shutil
+import socket
+from pathlib import Path
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification "i/N"
+    
+    Args:
+        spec: Shard index and count, e.g. "0/4" (indices run from 0 to N-1)
+        
+    Returns:
+        Tuple of (index, count)
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}'; expected i/N, e.g. 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}'; the index must be between 0 and {count - 1}")
+    return index, count
+
+
+def shard_jobs(jobs: Sequence[Dict[str, Any]], index: int, count: int) -> List[Dict[str, Any]]:
+    """
+    Select the jobs of one shard
+    
+    Jobs are dealt round-robin in sweep order, so every shard gets a similar
+    mix of traffic suites and the partition depends only on the job list.
+    
+    Args:
+        jobs: Jobs in sweep order
+        index: Shard index (0 to count-1)
+        count: Number of shards
+        
+    Returns:
+        The shard's jobs in sweep order
+    """
+    return list(jobs[index::count])
+
+
+class WorkQueue:
+    """
+    Directory-based job queue on a shared filesystem
+    
+    Layout:
+        queue.json      fingerprint of the experiment and the number of jobs
+        pending/        job files waiting to be claimed
+        claimed/        jobs being run (moving a file back to pending/ re-queues it)
+        done/           completed jobs
+        failed/         jobs that raised, with the error appended
+        
+    Usage:
+        queue = WorkQueue(queue_dir)
+        queue.create(jobs, fingerprint)     # only the first worker's call creates it
+        for job in queue.claims():
+            ...
+            queue.complete(job)
+    """
+    
+    FILENAME = "queue.json"
+    
+    def __init__(self, queue_dir: str):
+        """
+        Initialize work queue
+        
+        Args:
+            queue_dir: Queue directory shared by all workers
+        """
+        self.queue_dir = Path(queue_dir)
+        self.owner = f"{socket.gethostname()}-{os.getpid()}"
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def create(self, jobs: Sequence[Dict[str, Any]], fingerprint: str) -> bool:
+        """
+        Create the queue with the given jobs unless another worker already has
+        
+        The queue is assembled in a private directory and renamed into place,
+        so workers never see a partially created queue.
+        
+        Args:
+            jobs: Jobs in sweep order (JSON-serializable dicts with a "name")
+            fingerprint: Fingerprint of the experiment the jobs belong to
+            
+        Returns:
+            True if this call created the queue
+        """
+        if not (self.queue_dir / self.FILENAME).exists():
+            self.queue_dir.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.queue_dir.parent / f".{self.queue_dir.name}.{self.owner}"
+            shutil.rmtree(staging, ignore_errors=True)
+            for state in ("pending", "claimed", "done", "failed"):
+                (staging / state).mkdir(parents=True)
+            for job in jobs:
+                with open(staging / "pending" / f"{job['name']}.json", "w") as f:
+                    json.dump(job, f)
+            with open(staging / self.FILENAME, "w") as f:
+                json.dump({"fingerprint": fingerprint, "jobs": len(jobs)}, f)
+            
+            try:
+                os.rename(staging, self.queue_dir)
+                self.logger.info(f"Created work queue with {len(jobs)} jobs in {self.queue_dir}")
+                return True
+            except OSError:
+                # another worker created it first
+                shutil.rmtree(staging, ignore_errors=True)
+        
+        with open(self.queue_dir / self.FILENAME) as f:
+            existing = json.load(f)
+        if existing.get("fingerprint") != fingerprint:
+            raise RuntimeError(f"Work queue {self.queue_dir} belongs to a different experiment configuration")
+        return False
+    
+    def claims(self) -> Iterator[Dict[str, Any]]:
+        """
+        Claim pending jobs one at a time, in sweep order, until none are left
+        
+        Yields:
+            Claimed jobs; report each with complete or fail
+        """
+        while True:
+            job = self.claim()
+            if job is None:
+                return
+            yield job
+    
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Atomically claim the first pending job
+        
+        Returns:
+            The claimed job, or None when no jobs are pending
+        """
+        pending = self.queue_dir / "pending"
+        while True:
+            names = sorted(os.listdir(pending))
+            if not names:
+                return None
+            for name in names:
+                try:
+                    os.rename(pending / name, self.queue_dir / "claimed" / name)
+                except FileNotFoundError:
+                    # claimed by another worker in the meantime
+                    continue
+                with open(self.queue_dir / "claimed" / name) as f:
+                    job = json.load(f)
+                job["claimed_by"] = self.owner
+                return job
+    
+    def complete(self, job: Dict[str, Any]):
+        """Move a claimed job to done/"""
+        name = f"{job['name']}.json"
+        os.rename(self.queue_dir / "claimed" / name, self.queue_dir / "done" / name)
+    
+    def fail(self, job: Dict[str, Any], error: str):
+        """
+        Move a claimed job to failed/, recording the error
+        
+        Args:
+            job: Claimed job
+            error: Error message
+        """
+        name = f"{job['name']}.json"
+        with open(self.queue_dir / "claimed" / name, "w") as f:
+            json.dump({**job, "error": error}, f)
+        os.rename(self.queue_dir / "claimed" / name, self.queue_dir / "failed" / name)
+    
+    def status(self) -> Dict[str, int]:
+        """
+        Count the jobs in each state
+        
+        Returns:
+            Dictionary mapping "pending", "claimed", "done" and "failed" to job counts
+        """
+        return {state: len(os.listdir(self.queue_dir / state))
+                for state in ("pending", "claimed", "done", "failed")}
@@ -5,19 +5,22 @@ This is the main entry point that implements traffic evaluation
 with ArrayCharacterization integration.
 
 Usage:
-    python main.py <config_file.json>
-    
+    python main.py <config_file.json> [--no-cache] [--refresh-cache] [--jobs N] [--resume] [--pareto]
+                                      [--profile] [--coefficient-model PATH] [--plan]
+                                      
 Example:
     python main.py configs/basic_memory_comparison.json
 """
 
+import argparse
 import json
 import time
 import os
 import sys
 import csv
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 import logging
 
 # Add project root to Python path
@@ -27,14 +30,27 @@ sys.path.append(str(project_root))
 # Import traffic evaluation components
 from integrate.traffic_evaluation.traffic import (
     generic_traffic, dnn_traffic, graph_traffic, spec_traffic, 
-    generic_traffic_with_write_buff
+    generic_traffic_with_write_buff, generic_traffic_adaptive, catalog_traffic
 )
-from integrate.traffic_evaluation.eval_utils import ExperimentResult
+from integrate.traffic_evaluation.eval_utils import ExperimentResult, ResultSink
+from integrate.traffic_evaluation.pareto import write_pareto_frontier
+from integrate.traffic_evaluation.coefficient_model import CoefficientModel
+from integrate.traffic_evaluation.result_merge import combine_by_technology
 from integrate.data.workload_data import (
     DNN_weights, DNN_weights_acts, graph8MB, spec8MBLLC
 )
+from integrate.data.workload_catalog import WorkloadCatalog
 from integrate.input_defs.access_pattern import PatternConfig
 from integrate.interfaces.array_interface import ArrayCharacterizationInterface
+from integrate.interfaces.runtime_scheduler import config_signature, ideal_makespan, list_makespan, longest_first
+from integrate.run_manifest import RunManifest
+from integrate.sweep_axes import Settings, SweepAxes, axis_values, split_settings
+from integrate.sweep_plan import SweepPlan
+from integrate.work_queue import WorkQueue, parse_shard, shard_jobs
+from integrate.instrumentation import instrumentation, stage
+
+# (cell_type, opt_target, capacity, bits_per_cell, settings of the other sweep axes)
+Configuration = Tuple[str, str, float, int, Settings]
 
 class MemSysExplorer:
     """
@@ -44,11 +60,39 @@ class MemSysExplorer:
     integrating with ArrayCharacterization instead of NVSim.
     """
     
-    def __init__(self, config_path: str):
-        """Initialize runner with JSON configuration"""
+    # Traffic suites in the order their rows are written to a results CSV
+    TRAFFIC_SUITES = ["generic", "graph", "dnn", "spec", "generic_write_buff", "catalog", "generic_adaptive"]
+    
+    # Suites evaluated across all configurations at once, after every configuration has run
+    CROSS_CONFIG_SUITES = ["generic_adaptive"]
+    
+    def __init__(self, config_path: str, use_cache: bool = True, refresh_cache: bool = False,
+                 jobs: int = 1, resume: bool = False, pareto: bool = False, profile: bool = False):
+        """
+        Initialize runner with JSON configuration
+        
+        Args:
+            config_path: Path to JSON experiment configuration
+            use_cache: Reuse cached array characterization results
+            refresh_cache: Re-run every array characterization and overwrite cached results
+            jobs: Number of worker processes for running configurations in parallel
+            resume: Skip (configuration, traffic suite) units the run manifest records as
+                complete and append only the missing ones
+            pareto: Write the Pareto frontier of the results even if the config does not ask for it
+            profile: Record per-stage timings and write profile.json and profile_trace.json
+                (Chrome trace format) to the output directory at the end of run()
+        """
         self.config_path = config_path
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
+        self.jobs = max(1, jobs)
+        self.resume = resume
+        self.profile = profile
+        if profile:
+            instrumentation.enable()
         self.config = self._load_config()
-        self.array_interface = ArrayCharacterizationInterface(self.config)
+        # created on first use, so plan() can run without creating the cache
+        self._array_interface: Optional[ArrayCharacterizationInterface] = None
         self.logger = self._setup_logging()
         
         self.exp_name = "default"
@@ -64,9 +108,32 @@ class MemSysExplorer:
         self.capacity = [1]
         self.bits_per_cell = [1]
         self.traffic = []
+        self.adaptive_metric = "total_power"
+        self.adaptive_max_depth = 6
+        self.workloads = []
+        self._workload_catalog: Optional[WorkloadCatalog] = None
+        self.pareto = pareto
+        self.pareto_objectives = None
+        self.surrogate: Optional[Dict[str, Any]] = None
         self.output_path = "output"
+        # array results by configuration without traffic settings
+        self._array_results: Dict[Configuration, Dict[str, Any]] = {}
+        self.schedule: Optional[Dict[str, float]] = None
+        self.sweep: Optional[SweepAxes] = None
         self._parse_config()
-        
+        self.manifest = RunManifest(
+            self.output_path, RunManifest.experiment_fingerprint(self.config.get("experiment", {}))
+        )
+    
+    @property
+    def array_interface(self) -> ArrayCharacterizationInterface:
+        """ArrayCharacterization interface of the run, created on first use"""
+        if self._array_interface is None:
+            self._array_interface = ArrayCharacterizationInterface(
+                self.config, use_cache=self.use_cache, refresh_cache=self.refresh_cache
+            )
+        return self._array_interface
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup logging"""
         logging.basicConfig(
@@ -113,8 +180,28 @@ class MemSysExplorer:
             self.bits_per_cell = experiment["bits_per_cell"]
         if "traffic" in experiment and experiment["traffic"]:
             self.traffic = experiment["traffic"]
+        if "adaptive_metric" in experiment and experiment["adaptive_metric"]:
+            self.adaptive_metric = experiment["adaptive_metric"]
+        if "adaptive_max_depth" in experiment and experiment["adaptive_max_depth"] is not None:
+            self.adaptive_max_depth = experiment["adaptive_max_depth"]
+        if "workloads" in experiment and experiment["workloads"]:
+            self.workloads = experiment["workloads"]
+        if "pareto" in experiment and experiment["pareto"]:
+            self.pareto = True
+            if isinstance(experiment["pareto"], list):
+                self.pareto_objectives = experiment["pareto"]
+        if "surrogate" in experiment and experiment["surrogate"]:
+            self.surrogate = experiment["surrogate"] if isinstance(experiment["surrogate"], dict) else {}
         if "output_path" in experiment and experiment["output_path"]:
             self.output_path = experiment["output_path"]
+        
+        # every other list or range setting is a sweep axis after these four
+        self.sweep = SweepAxes.from_experiment(experiment, leading=[
+            (key, axis_values(values) or [values]) for key, values in (
+                ("cell_type", self.cell_type), ("opt_target", self.opt_target),
+                ("capacity", self.capacity), ("bits_per_cell", self.bits_per_cell)
+            )
+        ])
     
     def run(self) -> Dict[str, Any]:
         """
@@ -129,13 +216,22 @@ class MemSysExplorer:
         try:
             self._setup_output_directories()
             
-            for _cell_type in self.cell_type:
-                for _opt_target in self.opt_target:
-                    for _capacity in self.capacity:
-                        for _bits_per_cell in self.bits_per_cell:
-                            self._run_single_configuration(
-                                _cell_type, _opt_target, _capacity, _bits_per_cell
-                            )
+            with stage("run"):
+                if self.surrogate is not None:
+                    self._run_surrogate_sweep(self._iter_configurations())
+                
+                if self.jobs > 1 and len(self.sweep) > 1:
+                    results_csvs = self._run_configurations_parallel(self._iter_configurations())
+                else:
+                    results_csvs = [self._run_timed_configuration(configuration)[0]
+                                    for configuration in self._iter_configurations()]
+                
+                if "generic_adaptive" in self.traffic:
+                    self._run_adaptive_traffic(self._iter_configurations(), results_csvs)
+                
+                frontier_csv = None
+                if self.pareto:
+                    frontier_csv = self._write_pareto_frontier(results_csvs)
             
             execution_time = time.time() - start_time
             self.logger.info(f"Traffic evaluation completed in {execution_time:.2f} seconds")
@@ -143,12 +239,255 @@ class MemSysExplorer:
             return {
                 "status": "success",
                 "execution_time": execution_time,
-                "output_path": self.output_path
+                "output_path": self.output_path,
+                "results": results_csvs,
+                "pareto_frontier": frontier_csv,
+                "schedule": self.schedule
             }
-            
+        
         except Exception as e:
             self.logger.error(f"Traffic evaluation failed: {e}")
             raise
+        
+        finally:
+            self._write_profile()
+    
+    def plan(self) -> SweepPlan:
+        """
+        Expand the sweep into its plan without generating, writing or running anything
+        
+        Resolves the cell and config files of every configuration, collapses
+        configurations that would run NVSim on identical inputs and estimates
+        the runtime from the characterization cache and runtime history.
+        
+        Returns:
+            SweepPlan of the sweep, with the problems a run would hit as errors or warnings
+        """
+        sweep_plan = SweepPlan(workers=self.jobs)
+        # read only: planning must not create the cache or the output directory
+        interface = self._array_interface or ArrayCharacterizationInterface(
+            self.config, use_cache=self.use_cache, refresh_cache=self.refresh_cache, read_only=True
+        )
+        units = self._traffic_units()
+        suites = [unit for unit in units if unit != "header" and unit not in self.CROSS_CONFIG_SUITES]
+        
+        for configuration in self._iter_configurations():
+            memory_config = self._memory_config(*configuration)
+            label = self._configuration_name(configuration)
+            try:
+                characterization = interface.plan_characterization(memory_config)
+            except Exception as e:
+                sweep_plan.errors.append(f"{label}: {e}")
+                continue
+            evaluation = interface.runtime_history.predict(config_signature(memory_config), "evaluation")
+            sweep_plan.add_configuration(label, characterization, suites, evaluation)
+        for unit in units:
+            if unit in self.CROSS_CONFIG_SUITES:
+                sweep_plan.add_cross_configuration_suite(unit)
+        
+        unknown = [suite for suite in self.traffic if suite not in self.TRAFFIC_SUITES]
+        if unknown:
+            sweep_plan.errors.append(f"Unknown traffic suite(s) {', '.join(unknown)} would be skipped; "
+                                     f"expected any of {', '.join(self.TRAFFIC_SUITES)}")
+        if "catalog" in self.traffic:
+            if not self.workloads:
+                sweep_plan.errors.append("The catalog traffic suite needs a \"workloads\" list of workload files")
+            for path in self.workloads:
+                if not os.path.exists(path):
+                    sweep_plan.errors.append(f"Workload file {path} not found")
+        return sweep_plan
+    
+    def _iter_configurations(self) -> Iterator[Configuration]:
+        """
+        Generate the configurations of the sweep lazily, in sweep order
+        
+        Yields:
+            (cell_type, opt_target, capacity, bits_per_cell, settings) tuples; settings
+            holds the (key, value) pairs of the other sweep axes
+        """
+        keys = self.sweep.keys[4:]
+        for cell_type, opt_target, capacity, bits_per_cell, *values in self.sweep:
+            yield cell_type, opt_target, capacity, bits_per_cell, tuple(zip(keys, values))
+    
+    @staticmethod
+    def _array_configuration(configuration: Configuration) -> Configuration:
+        """Return a configuration without its traffic settings; configurations sharing it share array results"""
+        return tuple(configuration[:4]) + (split_settings(configuration[4])[0],)
+    
+    @staticmethod
+    def _job_configuration(configuration: Sequence[Any]) -> Configuration:
+        """Return a job's configuration as a hashable tuple (JSON turns its settings into lists)"""
+        cell_type, opt_target, capacity, bits_per_cell, settings = configuration
+        return cell_type, opt_target, capacity, bits_per_cell, tuple((key, value) for key, value in settings)
+    
+    def _settings_label(self, settings: Settings) -> str:
+        """Return "-key=value" for each setting of an axis with several values, as used in file names"""
+        varying = self.sweep.varying
+        return "".join(f"-{key}={value}" for key, value in settings if key in varying)
+    
+    def _configuration_name(self, configuration: Configuration) -> str:
+        """Return the name of a configuration, e.g. SRAM_1MB_ReadLatency_1BPC-process_node=45"""
+        cell_type, opt_target, capacity, bits_per_cell, settings = configuration
+        return f"{cell_type}_{capacity}MB_{opt_target}_{bits_per_cell}BPC{self._settings_label(settings)}"
+    
+    def _run_configurations_parallel(self, configurations: Iterable[Configuration]) -> List[Optional[str]]:
+        """
+        Run configurations in a process pool, one array configuration per task
+        
+        Each configuration characterizes its array and writes its own results CSV,
+        so the outputs do not depend on completion order. Configurations that
+        differ only in traffic settings run in the same task and share one array
+        characterization. Results are returned in sweep order. Tasks are submitted
+        longest-first by recorded runtime, and the makespan is logged against the
+        ideal for the same work.
+        
+        Args:
+            configurations: Configurations from :meth:`_iter_configurations`
+            
+        Returns:
+            Results CSV path for each configuration (None where it failed)
+        """
+        # imported here so serial runs do not pay for multiprocessing's startup
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        groups: Dict[Configuration, List[Tuple[int, Configuration]]] = {}
+        for index, configuration in enumerate(configurations):
+            groups.setdefault(self._array_configuration(configuration), []).append((index, configuration))
+        tasks = [[index for index, _ in group] for group in groups.values()]
+        task_configurations = [[configuration for _, configuration in group] for group in groups.values()]
+        
+        total = sum(len(task) for task in tasks)
+        workers = min(self.jobs, len(tasks))
+        if len(tasks) < total:
+            self.logger.info(f"Running {total} configurations as {len(tasks)} array configurations "
+                             f"on {workers} worker processes")
+        else:
+            self.logger.info(f"Running {total} configurations on {workers} worker processes")
+        
+        results_csvs: List[Optional[str]] = [None] * total
+        failures, failed = [], 0
+        durations = [0.0] * len(tasks)
+        predicted = [self._predict_task_runtime(task) for task in task_configurations]
+        order = longest_first(predicted)
+        start_time = time.time()
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.config_path, self.use_cache, self.refresh_cache,
+                                           self.resume, self.profile)) as pool:
+            # the pool starts tasks in submission order
+            futures = {
+                pool.submit(_run_configuration_job, task_configurations[task],
+                            self._array_results.get(self._array_configuration(task_configurations[task][0]))): task
+                for task in order
+            }
+            
+            for done, future in enumerate(as_completed(futures), start=1):
+                task = futures[future]
+                indices = tasks[task]
+                array_configuration = self._array_configuration(task_configurations[task][0])
+                if len(indices) > 1:
+                    label = f"{self._configuration_name(array_configuration)} ({len(indices)} traffic settings)"
+                else:
+                    label = self._configuration_name(task_configurations[task][0])
+                try:
+                    task_csvs, elapsed, array_results, profile = future.result()
+                    for index, results_csv in zip(indices, task_csvs):
+                        results_csvs[index] = results_csv
+                    if profile is not None:
+                        instrumentation.merge(profile)
+                    if array_results is not None:
+                        self._array_results[array_configuration] = array_results
+                    durations[task] = elapsed
+                    self.logger.info(f"[{done}/{len(tasks)}] {label} done in {elapsed:.2f}s")
+                except Exception as e:
+                    failures.append(label)
+                    failed += len(indices)
+                    self.logger.error(f"[{done}/{len(tasks)}] {label} failed: {e}")
+        
+        wall_time = time.time() - start_time
+        busy_time = sum(durations)
+        speedup = busy_time / wall_time if wall_time > 0 else 0.0
+        self.logger.info(f"Completed {total - failed}/{total} configurations in {wall_time:.2f}s "
+                         f"({busy_time:.2f}s of work, {speedup:.1f}x speedup)")
+        ideal = ideal_makespan(durations, workers)
+        self.schedule = {
+            "workers": workers,
+            "makespan": wall_time,
+            "ideal_makespan": ideal,
+            "longest_first_makespan": list_makespan(durations, workers, order),
+            "sweep_order_makespan": list_makespan(durations, workers),
+            "predicted": sum(seconds is not None for seconds in predicted)
+        }
+        self.logger.info(f"Makespan {wall_time:.2f}s vs ideal {ideal:.2f}s "
+                         f"({wall_time / ideal if ideal > 0 else 1.0:.2f}x); "
+                         f"{self.schedule['predicted']}/{len(tasks)} array configurations had runtime history")
+        
+        if failures:
+            raise RuntimeError(f"{len(failures)} configuration(s) failed: {', '.join(failures)}")
+        
+        return results_csvs
+    
+    def _predict_configuration_runtime(self, configuration: Configuration,
+                                       include_nvsim: bool = True) -> Optional[float]:
+        """
+        Predict the runtime of a configuration's job from the runtime history
+        
+        Args:
+            configuration: (cell_type, opt_target, capacity, bits_per_cell, settings) tuple
+            include_nvsim: Whether the job also characterizes the array
+            
+        Returns:
+            Predicted NVSim seconds (0 if the array results are known or cached) plus
+            the recorded evaluation seconds, or None without any history
+        """
+        memory_config = self._memory_config(*configuration)
+        nvsim = 0.0
+        if include_nvsim and self._array_configuration(configuration) not in self._array_results:
+            nvsim = self.array_interface.predict_runtime(memory_config)
+        evaluation = self.array_interface.runtime_history.predict(config_signature(memory_config), "evaluation")
+        if nvsim is None and evaluation is None:
+            return None
+        return (nvsim or 0.0) + (evaluation or 0.0)
+    
+    def _predict_task_runtime(self, configurations: Sequence[Configuration]) -> Optional[float]:
+        """
+        Predict the runtime of configurations that share one array characterization
+        
+        Args:
+            configurations: Configurations differing only in traffic settings
+            
+        Returns:
+            Predicted seconds of one NVSim run plus every evaluation, or None without any history
+        """
+        predicted = [self._predict_configuration_runtime(configuration, include_nvsim=index == 0)
+                     for index, configuration in enumerate(configurations)]
+        if all(seconds is None for seconds in predicted):
+            return None
+        return sum(seconds for seconds in predicted if seconds is not None)
+    
+    def _run_timed_configuration(self, configuration: Configuration) -> Tuple[str, float]:
+        """
+        Run a configuration and record how long its evaluation took besides NVSim
+        
+        Args:
+            configuration: (cell_type, opt_target, capacity, bits_per_cell, settings) tuple
+            
+        Returns:
+            Tuple of (results CSV path, elapsed seconds)
+        """
+        start_time = time.time()
+        nvsim_seconds = self.array_interface.nvsim_seconds
+        results_csv = self._run_single_configuration(*configuration)
+        elapsed = time.time() - start_time
+        
+        evaluation = elapsed - (self.array_interface.nvsim_seconds - nvsim_seconds)
+        try:
+            self.array_interface.runtime_history.record(
+                config_signature(self._memory_config(*configuration)), "evaluation", max(0.0, evaluation)
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to record the runtime of {configuration}: {e}")
+        return results_csv, elapsed
     
     def _setup_output_directories(self):
         """Setup output directory structure"""
@@ -159,7 +498,7 @@ class MemSysExplorer:
         (output_dir / "results").mkdir(exist_ok=True)
     
     def _run_single_configuration(self, cell_type: str, opt_target: str, 
-                                capacity: float, bits_per_cell: int):
+                                capacity: float, bits_per_cell: int, settings: Settings = ()) -> str:
         """
         Run traffic evaluation for a single memory configuration
         
@@ -168,99 +507,679 @@ class MemSysExplorer:
             opt_target: Optimization target (ReadLatency, ReadEDP, etc.)
             capacity: Memory capacity in MB
             bits_per_cell: Bits per memory cell
+            settings: (key, value) pairs of the other sweep axes
+            
+        Returns:
+            Path to the configuration's results CSV
         """
         display_type = cell_type
-        self.logger.info(f"→ {display_type} {capacity}MB {opt_target} {bits_per_cell}BPC")
+        self.logger.info(f"→ {display_type} {capacity}MB {opt_target} {bits_per_cell}BPC"
+                         f"{self._settings_label(settings)}")
         
-        access_pattern = PatternConfig(
-            exp_name=self.exp_name,
-            read_freq=self.read_frequency,
-            read_size=self.read_size,
-            write_freq=self.write_frequency,
-            write_size=self.write_size,
-            workingset=self.working_set
+        access_pattern = self._base_access_pattern(settings)
+        
+        results_csv = self._results_csv_path(cell_type, opt_target, capacity, bits_per_cell, settings)
+        
+        units = self._traffic_units()
+        completed, offset = [], 0
+        if self.resume:
+            completed, offset = self.manifest.verified_prefix(results_csv, units)
+            if units and len(completed) == len(units):
+                self.logger.info(f"✓ {display_type} {capacity}MB {opt_target} {bits_per_cell}BPC already complete")
+                return results_csv
+            if completed:
+                self.logger.info(f"Resuming after completed units: {', '.join(completed)}")
+        
+        if offset > 0:
+            # drop rows of a unit that was interrupted mid-write
+            with open(results_csv, "r+b") as f:
+                f.truncate(offset)
+            self.manifest.rewind(results_csv, len(completed))
+        else:
+            if os.path.exists(results_csv):
+                os.remove(results_csv)
+            self.manifest.reset(results_csv)
+        
+        configuration = (cell_type, opt_target, capacity, bits_per_cell, settings)
+        # already set by the surrogate sweep or a configuration differing only in traffic settings
+        array_results = self._array_results.get(self._array_configuration(configuration))
+        if array_results is None:
+            array_results = self._run_array_characterization(
+                cell_type, opt_target, capacity, bits_per_cell, settings
+            )
+            if self.sweep.traffic_keys or any(suite in self.traffic for suite in self.CROSS_CONFIG_SUITES):
+                self._array_results[self._array_configuration(configuration)] = array_results
+        
+        nvsim_input_cfgs, nvsim_outputs, cell_paths, cfg_paths = self._create_nvsim_compatible_objects(
+            array_results, cell_type, opt_target, capacity, bits_per_cell, settings
         )
         
-        results_csv = os.path.join(
+        if units and nvsim_input_cfgs and nvsim_outputs:
+            with ResultSink(results_csv) as sink:
+                for unit in units[len(completed):]:
+                    if unit in self.CROSS_CONFIG_SUITES:
+                        # written by _run_adaptive_traffic once every configuration has run
+                        break
+                    rows_before = sink.rows_written
+                    with stage(f"traffic.{unit}"):
+                        self._run_traffic_unit(unit, access_pattern, nvsim_input_cfgs, nvsim_outputs,
+                                               sink, cell_paths, cfg_paths)
+                    # checkpoint: rows must be on disk before the manifest says so
+                    sink.flush(sync=True)
+                    end = os.path.getsize(results_csv) if os.path.exists(results_csv) else 0
+                    self.manifest.record(results_csv, unit, offset, end,
+                                         sink.rows_written - rows_before, configuration)
+                    offset = end
+        
+        return results_csv
+    
+    def _base_access_pattern(self, settings: Settings = ()) -> PatternConfig:
+        """Return the configured base access pattern, with a configuration's traffic settings applied"""
+        traffic = dict(split_settings(settings)[1])
+        return PatternConfig(
+            exp_name=self.exp_name,
+            read_freq=traffic.get("read_frequency", self.read_frequency),
+            read_size=traffic.get("read_size", self.read_size),
+            write_freq=traffic.get("write_frequency", self.write_frequency),
+            write_size=traffic.get("write_size", self.write_size),
+            workingset=traffic.get("working_set", self.working_set)
+        )
+    
+    def _results_csv_path(self, cell_type: str, opt_target: str, capacity: float, bits_per_cell: int,
+                          settings: Settings = ()) -> str:
+        """Return the results CSV path of a configuration"""
+        return os.path.join(
             self.output_path, "results",
-            f"{display_type}_{capacity}MB_{opt_target}_{bits_per_cell}BPC-{self.exp_name}.csv"
+            f"{cell_type}_{capacity}MB_{opt_target}_{bits_per_cell}BPC{self._settings_label(settings)}"
+            f"-{self.exp_name}.csv"
         )
+    
+    def _traffic_units(self) -> List[str]:
+        """
+        Return the units written to each results CSV, in write order
         
-        if os.path.exists(results_csv):
-            os.remove(results_csv)
+        Returns:
+            ["header"] followed by the configured traffic suites, or an empty list without traffic
+        """
+        if len(self.traffic) == 0:
+            return []
+        return ["header"] + [suite for suite in self.TRAFFIC_SUITES if suite in self.traffic]
+    
+    def _run_adaptive_traffic(self, configurations: Iterable[Configuration],
+                              results_csvs: List[Optional[str]]):
+        """
+        Run the adaptive generic sweep across all configurations and append its rows
         
-        array_results = self._run_array_characterization(
-            cell_type, opt_target, capacity, bits_per_cell
-        )
+        The sweep refines the traffic grid where the best technology changes, which
+        needs every configuration's array results at once, so it runs after all
+        configurations have written their other units. Each configuration's rows are
+        appended to its own results CSV as the "generic_adaptive" unit. Configurations
+        are compared only with those sharing their traffic settings, one sweep each.
         
-        nvsim_input_cfgs, nvsim_outputs, cell_paths, cfg_paths = self._create_nvsim_compatible_objects(
-            array_results, cell_type, opt_target, capacity, bits_per_cell
-        )
+        Args:
+            configurations: Configurations from :meth:`_iter_configurations`
+            results_csvs: Results CSV path for each configuration
+        """
+        # workers may have recorded units since the manifest was first read
+        self.manifest.refresh()
         
-        if len(self.traffic) > 0:
-            if nvsim_input_cfgs and nvsim_outputs:
-                result = ExperimentResult(access_pattern, nvsim_input_cfgs[0], nvsim_outputs[0])
-                result.evaluate()
-                result.report_header_benchmark(1, results_csv, cell_paths[0], cfg_paths[0])
-                
-                if "generic" in self.traffic:
-                    self.logger.info("→ Running traffic evaluation")
-                    generic_traffic(access_pattern, nvsim_input_cfgs, nvsim_outputs, 
-                                      results_csv, cell_paths, cfg_paths)
-                
-                if "graph" in self.traffic:
-                    self.logger.info("Running graph traffic sweep")
-                    graph_traffic(graph8MB, access_pattern, nvsim_input_cfgs, nvsim_outputs,
-                                results_csv, cell_paths, cfg_paths)
-                
-                if "dnn" in self.traffic:
-                    self.logger.info("Running DNN traffic sweep")
-                    dnn_traffic(DNN_weights, DNN_weights_acts, access_pattern, 
-                                  nvsim_input_cfgs, nvsim_outputs, results_csv, cell_paths, cfg_paths)
-                
-                if "spec" in self.traffic:
-                    self.logger.info("Running SPEC traffic sweep")
-                    from integrate.traffic_evaluation.traffic import spec_traffic_single
-                    spec_traffic_single(spec8MBLLC, access_pattern, nvsim_input_cfgs, 
-                                      nvsim_outputs, results_csv, cell_paths, cfg_paths)
+        groups: Dict[Settings, List[Tuple[Configuration, Optional[str]]]] = {}
+        for configuration, results_csv in zip(configurations, results_csvs):
+            groups.setdefault(split_settings(configuration[4])[1], []).append((configuration, results_csv))
+        for traffic, group in groups.items():
+            self._run_adaptive_group([configuration for configuration, _ in group],
+                                     [results_csv for _, results_csv in group], traffic)
+    
+    def _run_adaptive_group(self, configurations: List[Configuration], results_csvs: List[Optional[str]],
+                            traffic: Settings):
+        """
+        Run the adaptive generic sweep across configurations sharing traffic settings
+        
+        Args:
+            configurations: Configurations with the same traffic settings
+            results_csvs: Results CSV path for each configuration
+            traffic: The configurations' traffic settings
+        """
+        units = self._traffic_units()
+        per_config_units = [unit for unit in units if unit not in self.CROSS_CONFIG_SUITES]
+        
+        access_pattern = self._base_access_pattern(traffic)
+        
+        nvsim_input_cfgs, nvsim_outputs, cell_paths, cfg_paths = [], [], [], []
+        sinks, offsets, pending = [], [], []
+        for configuration, results_csv in zip(configurations, results_csvs):
+            array_results = self._array_results.get(self._array_configuration(configuration))
+            if array_results is None:
+                array_results = self._run_array_characterization(*configuration)
+            cfgs, outs, cells, cfg_files = self._create_nvsim_compatible_objects(array_results, *configuration)
+            if not cfgs or not outs:
+                continue
+            nvsim_input_cfgs.append(cfgs[0])
+            nvsim_outputs.append(outs[0])
+            cell_paths.append(cells[0])
+            cfg_paths.append(cfg_files[0])
+            
+            if self.resume and len(self.manifest.verified_prefix(results_csv, units)[0]) == len(units):
+                sinks.append(None)
+                offsets.append(None)
+                continue
+            
+            completed, offset = self.manifest.verified_prefix(results_csv, per_config_units)
+            if len(completed) < len(per_config_units):
+                raise RuntimeError(f"Cannot run the adaptive sweep: {results_csv} is incomplete")
+            with open(results_csv, "r+b") as f:
+                f.truncate(offset)
+            self.manifest.rewind(results_csv, len(completed))
+            
+            sinks.append(ResultSink(results_csv))
+            offsets.append(offset)
+            pending.append((configuration, results_csv, len(sinks) - 1))
+        
+        varying = [f"{key}={value}" for key, value in traffic if key in self.sweep.varying]
+        label = f" for {', '.join(varying)}" if varying else ""
+        if not pending:
+            self.logger.info(f"✓ Adaptive sweep{label} already complete")
+            return
+        
+        self.logger.info(f"Running adaptive traffic sweep{label} across {len(nvsim_input_cfgs)} configurations "
+                         f"(metric: {self.adaptive_metric})")
+        try:
+            with stage("traffic.generic_adaptive"):
+                generic_traffic_adaptive(access_pattern, nvsim_input_cfgs, nvsim_outputs, sinks,
+                                         cell_paths, cfg_paths, metric=self.adaptive_metric,
+                                         max_depth=self.adaptive_max_depth)
+            for configuration, results_csv, index in pending:
+                sinks[index].flush(sync=True)
+                end = os.path.getsize(results_csv)
+                self.manifest.record(results_csv, "generic_adaptive", offsets[index], end,
+                                     sinks[index].rows_written, configuration)
+        finally:
+            for sink in sinks:
+                if sink is not None:
+                    sink.close()
+    
+    def _write_pareto_frontier(self, results_csvs: List[Optional[str]]) -> Optional[str]:
+        """
+        Post-processing stage: write the per-benchmark Pareto frontier of all results CSVs
+        
+        Args:
+            results_csvs: Results CSV path for each configuration
+            
+        Returns:
+            Path to the frontier CSV, or None when there are no results
+        """
+        existing = [path for path in results_csvs if path and os.path.exists(path)]
+        if not existing:
+            self.logger.warning("No results to compute a Pareto frontier from")
+            return None
+        
+        frontier_csv = os.path.join(self.output_path, f"pareto_frontier-{self.exp_name}.csv")
+        self.logger.info("→ Computing Pareto frontier")
+        with stage("pareto"):
+            write_pareto_frontier(existing, frontier_csv, objectives=self.pareto_objectives)
+        return frontier_csv
+    
+    def _expand_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Expand the sweep into independent jobs for sharded or queued execution
+        
+        Every (configuration, unit) pair is one job; cross-configuration suites
+        are one job each, covering every configuration. Job order and names
+        depend only on the configuration, so all workers agree on them.
+        
+        Returns:
+            Jobs in sweep order, as JSON-serializable dicts with "index", "name",
+            "configuration" (None for cross-configuration suites) and "unit"
+        """
+        units = self._traffic_units()
+        jobs = [{"configuration": list(configuration), "unit": unit}
+                for configuration in self._iter_configurations()
+                for unit in units if unit not in self.CROSS_CONFIG_SUITES]
+        jobs += [{"configuration": None, "unit": unit} for unit in units if unit in self.CROSS_CONFIG_SUITES]
+        
+        for index, job in enumerate(jobs):
+            label = "all" if job["configuration"] is None else \
+                "{}_{}MB_{}_{}BPC".format(*job["configuration"][:4]) + \
+                self._settings_label(job["configuration"][4])
+            job["index"] = index
+            job["name"] = f"{index:05d}-{label}-{job['unit']}"
+        return jobs
+    
+    def _part_path(self, results_csv: str, unit: str) -> str:
+        """
+        Return the file holding one unit's rows of a results CSV until the parts are merged
+        
+        Args:
+            results_csv: Results CSV path
+            unit: Unit name
+            
+        Returns:
+            Path under <output_path>/parts/<results CSV name>/
+        """
+        position = self._traffic_units().index(unit)
+        return os.path.join(self.output_path, "parts", Path(results_csv).stem, f"{position:02d}-{unit}.csv")
+    
+    def _check_parts_fingerprint(self):
+        """Record the experiment fingerprint with the parts, refusing to mix parts of different experiments"""
+        parts_dir = Path(self.output_path) / "parts"
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        fingerprint_path = parts_dir / "fingerprint"
+        try:
+            with open(fingerprint_path, "x") as f:
+                f.write(self.manifest.fingerprint)
+        except FileExistsError:
+            existing = fingerprint_path.read_text().strip()
+            if existing and existing != self.manifest.fingerprint:
+                raise RuntimeError(f"{parts_dir} holds parts of a different experiment configuration")
+    
+    @contextmanager
+    def _part_sink(self, part: str):
+        """
+        Yield a ResultSink whose rows appear at part only once the block succeeds
+        
+        Args:
+            part: Part file path
+        """
+        os.makedirs(os.path.dirname(part), exist_ok=True)
+        staging = f"{part}.{os.getpid()}.tmp"
+        if os.path.exists(staging):
+            os.remove(staging)
+        sink = ResultSink(staging)
+        try:
+            yield sink
+            sink.flush(sync=True)
+        except BaseException:
+            sink.close()
+            if os.path.exists(staging):
+                os.remove(staging)
+            raise
+        sink.close()
+        # a unit without rows still marks its job as done
+        open(staging, "a").close()
+        os.replace(staging, part)
+    
+    def _job_array_results(self, configuration: Configuration) -> Dict[str, Any]:
+        """Return a configuration's array results, characterizing its array once per process"""
+        array_configuration = self._array_configuration(configuration)
+        if array_configuration not in self._array_results:
+            self._array_results[array_configuration] = self._run_array_characterization(*array_configuration)
+        return self._array_results[array_configuration]
+    
+    def _run_job(self, job: Dict[str, Any]):
+        """
+        Run one job from :meth:`_expand_jobs`, writing its rows to part files
+        
+        Args:
+            job: Job dict
+        """
+        unit = job["unit"]
+        self.logger.info(f"→ Job {job['name']}")
+        
+        if job["configuration"] is not None:
+            configuration = self._job_configuration(job["configuration"])
+            access_pattern = self._base_access_pattern(configuration[4])
+            nvsim_input_cfgs, nvsim_outputs, cell_paths, cfg_paths = self._create_nvsim_compatible_objects(
+                self._job_array_results(configuration), *configuration
+            )
+            with self._part_sink(self._part_path(self._results_csv_path(*configuration), unit)) as sink:
+                if nvsim_input_cfgs and nvsim_outputs:
+                    with stage(f"traffic.{unit}"):
+                        self._run_traffic_unit(unit, access_pattern, nvsim_input_cfgs, nvsim_outputs,
+                                               sink, cell_paths, cfg_paths)
+            return
+        
+        # cross-configuration suite: one part per configuration, written together per traffic setting
+        groups: Dict[Settings, List[Configuration]] = {}
+        for configuration in self._iter_configurations():
+            groups.setdefault(split_settings(configuration[4])[1], []).append(configuration)
+        for traffic, configurations in groups.items():
+            nvsim_input_cfgs, nvsim_outputs, cell_paths, cfg_paths, sinks = [], [], [], [], []
+            with ExitStack() as stack:
+                for configuration in configurations:
+                    part = self._part_path(self._results_csv_path(*configuration), unit)
+                    sink = stack.enter_context(self._part_sink(part))
+                    cfgs, outs, cells, cfg_files = self._create_nvsim_compatible_objects(
+                        self._job_array_results(configuration), *configuration
+                    )
+                    if cfgs and outs:
+                        nvsim_input_cfgs.append(cfgs[0])
+                        nvsim_outputs.append(outs[0])
+                        cell_paths.append(cells[0])
+                        cfg_paths.append(cfg_files[0])
+                        sinks.append(sink)
+                with stage(f"traffic.{unit}"):
+                    generic_traffic_adaptive(self._base_access_pattern(traffic), nvsim_input_cfgs,
+                                             nvsim_outputs, sinks, cell_paths, cfg_paths,
+                                             metric=self.adaptive_metric, max_depth=self.adaptive_max_depth)
+    
+    def run_shard(self, index: int, count: int) -> Dict[str, Any]:
+        """
+        Run one shard of the sweep's jobs, for splitting a sweep across machines
+        
+        Every shard writes its rows to part files under the shared output
+        directory; once all shards have finished, :meth:`merge` assembles the
+        results CSVs.
+        
+        Args:
+            index: Shard index (0 to count-1)
+            count: Number of shards
+            
+        Returns:
+            Dictionary containing execution results
+        """
+        jobs = self._expand_jobs()
+        selected = shard_jobs(jobs, index, count)
+        self.logger.info(f"Shard {index}/{count}: running {len(selected)} of {len(jobs)} jobs")
+        return self._run_jobs(selected, f"shard{index}of{count}")
+    
+    def run_queue(self, queue_dir: str) -> Dict[str, Any]:
+        """
+        Claim and run jobs from a shared work queue until none are pending
+        
+        The first worker creates the queue; any number of workers on machines
+        sharing the queue and output directories can then run concurrently.
+        Once all jobs are done, :meth:`merge` assembles the results CSVs.
+        
+        Args:
+            queue_dir: Queue directory shared by all workers
+            
+        Returns:
+            Dictionary containing execution results
+        """
+        queue = WorkQueue(queue_dir)
+        queue.create(self._expand_jobs(), self.manifest.fingerprint)
+        results = self._run_jobs(queue.claims(), queue.owner, queue)
+        status = queue.status()
+        self.logger.info(f"Work queue: {status['done']} done, {status['failed']} failed, "
+                         f"{status['claimed']} running, {status['pending']} pending")
+        return results
+    
+    def _run_jobs(self, jobs, tag: str, queue: Optional[WorkQueue] = None) -> Dict[str, Any]:
+        """
+        Run jobs in order, continuing past failures
+        
+        Args:
+            jobs: Iterable of jobs (a list, or a queue's claims)
+            tag: Suffix distinguishing this worker's profile files
+            queue: Queue the jobs were claimed from, notified of each outcome
+            
+        Returns:
+            Dictionary containing execution results
+        """
+        if self.surrogate is not None:
+            raise ValueError("The surrogate sweep needs every configuration in one run; "
+                             "it cannot be combined with --shard or --queue")
+        
+        start_time = time.time()
+        completed, failures = [], []
+        try:
+            self._setup_output_directories()
+            self._check_parts_fingerprint()
+            with stage("run"):
+                for job in jobs:
+                    try:
+                        self._run_job(job)
+                    except Exception as e:
+                        self.logger.error(f"Job {job['name']} failed: {e}")
+                        failures.append(job["name"])
+                        if queue is not None:
+                            queue.fail(job, str(e))
+                        continue
+                    if queue is not None:
+                        queue.complete(job)
+                    completed.append(job["name"])
+        finally:
+            self._write_profile(f"-{tag}")
+        
+        execution_time = time.time() - start_time
+        self.logger.info(f"Completed {len(completed)} jobs in {execution_time:.2f} seconds")
+        if failures:
+            raise RuntimeError(f"{len(failures)} job(s) failed: {', '.join(failures)}")
+        
+        return {
+            "status": "success",
+            "execution_time": execution_time,
+            "output_path": self.output_path,
+            "jobs": completed
+        }
+    
+    def merge(self) -> Dict[str, Any]:
+        """
+        Assemble the results CSVs from the part files of sharded or queued jobs
+        
+        Parts are concatenated in unit order, so the results CSVs are identical
+        to those of a single-machine run, and every unit is recorded in the run
+        manifest so that a later --resume treats them as complete.
+        
+        Returns:
+            Dictionary containing execution results
+        """
+        start_time = time.time()
+        self._setup_output_directories()
+        
+        units = self._traffic_units()
+        results_csvs = [self._results_csv_path(*configuration) for configuration in self._iter_configurations()]
+        missing = [part for results_csv in results_csvs for part in
+                   (self._part_path(results_csv, unit) for unit in units) if not os.path.exists(part)]
+        if missing:
+            raise RuntimeError(f"Cannot merge: {len(missing)} of {len(results_csvs) * len(units)} parts are "
+                               f"missing (first: {missing[0]}); finish every shard or queued job first")
+        if units:
+            self._check_parts_fingerprint()
+        
+        with stage("merge"):
+            for configuration, results_csv in zip(self._iter_configurations(), results_csvs):
+                parts = [self._part_path(results_csv, unit) for unit in units]
+                if os.path.exists(results_csv):
+                    os.remove(results_csv)
+                self.manifest.reset(results_csv)
+                if all(os.path.getsize(part) == 0 for part in parts):
+                    continue
                 
-                if "generic_write_buff" in self.traffic:
-                    self.logger.info("Running generic traffic with write buffering")
-                    generic_traffic_with_write_buff(access_pattern, nvsim_input_cfgs, nvsim_outputs,
-                                                  results_csv, cell_paths, cfg_paths)
+                spans = []
+                with open(results_csv, "wb") as out:
+                    for unit, part in zip(units, parts):
+                        start, rows = out.tell(), 0
+                        with open(part, "rb") as f:
+                            while True:
+                                chunk = f.read(1 << 20)
+                                if not chunk:
+                                    break
+                                out.write(chunk)
+                                rows += chunk.count(b"\n")
+                        spans.append((unit, start, out.tell(), rows))
+                    out.flush()
+                    os.fsync(out.fileno())
+                for unit, start, end, rows in spans:
+                    self.manifest.record(results_csv, unit, start, end, rows, configuration)
+        
+        self.logger.info(f"Merged {len(units)} units of {len(results_csvs)} configurations "
+                         f"into {os.path.join(self.output_path, 'results')}")
+        
+        frontier_csv = None
+        if self.pareto:
+            frontier_csv = self._write_pareto_frontier(results_csvs)
+        
+        return {
+            "status": "success",
+            "execution_time": time.time() - start_time,
+            "output_path": self.output_path,
+            "results": results_csvs,
+            "pareto_frontier": frontier_csv
+        }
     
-    def _run_array_characterization(self, cell_type: str, opt_target: str, 
-                                  capacity: float, bits_per_cell: int) -> Dict[str, Any]:
+    def _write_profile(self, suffix: str = ""):
         """
-        Run ArrayCharacterization for the specified memory configuration
+        Write the stage profile to the output directory when profiling is enabled
+        
+        Args:
+            suffix: Appended to the file names, so concurrent workers do not overwrite each other
+        """
+        if self.profile:
+            instrumentation.write(os.path.join(self.output_path, f"profile{suffix}.json"),
+                                  os.path.join(self.output_path, f"profile_trace{suffix}.json"))
+    
+    def build_coefficient_model(self) -> CoefficientModel:
+        """
+        Build a closed-form coefficient model of every configured array configuration
+        
+        Array results come from the characterization cache where available, so this is
+        cheap after a sweep. Configurations are labelled like their results CSVs;
+        traffic settings do not change the coefficients, so they are left out.
         
         Returns:
-            Dictionary containing array characterization results
+            CoefficientModel with one entry per array configuration, in sweep order
+        """
+        model = CoefficientModel()
+        for configuration in dict.fromkeys(map(self._array_configuration, self._iter_configurations())):
+            array_results = self._run_array_characterization(*configuration)
+            nvsim_input_cfgs, nvsim_outputs, _, _ = self._create_nvsim_compatible_objects(
+                array_results, *configuration
+            )
+            if nvsim_input_cfgs and nvsim_outputs:
+                model.add(nvsim_input_cfgs[0], nvsim_outputs[0], label=self._configuration_name(configuration))
+        return model
+    
+    def _run_traffic_unit(self, unit: str, access_pattern: PatternConfig, nvsim_input_cfgs: list,
+                          nvsim_outputs: list, sink: ResultSink, cell_paths: list, cfg_paths: list):
+        """
+        Write one unit (the header row or one traffic suite) of a results CSV
+        
+        Args:
+            unit: "header" or a traffic suite name from TRAFFIC_SUITES
+            access_pattern: Base access pattern
+            nvsim_input_cfgs: List of NVSim input configurations
+            nvsim_outputs: List of NVSim output results
+            sink: Result sink of the configuration's results CSV
+            cell_paths: List of cell configuration paths
+            cfg_paths: List of memory configuration paths
         """
+        if unit == "header":
+            result = ExperimentResult(access_pattern, nvsim_input_cfgs[0], nvsim_outputs[0])
+            result.evaluate()
+            sink.write_header(result, cell_paths[0], cfg_paths[0])
+        
+        elif unit == "generic":
+            self.logger.info("→ Running traffic evaluation")
+            generic_traffic(access_pattern, nvsim_input_cfgs, nvsim_outputs, 
+                              sink, cell_paths, cfg_paths)
+        
+        elif unit == "graph":
+            self.logger.info("Running graph traffic sweep")
+            graph_traffic(graph8MB, access_pattern, nvsim_input_cfgs, nvsim_outputs,
+                        sink, cell_paths, cfg_paths)
+        
+        elif unit == "dnn":
+            self.logger.info("Running DNN traffic sweep")
+            dnn_traffic(DNN_weights, DNN_weights_acts, access_pattern, 
+                          nvsim_input_cfgs, nvsim_outputs, sink, cell_paths, cfg_paths)
+        
+        elif unit == "spec":
+            self.logger.info("Running SPEC traffic sweep")
+            from integrate.traffic_evaluation.traffic import spec_traffic_single
+            spec_traffic_single(spec8MBLLC, access_pattern, nvsim_input_cfgs, 
+                              nvsim_outputs, sink, cell_paths, cfg_paths)
+        
+        elif unit == "generic_write_buff":
+            self.logger.info("Running generic traffic with write buffering")
+            generic_traffic_with_write_buff(access_pattern, nvsim_input_cfgs, nvsim_outputs,
+                                          sink, cell_paths, cfg_paths)
+        
+        elif unit == "catalog":
+            catalog = self._load_workload_catalog()
+            self.logger.info(f"Running workload catalog sweep ({len(catalog)} workloads)")
+            catalog_traffic(catalog, access_pattern, nvsim_input_cfgs, nvsim_outputs,
+                            sink, cell_paths, cfg_paths)
+    
+    def _load_workload_catalog(self) -> WorkloadCatalog:
+        """
+        Load the workload files of the "workloads" config key once per process
+        
+        Returns:
+            WorkloadCatalog of all configured workload files, in order
+        """
+        if self._workload_catalog is None:
+            if not self.workloads:
+                raise ValueError("The catalog traffic suite needs a \"workloads\" list of workload files")
+            self._workload_catalog = WorkloadCatalog.from_files(self.workloads)
+        return self._workload_catalog
+    
+    def _memory_config(self, cell_type: str, opt_target: str,
+                       capacity: float, bits_per_cell: int, settings: Settings = ()) -> Dict[str, Any]:
+        """Return the ArrayCharacterization memory configuration of a configuration"""
         experiment_config = self.config.get("experiment", {}).copy()
-        experiment_config.pop("bits_per_cell", None)
-        experiment_config.pop("capacity", None)
         experiment_config.pop("process_node", None)
-        experiment_config.pop("opt_target", None)
-        experiment_config.pop("cell_type", None)
+        # sweep axes take the configuration's value instead of the whole list
+        for key in self.sweep.keys:
+            experiment_config.pop(key, None)
         
-        memory_config = {
+        return {
             "memory_type": cell_type,
             "process_node": self.process_node,
             "capacity_mb": capacity,
             "optimization_target": opt_target,
             "word_width": self.word_width,
             "bits_per_cell": bits_per_cell,
-            **experiment_config
+            **experiment_config,
+            **dict(split_settings(settings)[0])
         }
+    
+    def _run_array_characterization(self, cell_type: str, opt_target: str, 
+                                  capacity: float, bits_per_cell: int, settings: Settings = ()) -> Dict[str, Any]:
+        """
+        Run ArrayCharacterization for the specified memory configuration
+        
+        Returns:
+            Dictionary containing array characterization results
+        """
+        memory_config = self._memory_config(cell_type, opt_target, capacity, bits_per_cell, settings)
         
         try:
-            results = self.array_interface.run_characterization(memory_config)
+            with stage("array_characterization"):
+                results = self.array_interface.run_characterization(memory_config)
             return results
         except Exception as e:
             self.logger.error(f"ArrayCharacterization failed for {cell_type}: {e}")
             return self._get_default_array_results(cell_type)
     
+    def _run_surrogate_sweep(self, configurations: Iterable[Configuration]):
+        """
+        Characterize all configurations through the interface's surrogate sweep
+        
+        NVSim runs only where the surrogate trained on cached characterizations is
+        uncertain or a configuration is close to the Pareto frontier; the other
+        configurations use predicted array results. The results are kept for the
+        traffic evaluation, and surrogate.json in the output directory lists which
+        configurations were predicted.
+        
+        Args:
+            configurations: Configurations from :meth:`_iter_configurations`
+        """
+        options = dict(self.surrogate)
+        if "objectives" in options:
+            options["objectives"] = tuple(options["objectives"])
+        # configurations differing only in traffic settings share one array characterization
+        configurations = list(dict.fromkeys(map(self._array_configuration, configurations)))
+        memory_configs = [self._memory_config(*configuration) for configuration in configurations]
+        with stage("array_characterization"):
+            results = self.array_interface.run_surrogate_sweep(memory_configs, **options)
+        
+        summary = []
+        for configuration, array_results in zip(configurations, results):
+            self._array_results[configuration] = array_results
+            cell_type, opt_target, capacity, bits_per_cell, settings = configuration
+            summary.append({
+                "cell_type": cell_type,
+                "opt_target": opt_target,
+                "capacity": capacity,
+                "bits_per_cell": bits_per_cell,
+                **dict(settings),
+                "predicted": bool(array_results.get("surrogate", False)),
+                "uncertainty": array_results.get("surrogate_uncertainty")
+            })
+        with open(os.path.join(self.output_path, "surrogate.json"), "w") as f:
+            json.dump(summary, f, indent=2)
+    
     def _get_default_array_results(self, cell_type: str) -> Dict[str, Any]:
         """Return default array results when ArrayCharacterization fails"""
         defaults = {
@@ -310,7 +1229,7 @@ class MemSysExplorer:
     
     def _create_nvsim_compatible_objects(self, array_results: Dict[str, Any], 
                                        cell_type: str, opt_target: str, 
-                                       capacity: float, bits_per_cell: int):
+                                       capacity: float, bits_per_cell: int, settings: Settings = ()):
         """
         Create NVSim-compatible objects from ArrayCharacterization results
         
@@ -318,19 +1237,13 @@ class MemSysExplorer:
         """
         from integrate.input_defs.nvsim_interface import NVSimInputConfig, NVSimOutputConfig
         
-        cfg_name = f"{cell_type}_{capacity}MB_{opt_target}_{bits_per_cell}BPC"
+        array_settings = split_settings(settings)[0]
+        cfg_name = self._configuration_name((cell_type, opt_target, capacity, bits_per_cell, array_settings))
+        process_node = dict(array_settings).get("process_node", self.process_node)
+        word_width = dict(array_settings).get("word_width", self.word_width)
         
         try:
-            memory_config_for_path = {
-                "memory_type": cell_type,
-                "process_node": self.process_node,
-                "capacity_mb": capacity,
-                "optimization_target": opt_target,
-                "word_width": self.word_width,
-                "bits_per_cell": bits_per_cell,
-                "case": "best_case",
-                **self.config.get("experiment", {})
-            }
+            memory_config_for_path = self._memory_config(cell_type, opt_target, capacity, bits_per_cell, settings)
             
             case = memory_config_for_path.get('case', 'best_case')
             cell_filename = f"{cell_type}_{case}.cell"
@@ -340,7 +1253,7 @@ class MemSysExplorer:
                 cell_path = str(cell_path_check)
             else:
                 cell_path = f"../integrate/data/cell_cfgs/{cell_type}_{case}.cell"
-                
+        
         except Exception as e:
             self.logger.warning(f"Could not resolve actual cell path: {e}")
             cell_path = f"../integrate/data/cell_cfgs/{cell_type}_best_case.cell"
@@ -349,9 +1262,9 @@ class MemSysExplorer:
         
         nvsim_input_cfg = NVSimInputConfig(
             mem_cfg_file_path=cfg_path,
-            process_node=self.process_node,
+            process_node=process_node,
             opt_target=opt_target,
-            word_width=self.word_width,
+            word_width=word_width,
             capacity=capacity,
             cell_type=cell_type
         )
@@ -371,14 +1284,95 @@ class MemSysExplorer:
         return ([nvsim_input_cfg], [nvsim_output], [cell_path], [cfg_path])
 
 
+_worker_explorer: Optional[MemSysExplorer] = None
+
+
+def _init_worker(config_path: str, use_cache: bool, refresh_cache: bool, resume: bool,
+                 profile: bool = False):
+    """Build one MemSysExplorer per worker process for parallel sweeps"""
+    global _worker_explorer
+    _worker_explorer = MemSysExplorer(config_path, use_cache=use_cache, refresh_cache=refresh_cache,
+                                      resume=resume, profile=profile)
+
+
+def _run_configuration_job(configurations: List[Configuration],
+                           array_results: Optional[Dict[str, Any]] = None
+                           ) -> Tuple[List[str], float, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Run the configurations of one array configuration inside a worker process
+    
+    Args:
+        configurations: (cell_type, opt_target, capacity, bits_per_cell, settings) tuples
+            differing only in traffic settings
+        array_results: Array results already known (from the surrogate sweep), or
+            None to characterize the array in the worker
+        
+    Returns:
+        Tuple of (results CSV path per configuration, elapsed seconds, array results kept
+        for cross-configuration suites or None, stage profile of the job or None)
+    """
+    array_configuration = MemSysExplorer._array_configuration(configurations[0])
+    if array_results is not None:
+        _worker_explorer._array_results[array_configuration] = array_results
+    results_csvs, elapsed = [], 0.0
+    for configuration in configurations:
+        results_csv, seconds = _worker_explorer._run_timed_configuration(configuration)
+        results_csvs.append(results_csv)
+        elapsed += seconds
+    array_results = _worker_explorer._array_results.pop(array_configuration, None)
+    
+    profile = None
+    if instrumentation.enabled:
+        profile = instrumentation.snapshot()
+        instrumentation.reset()
+    return results_csvs, elapsed, array_results, profile
+
+
 def main():
     """Main entry point"""
-    if len(sys.argv) < 2:
-        print("Usage: python main.py <config_file.json>")
-        print("Example: python main.py configs/basic_memory_comparison.json")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="MemSysExplorer memory system traffic evaluation",
+        epilog="Example: python main.py configs/basic_memory_comparison.json"
+    )
+    parser.add_argument("config", help="JSON experiment configuration file")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always run NVSim and do not read or write the characterization cache")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Re-run NVSim for every configuration and overwrite cached results")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of configurations to run in parallel worker processes (default: 1)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted sweep: skip units recorded as complete in the "
+                             "output directory's run manifest and append only the missing ones")
+    parser.add_argument("--pareto", action="store_true",
+                        help="Write the per-benchmark Pareto frontier of the results to "
+                             "pareto_frontier-<exp_name>.csv in the output directory")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record per-stage wall time, call counts and bytes written and write "
+                             "profile.json and profile_trace.json (Chrome trace) to the output directory")
+    parser.add_argument("--coefficient-model", metavar="PATH",
+                        help="Also save a closed-form coefficient model of every configuration "
+                             "to PATH (.npz) for answering new workloads without a sweep")
+    parser.add_argument("--combine", action="store_true",
+                        help="Also merge the results CSVs into one <cell type>_<n>BPC-combined.csv per "
+                             "technology in <output_path>/combined, as read by the dataviz apps")
+    distributed = parser.add_mutually_exclusive_group()
+    distributed.add_argument("--shard", metavar="I/N",
+                             help="Run only shard I of N (0-based) of the (configuration, traffic suite) "
+                                  "jobs, writing part files to the output directory; combine with --merge")
+    distributed.add_argument("--queue", metavar="DIR",
+                             help="Claim and run jobs from a work queue in DIR (created by the first "
+                                  "worker) until none are left; combine with --merge")
+    distributed.add_argument("--merge", action="store_true",
+                             help="Assemble the results CSVs from the part files of finished "
+                                  "--shard or --queue runs")
+    distributed.add_argument("--plan", action="store_true",
+                             help="Print the sweep's cell files, config files, unique NVSim runs, traffic "
+                                  "suites and estimated runtime without running anything; exits with "
+                                  "status 1 if a configuration would fail")
+    args = parser.parse_args()
     
-    config_path = sys.argv[1]
+    config_path = args.config
     
     try:
         if not Path(config_path).exists():
@@ -397,14 +1391,39 @@ def main():
         
         print("Successfully Loaded Config File")
         
-        explorer = MemSysExplorer(config_path)
-        results = explorer.run()
+        explorer = MemSysExplorer(config_path, use_cache=not args.no_cache,
+                                  refresh_cache=args.refresh_cache, jobs=args.jobs, resume=args.resume,
+                                  pareto=args.pareto, profile=args.profile)
+        if args.plan:
+            sweep_plan = explorer.plan()
+            print(sweep_plan.format())
+            if sweep_plan.errors:
+                sys.exit(1)
+            return sweep_plan.to_dict()
+        elif args.shard:
+            results = explorer.run_shard(*parse_shard(args.shard))
+        elif args.queue:
+            results = explorer.run_queue(args.queue)
+        elif args.merge:
+            results = explorer.merge()
+        else:
+            results = explorer.run()
+        
+        if args.combine and results.get("results"):
+            combined_dir = os.path.join(explorer.output_path, "combined")
+            existing = [path for path in results["results"] if path and os.path.exists(path)]
+            combined = combine_by_technology(existing, combined_dir)
+            print(f"Wrote {len(combined)} combined results files to {combined_dir}")
+        
+        if args.coefficient_model:
+            explorer.build_coefficient_model().save(args.coefficient_model)
+            print(f"Saved coefficient model to {args.coefficient_model}")
         
         print("Retrieved Array-Level Results; Running Analytical Model")
         print("Reported Results; Evaluation Complete")
         
         return results
-        
+    
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the MemSysExplorer tech tests
+
+Run from the tech directory with ``python -m pytest tests``.
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+TECH_DIR = Path(__file__).resolve().parent.parent
+if str(TECH_DIR) not in sys.path:
+    sys.path.insert(0, str(TECH_DIR))
+
+ARRAY_CHAR_DIR = TECH_DIR / "ArrayCharacterization"
+
+# Stand-in for libnvsim.so: sleeps NVSIM_STUB_SLEEP seconds, then reports a design
+_STUB_SOURCE = r"""
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+#include "nvsim_api.h"
+
+int nvsim_characterize(const char *configText, const char *cellText, NVSimResult *result, char **output) {
+	const char *sleep = getenv("NVSIM_STUB_SLEEP");
+	if (sleep != NULL)
+		usleep((useconds_t) (atof(sleep) * 1e6));
+	memset(result, 0, sizeof(*result));
+	result->status = NVSIM_OK;
+	result->readLatency = 1e-9;
+	if (output != NULL)
+		*output = strdup("stub NVSim output\n");
+	return NVSIM_OK;
+}
+
+void nvsim_free(char *output) {
+	free(output);
+}
+"""
+
+
+@pytest.fixture(scope="session")
+def stub_nvsim_library(tmp_path_factory):
+    """Path to a stub libnvsim.so whose calls take NVSIM_STUB_SLEEP seconds"""
+    compiler = shutil.which("cc") or shutil.which("gcc")
+    if compiler is None:
+        pytest.skip("no C compiler to build the stub libnvsim.so")
+    build_dir = tmp_path_factory.mktemp("libnvsim")
+    source = build_dir / "nvsim_stub.c"
+    source.write_text(_STUB_SOURCE)
+    library = build_dir / "libnvsim.so"
+    subprocess.run([compiler, "-shared", "-fPIC", f"-I{ARRAY_CHAR_DIR}", "-o", str(library), str(source)],
+                   check=True)
+    return library
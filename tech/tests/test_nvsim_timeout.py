@@ -0,0 +1,59 @@
+"""Adaptive NVSim timeouts on the libnvsim.so path"""
+
+import sqlite3
+import sys
+import time
+
+import pytest
+
+from integrate.interfaces import runtime_scheduler
+from integrate.interfaces.array_interface import ArrayCharacterizationInterface
+from integrate.interfaces.nvsim_library import NVSimLibrary
+from integrate.interfaces.runtime_scheduler import config_signature
+
+MEMORY_CONFIG = {"memory_type": "RRAM", "capacity_mb": 1, "bits_per_cell": 1,
+                 "optimization_target": "ReadLatency", "case": "best_case", "process_node": 22}
+
+
+@pytest.fixture
+def library_interface(stub_nvsim_library, tmp_path, monkeypatch):
+    """Interface running the stub library, with timeouts short enough for a test"""
+    monkeypatch.setenv("NVSIM_LIBRARY", str(stub_nvsim_library))
+    monkeypatch.setenv("NVSIM_EXECUTABLE", sys.executable)
+    monkeypatch.setattr(runtime_scheduler, "TIMEOUT_SLACK", 0.1)
+    monkeypatch.setattr(runtime_scheduler, "MIN_TIMEOUT", 0.5)
+    interface = ArrayCharacterizationInterface({"experiment": {"output_path": str(tmp_path)}}, use_cache=False)
+    assert interface.nvsim_library is not None
+    return interface
+
+
+def test_library_overrun_is_killed_at_adaptive_timeout(library_interface, monkeypatch):
+    signature = config_signature(library_interface._with_default_case(MEMORY_CONFIG))
+    library_interface.runtime_history.record(signature, "nvsim", 0.1)
+    timeout = library_interface.nvsim_timeout(MEMORY_CONFIG)
+    assert timeout == pytest.approx(0.5)
+    
+    monkeypatch.setenv("NVSIM_STUB_SLEEP", "30")
+    start = time.perf_counter()
+    results = library_interface.run_characterization(MEMORY_CONFIG)
+    elapsed = time.perf_counter() - start
+    
+    assert elapsed < 10
+    assert results == library_interface._get_default_characteristics("RRAM", 22, 1)
+    with sqlite3.connect(str(library_interface.runtime_history.db_path)) as conn:
+        rows = conn.execute("SELECT seconds, timed_out FROM runtimes WHERE signature = ? ORDER BY id",
+                            (signature,)).fetchall()
+    assert rows[-1] == (pytest.approx(timeout), 1)
+
+
+def test_library_helper_restarts_after_timeout(stub_nvsim_library, monkeypatch):
+    library = NVSimLibrary(stub_nvsim_library)
+    monkeypatch.setenv("NVSIM_STUB_SLEEP", "30")
+    with pytest.raises(TimeoutError):
+        library.characterize("", "", timeout=0.5)
+    
+    monkeypatch.setenv("NVSIM_STUB_SLEEP", "0")
+    status, result, output = library.characterize("", "", timeout=10)
+    assert status == 0
+    assert result.readLatency == pytest.approx(1e-9)
+    assert output == "stub NVSim output\n"
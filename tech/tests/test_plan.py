@@ -0,0 +1,36 @@
+"""--plan reports problems as errors and writes nothing"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from main import MemSysExplorer
+
+TECH_DIR = Path(__file__).resolve().parent.parent
+
+
+def _write_config(tmp_path, cell_types):
+    config_path = tmp_path / "plan.json"
+    config_path.write_text(json.dumps({"experiment": {
+        "exp_name": "plan", "cell_type": cell_types, "opt_target": ["ReadLatency"], "capacity": [1],
+        "bits_per_cell": [1], "process_node": 22, "traffic": ["generic"], "output_path": str(tmp_path / "out")
+    }}))
+    return config_path
+
+
+def test_unknown_cell_type_is_an_error(tmp_path, monkeypatch):
+    monkeypatch.setenv("NVSIM_EXECUTABLE", sys.executable)
+    sweep_plan = MemSysExplorer(str(_write_config(tmp_path, ["SRAM", "Bogus"]))).plan()
+    assert [error for error in sweep_plan.errors if "Unknown cell type Bogus" in error]
+    assert not (tmp_path / "out").exists()
+
+
+def test_plan_exits_nonzero_and_writes_nothing(tmp_path):
+    config_path = _write_config(tmp_path, ["Bogus"])
+    result = subprocess.run([sys.executable, "main.py", str(config_path), "--plan"], cwd=TECH_DIR,
+                            env={**os.environ, "NVSIM_EXECUTABLE": sys.executable}, capture_output=True, text=True)
+    assert result.returncode == 1
+    assert "Unknown cell type Bogus" in result.stdout
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,24 @@
+"""Runtime signatures distinguish every configuration NVSim sees differently"""
+
+import pytest
+
+from integrate.interfaces.runtime_scheduler import config_signature
+
+BASE_CONFIG = {"memory_type": "RRAM", "capacity_mb": 1, "bits_per_cell": 1, "optimization_target": "ReadLatency",
+               "case": "custom", "process_node": 22, "word_width": 64,
+               "cell_file": "/data/cell_cfgs/RRAM_f27bb88926ba6e2e.cell"}
+
+
+@pytest.mark.parametrize("setting", [{"cell_file": "/data/cell_cfgs/RRAM_0123456789abcdef.cell"},
+                                     {"process_node_w": 45}, {"process_node_r": 45},
+                                     {"device_roadmap_r": "HP"}, {"device_roadmap_w": "LSTP"},
+                                     {"design_target": "cache"}, {"global_wire_type": "GlobalConservative"},
+                                     {"routing": "non-H-tree"}, {"internal_sensing": "false"}])
+def test_nvsim_settings_change_the_signature(setting):
+    assert config_signature({**BASE_CONFIG, **setting}) != config_signature(BASE_CONFIG)
+
+
+def test_signature_ignores_cell_file_directory():
+    moved = {**BASE_CONFIG, "cell_file": "/elsewhere/RRAM_f27bb88926ba6e2e.cell"}
+    assert config_signature(moved) == config_signature(BASE_CONFIG)
+
@@ -0,0 +1,62 @@
+"""Surrogate groups: configurations share samples only when NVSim sees the same settings"""
+
+import shutil
+import sys
+
+import pytest
+
+from integrate.interfaces.array_interface import ArrayCharacterizationInterface
+from integrate.interfaces.surrogate import CharacterizationSurrogate, group_key
+
+BASE_CONFIG = {"memory_type": "SRAM", "capacity_mb": 1, "bits_per_cell": 1, "optimization_target": "ReadLatency",
+               "case": "best_case", "process_node": 22, "word_width": 64, "temperature": 300,
+               "device_roadmap": "HP"}
+
+RESULTS = {"read_latency_ns": 1.0, "write_latency_ns": 1.0, "read_energy_pj": 1.0, "write_energy_pj": 1.0,
+           "leakage_power_mw": 1.0, "area_mm2": 1.0, "read_bandwidth_gbps": 1.0, "write_bandwidth_gbps": 1.0}
+
+
+@pytest.mark.parametrize("setting", [{"temperature": 400}, {"device_roadmap": "LSTP"},
+                                     {"device_roadmap_r": "LOP"}, {"process_node_w": 45},
+                                     {"retention_time_us": 100}])
+def test_other_settings_do_not_share_samples(setting):
+    other = {**BASE_CONFIG, **setting}
+    assert group_key(other) != group_key(BASE_CONFIG)
+    
+    surrogate = CharacterizationSurrogate([(BASE_CONFIG, RESULTS)])
+    assert surrogate.sample(BASE_CONFIG) == RESULTS
+    assert surrogate.sample(other) is None
+    assert surrogate.predict([other]) == [(None, float("inf"))]
+
+
+def test_features_share_a_group():
+    assert group_key({**BASE_CONFIG, "capacity_mb": 4, "process_node": 45, "word_width": 128}) == \
+        group_key(BASE_CONFIG)
+
+
+def test_surrogate_sweep_does_not_reuse_other_settings(tmp_path, monkeypatch):
+    monkeypatch.setenv("NVSIM_EXECUTABLE", sys.executable)
+    monkeypatch.delenv("NVSIM_LIBRARY", raising=False)
+    interface = ArrayCharacterizationInterface({"experiment": {"output_path": str(tmp_path)}})
+    interface.cache.put("cached", RESULTS, params=BASE_CONFIG)
+    
+    characterized = {**RESULTS, "read_latency_ns": 2.0}
+    monkeypatch.setattr(interface, "_characterize", lambda memory_config: characterized)
+    other = {**BASE_CONFIG, "temperature": 400, "device_roadmap": "LSTP"}
+    assert interface.run_surrogate_sweep([BASE_CONFIG, other]) == [RESULTS, characterized]
+
+
+def test_surrogate_sweep_does_not_train_on_failed_nvsim_runs(tmp_path, monkeypatch):
+    monkeypatch.setenv("NVSIM_EXECUTABLE", shutil.which("false"))
+    monkeypatch.delenv("NVSIM_LIBRARY", raising=False)
+    interface = ArrayCharacterizationInterface({"experiment": {"output_path": str(tmp_path / "out")}})
+    interface.mem_cfgs_dir = tmp_path
+    memory_configs = [{**BASE_CONFIG, "memory_type": memory_type, "capacity_mb": capacity}
+                      for memory_type in ("SRAM", "RRAM") for capacity in (1, 2, 4, 8, 16)]
+    
+    results = interface.run_surrogate_sweep(memory_configs)
+    
+    for memory_config, array_results in zip(memory_configs, results):
+        assert not array_results.get("surrogate")
+        assert array_results == interface._get_default_characteristics(memory_config["memory_type"], 22,
+                                                                        memory_config["capacity_mb"])
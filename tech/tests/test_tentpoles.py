@@ -0,0 +1,21 @@
+"""Custom cell generation rejects parameters it would otherwise drop"""
+
+import pytest
+
+from integrate.tentpoles import gen_custom_cells
+
+
+def test_custom_cells_are_named_after_their_parameters(tmp_path):
+    paths = gen_custom_cells("RRAM", [{"set_pulse": 5, "name": "a"}, {"set_pulse": 10}, {"set_pulse": 5}],
+                             cell_dir=str(tmp_path))
+    assert paths[0] == paths[2] != paths[1]
+
+
+def test_unknown_parameters_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="rOn_typo, r_on"):
+        gen_custom_cells("RRAM", [{"set_pulse": 5}, {"r_on": 1000, "rOn_typo": 1}], cell_dir=str(tmp_path))
+
+
+def test_ctt_cells_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="CTT"):
+        gen_custom_cells("CTT", [{"cell_size_F2": 4}], cell_dir=str(tmp_path))